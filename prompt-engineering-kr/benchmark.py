@@ -0,0 +1,864 @@
+"""
+성능 측정 스크립트
+
+로컬 모의 API 서버를 대상으로 AI 클라이언트의 성능을 측정합니다.
+API 키나 네트워크 연결 없이 실행할 수 있습니다.
+
+실행 방법: 프로젝트 루트에서 `python benchmark.py <측정 항목>` 명령 실행
+"""
+
+import os
+import sys
+import time
+import subprocess
+import asyncio
+import argparse
+import statistics
+from typing import Callable, Dict, List
+
+# 프로젝트 루트를 경로에 추가하여 utils 모듈을 import할 수 있게 설정
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+MOCK_API_KEY = "mock-key"
+
+
+def measure(func: Callable[[], None], iterations: int) -> List[float]:
+    """
+    함수를 반복 실행하고 실행 시간(초) 목록 반환
+
+    Args:
+        func: 측정할 함수
+        iterations: 반복 횟수
+
+    Returns:
+        실행 시간 목록
+    """
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def print_timings(label: str, timings: List[float]) -> None:
+    """
+    측정 결과 요약 출력
+
+    Args:
+        label: 측정 항목 이름
+        timings: 실행 시간 목록 (초)
+    """
+    total = sum(timings)
+    print(f"{label:<28} 총 {total * 1000:9.1f}ms | "
+          f"평균 {statistics.mean(timings) * 1000:7.3f}ms | "
+          f"중앙값 {statistics.median(timings) * 1000:7.3f}ms")
+
+
+def bench_mock(args) -> None:
+    """모의 서비스(service="mock")의 inprocess / http 백엔드 처리량과 지연 시간 분포 비교"""
+    from utils.ai_client import clear_client_registry, get_completions
+    from utils.config import load_config
+    from utils.mock_provider import reset_mock_provider
+
+    config = load_config()
+    print(f"\n[mock] 요청 {args.iterations}개, 동시 {args.concurrency}개, "
+          f"지연 분포 {args.distribution}({args.latency * 1000:.0f}ms), "
+          f"초당 토큰 {args.tps}, 오류율 {args.error_rate:.0%}")
+    for backend in ("inprocess", "http"):
+        # 측정 중에만 모의 서비스 설정 변경 (파일에는 저장하지 않음)
+        config["mock"] = {
+            "backend": backend,
+            "latency": {"distribution": args.distribution, "value": args.latency, "median": args.latency},
+            "tokens_per_second": args.tps,
+            "error_rate": args.error_rate,
+            "seed": 0
+        }
+        reset_mock_provider()
+        clear_client_registry()
+
+        prompts = [f"모의 서비스 벤치마크 요청 {i}" for i in range(args.iterations)]
+        start = time.perf_counter()
+        results = get_completions(prompts, max_concurrency=args.concurrency, provider="mock", max_tokens=64)
+        elapsed = time.perf_counter() - start
+
+        timings = sorted(result["elapsed"] for result in results)
+        failed = sum(1 for result in results if result["error"])
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"{backend:<12} 처리량 {len(results) / elapsed:8.1f} req/s | "
+              f"중앙값 {statistics.median(timings) * 1000:7.1f}ms | p95 {p95 * 1000:7.1f}ms | 실패 {failed}")
+    reset_mock_provider()
+    clear_client_registry()
+
+
+def bench_batch(args) -> None:
+    """일괄 처리 작업 전체 과정 측정 (JSONL 작성/제출 → 상태 확인 → 결과 스트리밍 → 재시작 후 이어받기)"""
+    import shutil
+    import tempfile
+    from utils.batch import BatchJob
+    from utils.config import load_config
+    from utils.mock_server import MockAPIServer
+    from utils.ai_client import AIClient
+
+    config = load_config()
+    config.setdefault("batch", {})["poll_interval"] = 0.05
+    state_dir = tempfile.mkdtemp(prefix="batch-bench-")
+    print(f"\n[batch] 요청 {args.iterations}개, 모의 작업 완료 시간 {args.batch_delay:.1f}초")
+    with MockAPIServer(batch_delay=args.batch_delay) as server:
+        for wire_format in ("openai", "anthropic"):
+            client = AIClient(api_key=MOCK_API_KEY, service=wire_format,
+                              base_url=server.get_endpoint(wire_format))
+            job = client.batch(f"bench-{wire_format}", state_dir)
+            start = time.perf_counter()
+            for i in range(args.iterations):
+                job.add(f"req-{i}", f"일괄 처리 벤치마크 요청 {i}", max_tokens=64)
+            job.submit()
+            submitted = time.perf_counter() - start
+
+            # 절반만 받고 멈춘 뒤 상태 파일로 이어받기 (프로세스 재시작 상황)
+            results = job.iter_results()
+            for _ in range(args.iterations // 2):
+                next(results)
+            results.close()
+            first_half = time.perf_counter() - start
+            resumed = BatchJob.resume(job.name, state_dir, client=client).wait()
+            total = time.perf_counter() - start
+
+            failed = sum(1 for result in resumed.values() if result["error"])
+            print(f"{wire_format:<12} 제출 {submitted * 1000:7.1f}ms | 절반 수신 {first_half:5.2f}초 | "
+                  f"전체 {total:5.2f}초 | 결과 {len(resumed)}개, 실패 {failed}")
+    shutil.rmtree(state_dir, ignore_errors=True)
+
+
+def bench_exercise(args) -> None:
+    """
+    run_exercise의 기본/향상된 프롬프트 동시 요청 효과 측정 (순차 요청 대비 전체 소요 시간)
+
+    응답 캐시를 끈 경우와 기본 설정(캐시 켬)을 모두 측정합니다. 캐시를 켠 경우에는
+    반복마다 주제를 바꿔 매번 캐시에 없는 요청을 보내고 두 스레드가 응답을 저장합니다.
+    """
+    import builtins
+    import contextlib
+    import io
+    import itertools
+    import tempfile
+    from functools import partial
+    from utils import exercise_template
+    from utils.ai_client import clear_client_registry, get_completion
+    from utils.config import load_config
+    from utils.mock_provider import reset_mock_provider
+    from utils.response_cache import DEFAULT_CACHE_SETTINGS, reset_response_cache
+
+    latency = args.latency or 0.2
+    config = load_config()
+    # 측정 중에만 모의 서비스 설정 변경 (파일에는 저장하지 않음)
+    config["mock"] = {
+        "backend": "inprocess",
+        "latency": {"distribution": "fixed", "value": latency},
+        "tokens_per_second": args.tps,
+        "seed": 0
+    }
+    reset_mock_provider()
+    clear_client_registry()
+
+    counter = itertools.count()
+    basic = lambda topic: f"{topic}에 대해 알려주세요."
+    enhanced = lambda topic, purpose, output_format: f"{purpose}을 위해 {topic}을 {output_format}으로 정리해 주세요."
+
+    def sequential(stream: bool) -> None:
+        topic = f"벤치마크 주제 {next(counter)}"
+        with contextlib.redirect_stdout(io.StringIO()):
+            exercise_template.request_completion(basic(topic), temperature=0.7, stream=stream)
+            exercise_template.request_completion(enhanced(topic, "정보 수집", "표"), temperature=0.5, stream=stream)
+
+    def concurrent(stream: bool) -> None:
+        topic_options = {"1": f"벤치마크 주제 {next(counter)}"}
+        with contextlib.redirect_stdout(io.StringIO()):
+            exercise_template.run_exercise("벤치마크", topic_options, basic, enhanced, {}, [], stream=stream)
+
+    # 실습 코드는 기본 서비스로 요청하므로 측정 중에만 모의 서비스로 연결하고 입력은 기본값 사용
+    original_completion, original_input = exercise_template.get_completion, builtins.input
+    exercise_template.get_completion = partial(get_completion, provider="mock")
+    builtins.input = lambda prompt="": "n" if "저장" in prompt else ""
+    iterations = min(args.iterations, 10)
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # 기본 설정과 같은 캐시(메모리 + SQLite)를 임시 폴더에 만들어 실제 캐시 파일은 건드리지 않음
+            cache_cases = (
+                ("캐시 끔", {"enabled": False}),
+                ("기본 설정, 캐시 켬", dict(DEFAULT_CACHE_SETTINGS, enabled=True,
+                                         path=os.path.join(cache_dir, "responses.sqlite3")))
+            )
+            for cache_label, cache_settings in cache_cases:
+                config["cache"] = cache_settings
+                reset_response_cache()
+                print(f"\n[exercise] {cache_label}, 요청당 지연 {latency * 1000:.0f}ms, {iterations}회")
+                for stream in (False, True):
+                    mode = "스트리밍" if stream else "일반"
+                    print_timings(f"순차 요청 ({mode})", measure(lambda: sequential(stream), iterations))
+                    print_timings(f"run_exercise 동시 요청 ({mode})", measure(lambda: concurrent(stream), iterations))
+            reset_response_cache()
+    finally:
+        exercise_template.get_completion, builtins.input = original_completion, original_input
+
+
+def bench_journal(args) -> None:
+    """실험 저널: 기록 비용(fsync 묶음 크기별)과 중단 후 다시 실행할 때 걸리는 시간"""
+    import shutil
+    import tempfile
+    from utils.ai_client import clear_client_registry, get_completions
+    from utils.config import load_config
+    from utils.journal import ExperimentJournal
+    from utils.mock_provider import reset_mock_provider
+
+    latency = args.latency or 0.2
+    config = load_config()
+    # 측정 중에만 모의 서비스 설정 변경 (파일에는 저장하지 않음)
+    config["cache"] = dict(config.get("cache", {}), enabled=False)
+    config["mock"] = {"backend": "inprocess", "latency": {"distribution": "fixed", "value": latency}, "seed": 0}
+    reset_mock_provider()
+    clear_client_registry()
+
+    journal_dir = tempfile.mkdtemp(prefix="journal-bench-")
+    records = min(args.iterations, 1000)
+    print(f"\n[journal] 기록 {records}줄 (응답 1KB)")
+    for fsync_every in (1, 8, 64):
+        path = os.path.join(journal_dir, f"records-{fsync_every}.jsonl")
+
+        def write_records() -> None:
+            with ExperimentJournal(path, fsync_every=fsync_every, fsync_interval=60.0) as journal:
+                for i in range(records):
+                    journal.record(f"key-{i}", "가" * 1024, label=f"단계 {i}")
+            os.remove(path)
+
+        print_timings(f"fsync {fsync_every}줄마다", measure(write_records, 3))
+
+    prompts = [f"실험 저널 벤치마크 프롬프트 {i}" for i in range(12)]
+    path = os.path.join(journal_dir, "experiment.jsonl")
+
+    def run(items: List[str], journal: ExperimentJournal = None) -> None:
+        get_completions(items, max_concurrency=4, provider="mock", journal=journal)
+
+    def run_with_journal() -> None:
+        with ExperimentJournal(path) as journal:
+            run(prompts, journal)
+        os.remove(path)
+
+    def resume() -> float:
+        # 절반을 완료한 뒤 중단된 실험을 다시 실행 (기록된 단계는 요청하지 않음)
+        with ExperimentJournal(path) as journal:
+            run(prompts[:len(prompts) // 2], journal)
+        start = time.perf_counter()
+        with ExperimentJournal(path) as journal:
+            run(prompts, journal)
+        os.remove(path)
+        return time.perf_counter() - start
+
+    print(f"\n[journal] 프롬프트 {len(prompts)}개, 동시 4개, 요청당 지연 {latency * 1000:.0f}ms")
+    print_timings("저널 없이 전체 실행", measure(lambda: run(prompts), 3))
+    print_timings("저널 기록하며 전체 실행", measure(run_with_journal, 3))
+    print_timings("절반 완료 후 다시 실행", [resume() for _ in range(3)])
+    shutil.rmtree(journal_dir, ignore_errors=True)
+
+
+def bench_manifest(args) -> None:
+    """실습 파일 찾기: 섹션마다 폴더를 훑는 방식 vs 실습 목록(생성 / 디스크에서 읽기 / 조회)"""
+    from utils import manifest
+
+    exercises_dir = manifest.EXERCISES_DIR
+    section_ids = [entry["id"] for entry in manifest.iter_entries() if entry["id"].count(".") == 1]
+    iterations = min(args.iterations, 50)
+
+    def scan_each_section() -> None:
+        # 이전 main.py 방식: 섹션마다 폴더 목록을 읽어 ID로 시작하는 파일 찾기
+        for section_id in section_ids:
+            section_dir = os.path.join(exercises_dir, f"part{section_id.split('.')[0]}", section_id)
+            next(f for f in os.listdir(section_dir) if f.startswith(f"{section_id}_") and f.endswith(".py"))
+
+    def load_from_disk() -> None:
+        manifest.clear_manifest()
+        manifest.get_manifest()
+
+    def lookup() -> None:
+        for section_id in section_ids:
+            manifest.get_entry(section_id)
+
+    print(f"\n[manifest] 섹션 {len(section_ids)}개, 실습 파일 {len(manifest.iter_entries())}개")
+    print_timings("섹션별 폴더 훑기", measure(scan_each_section, iterations))
+    print_timings("목록 생성 (scandir + AST)", measure(lambda: manifest.get_manifest(refresh=True), 3))
+    print_timings("저장된 목록 읽기", measure(load_from_disk, iterations))
+    print_timings("목록 조회 (전체 섹션)", measure(lookup, iterations))
+
+
+def bench_telemetry(args) -> None:
+    """원격 측정 기록 비용 측정 (inprocess 모의 서비스, 원격 측정 끔 / memory / 모든 싱크)"""
+    import tempfile
+    from utils.ai_client import AIClient
+    from utils.config import load_config
+    from utils.telemetry import get_telemetry_summary, reset_telemetry
+
+    config = load_config()
+    config["mock"] = {"backend": "inprocess"}
+    client = AIClient(service="mock")
+    with tempfile.TemporaryDirectory() as telemetry_dir:
+        cases = (
+            ("원격 측정 끔", {"enabled": False}),
+            ("memory 싱크", {"enabled": True, "sinks": ["memory"]}),
+            ("memory + jsonl + prometheus", {
+                "enabled": True,
+                "sinks": ["memory", "jsonl", "prometheus"],
+                "jsonl_path": os.path.join(telemetry_dir, "calls.jsonl"),
+                "prometheus_path": os.path.join(telemetry_dir, "metrics.prom")
+            })
+        )
+        print(f"\n[mock] 요청 {args.iterations}개 (지연 없음)")
+        for label, settings in cases:
+            # 측정 중에만 원격 측정 설정 변경 (파일에는 저장하지 않음)
+            config["telemetry"] = settings
+            reset_telemetry()
+            print_timings(label, measure(lambda: client.get_response("원격 측정 벤치마크", max_tokens=16),
+                                         args.iterations))
+
+        summary = get_telemetry_summary(group_by="provider").get("mock", {})
+        print(f"  집계: 호출 {summary.get('calls')}, p50 {summary.get('p50', 0) * 1000:.3f}ms, "
+              f"p99 {summary.get('p99', 0) * 1000:.3f}ms")
+        reset_telemetry()
+
+
+def bench_tokens(args) -> None:
+    """토큰 수 추정 속도 측정 (처음 계산 / LRU 캐시 적중 / 일괄 추정)"""
+    from utils.tokens import estimate_tokens, estimate_tokens_batch, get_estimator_cache_info
+
+    base = "프롬프트 엔지니어링은 원하는 결과를 얻기 위해 지시문을 설계하는 기술입니다. " \
+           "Clear instructions and examples matter. "
+    prompts = [f"{base * 20} #{i}" for i in range(args.iterations)]
+    print(f"\n[{args.service}] 프롬프트 {args.iterations}개 (각 {len(prompts[0])}자)")
+
+    texts = iter(prompts)
+    print_timings("처음 계산", measure(lambda: estimate_tokens(next(texts), args.service), args.iterations))
+    texts = iter(prompts)
+    print_timings("LRU 캐시 적중", measure(lambda: estimate_tokens(next(texts), args.service), args.iterations))
+
+    start = time.perf_counter()
+    counts = estimate_tokens_batch(prompts * 2, args.service)
+    elapsed = time.perf_counter() - start
+    print(f"{'일괄 추정 (중복 포함 x2)':<28} 총 {elapsed * 1000:9.1f}ms | 평균 추정값 {statistics.mean(counts):.0f} 토큰")
+    info = get_estimator_cache_info()
+    print(f"  캐시 통계: 적중 {info['hits']}, 미스 {info['misses']}, 크기 {info['size']}/{info['maxsize']}")
+
+
+# 콜드 스타트 측정 대상 (이름, 인터프리터 인자)
+IMPORTTIME_EXERCISE = os.path.join("exercises", "part1", "1.1", "1.1.1_specific_requests.py")
+IMPORTTIME_TARGETS = [
+    ("import utils", ["-c", "import utils"]),
+    ("연습 모듈 1개 로드", ["-c", "import importlib.util as u, sys; sys.path.insert(0, '.'); "
+                               f"s = u.spec_from_file_location('exercise', {IMPORTTIME_EXERCISE!r}); "
+                               "s.loader.exec_module(u.module_from_spec(s))"]),
+    ("main.py --list", ["main.py", "--list"]),
+]
+
+
+def _run_cold(argv: List[str]) -> float:
+    """새 인터프리터로 명령을 실행하고 걸린 시간(초) 반환 (실패하면 예외 발생)"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable] + argv, cwd=project_root, check=True,
+                   stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def _top_level_imports(argv: List[str]) -> List[tuple]:
+    """-X importtime 출력에서 최상위 import와 누적 시간 목록 반환 [(모듈, ms)]"""
+    result = subprocess.run([sys.executable, "-X", "importtime"] + argv, cwd=project_root,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    entries = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        # 들여쓰기가 없는 줄이 최상위 import
+        if len(parts) != 3 or parts[2].startswith("  "):
+            continue
+        try:
+            entries.append((parts[2].strip(), int(parts[1]) / 1000))
+        except ValueError:
+            continue
+    return entries
+
+
+def bench_importtime(args) -> None:
+    """콜드 스타트 측정 (새 프로세스에서 import utils / 연습 모듈 로드 / main.py --list)"""
+    # 프로세스를 새로 띄우므로 반복 횟수는 최대 20회로 제한
+    runs = max(1, min(args.iterations, 20))
+    baseline = statistics.median([_run_cold(["-c", "pass"]) for _ in range(runs)])
+    # 인터프리터가 시작할 때 항상 불러오는 모듈은 목록에서 제외
+    startup_modules = {module for module, _ in _top_level_imports(["-c", "pass"])}
+    print(f"\n새 프로세스 {runs}회 실행의 중앙값 (인터프리터 시작 {baseline * 1000:.1f}ms 제외)")
+
+    exceeded = []
+    for label, argv in IMPORTTIME_TARGETS:
+        timings = [_run_cold(argv) for _ in range(runs)]
+        net_ms = max(statistics.median(timings) - baseline, 0.0) * 1000
+        min_ms = max(min(timings) - baseline, 0.0) * 1000
+        print(f"{label:<28} 중앙값 {net_ms:7.1f}ms | 최소 {min_ms:7.1f}ms")
+        heaviest = sorted((entry for entry in _top_level_imports(argv) if entry[0] not in startup_modules),
+                          key=lambda entry: entry[1], reverse=True)
+        for module, cumulative_ms in heaviest[:5]:
+            print(f"    {module:<32} {cumulative_ms:7.1f}ms")
+        if args.max_ms is not None and net_ms > args.max_ms:
+            exceeded.append(label)
+
+    if exceeded:
+        print(f"\n기준 시간 {args.max_ms:.0f}ms 초과: {', '.join(exceeded)}")
+        sys.exit(1)
+
+
+def bench_daemon(args) -> None:
+    """상주 서버 효과 측정: 매번 새 프로세스로 실행 vs --connect로 상주 서버에서 실행"""
+    import tempfile
+
+    runs = max(1, min(args.iterations, 20))
+    socket_path = os.path.join(tempfile.mkdtemp(prefix="pe-daemon-"), "bench.sock")
+    server = subprocess.Popen([sys.executable, "main.py", "--serve", "--socket", socket_path],
+                              cwd=project_root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.time() + 30
+        while not os.path.exists(socket_path):
+            if server.poll() is not None or time.time() > deadline:
+                print("상주 서버를 시작하지 못했습니다 (Unix 소켓을 지원하지 않는 환경일 수 있습니다).")
+                return
+            time.sleep(0.05)
+
+        print(f"\n[daemon] 명령마다 {runs}회 실행의 중앙값 (--run은 첫 입력 요청까지)")
+        for label, argv in (("--list", ["--list"]), ("--run 1.1", ["--run", "1.1"])):
+            cold = [_run_cold(["main.py"] + argv) for _ in range(runs)]
+            warm = [_run_cold(["main.py", "--connect", "--socket", socket_path] + argv) for _ in range(runs)]
+            cold_ms, warm_ms = statistics.median(cold) * 1000, statistics.median(warm) * 1000
+            print(f"{label:<12} 새 프로세스 {cold_ms:7.1f}ms | 상주 서버 {warm_ms:7.1f}ms | "
+                  f"{cold_ms / warm_ms if warm_ms else 0:4.1f}배")
+    finally:
+        subprocess.run([sys.executable, "main.py", "--connect", "--shutdown", "--socket", socket_path],
+                       cwd=project_root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            server.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def bench_pool(args) -> None:
+    """연결 풀 사용 여부에 따른 요청 지연 시간 비교"""
+    import requests
+    from utils.ai_client import AIClient
+    from utils.http_pool import get_pool_stats, reset_pool_stats
+    from utils.mock_server import MockAPIServer
+
+    with MockAPIServer(latency=args.latency) as server:
+        for service in ("openai", "anthropic"):
+            endpoint = server.get_endpoint(service)
+            client = AIClient(api_key=MOCK_API_KEY, service=service, base_url=endpoint)
+            params = client._prepare_request_params("연결 풀 벤치마크", 64, 0.7, None)
+
+            def send_without_pool():
+                response = requests.post(endpoint, headers=client._get_headers(), json=params, timeout=30)
+                response.raise_for_status()
+
+            def send_with_pool():
+                client.get_response("연결 풀 벤치마크", max_tokens=64)
+
+            print(f"\n[{service}] 요청 {args.iterations}회")
+            print_timings("requests.post (매번 새 연결)", measure(send_without_pool, args.iterations))
+            reset_pool_stats()
+            print_timings("공유 세션 (keep-alive)", measure(send_with_pool, args.iterations))
+
+            stats = get_pool_stats(service)
+            print(f"  풀 통계: 요청 {stats['requests']}, 재사용 {stats['hits']}, "
+                  f"새 연결 {stats['new_connections']}, 대기 {stats['wait_time'] * 1000:.3f}ms")
+
+
+def bench_registry(args) -> None:
+    """호출마다 AIClient를 생성하는 경우와 레지스트리 재사용 비교"""
+    from utils.ai_client import AIClient, get_client, clear_client_registry, get_registry_stats
+
+    service = args.service
+    clear_client_registry()
+
+    print(f"\n[{service}] 클라이언트 준비 {args.iterations}회")
+    print_timings("AIClient() 매번 생성", measure(
+        lambda: AIClient(api_key=MOCK_API_KEY, service=service), args.iterations))
+    print_timings("get_client() 레지스트리", measure(
+        lambda: get_client(service=service, api_key=MOCK_API_KEY), args.iterations))
+
+    stats = get_registry_stats()
+    print(f"  레지스트리 통계: 클라이언트 {stats['clients']}, 재사용 {stats['hits']}, "
+          f"생성 {stats['misses']}, 생성 시간 {stats['construct_time'] * 1000:.3f}ms, "
+          f"절약 추정 {stats['saved_time'] * 1000:.3f}ms")
+
+
+def bench_async(args) -> None:
+    """동시 실행 수(1/10/100)에 따른 비동기 API 처리량 측정"""
+    from utils.ai_client import AIClient
+    from utils.config import load_config
+    from utils.mock_server import MockAPIServer
+
+    # 측정 중에만 연결 수 / 동시 요청 제한을 최대 동시 실행 수에 맞춤 (파일에는 저장하지 않음)
+    http_config = load_config().setdefault("http", {})
+    http_config["pool_maxsize"] = max(CONCURRENCY_LEVELS)
+    http_config["max_concurrency"] = max(CONCURRENCY_LEVELS)
+
+    async def run(client: AIClient, concurrency: int) -> None:
+        queue = asyncio.Queue()
+        for i in range(args.iterations):
+            queue.put_nowait(f"비동기 벤치마크 요청 {i}")
+
+        async def worker():
+            while not queue.empty():
+                prompt = queue.get_nowait()
+                await client.aget_response(prompt, max_tokens=64)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    with MockAPIServer(latency=args.latency) as server:
+        for service in ("openai", "anthropic"):
+            client = AIClient(api_key=MOCK_API_KEY, service=service, base_url=server.get_endpoint(service))
+            print(f"\n[{service}] 요청 {args.iterations}회, 서버 지연 {args.latency * 1000:.0f}ms")
+            for concurrency in CONCURRENCY_LEVELS:
+                start = time.perf_counter()
+                asyncio.run(run(client, concurrency))
+                elapsed = time.perf_counter() - start
+                print(f"  동시 실행 {concurrency:>3}: {elapsed * 1000:9.1f}ms, "
+                      f"처리량 {args.iterations / elapsed:8.1f} req/s")
+
+
+def bench_stream(args) -> None:
+    """스트리밍 응답의 첫 토큰 시간(TTFT)과 전체 응답 시간 비교"""
+    from utils.ai_client import AIClient
+    from utils.mock_server import MockAPIServer
+
+    with MockAPIServer(latency=args.latency, token_latency=args.token_latency) as server:
+        for service in ("openai", "anthropic"):
+            client = AIClient(api_key=MOCK_API_KEY, service=service, base_url=server.get_endpoint(service))
+            prompt = "스트리밍 벤치마크 요청에 대한 조금 긴 프롬프트 문장입니다"
+
+            metrics = []
+
+            def read_stream():
+                response = client.get_response(prompt, max_tokens=64, stream=True)
+                response.read()
+                metrics.append(response.metrics)
+
+            print(f"\n[{service}] 요청 {args.iterations}회, 조각 지연 {args.token_latency * 1000:.0f}ms")
+            print_timings("일반 요청 (전체 응답)", measure(
+                lambda: client.get_response(prompt, max_tokens=64), args.iterations))
+            print_timings("스트리밍 (전체 응답)", measure(read_stream, args.iterations))
+            print_timings("스트리밍 (첫 토큰)", [m["ttft"] for m in metrics])
+            gaps = [m["mean_inter_token"] for m in metrics if m["mean_inter_token"] is not None]
+            if gaps:
+                print_timings("스트리밍 (토큰 간 지연)", gaps)
+
+
+def bench_retry(args) -> None:
+    """장애가 섞인 모의 서버에서 재시도 정책의 성공률과 추가 지연 측정"""
+    from utils.ai_client import AIClient
+    from utils.config import load_config
+    from utils.errors import AIClientError
+    from utils.mock_server import MockAPIServer
+    from utils.retry import get_retry_stats, reset_retry_stats
+
+    # 측정 중에만 대기 시간을 줄이고 안내 메시지를 끔 (파일에는 저장하지 않음)
+    load_config().setdefault("retry", {}).update(base_delay=0.01, max_delay=0.2, verbose=False)
+
+    for fault in (429, 503, "disconnect"):
+        with MockAPIServer(latency=args.latency, fault_rate=args.fault_rate,
+                           fault_status=fault, seed=0) as server:
+            client = AIClient(api_key=MOCK_API_KEY, service="openai", base_url=server.get_endpoint("openai"))
+            reset_retry_stats()
+            failures = 0
+
+            def send():
+                nonlocal failures
+                try:
+                    client.get_response("재시도 벤치마크", max_tokens=64)
+                except AIClientError:
+                    failures += 1
+
+            print(f"\n[장애 {fault}] 요청 {args.iterations}회, 장애 확률 {args.fault_rate:.0%}")
+            print_timings("재시도 포함 응답 시간", measure(send, args.iterations))
+            stats = get_retry_stats("openai")
+            print(f"  성공 {args.iterations - failures}/{args.iterations}, 재시도 {stats['retries']}, "
+                  f"대기 {stats['wait_time'] * 1000:.1f}ms, 서버 요청 {server.request_count}")
+
+
+def bench_cache(args) -> None:
+    """응답 캐시 미스(API 호출) / 메모리 적중 / 디스크 적중 지연 시간 비교"""
+    import tempfile
+    from utils.ai_client import AIClient
+    from utils.config import load_config
+    from utils.mock_server import MockAPIServer
+    from utils.response_cache import get_cache_stats, reset_response_cache
+
+    with tempfile.TemporaryDirectory() as cache_dir, MockAPIServer(latency=args.latency) as server:
+        # 측정 중에만 임시 디렉터리의 캐시 사용 (파일에는 저장하지 않음)
+        load_config()["cache"] = {"enabled": True, "path": os.path.join(cache_dir, "responses.sqlite3")}
+        reset_response_cache()
+
+        client = AIClient(api_key=MOCK_API_KEY, service="openai", base_url=server.get_endpoint("openai"))
+        prompts = [f"캐시 벤치마크 요청 {i}" for i in range(args.iterations)]
+        responses = iter(prompts)
+
+        def send():
+            client.get_response(next(responses), max_tokens=64)
+
+        print(f"\n[openai] 서로 다른 요청 {args.iterations}개, 서버 지연 {args.latency * 1000:.0f}ms")
+        print_timings("캐시 미스 (API 호출)", measure(send, args.iterations))
+        responses = iter(prompts)
+        print_timings("메모리 캐시 적중", measure(send, args.iterations))
+        # 캐시 객체를 새로 열어 메모리 LRU를 비운 뒤 디스크(SQLite)에서 읽기
+        reset_response_cache()
+        responses = iter(prompts)
+        print_timings("디스크 캐시 적중", measure(send, args.iterations))
+
+        stats = get_cache_stats()
+        print(f"  캐시 통계: 메모리 적중 {stats['memory_hits']}, 디스크 적중 {stats['disk_hits']}, "
+              f"미스 {stats['misses']}, 읽은 바이트 {stats['bytes_read']}")
+        reset_response_cache()
+
+
+def bench_cassette(args) -> None:
+    """카세트 기록/재생 지연 시간과 대용량 카세트의 색인/조회 시간 측정"""
+    import json
+    import random
+    import tempfile
+    from utils.ai_client import AIClient
+    from utils.cassette import Cassette, reset_cassette
+    from utils.config import load_config
+    from utils.mock_server import MockAPIServer
+
+    config = load_config()
+    with tempfile.TemporaryDirectory() as cassette_dir, MockAPIServer(latency=args.latency) as server:
+        path = os.path.join(cassette_dir, "bench.jsonl")
+        client = AIClient(api_key=MOCK_API_KEY, service="openai", base_url=server.get_endpoint("openai"))
+        prompts = [f"카세트 벤치마크 요청 {i}" for i in range(args.iterations)]
+
+        def send():
+            client.get_response(next(responses), max_tokens=64)
+
+        print(f"\n[openai] 서로 다른 요청 {args.iterations}개, 서버 지연 {args.latency * 1000:.0f}ms")
+        for mode, label in (("record", "기록 (API 호출)"), ("replay", "재생 (네트워크 없음)")):
+            # 측정 중에만 임시 카세트 사용 (파일에는 저장하지 않음)
+            config["cassette"] = {"mode": mode, "path": path}
+            reset_cassette()
+            responses = iter(prompts)
+            print_timings(label, measure(send, args.iterations))
+        config["cassette"] = {"mode": "off"}
+        reset_cassette()
+
+        # 대용량 카세트: 색인 생성(처음) / 색인 파일 재사용 / 무작위 조회
+        big_path = os.path.join(cassette_dir, "big.jsonl")
+        keys = [f"{i:064x}" for i in range(args.entries)]
+        with open(big_path, "w", encoding="utf-8") as f:
+            for key in keys:
+                f.write(json.dumps({"key": key, "request": {}, "response": "응답 " * 20, "latency": 0.1}) + "\n")
+        size_mb = os.path.getsize(big_path) / 1024 / 1024
+        print(f"\n[cassette] 항목 {args.entries}개 ({size_mb:.1f}MB)")
+
+        for label in ("색인 생성 (전체 읽기)", "색인 파일 재사용"):
+            cassette = Cassette(big_path, "replay")
+            start = time.perf_counter()
+            cassette.lookup(keys[0])
+            print(f"{label:<28} {(time.perf_counter() - start) * 1000:9.1f}ms")
+            cassette.close()
+
+        cassette = Cassette(big_path, "replay")
+        cassette.lookup(keys[0])
+        sample = iter(random.choices(keys, k=args.iterations))
+        print_timings("무작위 조회", measure(lambda: cassette.lookup(next(sample)), args.iterations))
+        cassette.close()
+
+
+def bench_chapter(args) -> None:
+    """저장 1회당 호출 파일/챕터 경로 찾기 비용: inspect.stack() + 매번 계산 vs sys._getframe + LRU"""
+    import inspect
+    from utils.chapter_utils import get_caller_file, resolve_chapter_path
+    from utils.file_handler import _resolve_chapter_info
+
+    def with_inspect() -> None:
+        # 이전 방식: 저장 함수마다 전체 스택을 만들고 경로를 다시 계산
+        calling_file = inspect.stack()[1].filename
+        resolve_chapter_path.__wrapped__(calling_file)
+        _resolve_chapter_info.__wrapped__(os.path.abspath(calling_file))
+
+    def with_frame() -> None:
+        calling_file = get_caller_file()
+        resolve_chapter_path(calling_file)
+        _resolve_chapter_info(os.path.abspath(calling_file))
+
+    def nested(depth: int, func: Callable[[], None]) -> Callable[[], None]:
+        # 실습 파일 -> run_exercise -> save_results처럼 여러 단계 아래에서 호출되는 상황
+        if depth == 0:
+            return func
+        inner = nested(depth - 1, func)
+        return lambda: inner()
+
+    iterations = min(args.iterations, 2000)
+    for depth in (5, 20):
+        print(f"\n[chapter] 호출 깊이 {depth}, {iterations}회")
+        print_timings("inspect.stack() + 매번 계산", measure(nested(depth, with_inspect), iterations))
+        print_timings("sys._getframe + LRU", measure(nested(depth, with_frame), iterations))
+
+    # 저장 경로 준비: 매번 경로 계산 + makedirs + 디버그 출력 vs 캐시된 경로와 폴더 생성 기록
+    import contextlib
+    import io
+    from utils.chapter_utils import get_chapter_save_path
+    exercise_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "exercises", "part1", "1.1",
+                                 "1.1_clear_instructions.py")
+
+    def uncached_save_path() -> None:
+        save_path = resolve_chapter_path.__wrapped__(exercise_file)
+        print(f"파일 경로: {exercise_file}")
+        print(f"저장 경로: {save_path}")
+        os.makedirs(save_path, exist_ok=True)
+
+    print(f"\n[chapter] 저장 경로 준비, {iterations}회 (출력은 버림)")
+    with contextlib.redirect_stdout(io.StringIO()):
+        before = measure(uncached_save_path, iterations)
+        after = measure(lambda: get_chapter_save_path(exercise_file), iterations)
+    print_timings("계산 + makedirs + 디버그 출력", before)
+    print_timings("get_chapter_save_path (캐시)", after)
+
+
+def bench_coalesce(args) -> None:
+    """같은 프롬프트를 동시에 요청할 때 요청 병합 여부에 따른 API 호출 수 비교"""
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.ai_client import AIClient
+    from utils.config import load_config
+    from utils.mock_server import MockAPIServer
+    from utils.singleflight import coalesce_stats
+
+    http_config = load_config().setdefault("http", {})
+    students = 40
+    with MockAPIServer(latency=max(args.latency, 0.1)) as server:
+        client = AIClient(api_key=MOCK_API_KEY, service="openai", base_url=server.get_endpoint("openai"))
+        print(f"\n[openai] 같은 프롬프트 동시 요청 {students}개, 서버 지연 {max(args.latency, 0.1) * 1000:.0f}ms")
+
+        for coalesce in (False, True):
+            # 측정 중에만 병합 여부를 바꿈 (파일에는 저장하지 않음)
+            http_config["coalesce"] = coalesce
+            coalesce_stats.reset()
+            before = server.request_count
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=students) as executor:
+                list(executor.map(lambda _: client.get_response("여름 휴가 계획에 대해 알려주세요", max_tokens=64),
+                                  range(students)))
+            elapsed = time.perf_counter() - start
+            label = "병합 사용" if coalesce else "병합 안 함"
+            print(f"  {label:<8} {elapsed * 1000:8.1f}ms, API 호출 {server.request_count - before}회, "
+                  f"병합된 호출 {coalesce_stats.coalesced}회")
+
+
+def bench_ratelimit(args) -> None:
+    """여러 스레드가 공유하는 요청 한도(RPM/TPM)가 처리 속도를 제한하는지 확인"""
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.ai_client import AIClient, clear_rate_limiters, get_rate_limit_stats
+    from utils.config import load_config
+    from utils.mock_server import MockAPIServer
+
+    # 측정 중에만 mock 모델의 한도를 지정 (파일에는 저장하지 않음)
+    load_config()["rate_limits"] = {
+        "enabled": True,
+        "shared_state": args.shared_state,
+        "providers": {"openai": {"models": {"mock-model": {"rpm": args.rpm}}}}
+    }
+    clear_rate_limiters()
+
+    with MockAPIServer(latency=args.latency) as server:
+        client = AIClient(api_key=MOCK_API_KEY, service="openai", model="mock-model",
+                          base_url=server.get_endpoint("openai"))
+        # 버킷 용량(1분치)을 넘는 요청부터는 초당 rpm/60건으로 제한됨
+        over = max(0, args.iterations - args.rpm)
+        print(f"\n[openai/mock-model] 요청 {args.iterations}회, 스레드 8개, 한도 {args.rpm} RPM")
+        print(f"  예상 최소 시간: {over / (args.rpm / 60):.1f}초")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: client.get_response(f"한도 벤치마크 {i}", max_tokens=64),
+                              range(args.iterations)))
+        elapsed = time.perf_counter() - start
+
+        stats = get_rate_limit_stats()["openai/mock-model"]
+        print(f"  실제 시간: {elapsed:.1f}초, 처리량 {args.iterations / elapsed:.1f} req/s")
+        print(f"  한도 통계: 요청 {stats['requests']}, 대기 {stats['throttled']}회, "
+              f"최대 대기 {stats['max_wait_time']:.2f}초, 예약 토큰 {stats['reserved_tokens']}, "
+              f"실제 토큰 {stats['used_tokens']}")
+
+
+CONCURRENCY_LEVELS = (1, 10, 100)
+
+BENCHMARKS: Dict[str, Callable] = {
+    "async": bench_async,
+    "batch": bench_batch,
+    "cache": bench_cache,
+    "cassette": bench_cassette,
+    "chapter": bench_chapter,
+    "coalesce": bench_coalesce,
+    "daemon": bench_daemon,
+    "exercise": bench_exercise,
+    "importtime": bench_importtime,
+    "journal": bench_journal,
+    "manifest": bench_manifest,
+    "mock": bench_mock,
+    "pool": bench_pool,
+    "ratelimit": bench_ratelimit,
+    "registry": bench_registry,
+    "retry": bench_retry,
+    "stream": bench_stream,
+    "telemetry": bench_telemetry,
+    "tokens": bench_tokens
+}
+
+
+def parse_arguments():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="AI 클라이언트 성능 측정 도구")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS), help="실행할 측정 항목")
+    parser.add_argument("--iterations", type=int, default=200, help="반복 횟수")
+    parser.add_argument("--latency", type=float, default=0.0, help="모의 서버 응답 지연 (초)")
+    parser.add_argument("--token-latency", type=float, default=0.005, help="스트리밍 조각 사이 지연 (초)")
+    parser.add_argument("--fault-rate", type=float, default=0.3, help="모의 서버 장애 발생 확률 (retry 측정용)")
+    parser.add_argument("--rpm", type=int, default=600, help="분당 요청 한도 (ratelimit 측정용)")
+    parser.add_argument("--shared-state", default=None, help="프로세스 간 한도 공유 상태 파일 (ratelimit 측정용)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수 (mock 측정용)")
+    parser.add_argument("--distribution", default="lognormal", choices=["fixed", "lognormal"],
+                        help="모의 서비스 지연 시간 분포 (mock 측정용)")
+    parser.add_argument("--tps", type=float, default=0, help="모의 서비스 초당 토큰 수 (mock 측정용)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="모의 서비스 오류율 (mock 측정용)")
+    parser.add_argument("--entries", type=int, default=100000, help="대용량 카세트 항목 수 (cassette 측정용)")
+    parser.add_argument("--batch-delay", type=float, default=1.0,
+                        help="모의 일괄 처리 작업이 완료되기까지의 시간 (초, batch 측정용)")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="콜드 스타트 허용 시간 (ms, 초과하면 종료 코드 1; importtime 측정용)")
+    parser.add_argument("--service", default="gemini", help="측정할 AI 서비스")
+    return parser.parse_args()
+
+
+def main():
+    """
+    메인 함수
+    """
+    args = parse_arguments()
+
+    # 측정 대상이 아닌 요청 한도, 응답 캐시, 카세트는 끄고 순수 성능만 측정 (파일에는 저장하지 않음)
+    # (exercise는 사용자가 실제로 쓰는 캐시 설정도 측정하므로 캐시를 직접 설정)
+    from utils.cassette import MODE_ENV
+    from utils.config import load_config
+    config = load_config()
+    if args.benchmark != "ratelimit":
+        config.setdefault("rate_limits", {})["enabled"] = False
+    if args.benchmark not in ("cache", "exercise"):
+        config.setdefault("cache", {})["enabled"] = False
+    config["cassette"] = {"mode": "off"}
+    os.environ.pop(MODE_ENV, None)
+
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == "__main__":
+    main()
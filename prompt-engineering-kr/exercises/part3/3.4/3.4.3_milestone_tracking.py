@@ -15,7 +15,8 @@ import re
 # 상위 디렉토리를 경로에 추가하여 utils 모듈을 import할 수 있게 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-sys.path.append(project_root)
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from utils.prompt_builder import PromptBuilder
 from utils.exercise_template import run_exercise
@@ -13,7 +13,8 @@ import datetime
 # 상위 디렉토리를 경로에 추가하여 utils 모듈을 import할 수 있게 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-sys.path.append(project_root)
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from utils.prompt_builder import PromptBuilder
 from utils.exercise_template import run_exercise
@@ -140,13 +141,13 @@ class ExperimentTracker:
         
         Args:
             experiment_name: 실험 이름
-            save_dir: 결과 저장 디렉토리 (없으면 현재 디렉토리에 'experiments' 폴더 생성)
+            save_dir: 결과 저장 디렉토리 (없으면 실습 파일 폴더에 'experiments' 폴더 생성)
         """
         self.experiment_name = experiment_name
         
         # 저장 디렉토리 설정
         if save_dir is None:
-            self.save_dir = os.path.join(os.getcwd(), "experiments")
+            self.save_dir = os.path.join(current_dir, "experiments")
         else:
             self.save_dir = save_dir
             
@@ -15,7 +15,8 @@ import copy
 # 상위 디렉토리를 경로에 추가하여 utils 모듈을 import할 수 있게 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-sys.path.append(project_root)
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from utils.prompt_builder import PromptBuilder
 from utils.exercise_template import run_exercise
@@ -143,13 +144,13 @@ class PromptPatternLibrary:
         
         Args:
             library_name: 라이브러리 이름
-            save_dir: 저장 디렉토리 (없으면 현재 디렉토리에 'prompt_patterns' 폴더 생성)
+            save_dir: 저장 디렉토리 (없으면 실습 파일 폴더에 'prompt_patterns' 폴더 생성)
         """
         self.library_name = library_name
         
         # 저장 디렉토리 설정
         if save_dir is None:
-            self.save_dir = os.path.join(os.getcwd(), "prompt_patterns")
+            self.save_dir = os.path.join(current_dir, "prompt_patterns")
         else:
             self.save_dir = save_dir
             
@@ -818,7 +819,7 @@ class PromptIntegrator:
         통합 보고서를 마크다운 파일로 저장
         
         Args:
-            save_dir: 저장 디렉토리 (없으면 현재 디렉토리)
+            save_dir: 저장 디렉토리 (없으면 실습 파일 폴더)
             
         Returns:
             저장된 파일 경로
@@ -827,7 +828,7 @@ class PromptIntegrator:
         
         # 저장 디렉토리 설정
         if save_dir is None:
-            save_dir = os.getcwd()
+            save_dir = current_dir
         
         # 저장 디렉토리가 없으면 생성
         if not os.path.exists(save_dir):
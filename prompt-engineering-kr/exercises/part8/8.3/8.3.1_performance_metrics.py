@@ -12,14 +12,17 @@ from typing import Dict, List, Any, Optional, Tuple
 # 상위 디렉토리를 경로에 추가하여 utils 모듈을 import할 수 있게 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-sys.path.append(project_root)
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from utils.prompt_builder import PromptBuilder
-from utils.ai_client import get_completion
+from utils.ai_client import get_completions
 from utils.file_handler import save_markdown
+from utils.journal import experiment_journal
 from utils.ui_helpers import (
     print_header, print_step, get_user_input, 
-    display_results_comparison, print_prompt_summary
+    display_results_comparison, print_prompt_summary,
+    get_result_text, print_completion_status
 )
 
 # 프롬프트 균형 조정 실험을 위한 주제 옵션
@@ -182,79 +185,30 @@ def run_balance_experiment(topic: str) -> Dict[str, Any]:
         "purpose_experiments": []
     }
     
-    # 1. 기본 프롬프트 (모든 요소 중간 수준)
-    print_step(1, "기본 균형 프롬프트 테스트 (모든 요소 중간 수준)")
-    base_prompt = create_balanced_prompt(topic, "중간", "중간", "중간")
-    print(f"\n기본 프롬프트:\n{base_prompt}\n")
-    
-    print("응답 생성 중...")
-    base_result = get_completion(base_prompt, temperature=0.7)
-    print("\n✅ 기본 프롬프트 응답이 생성되었습니다.")
-    
-    results["experiments"].append({
-        "name": "기본 균형",
-        "clarity": "중간",
-        "specificity": "중간",
-        "context": "중간",
-        "prompt": base_prompt,
-        "result": base_result
-    })
-    
-    # 2. 명확성 강화 프롬프트
-    print_step(2, "명확성 강화 프롬프트 테스트")
-    clarity_prompt = create_balanced_prompt(topic, "높음", "중간", "중간")
-    print(f"\n명확성 강화 프롬프트:\n{clarity_prompt}\n")
-    
-    print("응답 생성 중...")
-    clarity_result = get_completion(clarity_prompt, temperature=0.7)
-    print("\n✅ 명확성 강화 프롬프트 응답이 생성되었습니다.")
-    
-    results["experiments"].append({
-        "name": "명확성 강화",
-        "clarity": "높음",
-        "specificity": "중간",
-        "context": "중간",
-        "prompt": clarity_prompt,
-        "result": clarity_result
-    })
-    
-    # 3. 구체성 강화 프롬프트
-    print_step(3, "구체성 강화 프롬프트 테스트")
-    specificity_prompt = create_balanced_prompt(topic, "중간", "높음", "중간")
-    print(f"\n구체성 강화 프롬프트:\n{specificity_prompt}\n")
-    
-    print("응답 생성 중...")
-    specificity_result = get_completion(specificity_prompt, temperature=0.7)
-    print("\n✅ 구체성 강화 프롬프트 응답이 생성되었습니다.")
-    
-    results["experiments"].append({
-        "name": "구체성 강화",
-        "clarity": "중간",
-        "specificity": "높음",
-        "context": "중간",
-        "prompt": specificity_prompt,
-        "result": specificity_result
-    })
-    
-    # 4. 맥락 강화 프롬프트
-    print_step(4, "맥락 강화 프롬프트 테스트")
-    context_prompt = create_balanced_prompt(topic, "중간", "중간", "높음")
-    print(f"\n맥락 강화 프롬프트:\n{context_prompt}\n")
-    
-    print("응답 생성 중...")
-    context_result = get_completion(context_prompt, temperature=0.7)
-    print("\n✅ 맥락 강화 프롬프트 응답이 생성되었습니다.")
-    
-    results["experiments"].append({
-        "name": "맥락 강화",
-        "clarity": "중간",
-        "specificity": "중간",
-        "context": "높음",
-        "prompt": context_prompt,
-        "result": context_result
-    })
-    
-    # 5. 목적별 최적 균형 테스트
+    # 요소별 강화 실험 설정 (이름, 명확성, 구체성, 맥락, 단계 설명)
+    element_settings = [
+        ("기본 균형", "중간", "중간", "중간", "기본 균형 프롬프트 테스트 (모든 요소 중간 수준)"),
+        ("명확성 강화", "높음", "중간", "중간", "명확성 강화 프롬프트 테스트"),
+        ("구체성 강화", "중간", "높음", "중간", "구체성 강화 프롬프트 테스트"),
+        ("맥락 강화", "중간", "중간", "높음", "맥락 강화 프롬프트 테스트")
+    ]
+    
+    # 1~4. 요소별 강화 프롬프트 생성
+    for step, (name, clarity, specificity, context, step_desc) in enumerate(element_settings, 1):
+        print_step(step, step_desc)
+        prompt = create_balanced_prompt(topic, clarity, specificity, context)
+        print(f"\n{name} 프롬프트:\n{prompt}\n")
+        
+        results["experiments"].append({
+            "name": name,
+            "clarity": clarity,
+            "specificity": specificity,
+            "context": context,
+            "prompt": prompt,
+            "result": ""
+        })
+    
+    # 5. 목적별 최적 균형 프롬프트 생성
     print_step(5, "목적별 최적 균형 테스트")
     
     for purpose, profile in PURPOSE_BALANCE_PROFILES.items():
@@ -271,17 +225,31 @@ def run_balance_experiment(topic: str) -> Dict[str, Any]:
         print(f"- 구체성: {profile['구체성']}")
         print(f"- 맥락: {profile['맥락']}")
         
-        print("\n응답 생성 중...")
-        purpose_result = get_completion(purpose_prompt, temperature=0.7)
-        print(f"\n✅ {purpose} 목적 프롬프트 응답이 생성되었습니다.")
-        
         results["purpose_experiments"].append({
             "purpose": purpose,
             "profile": profile,
             "prompt": purpose_prompt,
-            "result": purpose_result
+            "result": ""
         })
     
+    # 서로 독립적인 요청이므로 한 번에 동시 요청
+    experiments = results["experiments"] + results["purpose_experiments"]
+    labels = [f"{exp['name']} 프롬프트" if "name" in exp else f"{exp['purpose']} 목적 프롬프트"
+              for exp in experiments]
+    
+    print(f"\n응답 생성 중... ({len(experiments)}개 프롬프트 동시 요청)")
+    # 완료된 응답은 저널에 기록해 중단되어도 다시 실행하면 남은 요청만 보냄
+    with experiment_journal("8.3.1_balance", topic) as journal:
+        completions = get_completions(
+            [exp["prompt"] for exp in experiments],
+            temperature=0.7,
+            journal=journal,
+            on_result=lambda item: print_completion_status(labels[item['index']], item)
+        )
+    
+    for exp, item in zip(experiments, completions):
+        exp["result"] = get_result_text(item)
+    
     # 결과 비교 표시
     print_step(6, "실험 결과 비교")
     
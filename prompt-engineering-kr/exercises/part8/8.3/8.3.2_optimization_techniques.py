@@ -12,14 +12,17 @@ from typing import Dict, List, Any, Optional, Tuple
 # 상위 디렉토리를 경로에 추가하여 utils 모듈을 import할 수 있게 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-sys.path.append(project_root)
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from utils.prompt_builder import PromptBuilder
-from utils.ai_client import get_completion
+from utils.ai_client import get_completions
 from utils.file_handler import save_markdown
+from utils.journal import experiment_journal
 from utils.ui_helpers import (
     print_header, print_step, get_user_input, 
-    display_results_comparison, print_prompt_summary
+    display_results_comparison, print_prompt_summary,
+    get_result_text, print_completion_status
 )
 
 # 단어 선택과 구조 실험을 위한 주제 옵션
@@ -201,14 +204,10 @@ def run_word_choice_experiment(topic: str) -> Dict[str, Any]:
     for level, prompt in verb_prompts.items():
         print(f"\n{level} 지시 동사 프롬프트:\n{prompt}\n")
         
-        print("응답 생성 중...")
-        result = get_completion(prompt, temperature=0.7)
-        print(f"\n✅ {level} 지시 동사 프롬프트 응답이 생성되었습니다.")
-        
         results["verb_experiments"].append({
             "level": level,
             "prompt": prompt,
-            "result": result
+            "result": ""
         })
     
     # 2. 수식어 변형 실험
@@ -218,14 +217,10 @@ def run_word_choice_experiment(topic: str) -> Dict[str, Any]:
     for type_name, prompt in modifier_prompts.items():
         print(f"\n{type_name} 수식어 프롬프트:\n{prompt}\n")
         
-        print("응답 생성 중...")
-        result = get_completion(prompt, temperature=0.7)
-        print(f"\n✅ {type_name} 수식어 프롬프트 응답이 생성되었습니다.")
-        
         results["modifier_experiments"].append({
             "type": type_name,
             "prompt": prompt,
-            "result": result
+            "result": ""
         })
     
     # 3. 최적 조합 실험
@@ -241,14 +236,10 @@ def run_word_choice_experiment(topic: str) -> Dict[str, Any]:
     
     print(f"\n정보 추출 목적 최적 조합 프롬프트:\n{info_extraction_prompt}\n")
     
-    print("응답 생성 중...")
-    info_extraction_result = get_completion(info_extraction_prompt, temperature=0.7)
-    print("\n✅ 정보 추출 목적 최적 조합 프롬프트 응답이 생성되었습니다.")
-    
     results["combined_experiments"].append({
         "purpose": "정보 추출",
         "prompt": info_extraction_prompt,
-        "result": info_extraction_result
+        "result": ""
     })
     
     # 창의적 콘텐츠 목적 최적 조합
@@ -261,14 +252,10 @@ def run_word_choice_experiment(topic: str) -> Dict[str, Any]:
     
     print(f"\n창의적 콘텐츠 목적 최적 조합 프롬프트:\n{creative_prompt}\n")
     
-    print("응답 생성 중...")
-    creative_result = get_completion(creative_prompt, temperature=0.7)
-    print("\n✅ 창의적 콘텐츠 목적 최적 조합 프롬프트 응답이 생성되었습니다.")
-    
     results["combined_experiments"].append({
         "purpose": "창의적 콘텐츠",
         "prompt": creative_prompt,
-        "result": creative_result
+        "result": ""
     })
     
     # 분석 목적 최적 조합
@@ -282,16 +269,31 @@ def run_word_choice_experiment(topic: str) -> Dict[str, Any]:
     
     print(f"\n분석 목적 최적 조합 프롬프트:\n{analysis_prompt}\n")
     
-    print("응답 생성 중...")
-    analysis_result = get_completion(analysis_prompt, temperature=0.7)
-    print("\n✅ 분석 목적 최적 조합 프롬프트 응답이 생성되었습니다.")
-    
     results["combined_experiments"].append({
         "purpose": "분석",
         "prompt": analysis_prompt,
-        "result": analysis_result
+        "result": ""
     })
     
+    # 서로 독립적인 요청이므로 한 번에 동시 요청
+    experiments = (results["verb_experiments"] + results["modifier_experiments"]
+                   + results["combined_experiments"])
+    labels = (
+        [f"{exp['level']} 지시 동사 프롬프트" for exp in results["verb_experiments"]]
+        + [f"{exp['type']} 수식어 프롬프트" for exp in results["modifier_experiments"]]
+        + [f"{exp['purpose']} 목적 최적 조합 프롬프트" for exp in results["combined_experiments"]]
+    )
+    
+    print(f"\n응답 생성 중... ({len(experiments)}개 프롬프트 동시 요청)")
+    completions = get_completions(
+        [exp["prompt"] for exp in experiments],
+        temperature=0.7,
+        on_result=lambda item: print_completion_status(labels[item['index']], item)
+    )
+    
+    for exp, item in zip(experiments, completions):
+        exp["result"] = get_result_text(item)
+    
     # 결과 비교 표시
     print_step(4, "단어 선택 실험 결과 비교")
     
@@ -336,16 +338,30 @@ def run_structure_experiment(topic: str) -> Dict[str, Any]:
     for pattern_name, prompt in structure_prompts.items():
         print(f"\n{pattern_name} 프롬프트:\n{prompt}\n")
         
-        print("응답 생성 중...")
-        result = get_completion(prompt, temperature=0.7)
-        print(f"\n✅ {pattern_name} 프롬프트 응답이 생성되었습니다.")
-        
         results["structure_experiments"].append({
             "pattern": pattern_name,
             "prompt": prompt,
-            "result": result
+            "result": ""
         })
     
+    # 구조 패턴별 요청을 한 번에 동시 요청
+    experiments = results["structure_experiments"]
+    
+    print(f"응답 생성 중... ({len(experiments)}개 프롬프트 동시 요청)")
+    # 완료된 응답은 저널에 기록해 중단되어도 다시 실행하면 남은 요청만 보냄
+    with experiment_journal("8.3.2_structure", topic) as journal:
+        completions = get_completions(
+            [exp["prompt"] for exp in experiments],
+            temperature=0.7,
+            journal=journal,
+            on_result=lambda item: print_completion_status(
+                f"{experiments[item['index']]['pattern']} 프롬프트", item
+            )
+        )
+    
+    for exp, item in zip(experiments, completions):
+        exp["result"] = get_result_text(item)
+    
     # 결과 비교 표시
     print_step(2, "구조 패턴 실험 결과 비교")
     
@@ -12,14 +12,17 @@ from typing import Dict, List, Any, Optional, Tuple
 # 상위 디렉토리를 경로에 추가하여 utils 모듈을 import할 수 있게 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-sys.path.append(project_root)
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from utils.prompt_builder import PromptBuilder
-from utils.ai_client import get_completion
+from utils.ai_client import get_completions
 from utils.file_handler import save_markdown
+from utils.journal import experiment_journal
 from utils.ui_helpers import (
     print_header, print_step, get_user_input, 
-    display_results_comparison, print_prompt_summary
+    display_results_comparison, print_prompt_summary,
+    get_result_text, print_completion_status
 )
 
 # 뉘앙스 조정 실험을 위한 주제 옵션
@@ -406,6 +409,9 @@ def run_nuance_experiment(topic: str) -> Dict[str, Any]:
         "advanced_experiments": []
     }
     
+    # 응답을 요청할 실험 항목과 표시 이름 (모든 선택을 마친 뒤 한 번에 동시 요청)
+    pending = []
+    
     # 1. 어조 변형 실험
     print_step(1, "어조 변형 실험")
     
@@ -434,15 +440,12 @@ def run_nuance_experiment(topic: str) -> Dict[str, Any]:
         
         print(f"\n{tone} 어조 프롬프트:\n{prompt}\n")
         
-        print("응답 생성 중...")
-        result = get_completion(prompt, temperature=0.7)
-        print(f"\n✅ {tone} 어조 프롬프트 응답이 생성되었습니다.")
-        
         results["tone_experiments"].append({
             "tone": tone,
             "prompt": prompt,
-            "result": result
+            "result": ""
         })
+        pending.append((results["tone_experiments"][-1], f"{tone} 어조 프롬프트"))
     
     # 2. 관점 프레이밍 실험
     print_step(2, "관점 프레이밍 실험")
@@ -469,15 +472,12 @@ def run_nuance_experiment(topic: str) -> Dict[str, Any]:
         
         print(f"\n{perspective} 프롬프트:\n{prompt}\n")
         
-        print("응답 생성 중...")
-        result = get_completion(prompt, temperature=0.7)
-        print(f"\n✅ {perspective} 프롬프트 응답이 생성되었습니다.")
-        
         results["perspective_experiments"].append({
             "perspective": perspective,
             "prompt": prompt,
-            "result": result
+            "result": ""
         })
+        pending.append((results["perspective_experiments"][-1], f"{perspective} 프롬프트"))
     
     # 3. 제약 조건과 자유도 실험
     print_step(3, "제약 조건과 자유도 실험")
@@ -489,15 +489,12 @@ def run_nuance_experiment(topic: str) -> Dict[str, Any]:
     for level, prompt in constraint_freedom_prompts.items():
         print(f"\n{level} 프롬프트:\n{prompt}\n")
         
-        print("응답 생성 중...")
-        result = get_completion(prompt, temperature=0.7)
-        print(f"\n✅ {level} 프롬프트 응답이 생성되었습니다.")
-        
         results["constraint_freedom_experiments"].append({
             "level": level,
             "prompt": prompt,
-            "result": result
+            "result": ""
         })
+        pending.append((results["constraint_freedom_experiments"][-1], f"{level} 프롬프트"))
     
     # 4. 언어적 장치 실험
     print_step(4, "언어적 장치 실험")
@@ -527,15 +524,12 @@ def run_nuance_experiment(topic: str) -> Dict[str, Any]:
         
         print(f"\n{device} 프롬프트:\n{prompt}\n")
         
-        print("응답 생성 중...")
-        result = get_completion(prompt, temperature=0.7)
-        print(f"\n✅ {device} 프롬프트 응답이 생성되었습니다.")
-        
         results["linguistic_experiments"].append({
             "device": device,
             "prompt": prompt,
-            "result": result
+            "result": ""
         })
+        pending.append((results["linguistic_experiments"][-1], f"{device} 프롬프트"))
     
     # 5. 고급 뉘앙스 조정 실험
     print_step(5, "고급 뉘앙스 조정 실험")
@@ -547,15 +541,26 @@ def run_nuance_experiment(topic: str) -> Dict[str, Any]:
     for example_name, prompt in advanced_prompts.items():
         print(f"\n{example_name} 고급 뉘앙스 프롬프트:\n{prompt}\n")
         
-        print("응답 생성 중...")
-        result = get_completion(prompt, temperature=0.7)
-        print(f"\n✅ {example_name} 고급 뉘앙스 프롬프트 응답이 생성되었습니다.")
-        
         results["advanced_experiments"].append({
             "example": example_name,
             "prompt": prompt,
-            "result": result
+            "result": ""
         })
+        pending.append((results["advanced_experiments"][-1], f"{example_name} 고급 뉘앙스 프롬프트"))
+    
+    # 선택한 모든 실험의 프롬프트를 한 번에 동시 요청
+    print(f"\n응답 생성 중... ({len(pending)}개 프롬프트 동시 요청)")
+    # 완료된 응답은 저널에 기록해 중단되어도 다시 실행하면 남은 요청만 보냄
+    with experiment_journal("8.3.3_nuance", topic) as journal:
+        completions = get_completions(
+            [exp["prompt"] for exp, _ in pending],
+            temperature=0.7,
+            journal=journal,
+            on_result=lambda item: print_completion_status(pending[item['index']][1], item)
+        )
+    
+    for (exp, _), item in zip(pending, completions):
+        exp["result"] = get_result_text(item)
     
     # 결과 비교 표시
     print_step(6, "실험 결과 비교")
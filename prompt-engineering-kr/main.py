@@ -93,10 +93,16 @@ COURSE_PARTS = [
      "description": "AI의 책임감 있는 활용과 학문적 진실성 유지"}
 ]
 
-def parse_arguments():
+# 파트/섹션 ID -> 정보 (조회할 때마다 COURSE_PARTS를 훑지 않도록 한 번만 구성)
+PARTS_BY_ID = {part["part_id"]: part for part in COURSE_PARTS}
+
+def parse_arguments(argv: Optional[List[str]] = None):
     """
     명령줄 인자 파싱
     
+    Args:
+        argv: 파싱할 인자 목록 (없으면 sys.argv)
+        
     Returns:
         파싱된 인자
     """
@@ -108,13 +114,34 @@ def parse_arguments():
                         help='사용 가능한 파트 및 섹션 목록 표시')
     parser.add_argument('--config', action='store_true', 
                         help='설정 파일 확인 및 수정')
+    parser.add_argument('--headless', nargs='?', const='all', metavar='SCRIPT',
+                        help='질문 없이 실행: 입력 스크립트(JSON/YAML) 또는 all (모든 주제 옵션, --run과 함께 쓰면 해당 파트/섹션만)')
+    parser.add_argument('--run-all', action='store_true',
+                        help='모든 실습 파일을 프로세스별로 동시에 무인 실행 (--run과 함께 쓰면 해당 파트/섹션만)')
+    parser.add_argument('--workers', type=int,
+                        help='--run-all에서 동시에 실행할 프로세스 수 (기본값: run_all.workers 설정)')
+    parser.add_argument('--timeout', type=float,
+                        help='--run-all에서 실습별 제한 시간 (초, 기본값: run_all.timeout 설정)')
+    parser.add_argument('--serve', action='store_true',
+                        help='상주 서버 실행 (클라이언트, 캐시, 실습 모듈을 메모리에 유지)')
+    parser.add_argument('--connect', action='store_true',
+                        help='나머지 옵션을 상주 서버에서 실행 (예: --connect --run 1.1)')
+    parser.add_argument('--shutdown', action='store_true',
+                        help='--connect와 함께 사용: 실행 중인 상주 서버 종료')
+    parser.add_argument('--socket', type=str,
+                        help='상주 서버 소켓 경로 (기본값: daemon.socket_path 설정 또는 임시 폴더)')
+    # --run-all이 실습마다 띄우는 작업 프로세스용 (직접 사용하지 않음)
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--report-file', help=argparse.SUPPRESS)
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 def list_parts():
     """
     사용 가능한 파트 및 섹션 목록 표시
     """
+    from utils.manifest import get_children, get_entry
+    
     print("\n===== 프롬프트 엔지니어링 교안 목차 =====\n")
     
     current_main_part = None
@@ -137,6 +164,11 @@ def list_parts():
             print(f"  ● {part_id}: {title}")
             if description:
                 print(f"    - {description}")
+            
+            # 하위 섹션 실습 파일 (실습 목록에서 조회)
+            for sub_id in get_children(part_id):
+                entry = get_entry(sub_id)
+                print(f"      ▸ {sub_id}: {entry.get('title') or os.path.basename(entry['path'])}")
     
     print("\n실행 방법: python main.py --run <파트ID 또는 섹션ID>")
 
@@ -145,27 +177,23 @@ def run_exercise(part_id: str):
     특정 파트 또는 섹션의 실습 코드 실행
     
     Args:
-        part_id: 실행할 파트 또는 섹션 ID (예: "1", "1.2")
+        part_id: 실행할 파트 또는 섹션 ID (예: "1", "1.2", "8.3.1")
     """
-    # 파트/섹션 유효성 검사
-    valid_parts = [p["part_id"] for p in COURSE_PARTS]
-    if part_id not in valid_parts:
+    from utils.manifest import get_children, get_entry
+    
+    # 파트/섹션 정보 찾기 (하위 섹션은 교안 목차에 없으므로 실습 목록에서 찾음)
+    part_info = PARTS_BY_ID.get(part_id)
+    if not part_info and get_entry(part_id) is None:
         print(f"오류: '{part_id}'를 찾을 수 없습니다.")
         print("사용 가능한 파트 및 섹션 목록을 확인하려면 --list 옵션을 사용하세요.")
         return
     
-    # 파트/섹션 정보 찾기
-    part_info = next((p for p in COURSE_PARTS if p["part_id"] == part_id), None)
-    if not part_info:
-        print(f"오류: '{part_id}' 정보를 찾을 수 없습니다.")
-        return
-    
-    # 메인 파트인 경우 (예: "1", "2") - 해당 파트의 모든 섹션 실행
-    if len(part_id) == 1:
+    # 메인 파트인 경우 (예: "1", "2") - 해당 파트의 첫 번째 섹션 실행
+    if "." not in part_id:
         print(f"\n===== Part {part_id}: {part_info['title']} =====\n")
         
         # 해당 파트의 모든 섹션 찾기
-        sections = [p for p in COURSE_PARTS if p["part_id"].startswith(f"{part_id}.")]
+        sections = get_children(part_id)
         
         if not sections:
             print(f"이 파트에 실행 가능한 섹션이 없습니다.")
@@ -173,88 +201,194 @@ def run_exercise(part_id: str):
         
         # 첫 번째 섹션만 실행 (또는 사용자 선택 가능)
         first_section = sections[0]
-        print(f"섹션 {first_section['part_id']}: {first_section['title']}을(를) 실행합니다.\n")
-        run_section_exercise(first_section["part_id"])
+        print(f"섹션 {first_section}: {get_section_title(first_section)}을(를) 실행합니다.\n")
+        run_section_exercise(first_section)
     
-    # 섹션인 경우 (예: "1.1", "2.3") - 해당 섹션 실행
+    # 섹션 또는 하위 섹션인 경우 (예: "1.1", "2.3", "8.3.1") - 해당 실습 실행
     else:
         run_section_exercise(part_id)
 
+def get_section_title(section_id: str) -> str:
+    """
+    섹션/하위 섹션 제목 (교안 목차에 없으면 실습 파일에서 읽은 제목)
+    
+    Args:
+        section_id: 섹션 ID
+        
+    Returns:
+        제목
+    """
+    from utils.manifest import get_entry
+    
+    if section_id in PARTS_BY_ID:
+        return PARTS_BY_ID[section_id]["title"]
+    entry = get_entry(section_id)
+    return (entry and entry.get("title")) or section_id
+
 def run_section_exercise(section_id: str):
     """
     특정 섹션의 실습 코드 실행
     
     Args:
-        section_id: 실행할 섹션 ID (예: "1.2")
+        section_id: 실행할 섹션 ID (예: "1.2", "8.3.1")
     """
-    # 섹션 정보 찾기
-    section_info = next((p for p in COURSE_PARTS if p["part_id"] == section_id), None)
-    if not section_info:
-        print(f"오류: 섹션 '{section_id}' 정보를 찾을 수 없습니다.")
+    script_path = find_section_script(section_id)
+    if script_path is None:
         return
     
-    main_part = section_id.split(".")[0]
-    
-    # 스크립트 파일 경로 구성
-    script_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        "exercises",
-        f"part{main_part}",
-        section_id,
-        f"{section_id}_{section_info['title'].lower().replace(' ', '_').replace('-', '_')}.py"
-    )
-    
-    # 파일 존재 확인
-    if not os.path.exists(script_path):
-        # 섹션의 모든 파일 경로 체크
-        section_dir = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            "exercises",
-            f"part{main_part}",
-            section_id
-        )
-        
-        # 디렉토리는 있지만 파일이 없는 경우
-        files = os.listdir(section_dir)
-        if not files:
-            print(f"오류: 실행할 파일이 없습니다. 섹션 {section_id} 디렉토리가 비어 있습니다.")
-            return
+    # 스크립트 실행
+    print(f"\n===== 섹션 {section_id}: {get_section_title(section_id)} =====\n")
+    run_script(script_path)
+
+def find_section_script(section_id: str) -> Optional[str]:
+    """
+    섹션의 실습 파일 경로 찾기 (실습 목록 조회, 폴더는 훑지 않음)
+    
+    Args:
+        section_id: 섹션/하위 섹션 ID (예: "1.2", "8.3.1")
         
-        # 첫 번째 파일 선택 (또는 특정 패턴 매칭)
-        for file in files:
-            if file.startswith(f"{section_id}_") and file.endswith(".py"):
-                script_path = os.path.join(section_dir, file)
-                break
-        else:
-            print(f"오류: 섹션 {section_id}에 적합한 실행 파일을 찾을 수 없습니다.")
-            return
+    Returns:
+        실습 파일 경로 (찾지 못하면 오류를 출력하고 None)
+    """
+    from utils.manifest import get_entry, PROJECT_ROOT
     
-    # 스크립트 실행
-    print(f"\n===== 섹션 {section_id}: {section_info['title']} =====\n")
+    entry = get_entry(section_id)
+    if entry is None:
+        print(f"오류: 섹션 {section_id}에 적합한 실행 파일을 찾을 수 없습니다.")
+        return None
+    if not entry["has_main"]:
+        print(f"주의: '{os.path.basename(entry['path'])}' 파일에 main() 함수가 없습니다.")
+    return os.path.join(PROJECT_ROOT, entry["path"])
+
+def run_script(script_path: str) -> bool:
+    """
+    실습 파일을 불러와 main() 실행
     
-    try:
-        # 상대 경로에서 모듈 import 문제 방지를 위해 해당 디렉토리로 이동
-        original_dir = os.getcwd()
-        script_dir = os.path.dirname(script_path)
-        os.chdir(script_dir)
+    Args:
+        script_path: 실습 파일 경로
         
-        # 스크립트 파일 이름 추출 (.py 제거)
-        script_name = os.path.basename(script_path).replace('.py', '')
-        sys.path.insert(0, script_dir)
+    Returns:
+        오류 없이 실행했는지 여부
+    """
+    from utils.exercise_loader import load_exercise
+    
+    # 작업 디렉토리나 sys.path를 바꾸지 않고 파일 위치로 직접 불러와 실행
+    # (같은 내용의 파일은 이전에 불러온 모듈을 재사용)
+    try:
+        module = load_exercise(script_path)
+        if not hasattr(module, 'main'):
+            print(f"주의: '{os.path.basename(script_path)}' 모듈에 main() 함수가 없습니다.")
+            return False
+        module.main()
+    except Exception as e:
+        print(f"스크립트 실행 중 오류 발생: {e}")
+        return False
+    return True
+
+def run_headless(source: str, part_id: Optional[str] = None) -> int:
+    """
+    질문 없이 실습 실행 (입력 스크립트 또는 모든 주제 옵션)
+    
+    Args:
+        source: 입력 스크립트 경로 또는 "all"
+        part_id: 실행할 파트/섹션 ID (없으면 스크립트 전체 또는 모든 섹션)
         
-        try:
-            # 동적으로 모듈 import 및 main 함수 실행
-            module = __import__(script_name)
-            if hasattr(module, 'main'):
-                module.main()
+    Returns:
+        실패한 주제 수 (스크립트를 읽지 못하면 1)
+    """
+    import io
+    from utils.console import redirect_input
+    from utils.headless import load_script, headless_scope, print_plan_report
+    
+    try:
+        script = load_script(source)
+    except (OSError, ValueError) as e:
+        print(f"오류: 무인 실행 스크립트를 읽을 수 없습니다: {e}")
+        return 1
+    
+    in_part = lambda section_id: (part_id is None or section_id == part_id
+                                  or section_id.startswith(f"{part_id}."))
+    entries = script["exercises"]
+    if entries is None:
+        from utils.manifest import iter_entries
+        entries = [{"section": entry["id"], "file": None, "plan": dict(script["defaults"], results=[])}
+                   for entry in iter_entries(part_id)]
+    else:
+        entries = [entry for entry in entries if entry["file"] or in_part(entry["section"])]
+    if not entries:
+        print("오류: 실행할 실습이 없습니다.")
+        return 1
+    
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    plans = []
+    # 질문에 답할 수 없는 input() 호출이 멈춰 있지 않도록 빈 입력으로 대체
+    with redirect_input(io.StringIO()):
+        for entry in entries:
+            if entry["file"]:
+                script_path = os.path.join(project_dir, entry["file"])
+                name = os.path.basename(script_path)
+                if not os.path.exists(script_path):
+                    print(f"오류: 실습 파일 '{entry['file']}'을(를) 찾을 수 없습니다.")
+                    continue
             else:
-                print(f"주의: '{script_name}' 모듈에 main() 함수가 없습니다.")
-        finally:
-            # 원래 디렉토리로 복원
-            os.chdir(original_dir)
+                script_path = find_section_script(entry["section"])
+                if script_path is None:
+                    continue
+                name = f"{entry['section']} {get_section_title(entry['section'])}"
             
-    except Exception as e:
-        print(f"스크립트 실행 중 오류 발생: {e}")
+            print(f"\n===== 무인 실행: {name} =====\n")
+            with headless_scope(entry["plan"]):
+                run_script(script_path)
+            plans.append((name, entry["plan"]))
+    
+    return print_plan_report(plans)
+
+def run_all(part_id: Optional[str] = None, workers: Optional[int] = None,
+            timeout: Optional[float] = None) -> int:
+    """
+    모든 실습 파일(또는 특정 파트/섹션의 실습 파일)을 프로세스별로 동시에 무인 실행
+    
+    Args:
+        part_id: 실행할 파트/섹션 ID (없으면 전체)
+        workers: 동시에 실행할 프로세스 수 (없으면 run_all.workers 설정)
+        timeout: 실습별 제한 시간 (초, 없으면 run_all.timeout 설정)
+        
+    Returns:
+        성공하지 못한 실습 수
+    """
+    import time
+    from utils.exercise_runner import discover_exercises, run_exercises, print_run_report
+    
+    exercises = discover_exercises(part_id)
+    if not exercises:
+        print(f"오류: '{part_id}'에 해당하는 실습 파일이 없습니다.")
+        return 1
+    
+    start = time.perf_counter()
+    results = run_exercises(exercises, workers=workers, timeout=timeout)
+    return print_run_report(results, time.perf_counter() - start)
+
+def run_worker(script_path: str, report_path: Optional[str] = None) -> bool:
+    """
+    --run-all의 작업 프로세스: 실습 하나를 무인 실행하고 결과 보고서 저장
+    
+    Args:
+        script_path: 실습 파일 경로
+        report_path: 보고서(JSON) 경로 (없으면 저장하지 않음)
+        
+    Returns:
+        실습 파일을 오류 없이 실행했는지 여부
+    """
+    from utils.headless import make_plan, headless_scope
+    
+    plan = make_plan()
+    with headless_scope(plan):
+        succeeded = run_script(os.path.abspath(script_path))
+    
+    if report_path:
+        from utils.exercise_runner import write_worker_report
+        write_worker_report(report_path, plan)
+    return succeeded
 
 def edit_config():
     """
@@ -324,20 +458,30 @@ def edit_config():
         print("오류: utils.config 모듈을 불러올 수 없습니다.")
         print("설정 관련 기능을 사용하려면 필요한 모듈을 설치하세요.")
 
-def main():
+def execute(args, cwd: Optional[str] = None) -> int:
     """
-    메인 함수
+    파싱된 인자에 따른 동작 수행 (직접 실행과 상주 서버가 공유)
+    
+    Args:
+        args: parse_arguments 결과
+        cwd: 상대 경로 인자의 기준 폴더 (상주 서버에서는 클라이언트의 작업 디렉토리)
+        
+    Returns:
+        종료 코드
     """
-    # 명령줄 인자 파싱
-    args = parse_arguments()
+    if args.headless and args.headless != "all" and cwd:
+        args.headless = os.path.join(cwd, args.headless)
     
-    # 인자에 따른 동작 수행
-    if args.setup:
-        setup_project()
+    if args.worker:
+        return 0 if run_worker(args.worker, args.report_file) else 1
     elif args.list:
         list_parts()
     elif args.config:
         edit_config()
+    elif args.run_all:
+        return 1 if run_all(args.run, args.workers, args.timeout) else 0
+    elif args.headless:
+        return 1 if run_headless(args.headless, args.run) else 0
     elif args.run:
         run_exercise(args.run)
     else:
@@ -347,6 +491,70 @@ def main():
         print("  python main.py --list        # 목차 및 가용 파트 표시")
         print("  python main.py --run 1.2     # 특정 파트/섹션 실행")
         print("  python main.py --config      # 설정 확인 및 수정")
+        print("  python main.py --headless    # 질문 없이 모든 주제 옵션 실행 (스크립트 파일 지정 가능)")
+        print("  python main.py --run-all     # 모든 실습 파일을 프로세스별로 동시에 실행")
+        print("  python main.py --serve       # 상주 서버 실행 (이후 --connect --run 1.2 처럼 빠르게 실행)")
+    return 0
+
+def serve_command(argv: List[str], cwd: str) -> int:
+    """
+    상주 서버가 받은 명령 실행
+    
+    Args:
+        argv: 클라이언트가 보낸 명령줄 인자
+        cwd: 클라이언트의 작업 디렉토리
+        
+    Returns:
+        종료 코드
+    """
+    args = parse_arguments(argv)
+    if args.serve or args.connect or args.worker:
+        print("오류: 상주 서버에서는 --serve, --connect 옵션을 사용할 수 없습니다.")
+        return 1
+    return execute(args, cwd)
+
+def strip_client_options(argv: List[str]) -> List[str]:
+    """
+    상주 서버로 보낼 인자 목록 (클라이언트 전용 옵션 제거)
+    
+    Args:
+        argv: 명령줄 인자
+        
+    Returns:
+        --connect, --shutdown, --socket을 뺀 인자 목록
+    """
+    forwarded = []
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg in ("--connect", "--shutdown"):
+            continue
+        elif arg == "--socket":
+            skip_value = True
+        elif not arg.startswith("--socket="):
+            forwarded.append(arg)
+    return forwarded
+
+def main():
+    """
+    메인 함수
+    """
+    # 명령줄 인자 파싱
+    args = parse_arguments()
+    
+    # 상주 서버 실행 / 상주 서버에 명령 전달 (클라이언트는 utils의 무거운 모듈을 불러오지 않음)
+    if args.serve:
+        from utils.daemon import serve
+        sys.exit(serve(serve_command, args.socket))
+    if args.connect:
+        from utils.daemon import run_client
+        sys.exit(run_client(strip_client_options(sys.argv[1:]), args.socket, shutdown=args.shutdown))
+    
+    # 인자에 따른 동작 수행
+    code = execute(args)
+    if code:
+        sys.exit(code)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
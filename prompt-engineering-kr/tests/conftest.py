@@ -0,0 +1,54 @@
+"""
+테스트 공통 설정
+
+프로젝트 루트를 경로에 추가하고, 테스트마다 설정을 메모리에서만 바꿨다가
+원래대로 되돌리는 fixture를 제공합니다. (config.json 파일은 바꾸지 않음)
+"""
+
+import copy
+import os
+import sys
+
+import pytest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+
+def _reset_shared_state() -> None:
+    """설정으로 만든 공유 객체(응답 캐시, 카세트, 모의 서비스, 클라이언트) 폐기"""
+    from utils.ai_client import clear_client_registry
+    from utils.cassette import reset_cassette
+    from utils.mock_provider import reset_mock_provider
+    from utils.response_cache import reset_response_cache
+
+    reset_response_cache()
+    reset_cassette()
+    reset_mock_provider()
+    clear_client_registry()
+
+
+@pytest.fixture
+def config(tmp_path):
+    """
+    테스트 동안 사용할 설정 딕셔너리
+
+    응답 캐시, 카세트, 원격 측정 파일은 임시 폴더를 사용하고 모의 서비스는 지연 없이 동작합니다.
+    """
+    from utils.config import load_config
+
+    settings = load_config()
+    saved = copy.deepcopy(settings)
+    settings["cache"] = dict(settings.get("cache", {}), enabled=True,
+                             path=str(tmp_path / "responses.sqlite3"))
+    settings["cassette"] = dict(settings.get("cassette", {}), mode="off")
+    settings["telemetry"] = dict(settings.get("telemetry", {}), sinks=["memory"])
+    settings["mock"] = {"backend": "inprocess"}
+    _reset_shared_state()
+    try:
+        yield settings
+    finally:
+        settings.clear()
+        settings.update(saved)
+        _reset_shared_state()
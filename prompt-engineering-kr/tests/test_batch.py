@@ -0,0 +1,113 @@
+"""일괄 처리 작업 테스트 (모의 서버의 일괄 처리 프로토콜로 제출, 이어받기, 시간 초과 확인)"""
+
+import json
+
+import pytest
+
+from utils.ai_client import AIClient
+from utils.batch import BatchJob
+from utils.errors import APITimeoutError
+from utils.mock_server import MockAPIServer
+
+MOCK_API_KEY = "mock-key"
+
+REQUEST_COUNT = 6
+
+
+@pytest.fixture
+def batch_config(config):
+    """상태 확인 간격과 재시도 대기 시간을 줄인 설정"""
+    config["batch"] = {"poll_interval": 0.02, "max_poll_interval": 0.1}
+    config["retry"] = {"base_delay": 0.01, "max_delay": 0.05, "verbose": False}
+    return config
+
+
+def _submit(client: AIClient, name: str, state_dir: str) -> BatchJob:
+    job = client.batch(name, state_dir)
+    for i in range(REQUEST_COUNT):
+        job.add(f"req-{i}", f"일괄 처리 요청 {i}", max_tokens=32)
+    job.submit()
+    return job
+
+
+def _saved_ids(job: BatchJob):
+    """결과 파일에 저장된 custom_id 목록 (잘린 줄은 건너뜀)"""
+    ids = []
+    with open(job.results_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                ids.append(json.loads(line)["custom_id"])
+            except json.JSONDecodeError:
+                continue
+    return ids
+
+
+@pytest.mark.parametrize("wire_format", ["openai", "anthropic"])
+def test_submit_and_wait(batch_config, tmp_path, wire_format):
+    with MockAPIServer(batch_delay=0.1) as server:
+        client = AIClient(api_key=MOCK_API_KEY, service=wire_format, base_url=server.get_endpoint(wire_format))
+        job = _submit(client, f"wait-{wire_format}", str(tmp_path))
+        assert job.status != "pending"
+        results = job.wait(timeout=10)
+
+    assert sorted(results) == sorted(f"req-{i}" for i in range(REQUEST_COUNT))
+    assert all(result["response"] and result["error"] is None for result in results.values())
+    assert job.is_finished()
+    with open(job.state_path, "r", encoding="utf-8") as f:
+        assert json.load(f)["batch_id"] == job.batch_id
+
+
+@pytest.mark.parametrize("wire_format", ["openai", "anthropic"])
+def test_resume_skips_received_results(batch_config, tmp_path, wire_format):
+    with MockAPIServer(batch_delay=0.1) as server:
+        client = AIClient(api_key=MOCK_API_KEY, service=wire_format, base_url=server.get_endpoint(wire_format))
+        job = _submit(client, f"resume-{wire_format}", str(tmp_path))
+
+        # 절반만 받고 멈춘 뒤, 결과 파일의 마지막 줄이 쓰는 도중 잘린 상황
+        results = job.iter_results(timeout=10)
+        first = [next(results)["custom_id"] for _ in range(REQUEST_COUNT // 2)]
+        results.close()
+        with open(job.results_path, "a", encoding="utf-8") as f:
+            f.write('{"custom_id": "req-')
+
+        # 프로세스를 다시 시작한 것처럼 상태 파일에서 불러와 이어받기
+        resumed = BatchJob.resume(job.name, str(tmp_path), client=client)
+        assert resumed.batch_id == job.batch_id
+        requests_before = server.request_count
+        results = resumed.wait(timeout=10)
+        # 작업을 다시 제출하지 않음 (POST 요청만 서버 요청 수에 포함됨)
+        assert server.request_count == requests_before
+
+    assert sorted(results) == sorted(f"req-{i}" for i in range(REQUEST_COUNT))
+    saved = _saved_ids(resumed)
+    assert saved[:len(first)] == first
+    assert sorted(saved) == sorted(results)
+
+    # 모두 받은 뒤에는 서버 없이 결과 파일만으로 반환
+    assert BatchJob.resume(job.name, str(tmp_path), client=client).wait() == results
+
+
+def test_wait_times_out(batch_config, tmp_path):
+    with MockAPIServer(batch_delay=30) as server:
+        client = AIClient(api_key=MOCK_API_KEY, service="openai", base_url=server.get_endpoint("openai"))
+        job = _submit(client, "timeout", str(tmp_path))
+        with pytest.raises(APITimeoutError):
+            job.wait(timeout=0.2)
+        assert job.status == "in_progress"
+
+
+def test_mock_service_uses_local_batch_server(batch_config, tmp_path):
+    # inprocess 모의 백엔드에는 일괄 처리 엔드포인트가 없으므로 공유 로컬 모의 서버로 대신 처리
+    batch_config["mock"] = {"backend": "inprocess", "batch_delay": 0.1,
+                            "error_rate": 0.3, "error_status": 503, "seed": 0}
+    client = AIClient(service="mock")
+    assert client.mock_inprocess
+    job = _submit(client, "mock", str(tmp_path))
+    results = job.wait(timeout=10)
+
+    assert len(results) == REQUEST_COUNT
+    failed = [result for result in results.values() if result["error"]]
+    # seed 0, error_rate 0.3이면 일부 요청이 실패함 (실패한 요청은 오류 메시지만 있음)
+    assert failed
+    assert all(result["response"] is None and "503" in result["error"] for result in failed)
+    assert all(result["response"] for result in results.values() if not result["error"])
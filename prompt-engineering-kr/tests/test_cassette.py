@@ -0,0 +1,81 @@
+"""카세트 테스트 (모의 서버 응답을 기록한 뒤 서버 없이 재생)"""
+
+import json
+
+import pytest
+
+from utils.ai_client import AIClient
+from utils.cassette import MODE_ENV, PATH_ENV, Cassette, reset_cassette
+from utils.errors import CassetteMissError
+from utils.mock_server import MockAPIServer
+
+MOCK_API_KEY = "mock-key"
+
+PROMPTS = ["카세트 요청 1", "카세트 요청 2", "카세트 요청 3"]
+
+
+@pytest.fixture
+def cassette_config(config, tmp_path, monkeypatch):
+    """임시 카세트 파일을 쓰는 설정 (환경 변수가 설정 파일보다 우선하지 않도록 제거)"""
+    monkeypatch.delenv(MODE_ENV, raising=False)
+    monkeypatch.delenv(PATH_ENV, raising=False)
+    config["cassette"] = {"mode": "off", "path": str(tmp_path / "test.jsonl")}
+    return config
+
+
+def _use_mode(config, mode: str) -> None:
+    config["cassette"]["mode"] = mode
+    reset_cassette()
+
+
+def test_replay_returns_recorded_responses_without_server(cassette_config):
+    _use_mode(cassette_config, "record")
+    with MockAPIServer() as server:
+        endpoint = server.get_endpoint("openai")
+        client = AIClient(api_key=MOCK_API_KEY, service="openai", base_url=endpoint)
+        recorded = [client.get_response(prompt, max_tokens=32) for prompt in PROMPTS]
+        streamed = "".join(client.get_response("스트리밍 카세트 요청", max_tokens=32, stream=True))
+        assert server.request_count == len(PROMPTS) + 1
+
+    # 서버가 종료되어 실제로 요청을 보내면 연결 오류가 발생함
+    _use_mode(cassette_config, "replay")
+    client = AIClient(api_key=MOCK_API_KEY, service="openai", base_url=endpoint)
+    assert [client.get_response(prompt, max_tokens=32) for prompt in PROMPTS] == recorded
+    assert client.get_response("스트리밍 카세트 요청", max_tokens=32) == streamed
+    assert "".join(client.get_response(PROMPTS[0], max_tokens=32, stream=True)) == recorded[0]
+
+
+def test_replay_miss_raises(cassette_config):
+    _use_mode(cassette_config, "record")
+    with MockAPIServer() as server:
+        client = AIClient(api_key=MOCK_API_KEY, service="openai", base_url=server.get_endpoint("openai"))
+        client.get_response(PROMPTS[0], max_tokens=32)
+
+    _use_mode(cassette_config, "replay")
+    # 생성 설정이 다르면 다른 요청으로 보고 재생하지 않음
+    with pytest.raises(CassetteMissError):
+        client.get_response(PROMPTS[0], max_tokens=64)
+    with pytest.raises(CassetteMissError):
+        client.get_response("기록하지 않은 요청", max_tokens=32)
+
+
+def test_index_picks_up_appended_entries_and_skips_partial_line(tmp_path):
+    path = str(tmp_path / "index.jsonl")
+    cassette = Cassette(path, "record")
+    cassette.record("a", {}, "응답 a", 0.1)
+    assert cassette.lookup("a")["response"] == "응답 a"
+    cassette.close()
+
+    # 색인 파일을 만든 뒤 다른 프로세스가 항목을 추가하고, 마지막 줄은 쓰는 도중 끊긴 상황
+    cassette = Cassette(path, "record")
+    cassette.record("b", {}, "응답 b", 0.1)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"key": "c", "response": "응답 c"}, ensure_ascii=False)[:10])
+
+    replay = Cassette(path, "replay")
+    assert replay.replay("a")["response"] == "응답 a"
+    assert replay.replay("b")["response"] == "응답 b"
+    with pytest.raises(CassetteMissError):
+        replay.replay("c")
+    assert replay.stats == {"recorded": 0, "replayed": 2, "misses": 1}
+    replay.close()
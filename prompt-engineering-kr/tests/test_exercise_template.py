@@ -0,0 +1,90 @@
+"""실습 템플릿 테스트 (부가 기능 오류가 실습을 중단시키지 않는지 확인)"""
+
+import builtins
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils import exercise_template
+from utils.errors import AIClientError
+
+
+def _raise_locked(prompt, **kwargs):
+    raise sqlite3.OperationalError("database is locked")
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_pending_completion_converts_other_errors(monkeypatch, stream):
+    monkeypatch.setattr(exercise_template, "get_completion", _raise_locked)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = exercise_template.PendingCompletion(executor, "프롬프트", stream=stream)
+        with pytest.raises(AIClientError, match="OperationalError"):
+            pending.result()
+
+
+def test_run_exercise_reports_failure_instead_of_crashing(monkeypatch, capsys):
+    monkeypatch.setattr(exercise_template, "get_completion", _raise_locked)
+    monkeypatch.setattr(builtins, "input", lambda prompt="": "")
+    exercise_template.run_exercise(
+        "테스트 실습", {"1": "테스트 주제"},
+        lambda topic: f"{topic}?", lambda topic, purpose, output_format: f"{topic}!",
+        {}, [], stream=False
+    )
+    assert "응답을 생성하지 못했습니다" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_finished_at_is_set_when_result_returns(monkeypatch, stream):
+    class Response(list):
+        text = "응답"
+        metrics = {}
+
+    monkeypatch.setattr(exercise_template, "get_completion",
+                        lambda prompt, **kwargs: Response(["응답"]) if kwargs.get("stream") else "응답")
+    monkeypatch.setattr(exercise_template, "print_stream_metrics", lambda response: None)
+    switch_interval = sys.getswitchinterval()
+    # 스레드 전환을 잦게 하여 result()가 완료 직후 바로 돌아오는 상황을 자주 만듦
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for _ in range(200):
+                pending = exercise_template.PendingCompletion(executor, "프롬프트", stream=stream)
+                pending.result()
+                assert pending.finished_at is not None
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_interrupted_exercise_stops_other_request(monkeypatch):
+    received = []
+
+    class SlowStream:
+        text = ""
+        metrics = {}
+
+        def __iter__(self):
+            for i in range(100):
+                time.sleep(0.01)
+                received.append(i)
+                yield "조각"
+
+    def fake_completion(prompt, **kwargs):
+        if prompt.endswith("?"):
+            raise KeyboardInterrupt
+        return SlowStream()
+
+    monkeypatch.setattr(exercise_template, "get_completion", fake_completion)
+    monkeypatch.setattr(builtins, "input", lambda prompt="": "")
+    # 기본 프롬프트 응답을 기다리다 Ctrl-C로 중단한 상황
+    with pytest.raises(KeyboardInterrupt):
+        exercise_template.run_exercise(
+            "테스트 실습", {"1": "테스트 주제"},
+            lambda topic: f"{topic}?", lambda topic, purpose, output_format: f"{topic}!",
+            {}, [], stream=True
+        )
+    time.sleep(0.5)
+    # 향상된 프롬프트의 스트리밍 응답은 끝까지(1초) 받지 않고 바로 멈춤
+    assert len(received) < 10
@@ -0,0 +1,69 @@
+"""무인 실행 테스트 (주제별 소요 시간과 주제별 오류 처리)"""
+
+import time
+
+import pytest
+
+from utils import exercise_template
+from utils.headless import make_plan
+
+TOPICS = {"1": "주제 A", "2": "주제 B", "3": "주제 C"}
+
+
+def _run(monkeypatch, tmp_path, plan):
+    def slow_completion(prompt, **kwargs):
+        time.sleep(0.2)
+        return f"응답: {prompt}"
+
+    def save_results(topic, *args):
+        if topic == "주제 B":
+            raise OSError("디스크가 가득 찼습니다")
+
+    monkeypatch.setattr(exercise_template, "get_completion", slow_completion)
+    monkeypatch.setattr(exercise_template, "save_results", save_results)
+    monkeypatch.setattr(exercise_template, "get_chapter_save_path", lambda calling_file: str(tmp_path))
+    return exercise_template.run_exercise_headless(
+        "테스트 실습", TOPICS, lambda topic: topic, lambda topic, purpose, output_format: topic,
+        str(tmp_path / "1.1_test.py"), plan
+    )
+
+
+def test_elapsed_is_measured_per_topic(monkeypatch, tmp_path):
+    plan = make_plan(max_concurrency=6, save=False)
+    start = time.perf_counter()
+    results = _run(monkeypatch, tmp_path, plan)
+    wall = time.perf_counter() - start
+    # 모든 요청이 동시에 진행되므로 주제별 시간은 요청 하나 정도이고 뒤 주제로 갈수록 늘어나지 않음
+    for result in results:
+        assert 0.15 < result["elapsed"] < 0.4
+    assert plan["elapsed"] >= max(result["elapsed"] for result in results)
+    assert plan["elapsed"] <= wall
+
+
+def test_one_topic_failure_does_not_stop_the_plan(monkeypatch, tmp_path):
+    plan = make_plan(max_concurrency=6, save=True)
+    results = _run(monkeypatch, tmp_path, plan)
+    assert [result["topic"] for result in results] == ["주제 A", "주제 B", "주제 C"]
+    assert results[0]["error"] is None and results[2]["error"] is None
+    assert results[1]["error"] == "OSError: 디스크가 가득 찼습니다"
+    assert plan["results"] == results
+
+
+def test_interrupt_does_not_start_queued_topics(monkeypatch, tmp_path):
+    prompts = []
+
+    def interrupted_completion(prompt, **kwargs):
+        prompts.append(prompt)
+        time.sleep(0.05)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(exercise_template, "get_completion", interrupted_completion)
+    plan = make_plan(max_concurrency=1, save=False)
+    with pytest.raises(KeyboardInterrupt):
+        exercise_template.run_exercise_headless(
+            "테스트 실습", TOPICS, lambda topic: topic, lambda topic, purpose, output_format: topic,
+            str(tmp_path / "1.1_test.py"), plan
+        )
+    time.sleep(0.1)
+    # 동시 1개이므로 첫 주제의 요청만 보내고, 대기 중이던 나머지 주제는 시작하지 않음
+    assert set(prompts) == {"주제 A"}
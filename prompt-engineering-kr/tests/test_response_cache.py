@@ -0,0 +1,154 @@
+"""응답 캐시 테스트 (여러 스레드에서 같은 SQLite 캐시를 사용할 때 잠금이 남지 않는지 확인)"""
+
+import threading
+import time
+
+from utils.ai_client import get_completion, get_completions
+from utils.response_cache import ResponseCache
+
+# 잠금 대기(SQLite timeout 30초)에 걸리지 않았다고 볼 수 있는 시간
+MAX_SECONDS = 5.0
+
+
+def _run_in_thread(func) -> None:
+    """새 스레드에서 func를 실행하고 발생한 예외를 다시 발생"""
+    errors = []
+
+    def target():
+        try:
+            func()
+        except Exception as e:  # 스레드 밖에서 확인하려고 보관
+            errors.append(e)
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if errors:
+        raise errors[0]
+
+
+def test_set_from_second_thread_is_not_blocked(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "cache.sqlite3"))
+    start = time.perf_counter()
+    _run_in_thread(lambda: cache.set("a", "응답 a"))
+    # 만료된 항목이 없어도 첫 스레드의 연결이 쓰기 잠금을 잡고 있으면 여기서 멈춤
+    _run_in_thread(lambda: cache.set("b", "응답 b"))
+    _run_in_thread(lambda: cache.set("c", "응답 c", ttl=0))
+    assert time.perf_counter() - start < MAX_SECONDS
+    assert cache.get("a") == "응답 a"
+    cache.close()
+
+
+def test_concurrent_writes_and_disk_hits(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "cache.sqlite3"), memory_entries=0)
+    start = time.perf_counter()
+    threads = [threading.Thread(target=cache.set, args=(f"key-{i}", f"응답 {i}")) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results = {}
+    readers = [threading.Thread(target=lambda i=i: results.update({i: cache.get(f"key-{i}")})) for i in range(8)]
+    for thread in readers:
+        thread.start()
+    for thread in readers:
+        thread.join()
+    assert time.perf_counter() - start < MAX_SECONDS
+    assert results == {i: f"응답 {i}" for i in range(8)}
+    assert cache.stats.as_dict()["disk_hits"] == 8
+    cache.close()
+
+
+def test_get_completion_from_two_threads_with_cache_enabled(config):
+    assert config["cache"]["enabled"]
+    start = time.perf_counter()
+    _run_in_thread(lambda: get_completion("첫 번째 스레드", provider="mock"))
+    _run_in_thread(lambda: get_completion("두 번째 스레드", provider="mock"))
+    assert time.perf_counter() - start < MAX_SECONDS
+
+
+def test_get_completions_with_cache_enabled(config):
+    start = time.perf_counter()
+    results = get_completions(["a", "b", "c"], provider="mock")
+    assert time.perf_counter() - start < MAX_SECONDS
+    assert [result["error"] for result in results] == [None, None, None]
+    # 같은 요청을 다시 보내면 캐시에서 응답
+    again = get_completions(["a", "b", "c"], provider="mock")
+    assert [result["response"] for result in again] == [result["response"] for result in results]
+
+
+def test_locked_database_falls_back_without_raising(tmp_path, monkeypatch):
+    import sqlite3
+    from utils import response_cache
+
+    monkeypatch.setattr(response_cache, "_BUSY_TIMEOUT", 0.1)
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(path=path, memory_entries=0)
+    # 다른 연결이 쓰기 잠금을 잡고 있는 상황
+    holder = sqlite3.connect(path)
+    holder.execute("BEGIN EXCLUSIVE")
+    try:
+        cache.set("a", "응답 a")
+        assert cache.get("a") is None
+    finally:
+        holder.rollback()
+        holder.close()
+    assert cache.stats.as_dict()["errors"] >= 1
+    cache.set("b", "응답 b")
+    assert cache.get("b") == "응답 b"
+    cache.close()
+
+
+def _disk_size(path: str) -> int:
+    """디스크 캐시에 실제로 저장된 전체 크기"""
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_writes_do_not_scan_whole_table(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "cache.sqlite3"), memory_entries=0)
+    statements = []
+    cache._connect().set_trace_callback(statements.append)
+    for i in range(100):
+        cache.set(f"key-{i}", f"응답 {i}")
+    # 크기 한도 확인은 누적 크기로 하고, 전체 합계는 주기적인 정리 때만 다시 계산
+    assert not [statement for statement in statements if "SUM(size)" in statement]
+    cache.close()
+
+
+def test_size_limit_keeps_recent_entries(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(path=path, memory_entries=0, max_bytes=2000)
+    value = "x" * 100
+    for i in range(100):
+        cache.set(f"key-{i}", value)
+    assert _disk_size(path) <= 2000
+    assert cache.get("key-0") is None
+    assert cache.get("key-99") == value
+    assert cache.stats.as_dict()["evictions"] >= 80
+    cache.close()
+
+
+def test_tracked_size_matches_disk(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(path=path, memory_entries=0)
+    cache.set("a", "짧은 응답")
+    cache.set("a", "같은 키를 더 긴 응답으로 덮어쓰기")
+    cache.set("b", "만료될 응답", ttl=0.01)
+    cache.set("c", "응답 c")
+    time.sleep(0.02)
+    assert cache.get("b") is None
+    assert cache._disk_bytes == _disk_size(path)
+    cache.close()
+
+    # 다시 열면 저장된 크기에서 시작
+    reopened = ResponseCache(path=path)
+    assert reopened._disk_bytes == _disk_size(path)
+    reopened.clear()
+    assert reopened._disk_bytes == 0
+    reopened.close()
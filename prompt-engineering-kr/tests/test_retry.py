@@ -0,0 +1,92 @@
+"""재시도 정책 테스트 (장애를 예약한 모의 서버로 Retry-After, 멱등성, 시간 한도 확인)"""
+
+import time
+
+import pytest
+
+from utils.ai_client import AIClient
+from utils.errors import RateLimitError, ServerError
+from utils.mock_server import MockAPIServer
+from utils.retry import get_retry_stats, reset_retry_stats
+
+MOCK_API_KEY = "mock-key"
+
+
+@pytest.fixture
+def retry_config(config):
+    """대기 시간을 줄이고 안내 메시지를 끈 재시도 설정"""
+    config["retry"] = {"max_attempts": 4, "base_delay": 0.01, "max_delay": 0.05,
+                       "max_elapsed": 10.0, "verbose": False}
+    reset_retry_stats()
+    return config
+
+
+def _client(server: MockAPIServer, service: str = "openai") -> AIClient:
+    return AIClient(api_key=MOCK_API_KEY, service=service, base_url=server.get_endpoint(service))
+
+
+def test_rate_limit_waits_for_retry_after(retry_config):
+    with MockAPIServer(retry_after=0.3) as server:
+        server.inject_faults(429)
+        start = time.perf_counter()
+        assert _client(server).get_response("Retry-After 확인", max_tokens=16)
+        elapsed = time.perf_counter() - start
+        assert server.request_count == 2
+
+    # 백오프 상한(max_delay 0.05초)보다 서버가 알려준 0.3초를 우선해야 함
+    assert elapsed >= 0.3
+    stats = get_retry_stats("openai")
+    assert stats["retries"] == 1
+    assert stats["wait_time"] >= 0.3
+
+
+def test_gives_up_when_retry_after_exceeds_max_elapsed(retry_config):
+    retry_config["retry"]["max_elapsed"] = 0.2
+    with MockAPIServer(retry_after=5) as server:
+        server.inject_faults(429)
+        start = time.perf_counter()
+        with pytest.raises(RateLimitError):
+            _client(server).get_response("시간 한도 확인", max_tokens=16)
+        elapsed = time.perf_counter() - start
+        assert server.request_count == 1
+
+    # 5초를 기다려도 한도 안에 끝날 수 없으므로 기다리지 않고 바로 포기
+    assert elapsed < 1.0
+    assert get_retry_stats("openai")["failures"] == 1
+
+
+def test_stops_after_max_attempts(retry_config):
+    with MockAPIServer() as server:
+        server.inject_faults(*[503] * 10)
+        with pytest.raises(ServerError):
+            _client(server).get_response("시도 횟수 확인", max_tokens=16)
+        assert server.request_count == 4
+
+
+def test_idempotent_request_retries_server_error(retry_config):
+    with MockAPIServer() as server:
+        server.inject_faults(500, "disconnect")
+        assert _client(server).get_response("멱등 요청 재시도", max_tokens=16)
+        assert server.request_count == 3
+
+
+def test_non_idempotent_request_is_not_retried_after_server_error(retry_config, tmp_path):
+    with MockAPIServer() as server:
+        job = _client(server, "anthropic").batch("no-retry", str(tmp_path))
+        job.add("req-0", "작업 생성 재시도 확인", max_tokens=16)
+        server.inject_faults(500)
+        # 서버가 이미 작업을 만들었을 수 있으므로 다시 보내면 중복 작업이 생길 수 있음
+        with pytest.raises(ServerError):
+            job.submit()
+        assert server.request_count == 1
+        assert job.batch_id is None
+
+
+def test_non_idempotent_request_retries_when_not_executed(retry_config, tmp_path):
+    with MockAPIServer() as server:
+        job = _client(server, "anthropic").batch("retry-429", str(tmp_path))
+        job.add("req-0", "처리되지 않은 요청 재시도 확인", max_tokens=16)
+        # 429/503은 서버가 요청을 처리하지 않았으므로 멱등하지 않아도 다시 보냄
+        server.inject_faults(429, 503)
+        assert job.submit()
+        assert server.request_count == 3
@@ -2,19 +2,47 @@
 프롬프트 엔지니어링 유틸리티 패키지
 
 다양한 AI 모델에 연결하고 프롬프트를 구성하는 기능을 제공합니다.
+하위 모듈은 이름을 처음 사용할 때 불러오므로 `import utils` 자체는 가볍습니다.
 """
 
-# 주요 클래스 및 함수 가져오기
-from .ai_client import AIClient, get_completion
-from .prompt_builder import PromptBuilder, add_role, add_examples
-from .file_handler import read_file, write_file, read_json, write_json, read_csv, write_csv, save_markdown
-from .response_formatter import format_response, extract_sections, extract_code_blocks
-from .config import load_config, get_setting, update_setting, get_api_key
+import importlib
+from typing import Any, List
+
+# 공개 이름 -> 정의된 하위 모듈
+_LAZY_EXPORTS = {
+    'AIClient': 'ai_client', 'get_completion': 'ai_client', 'get_completions': 'ai_client',
+    'get_client': 'ai_client', 'ChatSession': 'ai_client',
+    'PromptBuilder': 'prompt_builder', 'add_role': 'prompt_builder', 'add_examples': 'prompt_builder',
+    'read_file': 'file_handler', 'write_file': 'file_handler', 'read_json': 'file_handler',
+    'write_json': 'file_handler', 'read_csv': 'file_handler', 'write_csv': 'file_handler',
+    'save_markdown': 'file_handler',
+    'format_response': 'response_formatter', 'extract_sections': 'response_formatter',
+    'extract_code_blocks': 'response_formatter',
+    'load_config': 'config', 'get_setting': 'config', 'update_setting': 'config',
+    'get_api_key': 'config',
+    'AIClientError': 'errors', 'RateLimitError': 'errors', 'ServerError': 'errors',
+    'APIConnectionError': 'errors', 'APITimeoutError': 'errors',
+}
 
 __all__ = [
-    'AIClient', 'get_completion',
+    'AIClient', 'get_completion', 'get_completions', 'get_client', 'ChatSession',
     'PromptBuilder', 'add_role', 'add_examples',
     'read_file', 'write_file', 'read_json', 'write_json', 'read_csv', 'write_csv', 'save_markdown',
     'format_response', 'extract_sections', 'extract_code_blocks',
-    'load_config', 'get_setting', 'update_setting', 'get_api_key'
-]
\ No newline at end of file
+    'load_config', 'get_setting', 'update_setting', 'get_api_key',
+    'AIClientError', 'RateLimitError', 'ServerError', 'APIConnectionError', 'APITimeoutError'
+]
+
+
+def __getattr__(name: str) -> Any:
+    """공개 이름을 처음 사용할 때 하위 모듈을 불러와 반환 (이후에는 패키지 속성으로 캐시)"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,49 +4,477 @@ AI 모델 연결 및 응답 처리 모듈
 """
 
 import os
-import requests
 import json
-from typing import Dict, List, Any, Optional
-from dotenv import load_dotenv
+import contextvars
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
 
-# .env 파일 로드
-load_dotenv()
+from utils.config import get_setting, add_setting_listener, load_env
+from utils.http_pool import get_session, get_pool_setting, DEFAULT_POOL_SETTINGS
+from utils.cassette import Cassette, get_cassette
+from utils.errors import AIClientError, error_from_status, error_from_exception
+from utils.retry import RetryPolicy
+from utils.response_cache import ResponseCache, get_response_cache, make_cache_key
+from utils.singleflight import SingleFlight, get_async_singleflight
+from utils.streaming import StreamingResponse, iter_openai_deltas, iter_anthropic_deltas
+from utils.tokens import estimate_tokens, fit_request, get_token_setting
+from utils.telemetry import record_add, record_set, track_call, track_stream, current_record
 
-# Gemini API 사용을 위한 라이브러리 추가
+# 프로세스 간 파일 잠금 (Windows에서는 msvcrt 사용)
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    import fcntl
 except ImportError:
-    GEMINI_AVAILABLE = False
-    print("google-generativeai 라이브러리가 설치되어 있지 않습니다. Gemini 기능을 사용할 수 없습니다.")
-    print("설치하려면: pip install google-generativeai")
+    fcntl = None
+    import msvcrt
+
+# Gemini SDK(google-generativeai)는 import 비용이 크므로 Gemini를 처음 사용할 때 불러옴
+genai = None
+_gemini_import_checked = False
+_gemini_import_lock = threading.Lock()
+
+
+def _gemini_available() -> bool:
+    """Gemini 라이브러리를 불러오고 사용 가능 여부 반환 (처음 한 번만 시도)"""
+    global genai, _gemini_import_checked
+    
+    if not _gemini_import_checked:
+        with _gemini_import_lock:
+            if not _gemini_import_checked:
+                try:
+                    import google.generativeai as module
+                    genai = module
+                except ImportError:
+                    print("google-generativeai 라이브러리가 설치되어 있지 않습니다. Gemini 기능을 사용할 수 없습니다.")
+                    print("설치하려면: pip install google-generativeai")
+                _gemini_import_checked = True
+    return genai is not None
+
+
+def __getattr__(name: str) -> Any:
+    # 이전 버전과의 호환: GEMINI_AVAILABLE은 처음 조회할 때 라이브러리를 불러와 확인
+    if name == "GEMINI_AVAILABLE":
+        return _gemini_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# genai.configure는 전역 설정이므로 마지막으로 설정한 키를 기억해 중복 호출 방지
+_gemini_configured_key: Optional[str] = None
+_gemini_lock = threading.Lock()
+
+
+def _configure_gemini(api_key: str) -> None:
+    """Gemini API 키 설정 (키가 바뀐 경우에만 genai.configure 호출)"""
+    global _gemini_configured_key
+    
+    if _gemini_configured_key == api_key:
+        return
+    with _gemini_lock:
+        if _gemini_configured_key != api_key:
+            genai.configure(api_key=api_key)
+            _gemini_configured_key = api_key
+
+
+# 스레드 간 동일 요청 병합 (비동기 경로는 이벤트 루프별 객체 사용)
+_singleflight = SingleFlight()
+
+# 대화 요청용 예약 파라미터 (additional_params로 전달하며 API 파라미터에 그대로 넣지 않음)
+# - system_prompt: 시스템 프롬프트 (실제 system 역할로 전송)
+# - messages: 이전 대화 [{"role": "user" | "assistant", "content": 텍스트}, ...]
+# - prompt_cache: 변하지 않는 앞부분(시스템 프롬프트 + 이전 대화)에 프롬프트 캐시 표시
+CONVERSATION_PARAMS = ("system_prompt", "messages", "prompt_cache")
+
+# 현재 컨텍스트의 호출이 보고한 사용량을 받을 딕셔너리 (ChatSession이 설정)
+_usage_capture: contextvars.ContextVar = contextvars.ContextVar("ai_client_usage", default=None)
+
+
+def _split_conversation_params(additional_params: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """추가 파라미터를 (대화 예약 파라미터, 나머지 API 파라미터)로 분리"""
+    conversation, extra = {}, {}
+    for key, value in (additional_params or {}).items():
+        if key in CONVERSATION_PARAMS:
+            conversation[key] = value
+        else:
+            extra[key] = value
+    return conversation, extra
+
+
+def _cache_block(text: str, cache: bool) -> List[Dict[str, Any]]:
+    """Anthropic 텍스트 블록 (cache=True이면 여기까지를 프롬프트 캐시 구간으로 표시)"""
+    block: Dict[str, Any] = {"type": "text", "text": text}
+    if cache:
+        block["cache_control"] = {"type": "ephemeral"}
+    return [block]
+
+
+# asyncio, 비동기 HTTP 모듈, 모의 서비스 모듈은 import 비용을 줄이기 위해 사용하는 함수 안에서 불러옴
+
+# 이벤트 루프별 동시 요청 수 제한 세마포어
+_async_semaphores: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _get_async_semaphore() -> 'asyncio.Semaphore':
+    """현재 이벤트 루프에서 동시에 진행할 수 있는 요청 수를 제한하는 세마포어 반환"""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        limit = get_setting("http.max_concurrency", DEFAULT_POOL_SETTINGS["max_concurrency"])
+        semaphore = _async_semaphores[loop] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+# 요청 한도 기본 설정값 (설정 파일의 rate_limits 항목이 없을 때 사용)
+DEFAULT_RATE_LIMIT_SETTINGS = {
+    "enabled": True,        # 클라이언트 측 요청 한도 사용 여부
+    "shared_state": None    # 여러 프로세스가 한도를 공유할 상태 파일 경로 (없으면 프로세스 내에서만 공유)
+}
+
+
+@contextmanager
+def _locked_file(path: str):
+    """상태 파일 옆의 .lock 파일에 프로세스 간 배타적 잠금을 걸고 실행"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + ".lock", "a+") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class TokenBucket:
+    """
+    분당 한도를 연속적으로 채우는 토큰 버킷
+    
+    예약량만큼 토큰을 먼저 차감하고(부족하면 음수), 토큰이 0으로 회복될 때까지의
+    대기 시간을 돌려줍니다. 대기는 호출한 쪽에서 잠금 밖에서 수행합니다.
+    """
+    
+    def __init__(self, per_minute: float, key: str, state_path: Optional[str] = None):
+        """
+        토큰 버킷 초기화
+        
+        Args:
+            per_minute: 분당 한도 (버킷 용량)
+            key: 상태 파일에서 이 버킷을 구분할 이름
+            state_path: 프로세스 간 공유 상태 파일 경로 (없으면 메모리에만 보관)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.key = key
+        self.state_path = state_path
+        self._tokens = self.capacity
+        self._updated = time.time()
+        self._lock = threading.Lock()
+    
+    def reserve(self, amount: float) -> float:
+        """
+        토큰 예약
+        
+        Args:
+            amount: 예약할 양 (용량보다 크면 용량만큼만 예약)
+            
+        Returns:
+            예약한 토큰을 사용할 수 있을 때까지 기다려야 하는 시간 (초)
+        """
+        amount = min(float(amount), self.capacity)
+        tokens = self._update(-amount)
+        return max(0.0, -tokens / self.rate)
+    
+    def refund(self, amount: float) -> None:
+        """
+        예약한 토큰 돌려주기 (음수이면 추가 차감)
+        
+        Args:
+            amount: 돌려줄 양
+        """
+        if amount:
+            self._update(float(amount))
+    
+    def _update(self, delta: float) -> float:
+        """경과 시간만큼 채운 뒤 delta를 더하고 남은 토큰 반환"""
+        with self._lock:
+            if not self.state_path:
+                self._tokens, self._updated = self._apply(self._tokens, self._updated, delta)
+                return self._tokens
+            
+            with _locked_file(self.state_path):
+                state = {}
+                if os.path.exists(self.state_path):
+                    try:
+                        with open(self.state_path, "r", encoding="utf-8") as f:
+                            state = json.load(f)
+                    except (OSError, ValueError):
+                        state = {}
+                entry = state.get(self.key, {"tokens": self.capacity, "updated": time.time()})
+                tokens, updated = self._apply(entry["tokens"], entry["updated"], delta)
+                state[self.key] = {"tokens": tokens, "updated": updated}
+                
+                temp_path = f"{self.state_path}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+                os.replace(temp_path, self.state_path)
+                return tokens
+    
+    def _apply(self, tokens: float, updated: float, delta: float) -> Tuple[float, float]:
+        now = time.time()
+        tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+        return min(self.capacity, tokens + delta), now
+
+
+class RateLimiter:
+    """(서비스, 모델)별 분당 요청 수(RPM)와 분당 토큰 수(TPM) 제한"""
+    
+    def __init__(self, service: str, model: str,
+                 rpm: Optional[float] = None, tpm: Optional[float] = None,
+                 state_path: Optional[str] = None):
+        """
+        요청 한도 초기화
+        
+        Args:
+            service: AI 서비스 이름
+            model: 모델명
+            rpm: 분당 최대 요청 수 (없으면 제한 없음)
+            tpm: 분당 최대 토큰 수 (없으면 제한 없음)
+            state_path: 프로세스 간 공유 상태 파일 경로
+        """
+        self.service = service
+        self.model = model
+        self.requests = TokenBucket(rpm, f"{service}/{model}/rpm", state_path) if rpm else None
+        self.tokens = TokenBucket(tpm, f"{service}/{model}/tpm", state_path) if tpm else None
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "throttled": 0,
+            "wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "reserved_tokens": 0,
+            "used_tokens": 0
+        }
+    
+    @property
+    def enabled(self) -> bool:
+        """RPM 또는 TPM 한도가 설정되어 있는지 여부"""
+        return self.requests is not None or self.tokens is not None
+    
+    def _reserve(self, tokens: int) -> float:
+        """요청 1건과 토큰을 예약하고 기다려야 할 시간 반환"""
+        wait = 0.0
+        if self.requests:
+            wait = max(wait, self.requests.reserve(1))
+        if self.tokens and tokens:
+            wait = max(wait, self.tokens.reserve(tokens))
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["reserved_tokens"] += tokens
+            if wait > 0:
+                self.stats["throttled"] += 1
+                self.stats["wait_time"] += wait
+                self.stats["max_wait_time"] = max(self.stats["max_wait_time"], wait)
+        return wait
+    
+    def release(self, reserved: int) -> None:
+        """
+        실패한 요청이 예약한 토큰 돌려주기 (요청 수는 돌려주지 않음)
+        
+        Args:
+            reserved: 예약했던 토큰 수
+        """
+        if self.tokens:
+            self.tokens.refund(reserved)
+    
+    def settle(self, reserved: int, used: Optional[int]) -> None:
+        """
+        응답에 보고된 실제 사용량으로 예약량 정산
+        
+        Args:
+            reserved: 예약했던 토큰 수
+            used: 실제 사용한 토큰 수 (알 수 없으면 예약량 유지)
+        """
+        if used is None:
+            return
+        with self._stats_lock:
+            self.stats["used_tokens"] += used
+        if self.tokens:
+            self.tokens.refund(reserved - used)
+    
+    def call(self, func: Callable[[], Any], tokens: int,
+             get_usage: Callable[[Any], Optional[int]]) -> Any:
+        """
+        한도에 맞춰 대기한 뒤 함수를 실행하고 사용량 정산
+        
+        Args:
+            func: 요청을 보내는 함수 (인자 없음)
+            tokens: 예약할 추정 토큰 수
+            get_usage: 응답에서 실제 사용 토큰 수를 꺼내는 함수
+            
+        Returns:
+            함수의 반환값
+        """
+        if not self.enabled:
+            return func()
+        wait = self._reserve(tokens)
+        record_add("queue_wait", wait)
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            result = func()
+        except BaseException:
+            self.release(tokens)
+            raise
+        self.settle(tokens, get_usage(result))
+        return result
+    
+    async def acall(self, func: Callable[[], Any], tokens: int,
+                    get_usage: Callable[[Any], Optional[int]]) -> Any:
+        """
+        call의 비동기 버전 (func는 코루틴을 만드는 함수)
+        """
+        import asyncio
+        if not self.enabled:
+            return await func()
+        wait = self._reserve(tokens)
+        record_add("queue_wait", wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            result = await func()
+        except BaseException:
+            self.release(tokens)
+            raise
+        self.settle(tokens, get_usage(result))
+        return result
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """한도 사용 통계 반환"""
+        with self._stats_lock:
+            return dict(self.stats)
+
+
+# (서비스, 모델)별 요청 한도 - 같은 프로세스의 모든 스레드와 클라이언트가 공유
+_rate_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def _get_rate_limit_values(service: str, model: str) -> Dict[str, Any]:
+    """설정 파일에서 (서비스, 모델)에 적용할 rpm / tpm 값 조회 (모델별 설정 우선)"""
+    # 모델명에는 '.'이 들어갈 수 있으므로 점 표기 대신 딕셔너리로 조회
+    provider = get_setting(f"rate_limits.providers.{service}", {}) or {}
+    values = {key: provider.get(key) for key in ("rpm", "tpm")}
+    values.update((provider.get("models") or {}).get(model) or {})
+    return values
+
+
+def get_rate_limiter(service: str, model: str) -> RateLimiter:
+    """
+    (서비스, 모델)별 공유 요청 한도 반환 (없으면 설정값으로 생성)
+    
+    Args:
+        service: AI 서비스 이름
+        model: 모델명
+        
+    Returns:
+        RateLimiter 객체 (rate_limits.enabled가 꺼져 있으면 제한 없는 객체)
+    """
+    key = (service, model)
+    limiter = _rate_limiters.get(key)
+    if limiter is not None:
+        return limiter
+    
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            if get_setting("rate_limits.enabled", DEFAULT_RATE_LIMIT_SETTINGS["enabled"]):
+                values = _get_rate_limit_values(service, model)
+                state_path = get_setting("rate_limits.shared_state", DEFAULT_RATE_LIMIT_SETTINGS["shared_state"])
+                _rate_limiters[key] = RateLimiter(service, model, values.get("rpm"), values.get("tpm"), state_path)
+            else:
+                _rate_limiters[key] = RateLimiter(service, model)
+        return _rate_limiters[key]
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    (서비스/모델)별 요청 한도 통계 조회
+    
+    Returns:
+        "서비스/모델" 키별 통계 딕셔너리 (requests, throttled, wait_time, reserved_tokens, used_tokens 등)
+    """
+    return {f"{service}/{model}": limiter.get_stats()
+            for (service, model), limiter in list(_rate_limiters.items())}
+
+
+def clear_rate_limiters() -> None:
+    """요청 한도 객체를 모두 폐기 (설정 변경 후 다시 생성됨)"""
+    with _rate_limiters_lock:
+        _rate_limiters.clear()
+
 
 class AIClient:
     """AI 서비스 연결 및 응답 처리를 위한 클래스"""
     
-    def __init__(self, api_key: Optional[str] = None, service: str = "gemini"):
+    def __init__(self, api_key: Optional[str] = None, service: str = "gemini",
+                 model: Optional[str] = None, base_url: Optional[str] = None):
         """
         AI 서비스 연결 객체 초기화
         
         Args:
             api_key: API 키 (없을 경우 환경 변수에서 로드)
-            service: 사용할 AI 서비스 (gemini, openai, anthropic 등)
+            service: 사용할 AI 서비스 (gemini, openai, anthropic, mock 등)
+            model: 사용할 모델명 (없으면 서비스별 기본 모델)
+            base_url: API 엔드포인트 URL (없으면 서비스별 기본 URL)
         """
         self.service = service.lower()
         self.api_key = api_key or self._get_api_key_from_env()
+        self.model = model or self._get_default_model()
+        # 요청/응답 형식 (모의 서비스는 흉내 내는 서비스의 형식을 사용)
+        self.api_format = self.service
+        # 네트워크 없이 같은 프로세스에서 응답을 만드는 모의 서비스인지 여부
+        self.mock_inprocess = False
+        
+        # 생성 설정별 Gemini 모델 객체 캐시
+        self._gemini_models: Dict[Tuple, Any] = {}
+        self._gemini_models_lock = threading.Lock()
         
         # Gemini API 설정
-        if self.service == "gemini" and GEMINI_AVAILABLE:
-            genai.configure(api_key=self.api_key)
-            self.model = self._get_default_model()
+        if self.service == "gemini" and _gemini_available():
+            _configure_gemini(self.api_key)
+            self.base_url = base_url
+        elif self.service == "mock":
+            self._init_mock(base_url)
         else:
-            self.base_url = self._get_base_url()
+            self.base_url = base_url or self._get_base_url()
+    
+    def _init_mock(self, base_url: Optional[str]) -> None:
+        """모의 서비스 설정 (mock.backend 설정에 따라 inprocess 또는 로컬 HTTP 서버 사용)"""
+        from utils.mock_provider import get_mock_backend_name, get_mock_server, get_mock_wire_format
+        if base_url is None and get_mock_backend_name() == "inprocess":
+            self.mock_inprocess = True
+            self.api_format = "openai"
+            self.base_url = "mock://inprocess"
+            return
+        self.api_format = get_mock_wire_format()
+        self.base_url = base_url or get_mock_server().get_endpoint(self.api_format)
         
     def _get_api_key_from_env(self) -> str:
-        """환경 변수에서 API 키 로드"""
+        """환경 변수에서 API 키 로드 (.env 파일은 처음 필요할 때 읽음)"""
+        load_env()
         env_var = f"{self.service.upper()}_API_KEY"
         api_key = os.environ.get(env_var)
         if not api_key:
+            # 모의 서비스는 API 키가 필요 없음
+            if self.service == "mock":
+                return "mock-key"
             raise ValueError(f"{env_var} 환경변수가 설정되어 있지 않습니다.")
         return api_key
     
@@ -55,7 +483,8 @@ class AIClient:
         defaults = {
             "gemini": "gemini-1.5-flash",
             "openai": "gpt-3.5-turbo",
-            "anthropic": "claude-instant-1"
+            "anthropic": "claude-instant-1",
+            "mock": "mock-1"
         }
         return defaults.get(self.service, "gemini-1.5-pro")
     
@@ -71,106 +500,567 @@ class AIClient:
     def get_response(self, prompt: str, 
                     max_tokens: int = 8000, 
                     temperature: float = 0.7,
-                    additional_params: Dict[str, Any] = None) -> str:
+                    additional_params: Dict[str, Any] = None,
+                    stream: bool = False,
+                    cache: Optional[bool] = None) -> Union[str, StreamingResponse]:
         """
         AI 모델에 프롬프트를 전송하고 응답 받기
         
         Args:
             prompt: 사용자 프롬프트
-            max_tokens: 최대 토큰 수
+            max_tokens: 최대 토큰 수 (tokens.budget_check가 켜져 있으면 모델 한도에 맞게 조정, None이면 가능한 최대값)
             temperature: 응답 다양성 (0~1)
             additional_params: 추가 파라미터
+            stream: True이면 텍스트 조각을 도착하는 대로 내보내는 StreamingResponse 반환
+            cache: 응답 캐시 사용 여부 (None이면 cache.enabled 설정을 따름)
             
         Returns:
-            AI 모델의 응답 텍스트
+            AI 모델의 응답 텍스트 (stream=True이면 StreamingResponse)
+            
+        Raises:
+            TokenLimitError: 프롬프트가 모델의 컨텍스트 한도를 넘는 경우 (tokens.over_budget이 reject일 때)
+            CassetteMissError: 카세트 재생 모드에서 기록되지 않은 요청인 경우
+            AIClientError: 재시도 후에도 응답을 받지 못한 경우
         """
-        if self.service == "gemini" and GEMINI_AVAILABLE:
-            return self._get_gemini_response(prompt, max_tokens, temperature, additional_params)
+        # 호출 하나를 원격 측정 기록 하나로 남김 (스트리밍은 스트림이 끝날 때 기록)
+        with track_call(self.service, self.model, stream):
+            return self._get_response(prompt, max_tokens, temperature, additional_params, stream, cache)
+    
+    def _get_response(self, prompt, max_tokens, temperature, additional_params, stream, cache):
+        """get_response의 본체 (토큰 예산 → 카세트 → 응답 캐시 → 요청 병합 → API 호출 순서)"""
+        prompt, max_tokens = self._fit_token_budget(prompt, max_tokens, additional_params)
+        key = self._make_cache_key(prompt, max_tokens, temperature, additional_params)
+        # 카세트를 사용하면 모든 요청을 기록/재생하도록 응답 캐시를 거치지 않음
+        cassette = get_cassette()
+        if cassette is not None and cassette.mode == "replay":
+            entry = cassette.replay(key)
+            time.sleep(cassette.replay_delay(entry))
+            text = entry["response"]
+            return StreamingResponse([text], self.service, self.model) if stream else text
+        
+        response_cache = get_response_cache(cache) if cassette is None else None
+        if response_cache is not None:
+            cached = response_cache.get(key)
+            if cached is not None:
+                record_set(cache_hit=True)
+                return StreamingResponse([cached], self.service, self.model) if stream else cached
+        
+        if stream:
+            deltas = self._iter_stream_deltas(prompt, max_tokens, temperature, additional_params)
+            if response_cache is not None:
+                deltas = self._cache_stream(deltas, response_cache, key)
+            if cassette is not None:
+                deltas = self._record_stream(deltas, cassette, key, prompt, max_tokens,
+                                             temperature, additional_params)
+            return StreamingResponse(track_stream(deltas, current_record()), self.service, self.model)
+        
+        def fetch():
+            text = self._fetch_response(prompt, max_tokens, temperature, additional_params, key, cassette)
+            if response_cache is not None and text:
+                response_cache.set(key, text)
+            return text
+        
+        # 같은 요청이 이미 진행 중이면 새로 보내지 않고 그 결과를 함께 받음
+        if get_setting("http.coalesce", DEFAULT_POOL_SETTINGS["coalesce"]):
+            return _singleflight.do((self.base_url, key), fetch)
+        return fetch()
+    
+    def _fit_token_budget(self, prompt, max_tokens, additional_params):
+        """전송 전에 컨텍스트 한도를 확인하고 max_tokens를 모델에 맞게 조정 (tokens.budget_check 설정)"""
+        if not get_token_setting("budget_check"):
+            return prompt, max_tokens
+        conversation = _split_conversation_params(additional_params)[0]
+        return fit_request(prompt, max_tokens, self.service, self.model,
+                           conversation.get("system_prompt"), conversation.get("messages"))
+    
+    def _make_cache_key(self, prompt, max_tokens, temperature, additional_params) -> str:
+        """요청 내용 전체(서비스, 모델, 프롬프트, 생성 설정)로 응답 캐시 키 생성"""
+        params = dict(additional_params or {})
+        system_prompt = params.pop("system_prompt", None)
+        return make_cache_key(self.service, self.model, prompt, system_prompt,
+                              temperature, max_tokens, params)
+    
+    def _cache_stream(self, deltas, response_cache: ResponseCache, key: str):
+        """스트리밍 조각을 그대로 전달하고, 끝까지 받으면 전체 텍스트를 캐시에 저장"""
+        received: List[str] = []
+        for delta in deltas:
+            received.append(delta)
+            yield delta
+        text = "".join(received)
+        if text:
+            response_cache.set(key, text)
+    
+    def _record_stream(self, deltas, cassette: Cassette, key: str, prompt, max_tokens,
+                       temperature, additional_params):
+        """스트리밍 조각을 그대로 전달하고, 끝까지 받으면 전체 텍스트를 카세트에 기록"""
+        start = time.perf_counter()
+        received: List[str] = []
+        for delta in deltas:
+            received.append(delta)
+            yield delta
+        request = self._cassette_request(prompt, max_tokens, temperature, additional_params)
+        cassette.record(key, request, "".join(received), time.perf_counter() - start)
+    
+    def _cassette_request(self, prompt, max_tokens, temperature, additional_params) -> Dict[str, Any]:
+        """카세트에 기록할 요청 내용"""
+        params = dict(additional_params or {})
+        return {
+            "service": self.service,
+            "model": self.model,
+            "prompt": prompt,
+            "system_prompt": params.pop("system_prompt", None),
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "params": params
+        }
+    
+    def _fetch_response(self, prompt, max_tokens, temperature, additional_params,
+                        key: Optional[str] = None, cassette: Optional[Cassette] = None) -> str:
+        """캐시를 거치지 않고 API를 호출하여 응답 텍스트 받기 (record 모드이면 카세트에 기록)"""
+        if self.service == "gemini" and _gemini_available():
+            send = lambda: self._send_gemini_request(prompt, max_tokens, temperature, additional_params)
+            extract = self._extract_gemini_text
+        elif self.mock_inprocess:
+            from utils.mock_provider import get_mock_backend
+            backend = get_mock_backend()
+            send = lambda: backend.complete(prompt, max_tokens)
+            extract = self._extract_response_text
         else:
             params = self._prepare_request_params(prompt, max_tokens, temperature, additional_params)
-            response = self._send_request(params)
-            return self._extract_response_text(response)
+            send = lambda: self._send_request(params)
+            extract = self._extract_response_text
+        
+        # 재시도마다 요청 한도에 맞춰 대기한 뒤 전송하고, 응답의 실제 사용량으로 정산
+        limiter = get_rate_limiter(self.service, self.model)
+        tokens = self._estimate_request_tokens(prompt, max_tokens)
+        start = time.perf_counter()
+        response = RetryPolicy.from_config(self.service).call(
+            lambda: limiter.call(send, tokens, self._extract_usage), self.service
+        )
+        text = extract(response)
+        self._record_usage(response)
+        if cassette is not None:
+            request = self._cassette_request(prompt, max_tokens, temperature, additional_params)
+            cassette.record(key, request, text, time.perf_counter() - start, self._extract_usage(response))
+        return text
+    
+    def _estimate_request_tokens(self, prompt: str, max_tokens: Optional[int]) -> int:
+        """요청 한도에 예약할 토큰 수 추정 (프롬프트 + 최대 출력 토큰)"""
+        return estimate_tokens(prompt, self.service, self.model) + (max_tokens or 0)
+    
+    def _extract_usage(self, response) -> Optional[int]:
+        """응답에 보고된 전체 사용 토큰 수 추출 (없으면 None)"""
+        if isinstance(response, dict):
+            usage = response.get("usage") or {}
+            if "total_tokens" in usage:
+                return usage["total_tokens"]
+            if "input_tokens" in usage or "output_tokens" in usage:
+                return usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+            return None
+        metadata = getattr(response, "usage_metadata", None)
+        return getattr(metadata, "total_token_count", None) if metadata else None
+    
+    def _record_usage(self, response) -> None:
+        """응답의 사용량을 원격 측정 기록과 (ChatSession이 요청한 경우) 사용량 딕셔너리에 저장"""
+        detail = self._extract_usage_detail(response)
+        record_set(**detail)
+        capture = _usage_capture.get()
+        if capture is not None:
+            capture.update(detail)
+    
+    def _extract_usage_detail(self, response) -> Dict[str, Optional[int]]:
+        """
+        응답에 보고된 입력/출력/프롬프트 캐시 적중 토큰 수 추출 (없는 항목은 None)
+        
+        prompt_tokens는 캐시에서 읽은 토큰을 포함한 전체 입력 토큰 수입니다.
+        (Anthropic의 input_tokens는 캐시 구간을 제외하므로 캐시 읽기/쓰기 토큰을 더함)
+        """
+        if isinstance(response, dict):
+            usage = response.get("usage") or {}
+            if "prompt_tokens" in usage:
+                details = usage.get("prompt_tokens_details") or {}
+                return {
+                    "prompt_tokens": usage.get("prompt_tokens"),
+                    "completion_tokens": usage.get("completion_tokens"),
+                    "cached_tokens": details.get("cached_tokens")
+                }
+            prompt_tokens = usage.get("input_tokens")
+            if prompt_tokens is not None:
+                prompt_tokens += (usage.get("cache_read_input_tokens") or 0) + \
+                    (usage.get("cache_creation_input_tokens") or 0)
+            return {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": usage.get("output_tokens"),
+                "cached_tokens": usage.get("cache_read_input_tokens")
+            }
+        metadata = getattr(response, "usage_metadata", None)
+        return {
+            "prompt_tokens": getattr(metadata, "prompt_token_count", None),
+            "completion_tokens": getattr(metadata, "candidates_token_count", None),
+            "cached_tokens": getattr(metadata, "cached_content_token_count", None)
+        }
     
-    def _get_gemini_response(self, prompt, max_tokens, temperature, additional_params):
-        """Gemini API를 사용하여 응답 얻기"""
+    def _get_gemini_model(self, generation_config: Dict[str, Any], system_prompt: Optional[str] = None):
+        """
+        생성 설정과 시스템 프롬프트에 맞는 Gemini 모델 객체 반환 (조합별로 한 번만 생성)
+        
+        Args:
+            generation_config: Gemini 생성 설정 딕셔너리
+            system_prompt: 시스템 지시문 (system_instruction으로 전달)
+            
+        Returns:
+            genai.GenerativeModel 객체
+        """
+        key = (tuple(sorted((k, repr(v)) for k, v in generation_config.items())), system_prompt)
+        model = self._gemini_models.get(key)
+        if model is None:
+            with self._gemini_models_lock:
+                model = self._gemini_models.get(key)
+                if model is None:
+                    _configure_gemini(self.api_key)
+                    model = genai.GenerativeModel(self.model, generation_config=generation_config,
+                                                  system_instruction=system_prompt or None)
+                    self._gemini_models[key] = model
+        return model
+    
+    def _build_gemini_config(self, max_tokens, temperature, additional_params) -> Dict[str, Any]:
+        """Gemini 생성 설정 구성 (값이 없는 항목과 대화 예약 파라미터는 제외)"""
+        generation_config = {
+            "max_output_tokens": max_tokens,
+            "temperature": temperature
+        }
+        generation_config.update(_split_conversation_params(additional_params)[1])
+        return {k: v for k, v in generation_config.items() if v is not None}
+    
+    def _prepare_gemini_request(self, prompt, max_tokens, temperature, additional_params):
+        """
+        Gemini 모델 객체와 전송할 내용 준비
+        
+        이전 대화가 있으면 user/model 역할의 contents 목록으로 보냅니다.
+        Gemini는 같은 앞부분을 자동으로 캐시(implicit caching)하므로 별도 표시가 필요 없습니다.
+        
+        Returns:
+            (GenerativeModel, contents) 튜플
+        """
+        conversation = _split_conversation_params(additional_params)[0]
+        generation_config = self._build_gemini_config(max_tokens, temperature, additional_params)
+        model = self._get_gemini_model(generation_config, conversation.get("system_prompt"))
+        history = conversation.get("messages")
+        if not history:
+            return model, prompt
+        contents = [{"role": "model" if message["role"] == "assistant" else "user",
+                     "parts": [message["content"]]} for message in history]
+        contents.append({"role": "user", "parts": [prompt]})
+        return model, contents
+    
+    def _extract_gemini_text(self, response) -> str:
+        """Gemini 응답 객체에서 텍스트 추출"""
+        if hasattr(response, 'text'):
+            return response.text
+        elif hasattr(response, 'parts'):
+            return ''.join(part.text for part in response.parts)
+        else:
+            return str(response)
+    
+    def _send_gemini_request(self, prompt, max_tokens, temperature, additional_params):
+        """Gemini API를 호출하여 응답 객체 받기"""
+        # 캐시된 모델로 응답 생성
+        model, contents = self._prepare_gemini_request(prompt, max_tokens, temperature, additional_params)
+        return model.generate_content(contents)
+    
+    def _iter_stream_deltas(self, prompt, max_tokens, temperature, additional_params):
+        """
+        서비스별 스트리밍 API를 호출하여 텍스트 조각을 차례로 반환
+        
+        응답이 시작되기 전의 오류만 재시도하며, 조각을 받는 도중 끊기면 예외가 발생합니다.
+        """
+        policy = RetryPolicy.from_config(self.service)
+        limiter = get_rate_limiter(self.service, self.model)
+        tokens = self._estimate_request_tokens(prompt, max_tokens)
+        # 스트리밍 응답에는 사용량 정보가 없으므로 받은 텍스트로 사용량을 추정하여 정산
+        received: List[str] = []
+        opened = False
+        
+        def open_with_limit(send):
+            return limiter.call(send, tokens, lambda _: None)
+        
         try:
-            # 모델 가져오기
-            model = genai.GenerativeModel(self.model)
-            
-            # 추가 파라미터 설정
-            generation_config = genai.GenerationConfig(
-                max_output_tokens = max_tokens,
-                temperature = temperature
-            )
-            
-            if additional_params:
-                generation_config.update(additional_params)
-            
-            # 응답 생성
-            response = model.generate_content(prompt, generation_config=generation_config)
-            
-            # 응답 텍스트 반환
-            if hasattr(response, 'text'):
-                return response.text
-            elif hasattr(response, 'parts'):
-                return ''.join(part.text for part in response.parts)
-            else:
-                return str(response)
-                
+            if self.service == "gemini" and _gemini_available():
+                model, contents = self._prepare_gemini_request(prompt, max_tokens, temperature, additional_params)
+                chunks = policy.call(
+                    lambda: open_with_limit(lambda: model.generate_content(contents, stream=True)), self.service
+                )
+                opened = True
+                for chunk in chunks:
+                    text = self._extract_gemini_text(chunk)
+                    received.append(text)
+                    yield text
+                return
+            
+            if self.mock_inprocess:
+                from utils.mock_provider import get_mock_backend
+                backend = get_mock_backend()
+                chunks = policy.call(lambda: open_with_limit(lambda: backend.stream(prompt, max_tokens)), self.service)
+                opened = True
+                for text in chunks:
+                    received.append(text)
+                    yield text
+                return
+            
+            params = self._prepare_request_params(prompt, max_tokens, temperature, additional_params)
+            params["stream"] = True
+            with policy.call(lambda: open_with_limit(lambda: self._open_stream(params)), self.service) as response:
+                opened = True
+                parse = iter_anthropic_deltas if self.api_format == "anthropic" else iter_openai_deltas
+                # chunk_size=None: 도착한 조각을 버퍼링 없이 바로 처리
+                lines = self._count_response_bytes(response.iter_lines(chunk_size=None))
+                for delta in parse(lines):
+                    received.append(delta)
+                    yield delta
+                # 종료 이벤트 뒤에 남은 본문까지 읽어야 연결이 풀로 반환됨
+                for _ in lines:
+                    pass
+        except AIClientError:
+            raise
         except Exception as e:
-            print(f"Gemini API 호출 오류: {e}")
-            return f"오류가 발생했습니다: {str(e)}"
+            raise error_from_exception(self.service, e) from e
+        finally:
+            if opened:
+                used = estimate_tokens(prompt, self.service, self.model)
+                limiter.settle(tokens, used + estimate_tokens("".join(received), self.service, self.model))
+    
+    def _count_response_bytes(self, lines):
+        """스트리밍 응답 줄을 그대로 전달하면서 받은 바이트 수를 원격 측정 기록에 더함"""
+        for line in lines:
+            record_add("response_bytes", len(line) + 1)
+            yield line
+    
+    def _encode_body(self, params) -> bytes:
+        """요청 본문을 JSON 바이트로 변환하고 크기를 원격 측정 기록에 더함"""
+        body = json.dumps(params, ensure_ascii=False).encode("utf-8")
+        record_add("request_bytes", len(body))
+        return body
+    
+    def _open_stream(self, params):
+        """스트리밍 요청을 보내고 응답 헤더까지 받은 응답 객체 반환"""
+        response = get_session(self.service).post(
+            self.base_url,
+            headers=self._get_headers(),
+            data=self._encode_body(params),
+            timeout=get_pool_setting(self.service, "timeout"),
+            stream=True
+        )
+        if response.status_code >= 400:
+            error = error_from_status(self.service, response.status_code, response.text, response.headers)
+            response.close()
+            raise error
+        return response
+    
+    async def aget_response(self, prompt: str,
+                            max_tokens: int = 8000,
+                            temperature: float = 0.7,
+                            additional_params: Dict[str, Any] = None,
+                            timeout: Optional[float] = None,
+                            cache: Optional[bool] = None) -> str:
+        """
+        get_response의 비동기 버전
+        
+        이벤트 루프별 세마포어(http.max_concurrency 설정)로 동시 요청 수를 제한하며,
+        호출한 태스크가 취소되면 진행 중인 요청도 함께 취소됩니다.
+        
+        Args:
+            prompt: 사용자 프롬프트
+            max_tokens: 최대 토큰 수
+            temperature: 응답 다양성 (0~1)
+            additional_params: 추가 파라미터
+            timeout: 호출별 제한 시간 (초, 없으면 http.timeout 설정값)
+            cache: 응답 캐시 사용 여부 (None이면 cache.enabled 설정을 따름)
+            
+        Returns:
+            AI 모델의 응답 텍스트
+            
+        Raises:
+            APITimeoutError: 재시도 후에도 제한 시간 안에 응답을 받지 못한 경우
+            TokenLimitError: 프롬프트가 모델의 컨텍스트 한도를 넘는 경우 (tokens.over_budget이 reject일 때)
+            CassetteMissError: 카세트 재생 모드에서 기록되지 않은 요청인 경우
+            AIClientError: 재시도 후에도 응답을 받지 못한 경우
+        """
+        with track_call(self.service, self.model):
+            return await self._aget_response(prompt, max_tokens, temperature, additional_params, timeout, cache)
+    
+    async def _aget_response(self, prompt, max_tokens, temperature, additional_params, timeout, cache):
+        """aget_response의 본체"""
+        import asyncio
+        prompt, max_tokens = self._fit_token_budget(prompt, max_tokens, additional_params)
+        key = self._make_cache_key(prompt, max_tokens, temperature, additional_params)
+        cassette = get_cassette()
+        if cassette is not None and cassette.mode == "replay":
+            entry = cassette.replay(key)
+            await asyncio.sleep(cassette.replay_delay(entry))
+            return entry["response"]
+        
+        response_cache = get_response_cache(cache) if cassette is None else None
+        if response_cache is not None:
+            cached = response_cache.get(key)
+            if cached is not None:
+                record_set(cache_hit=True)
+                return cached
+        
+        async def fetch():
+            text = await self._afetch_response(prompt, max_tokens, temperature, additional_params,
+                                               timeout, key, cassette)
+            if response_cache is not None and text:
+                response_cache.set(key, text)
+            return text
+        
+        # 같은 이벤트 루프에서 같은 요청이 진행 중이면 그 결과를 함께 받음
+        if get_setting("http.coalesce", DEFAULT_POOL_SETTINGS["coalesce"]):
+            return await get_async_singleflight().do((self.base_url, key), fetch)
+        return await fetch()
+    
+    async def _afetch_response(self, prompt, max_tokens, temperature, additional_params, timeout,
+                               key: Optional[str] = None, cassette: Optional[Cassette] = None) -> str:
+        """캐시를 거치지 않고 API를 비동기로 호출하여 응답 텍스트 받기 (record 모드이면 카세트에 기록)"""
+        import asyncio
+        if timeout is None:
+            timeout = get_pool_setting(self.service, "timeout")
+        
+        if self.service == "gemini" and _gemini_available():
+            send = lambda: self._asend_gemini_request(prompt, max_tokens, temperature, additional_params)
+            extract = self._extract_gemini_text
+        elif self.mock_inprocess:
+            from utils.mock_provider import get_mock_backend
+            backend = get_mock_backend()
+            send = lambda: backend.acomplete(prompt, max_tokens)
+            extract = self._extract_response_text
+        else:
+            params = self._prepare_request_params(prompt, max_tokens, temperature, additional_params)
+            send = lambda: self._asend_request(params)
+            extract = self._extract_response_text
+        
+        async def send_with_limit():
+            # 재시도 대기 중에는 다른 요청이 진행되도록 시도마다 세마포어 획득
+            start = time.perf_counter()
+            async with _get_async_semaphore():
+                record_add("queue_wait", time.perf_counter() - start)
+                return await asyncio.wait_for(send(), timeout)
+        
+        limiter = get_rate_limiter(self.service, self.model)
+        tokens = self._estimate_request_tokens(prompt, max_tokens)
+        start = time.perf_counter()
+        response = await RetryPolicy.from_config(self.service).acall(
+            lambda: limiter.acall(send_with_limit, tokens, self._extract_usage), self.service
+        )
+        text = extract(response)
+        self._record_usage(response)
+        if cassette is not None:
+            request = self._cassette_request(prompt, max_tokens, temperature, additional_params)
+            cassette.record(key, request, text, time.perf_counter() - start, self._extract_usage(response))
+        return text
+    
+    async def _asend_gemini_request(self, prompt, max_tokens, temperature, additional_params):
+        """Gemini API를 비동기로 호출하여 응답 객체 받기"""
+        model, contents = self._prepare_gemini_request(prompt, max_tokens, temperature, additional_params)
+        return await model.generate_content_async(contents)
     
     def _prepare_request_params(self, prompt, max_tokens, temperature, additional_params):
-        """서비스별 요청 파라미터 준비"""
-        if self.service == "openai":
+        """서비스별 요청 파라미터 준비 (시스템 프롬프트와 이전 대화는 실제 역할의 메시지로 전송)"""
+        conversation, extra = _split_conversation_params(additional_params)
+        system_prompt = conversation.get("system_prompt")
+        history = [dict(message) for message in conversation.get("messages") or []]
+        
+        if self.api_format == "openai":
+            # OpenAI는 1024 토큰 이상의 같은 앞부분을 자동으로 캐시하므로 별도 표시가 필요 없음
+            system = [{"role": "system", "content": system_prompt}] if system_prompt else []
             params = {
                 "model": self.model,
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": system + history + [{"role": "user", "content": prompt}],
                 "max_tokens": max_tokens,
                 "temperature": temperature
             }
-        elif self.service == "anthropic":
+        elif self.api_format == "anthropic":
+            # 시스템 프롬프트와 마지막 이전 메시지에 cache_control을 붙여 그 앞부분을 캐시 구간으로 표시
+            cache = bool(conversation.get("prompt_cache"))
+            if cache and history:
+                history[-1]["content"] = _cache_block(history[-1]["content"], cache)
             params = {
                 "model": self.model,
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": history + [{"role": "user", "content": prompt}],
                 "max_tokens": max_tokens,
                 "temperature": temperature
             }
+            if system_prompt:
+                params["system"] = _cache_block(system_prompt, cache) if cache else system_prompt
         else:
+            if system_prompt:
+                prompt = f"{system_prompt}\n\n{prompt}"
             params = {"prompt": prompt, "max_tokens": max_tokens, "temperature": temperature}
         
         # 추가 파라미터 적용
-        if additional_params:
-            params.update(additional_params)
+        if extra:
+            params.update(extra)
             
         return params
         
+    def _get_headers(self) -> Dict[str, str]:
+        """서비스별 요청 헤더 반환"""
+        if self.api_format == "anthropic":
+            return {
+                "Content-Type": "application/json",
+                "x-api-key": self.api_key,
+                "anthropic-version": "2023-06-01"
+            }
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+    
     def _send_request(self, params):
-        """실제 API 요청 보내기"""
-        try:
-            response = requests.post(
-                self.base_url,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.api_key}"
-                },
-                json=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            print(f"API 요청 오류: {e}")
-            return {"error": str(e)}
+        """실제 API 요청 보내기 (서비스별 공유 세션으로 연결 재사용)"""
+        session = get_session(self.service)
+        response = session.post(
+            self.base_url,
+            headers=self._get_headers(),
+            data=self._encode_body(params),
+            timeout=get_pool_setting(self.service, "timeout")
+        )
+        record_add("response_bytes", len(response.content))
+        if response.status_code >= 400:
+            raise error_from_status(self.service, response.status_code, response.text, response.headers)
+        return response.json()
+    
+    async def _asend_request(self, params):
+        """실제 API 요청을 비동기로 보내기 (이벤트 루프별 연결 풀 사용)"""
+        from utils.async_http import get_async_pool
+        pool = get_async_pool(get_pool_setting(self.service, "pool_maxsize"))
+        body = self._encode_body(params)
+        response = await pool.request("POST", self.base_url, self._get_headers(), body)
+        record_add("response_bytes", len(response.body))
+        if response.status >= 400:
+            raise error_from_status(self.service, response.status, response.body, response.headers)
+        return response.json()
     
     def _extract_response_text(self, response):
         """응답에서 텍스트 추출"""
-        if self.service == "openai":
+        if self.api_format == "openai":
             return response.get("choices", [{}])[0].get("message", {}).get("content", "")
-        elif self.service == "anthropic":
+        elif self.api_format == "anthropic":
             return response.get("content", [{}])[0].get("text", "")
         return "응답을 처리할 수 없습니다."
+    
+    def batch(self, name: Optional[str] = None, state_dir: Optional[str] = None) -> 'BatchJob':
+        """
+        서비스 자체의 일괄 처리 API로 제출할 작업 만들기 (동기 호출의 절반 비용, 결과는 최대 24시간 뒤)
+        
+        Args:
+            name: 작업 이름 (상태 파일 이름, 같은 이름으로 BatchJob.resume 가능)
+            state_dir: 상태 파일 폴더 (없으면 batch.state_dir 설정)
+            
+        Returns:
+            BatchJob 객체 (add로 요청을 추가한 뒤 submit)
+        """
+        from utils.batch import BatchJob
+        return BatchJob(self, name, state_dir)
 
 
 def get_completion(prompt: str, 
@@ -178,7 +1068,9 @@ def get_completion(prompt: str,
                   temperature: float = 0.7, 
                   max_tokens: int = None,
                   system_prompt: Optional[str] = None,
-                  **kwargs) -> str:
+                  stream: bool = False,
+                  cache: Optional[bool] = None,
+                  **kwargs) -> Union[str, StreamingResponse]:
 
     """
     간편하게 AI 응답을 받는 유틸리티 함수
@@ -189,27 +1081,453 @@ def get_completion(prompt: str,
         temperature: 응답 다양성 (0~1)
         max_tokens: 최대 토큰 수
         system_prompt: 시스템 프롬프트
+        stream: True이면 응답을 조각 단위로 받는 StreamingResponse 반환
+        cache: 응답 캐시 사용 여부 (None이면 cache.enabled 설정, False이면 항상 새로 요청)
+        **kwargs: 추가 파라미터
+        
+    Returns:
+        AI 모델의 응답 텍스트 (stream=True이면 StreamingResponse)
+        
+    Raises:
+        AIClientError: 재시도 후에도 응답을 받지 못한 경우
+    """
+    client, request = _build_completion_request(prompt, provider, temperature, max_tokens, system_prompt, kwargs)
+    return client.get_response(stream=stream, cache=cache, **request)
+
+
+async def aget_completion(prompt: str,
+                          provider: str = "gemini",
+                          temperature: float = 0.7,
+                          max_tokens: int = None,
+                          system_prompt: Optional[str] = None,
+                          timeout: Optional[float] = None,
+                          cache: Optional[bool] = None,
+                          **kwargs) -> str:
+    """
+    get_completion의 비동기 버전
+    
+    Args:
+        prompt: 사용자 프롬프트
+        provider: 사용할 AI 서비스
+        temperature: 응답 다양성 (0~1)
+        max_tokens: 최대 토큰 수
+        system_prompt: 시스템 프롬프트
+        timeout: 호출별 제한 시간 (초)
+        cache: 응답 캐시 사용 여부 (None이면 cache.enabled 설정)
         **kwargs: 추가 파라미터
         
     Returns:
         AI 모델의 응답 텍스트
     """
-    # system_prompt가 있으면 프롬프트에 추가
-    if system_prompt and provider != "gemini":
-        full_prompt = f"{system_prompt}\n\n{prompt}"
-    else:
-        full_prompt = prompt
+    client, request = _build_completion_request(prompt, provider, temperature, max_tokens, system_prompt, kwargs)
+    return await client.aget_response(timeout=timeout, cache=cache, **request)
+
+
+def get_completions(prompts: List[Union[str, Dict[str, Any]]],
+                    max_concurrency: int = 4,
+                    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+                    provider: str = "gemini",
+                    temperature: float = 0.7,
+                    max_tokens: int = None,
+                    system_prompt: Optional[str] = None,
+                    journal: Optional['ExperimentJournal'] = None,
+                    **kwargs) -> List[Dict[str, Any]]:
+    """
+    여러 프롬프트를 스레드 풀로 동시에 요청하는 유틸리티 함수
+    
+    각 항목은 프롬프트 문자열 또는 {"prompt": ..., "temperature": ...}처럼
+    get_completion 인자를 항목별로 덮어쓰는 딕셔너리입니다.
+    일부 요청이 실패해도 나머지 결과는 그대로 반환됩니다.
+    
+    journal을 전달하면 성공한 요청을 완료되는 즉시 저널에 기록하고,
+    이미 기록된 요청은 다시 보내지 않고 기록된 응답을 사용합니다(resumed=True).
+    
+    Args:
+        prompts: 프롬프트 목록
+        max_concurrency: 동시에 진행할 최대 요청 수
+        on_result: 각 결과가 완료될 때마다 호출할 함수 (호출한 스레드에서 실행)
+        provider: 사용할 AI 서비스
+        temperature: 응답 다양성 (0~1)
+        max_tokens: 최대 토큰 수
+        system_prompt: 시스템 프롬프트
+        journal: 실험 저널 (utils.journal.experiment_journal, 없으면 기록하지 않음)
+        **kwargs: 추가 파라미터
+        
+    Returns:
+        입력 순서를 유지한 결과 목록
+        (각 결과: index, prompt, response, error, elapsed 키를 가진 딕셔너리)
+    """
+    defaults = dict(kwargs, provider=provider, temperature=temperature,
+                    max_tokens=max_tokens, system_prompt=system_prompt)
+    items = [_build_batch_item(item, defaults) for item in prompts]
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    
+    keys: List[Optional[str]] = [None] * len(items)
+    pending = list(range(len(items)))
+    if journal is not None:
+        from utils.journal import step_key
+        keys = [step_key(request) for request in items]
+        pending = []
+        for i, request in enumerate(items):
+            step = journal.get(keys[i])
+            if step is None:
+                pending.append(i)
+                continue
+            results[i] = dict(_batch_result(i, request, step["response"], None, 0.0), resumed=True)
+            if on_result:
+                on_result(results[i])
+    
+    def run(index: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            response, error = get_completion(**request), None
+        except Exception as e:
+            response, error = None, f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+        # 완료된 요청은 다른 요청을 기다리지 않고 바로 기록 (중단되어도 남도록)
+        if journal is not None:
+            if error is None:
+                journal.record(keys[index], response, label=request["prompt"][:80], elapsed=elapsed)
+            else:
+                journal.record_failure(keys[index])
+        return _batch_result(index, request, response, error, elapsed)
+    
+    if not pending:
+        return results
+    
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(pending)))) as executor:
+        futures = [executor.submit(run, i, items[i]) for i in pending]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                results[result["index"]] = result
+                if on_result:
+                    on_result(result)
+        except BaseException:
+            # Ctrl-C 등으로 중단되면 아직 시작하지 않은 요청은 보내지 않음 (진행 중인 요청만 마무리)
+            for future in futures:
+                future.cancel()
+            raise
+    
+    return results
+
+
+async def aget_completions(prompts: List[Union[str, Dict[str, Any]]],
+                           max_concurrency: int = 16,
+                           on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+                           provider: str = "gemini",
+                           temperature: float = 0.7,
+                           max_tokens: int = None,
+                           system_prompt: Optional[str] = None,
+                           **kwargs) -> List[Dict[str, Any]]:
+    """
+    get_completions의 비동기 버전
+    
+    Args:
+        prompts: 프롬프트 목록 (문자열 또는 항목별 인자 딕셔너리)
+        max_concurrency: 동시에 진행할 최대 요청 수
+        on_result: 각 결과가 완료될 때마다 호출할 함수
+        provider: 사용할 AI 서비스
+        temperature: 응답 다양성 (0~1)
+        max_tokens: 최대 토큰 수
+        system_prompt: 시스템 프롬프트
+        **kwargs: 추가 파라미터 (timeout 포함)
         
-    # Gemini는 추가 파라미터에 system_prompt 추가
+    Returns:
+        입력 순서를 유지한 결과 목록
+    """
+    defaults = dict(kwargs, provider=provider, temperature=temperature,
+                    max_tokens=max_tokens, system_prompt=system_prompt)
+    import asyncio
+    items = [_build_batch_item(item, defaults) for item in prompts]
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def run(index: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response, error = await aget_completion(**request), None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                response, error = None, f"{type(e).__name__}: {e}"
+        result = _batch_result(index, request, response, error, time.perf_counter() - start)
+        if on_result:
+            on_result(result)
+        return result
+    
+    return list(await asyncio.gather(*(run(i, request) for i, request in enumerate(items))))
+
+
+def _build_batch_item(item: Union[str, Dict[str, Any]], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """일괄 요청 항목을 get_completion 인자 딕셔너리로 변환"""
+    request = dict(defaults)
+    if isinstance(item, dict):
+        request.update(item)
+    else:
+        request["prompt"] = item
+    return request
+
+
+def _batch_result(index, request, response, error, elapsed) -> Dict[str, Any]:
+    """일괄 요청 결과 딕셔너리 생성"""
+    return {
+        "index": index,
+        "prompt": request["prompt"],
+        "response": response,
+        "error": error,
+        "elapsed": elapsed
+    }
+
+
+def _build_completion_request(prompt, provider, temperature, max_tokens, system_prompt, kwargs):
+    """
+    get_completion / aget_completion이 공유하는 요청 구성
+    
+    Returns:
+        (클라이언트, get_response/aget_response 인자 딕셔너리) 튜플
+    """
+    # 시스템 프롬프트는 각 서비스의 system 역할로 전송 (OpenAI: system 메시지,
+    # Anthropic: system 필드, Gemini: system_instruction)
     additional_params = kwargs.copy()
-    if system_prompt and provider == "gemini":
+    if system_prompt:
         additional_params["system_prompt"] = system_prompt
     
-    # service 매개변수로 변경 (provider에서 service로)
-    client = AIClient(service=provider)
-    return client.get_response(
-        prompt=full_prompt,
-        temperature=temperature,
-        max_tokens=max_tokens,
-        additional_params=additional_params
-    )
\ No newline at end of file
+    # 공유 레지스트리에서 클라이언트 가져오기 (호출마다 새로 만들지 않음)
+    client = get_client(service=provider)
+    request = {
+        "prompt": prompt,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "additional_params": additional_params
+    }
+    return client, request
+
+
+class ChatSession:
+    """
+    여러 턴의 대화를 이어가는 세션
+    
+    메시지 목록을 보관하고 매 턴마다 시스템 프롬프트와 이전 대화를 실제 역할(system/user/assistant)로
+    전송합니다. prompt_cache=True이면 변하지 않는 앞부분(시스템 프롬프트 + 이전 대화)을
+    서비스의 프롬프트 캐시 구간으로 표시하고, 캐시에서 처리된 입력 토큰 수를 집계합니다.
+    
+    사용 예:
+        chat = ChatSession(provider="anthropic", system_prompt="당신은 글쓰기 조교입니다.")
+        chat.send("서론을 검토해 주세요.")
+        chat.send("방금 지적한 부분을 고쳐 주세요.")
+        print(chat.get_usage()["cached_tokens"])
+    """
+    
+    def __init__(self, provider: str = "gemini",
+                 system_prompt: Optional[str] = None,
+                 model: Optional[str] = None,
+                 temperature: float = 0.7,
+                 max_tokens: Optional[int] = None,
+                 prompt_cache: bool = True,
+                 client: Optional[AIClient] = None):
+        """
+        대화 세션 초기화
+        
+        Args:
+            provider: 사용할 AI 서비스
+            system_prompt: 시스템 프롬프트
+            model: 사용할 모델명 (없으면 서비스별 기본 모델)
+            temperature: 응답 다양성 (0~1)
+            max_tokens: 턴마다 최대 출력 토큰 수
+            prompt_cache: 변하지 않는 앞부분을 프롬프트 캐시 구간으로 표시할지 여부
+            client: 사용할 AIClient (없으면 공유 레지스트리에서 가져옴)
+        """
+        self.client = client or get_client(service=provider, model=model)
+        self.system_prompt = system_prompt
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.prompt_cache = prompt_cache
+        self.messages: List[Dict[str, str]] = []
+        self.last_usage: Dict[str, Optional[int]] = {}
+        self._usage = {"turns": 0, "prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0}
+    
+    def add_message(self, role: str, content: str) -> None:
+        """
+        대화 기록에 메시지 추가 (예시 대화를 미리 넣거나 이전 대화를 이어갈 때 사용)
+        
+        Args:
+            role: "user" 또는 "assistant"
+            content: 메시지 내용
+            
+        Raises:
+            ValueError: role이 user/assistant가 아닌 경우
+        """
+        if role not in ("user", "assistant"):
+            raise ValueError(f"지원하지 않는 역할입니다: {role} (user 또는 assistant)")
+        self.messages.append({"role": role, "content": content})
+    
+    def reset(self) -> None:
+        """대화 기록과 사용량 집계 초기화 (시스템 프롬프트는 유지)"""
+        self.messages.clear()
+        self.last_usage = {}
+        self._usage = dict.fromkeys(self._usage, 0)
+    
+    def _request(self, message: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """이번 턴의 get_response 인자 구성"""
+        cache = kwargs.pop("cache", None)
+        additional_params = dict(kwargs, messages=list(self.messages), prompt_cache=self.prompt_cache)
+        if self.system_prompt:
+            additional_params["system_prompt"] = self.system_prompt
+        return {
+            "prompt": message,
+            "max_tokens": additional_params.pop("max_tokens", self.max_tokens),
+            "temperature": additional_params.pop("temperature", self.temperature),
+            "additional_params": additional_params,
+            "cache": cache
+        }
+    
+    def _finish_turn(self, message: str, text: str, usage: Dict[str, Optional[int]]) -> str:
+        """응답을 받은 턴을 대화 기록과 사용량 집계에 반영"""
+        self.messages.append({"role": "user", "content": message})
+        self.messages.append({"role": "assistant", "content": text})
+        # 응답 캐시/카세트에서 받은 응답은 사용량이 없음
+        self.last_usage = {key: usage.get(key) for key in ("prompt_tokens", "completion_tokens", "cached_tokens")}
+        self._usage["turns"] += 1
+        for key, value in self.last_usage.items():
+            self._usage[key] += value or 0
+        return text
+    
+    def send(self, message: str, **kwargs) -> str:
+        """
+        사용자 메시지를 보내고 응답 받기 (응답을 받으면 두 메시지를 대화 기록에 추가)
+        
+        Args:
+            message: 사용자 메시지
+            **kwargs: 이번 턴에만 적용할 파라미터 (temperature, max_tokens, cache 등)
+            
+        Returns:
+            AI 모델의 응답 텍스트
+            
+        Raises:
+            AIClientError: 재시도 후에도 응답을 받지 못한 경우 (대화 기록은 바뀌지 않음)
+        """
+        usage: Dict[str, Optional[int]] = {}
+        token = _usage_capture.set(usage)
+        try:
+            text = self.client.get_response(**self._request(message, kwargs))
+        finally:
+            _usage_capture.reset(token)
+        return self._finish_turn(message, text, usage)
+    
+    async def asend(self, message: str, **kwargs) -> str:
+        """
+        send의 비동기 버전
+        
+        Args:
+            message: 사용자 메시지
+            **kwargs: 이번 턴에만 적용할 파라미터 (temperature, max_tokens, cache, timeout 등)
+            
+        Returns:
+            AI 모델의 응답 텍스트
+        """
+        usage: Dict[str, Optional[int]] = {}
+        token = _usage_capture.set(usage)
+        try:
+            request = self._request(message, kwargs)
+            request["timeout"] = request["additional_params"].pop("timeout", None)
+            text = await self.client.aget_response(**request)
+        finally:
+            _usage_capture.reset(token)
+        return self._finish_turn(message, text, usage)
+    
+    def get_usage(self) -> Dict[str, Any]:
+        """
+        세션 전체 사용량 조회
+        
+        Returns:
+            턴 수, 입력/출력 토큰 합계, 프롬프트 캐시에서 처리된 입력 토큰 수와 그 비율
+        """
+        usage: Dict[str, Any] = dict(self._usage)
+        prompt_tokens = usage["prompt_tokens"]
+        usage["cache_ratio"] = usage["cached_tokens"] / prompt_tokens if prompt_tokens else 0.0
+        return usage
+
+
+# 프로세스 전체에서 공유하는 클라이언트 레지스트리
+_client_registry: Dict[Tuple, AIClient] = {}
+_registry_lock = threading.Lock()
+_registry_stats = {
+    "hits": 0,
+    "misses": 0,
+    "construct_time": 0.0,
+    "invalidations": 0
+}
+
+
+def get_client(service: str = "gemini",
+               api_key: Optional[str] = None,
+               model: Optional[str] = None,
+               base_url: Optional[str] = None) -> AIClient:
+    """
+    공유 레지스트리에서 AIClient 가져오기 (없으면 생성 후 등록)
+    
+    Args:
+        service: 사용할 AI 서비스
+        api_key: API 키 (없으면 환경 변수에서 로드)
+        model: 사용할 모델명 (없으면 서비스별 기본 모델)
+        base_url: API 엔드포인트 URL (없으면 서비스별 기본 URL)
+        
+    Returns:
+        (service, model, api_key, base_url)별로 공유되는 AIClient
+    """
+    service = service.lower()
+    if api_key is None:
+        load_env()
+        api_key = os.environ.get(f"{service.upper()}_API_KEY")
+    key = (service, model, api_key, base_url)
+    
+    client = _client_registry.get(key)
+    if client is not None:
+        with _registry_lock:
+            _registry_stats["hits"] += 1
+        return client
+    
+    with _registry_lock:
+        client = _client_registry.get(key)
+        if client is None:
+            start = time.perf_counter()
+            client = AIClient(api_key=api_key, service=service, model=model, base_url=base_url)
+            _registry_stats["construct_time"] += time.perf_counter() - start
+            _registry_stats["misses"] += 1
+            _client_registry[key] = client
+        else:
+            _registry_stats["hits"] += 1
+    return client
+
+
+def clear_client_registry() -> None:
+    """등록된 클라이언트와 캐시된 모델 객체를 모두 제거"""
+    with _registry_lock:
+        _client_registry.clear()
+        _registry_stats["invalidations"] += 1
+
+
+def get_registry_stats() -> Dict[str, Any]:
+    """
+    클라이언트 레지스트리 통계 조회
+    
+    Returns:
+        등록된 클라이언트 수, 재사용(hits)/생성(misses) 횟수,
+        총 생성 시간과 재사용으로 절약된 예상 시간 (초)
+    """
+    with _registry_lock:
+        stats = dict(_registry_stats)
+        stats["clients"] = len(_client_registry)
+    average = stats["construct_time"] / stats["misses"] if stats["misses"] else 0.0
+    stats["saved_time"] = average * stats["hits"]
+    return stats
+
+
+# 'ai.*' 설정이 바뀌면 이전 설정으로 만든 클라이언트를 폐기
+add_setting_listener("ai", lambda key, value: clear_client_registry())
+# 'mock.*' 설정이 바뀌면 모의 백엔드/서버 주소가 달라질 수 있으므로 클라이언트 폐기
+add_setting_listener("mock", lambda key, value: clear_client_registry())
+# 'rate_limits.*' 설정이 바뀌면 새 한도로 다시 만들도록 기존 한도 폐기
+add_setting_listener("rate_limits", lambda key, value: clear_rate_limiters())
@@ -0,0 +1,223 @@
+"""
+비동기 HTTP 클라이언트 모듈
+
+asyncio 스트림 위에 구현한 최소한의 HTTP/1.1 클라이언트입니다.
+추가 라이브러리 없이 수백 개의 요청을 동시에 처리할 수 있도록
+호스트별 keep-alive 연결 풀을 이벤트 루프마다 하나씩 유지합니다.
+"""
+
+import asyncio
+import json
+import ssl
+import time
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from utils.http_pool import PoolStats
+
+# 이벤트 루프별 연결 풀 (루프가 사라지면 자동 제거)
+_pools: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+# 모든 비동기 연결 풀이 함께 쓰는 통계
+async_pool_stats = PoolStats()
+
+
+class AsyncHTTPError(ConnectionError):
+    """비동기 HTTP 통신 오류"""
+
+
+class AsyncConnectError(AsyncHTTPError):
+    """서버에 연결하지 못한 오류 (요청이 전송되지 않음)"""
+    request_sent = False
+
+
+class AsyncHTTPResponse:
+    """비동기 HTTP 응답"""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        """
+        응답 객체 초기화
+
+        Args:
+            status: HTTP 상태 코드
+            headers: 응답 헤더 (소문자 키)
+            body: 응답 본문
+        """
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        """본문을 JSON으로 파싱"""
+        return json.loads(self.body.decode("utf-8"))
+
+    def raise_for_status(self) -> None:
+        """오류 상태 코드이면 예외 발생"""
+        if self.status >= 400:
+            raise AsyncHTTPError(f"HTTP {self.status}: {self.body[:200].decode('utf-8', 'replace')}")
+
+
+class _Connection:
+    """keep-alive로 재사용되는 단일 연결"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncConnectionPool:
+    """호스트별 keep-alive 연결 풀 (하나의 이벤트 루프 전용)"""
+
+    def __init__(self, max_per_host: int = 10):
+        """
+        연결 풀 초기화
+
+        Args:
+            max_per_host: 호스트당 최대 동시 연결 수
+        """
+        self.max_per_host = max_per_host
+        self._idle: Dict[Tuple[str, str, int], List[_Connection]] = {}
+        self._limits: Dict[Tuple[str, str, int], asyncio.Semaphore] = {}
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
+    async def _open(self, key: Tuple[str, str, int]) -> _Connection:
+        """새 연결 생성"""
+        scheme, host, port = key
+        ssl_context = None
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            ssl_context = self._ssl_context
+
+        start = time.perf_counter()
+        try:
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=ssl_context, server_hostname=host if ssl_context else None
+            )
+        except OSError as e:
+            raise AsyncConnectError(f"{host}:{port} 연결 실패: {e}") from e
+        async_pool_stats.record_connect(time.perf_counter() - start)
+        return _Connection(reader, writer)
+
+    async def request(self, method: str, url: str,
+                      headers: Optional[Dict[str, str]] = None,
+                      body: bytes = b"") -> AsyncHTTPResponse:
+        """
+        HTTP 요청 전송
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            headers: 요청 헤더
+            body: 요청 본문
+
+        Returns:
+            AsyncHTTPResponse 객체
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        head = [f"{method} {path} HTTP/1.1", f"Host: {parts.netloc}",
+                f"Content-Length: {len(body)}", "Connection: keep-alive"]
+        for name, value in (headers or {}).items():
+            head.append(f"{name}: {value}")
+        payload = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = asyncio.Semaphore(self.max_per_host)
+
+        start = time.perf_counter()
+        async with limit:
+            async_pool_stats.record_checkout(time.perf_counter() - start)
+            idle = self._idle.setdefault(key, [])
+            while True:
+                reused = bool(idle)
+                conn = idle.pop() if reused else await self._open(key)
+                try:
+                    conn.writer.write(payload)
+                    await conn.writer.drain()
+                    response, keep_alive = await self._read_response(conn)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    conn.close()
+                    # 서버가 닫은 유휴 연결이면 새 연결로 한 번 더 시도
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    # 취소/타임아웃 등으로 중단되면 응답이 남은 연결은 재사용할 수 없음
+                    conn.close()
+                    raise
+
+                if keep_alive:
+                    idle.append(conn)
+                else:
+                    conn.close()
+                return response
+
+    async def _read_response(self, conn: _Connection) -> Tuple[AsyncHTTPResponse, bool]:
+        """응답 상태줄, 헤더, 본문 읽기"""
+        status_line = await conn.reader.readline()
+        if not status_line:
+            raise AsyncHTTPError("서버가 연결을 닫았습니다.")
+        version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+
+        headers = {}
+        while True:
+            line = await conn.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = headers.get("connection", "").lower() != "close" and version != "HTTP/1.0"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await conn.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await conn.reader.readline()
+                    break
+                chunks.append(await conn.reader.readexactly(size))
+                await conn.reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await conn.reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await conn.reader.read()
+            keep_alive = False
+
+        return AsyncHTTPResponse(int(status), headers, body), keep_alive
+
+    def close(self) -> None:
+        """유휴 연결을 모두 닫기"""
+        for connections in self._idle.values():
+            for conn in connections:
+                conn.close()
+        self._idle.clear()
+
+
+def get_async_pool(max_per_host: int = 10) -> AsyncConnectionPool:
+    """
+    현재 이벤트 루프의 연결 풀 반환 (없으면 생성)
+
+    Args:
+        max_per_host: 새로 만들 때 적용할 호스트당 최대 연결 수
+
+    Returns:
+        AsyncConnectionPool 객체
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = AsyncConnectionPool(max_per_host)
+    return pool
@@ -0,0 +1,473 @@
+"""
+일괄 처리(batch) 작업 모듈
+
+OpenAI Batch API와 Anthropic Message Batches API로 많은 요청을 한 번에 제출합니다.
+동기 호출의 절반 비용으로 처리되지만 결과는 몇 분에서 최대 24시간 뒤에 나오므로
+8.3.3 벤치마크 매트릭스처럼 밤새 돌리는 실험에 사용합니다.
+
+작업마다 상태 폴더(batch.state_dir)에 세 파일을 둡니다.
+- <이름>.requests.jsonl: 제출한 요청 (서비스 형식 그대로)
+- <이름>.json: 작업 ID와 상태 (프로세스가 다시 시작되면 이 파일로 이어서 진행)
+- <이름>.results.jsonl: 받은 결과 (이미 받은 결과는 다시 내려받지 않음)
+
+모의 서비스(service="mock")는 로컬 모의 서버의 일괄 처리 프로토콜을 사용하므로
+API 키나 네트워크 없이 전체 과정을 확인할 수 있습니다.
+"""
+
+import json
+import os
+import random
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.config import CONFIG_FILE, get_setting
+from utils.errors import AIClientError, APITimeoutError, BadRequestError, error_from_exception, error_from_status
+from utils.http_pool import get_pool_setting, get_session
+from utils.retry import RetryPolicy
+
+# 일괄 처리 기본 설정값
+DEFAULT_BATCH_SETTINGS = {
+    "state_dir": ".batches",
+    "poll_interval": 5.0,
+    "max_poll_interval": 60.0,
+    "completion_window": "24h"
+}
+
+# 상태 확인 간격을 늘리는 배율
+_POLL_BACKOFF = 1.5
+
+
+def _get_batch_setting(key: str) -> Any:
+    """일괄 처리 설정값 가져오기 (없으면 기본값)"""
+    return get_setting(f"batch.{key}", DEFAULT_BATCH_SETTINGS[key])
+
+
+def _resolve_dir(path: str) -> str:
+    """프로젝트 루트 기준 상대 경로를 절대 경로로 변환"""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.dirname(CONFIG_FILE), path)
+
+
+class _BatchProtocol:
+    """서비스별 일괄 처리 프로토콜의 공통 부분 (HTTP 호출과 재시도)"""
+
+    def __init__(self, client, base_url: str):
+        """
+        Args:
+            client: 요청 형식/헤더/응답 해석에 사용할 AIClient
+            base_url: 서비스의 메시지 엔드포인트 URL
+        """
+        self.client = client
+        self.base_url = base_url
+        self.service = client.service
+
+    def _call(self, method: str, url: str, idempotent: bool = True, stream: bool = False, **kwargs):
+        """
+        HTTP 요청 보내기 (재시도 정책 적용)
+
+        작업 생성처럼 반복하면 중복 작업이 생길 수 있는 요청은 idempotent=False로 보내
+        서버가 처리했을 수 있는 오류에서는 재시도하지 않습니다.
+        """
+        headers = self.client._get_headers()
+        if "files" in kwargs:
+            # multipart 본문은 requests가 Content-Type(경계 포함)을 정하도록 비워 둠
+            headers.pop("Content-Type", None)
+
+        def send():
+            try:
+                response = get_session(self.service).request(
+                    method, url, headers=headers, stream=stream,
+                    timeout=get_pool_setting(self.service, "timeout"), **kwargs
+                )
+            except Exception as e:
+                raise error_from_exception(self.service, e) from e
+            if response.status_code >= 400:
+                error = error_from_status(self.service, response.status_code, response.text, response.headers)
+                response.close()
+                raise error
+            return response
+
+        return RetryPolicy.from_config(self.service).call(send, self.service, idempotent=idempotent)
+
+    def _iter_jsonl(self, url: str) -> Iterator[Dict[str, Any]]:
+        """JSONL 결과 파일을 내려받으면서 한 줄씩 반환"""
+        with self._call("GET", url, stream=True) as response:
+            for line in response.iter_lines(chunk_size=None):
+                if line.strip():
+                    yield json.loads(line)
+
+    def _result(self, custom_id: str, body: Optional[Dict[str, Any]], error: Optional[str]) -> Dict[str, Any]:
+        """결과 딕셔너리 생성 (성공하면 응답 텍스트와 사용량 포함)"""
+        if body is None:
+            return {"custom_id": custom_id, "response": None, "error": error, "usage": None}
+        return {
+            "custom_id": custom_id,
+            "response": self.client._extract_response_text(body),
+            "error": None,
+            "usage": self.client._extract_usage_detail(body)
+        }
+
+
+class _OpenAIBatchProtocol(_BatchProtocol):
+    """OpenAI Batch API (파일 업로드 → /batches 생성 → 결과/오류 파일 다운로드)"""
+
+    ENDPOINT = "/v1/chat/completions"
+    TERMINAL = ("completed", "failed", "expired", "cancelled")
+
+    @property
+    def api_root(self) -> str:
+        return self.base_url.rsplit("/chat/completions", 1)[0]
+
+    def request_line(self, custom_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"custom_id": custom_id, "method": "POST", "url": self.ENDPOINT, "body": params}
+
+    def create(self, requests_path: str) -> Dict[str, Any]:
+        with open(requests_path, "rb") as f:
+            upload = self._call("POST", f"{self.api_root}/files", data={"purpose": "batch"},
+                                files={"file": (os.path.basename(requests_path), f.read())}).json()
+        return self._call("POST", f"{self.api_root}/batches", idempotent=False, data=json.dumps({
+            "input_file_id": upload["id"],
+            "endpoint": self.ENDPOINT,
+            "completion_window": _get_batch_setting("completion_window")
+        })).json()
+
+    def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        return self._call("GET", f"{self.api_root}/batches/{batch_id}").json()
+
+    def status(self, batch: Dict[str, Any]) -> str:
+        return batch.get("status", "unknown")
+
+    def is_finished(self, batch: Dict[str, Any]) -> bool:
+        return batch.get("status") in self.TERMINAL
+
+    def iter_results(self, batch: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        # 성공한 요청은 결과 파일, 실패한 요청은 오류 파일에 있음 (기한이 지난 작업도 일부 결과가 있음)
+        for file_id in (batch.get("output_file_id"), batch.get("error_file_id")):
+            if not file_id:
+                continue
+            for line in self._iter_jsonl(f"{self.api_root}/files/{file_id}/content"):
+                response = line.get("response") or {}
+                if response.get("status_code") == 200:
+                    yield self._result(line["custom_id"], response.get("body"), None)
+                    continue
+                error = line.get("error") or (response.get("body") or {}).get("error") or {}
+                message = error.get("message") if isinstance(error, dict) else str(error)
+                yield self._result(line["custom_id"], None,
+                                   f"HTTP {response.get('status_code')}: {message}")
+
+
+class _AnthropicBatchProtocol(_BatchProtocol):
+    """Anthropic Message Batches API (/messages/batches 생성 → results_url 다운로드)"""
+
+    @property
+    def batches_url(self) -> str:
+        return f"{self.base_url}/batches"
+
+    def request_line(self, custom_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"custom_id": custom_id, "params": params}
+
+    def create(self, requests_path: str) -> Dict[str, Any]:
+        with open(requests_path, "r", encoding="utf-8") as f:
+            requests = [json.loads(line) for line in f if line.strip()]
+        body = json.dumps({"requests": requests}, ensure_ascii=False).encode("utf-8")
+        return self._call("POST", self.batches_url, idempotent=False, data=body).json()
+
+    def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        return self._call("GET", f"{self.batches_url}/{batch_id}").json()
+
+    def status(self, batch: Dict[str, Any]) -> str:
+        return batch.get("processing_status", "unknown")
+
+    def is_finished(self, batch: Dict[str, Any]) -> bool:
+        return batch.get("processing_status") == "ended"
+
+    def iter_results(self, batch: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        url = batch.get("results_url")
+        if not url:
+            return
+        for line in self._iter_jsonl(url):
+            result = line.get("result") or {}
+            if result.get("type") == "succeeded":
+                yield self._result(line["custom_id"], result.get("message"), None)
+                continue
+            error = (result.get("error") or {}).get("error") or {}
+            yield self._result(line["custom_id"], None,
+                               f"{result.get('type', 'errored')}: {error.get('message', '')}".rstrip(": "))
+
+
+def _protocol_for(client) -> _BatchProtocol:
+    """클라이언트의 서비스/요청 형식에 맞는 일괄 처리 프로토콜 반환"""
+    base_url = client.base_url
+    if client.mock_inprocess:
+        # inprocess 모의 백엔드에는 일괄 처리 엔드포인트가 없으므로 로컬 모의 서버 사용
+        from utils.mock_provider import get_mock_server
+        base_url = get_mock_server().get_endpoint(client.api_format)
+    if client.api_format == "openai":
+        return _OpenAIBatchProtocol(client, base_url)
+    if client.api_format == "anthropic":
+        return _AnthropicBatchProtocol(client, base_url)
+    raise BadRequestError(f"{client.service} 서비스는 일괄 처리 작업을 지원하지 않습니다. (openai, anthropic, mock)",
+                          service=client.service)
+
+
+class BatchJob:
+    """
+    서비스 자체의 일괄 처리 API로 제출하는 작업
+
+    사용 예:
+        job = get_client("openai").batch("sweep-0801")
+        for i, prompt in enumerate(prompts):
+            job.add(f"req-{i}", prompt, max_tokens=500)
+        job.submit()
+        for result in job.iter_results():
+            print(result["custom_id"], result["response"] or result["error"])
+
+    프로세스가 중간에 끝나도 BatchJob.resume("sweep-0801")로 같은 작업을 이어서 기다립니다.
+    """
+
+    def __init__(self, client, name: Optional[str] = None, state_dir: Optional[str] = None):
+        """
+        작업 초기화
+
+        Args:
+            client: 요청을 보낼 AIClient
+            name: 작업 이름 (상태 파일 이름, 없으면 현재 시각으로 생성)
+            state_dir: 상태 파일 폴더 (없으면 batch.state_dir 설정)
+        """
+        self.client = client
+        self.name = name or time.strftime("batch-%Y%m%d-%H%M%S")
+        self.state_dir = _resolve_dir(state_dir or _get_batch_setting("state_dir"))
+        self.state_path = os.path.join(self.state_dir, f"{self.name}.json")
+        self.requests_path = os.path.join(self.state_dir, f"{self.name}.requests.jsonl")
+        self.results_path = os.path.join(self.state_dir, f"{self.name}.results.jsonl")
+        self.protocol = _protocol_for(client)
+        self.state: Dict[str, Any] = {
+            "name": self.name,
+            "service": client.service,
+            "model": client.model,
+            "batch_id": None,
+            "status": "pending",
+            "request_count": 0,
+            "submitted_at": None,
+            "batch": None
+        }
+        self._lines: List[Dict[str, Any]] = []
+        self._custom_ids: set = set()
+
+    @classmethod
+    def resume(cls, name: str, state_dir: Optional[str] = None, client=None) -> 'BatchJob':
+        """
+        상태 파일에서 작업 다시 불러오기 (프로세스 재시작 후 이어서 기다릴 때)
+
+        Args:
+            name: 작업 이름
+            state_dir: 상태 파일 폴더 (없으면 batch.state_dir 설정)
+            client: 사용할 AIClient (없으면 기록된 서비스/모델로 공유 레지스트리에서 가져옴)
+
+        Returns:
+            제출된 상태의 BatchJob
+
+        Raises:
+            FileNotFoundError: 상태 파일이 없는 경우
+        """
+        path = os.path.join(_resolve_dir(state_dir or _get_batch_setting("state_dir")), f"{name}.json")
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if client is None:
+            from utils.ai_client import get_client
+            client = get_client(service=state["service"], model=state["model"])
+        job = cls(client, name, state_dir)
+        job.state.update(state)
+        return job
+
+    @property
+    def batch_id(self) -> Optional[str]:
+        """서비스가 부여한 작업 ID (제출 전에는 None)"""
+        return self.state["batch_id"]
+
+    @property
+    def status(self) -> str:
+        """마지막으로 확인한 작업 상태 (pending, in_progress, completed, ended 등)"""
+        return self.state["status"]
+
+    def add(self, custom_id: str, prompt: str,
+            max_tokens: Optional[int] = None,
+            temperature: float = 0.7,
+            system_prompt: Optional[str] = None,
+            **kwargs) -> None:
+        """
+        작업에 요청 추가 (제출 전에만 가능)
+
+        Args:
+            custom_id: 결과와 짝지을 요청 ID (작업 안에서 고유해야 함)
+            prompt: 사용자 프롬프트
+            max_tokens: 최대 토큰 수 (tokens.budget_check가 켜져 있으면 모델 한도에 맞게 조정)
+            temperature: 응답 다양성 (0~1)
+            system_prompt: 시스템 프롬프트
+            **kwargs: 추가 파라미터 (messages 등 대화 파라미터 포함)
+
+        Raises:
+            ValueError: 이미 제출한 작업이거나 custom_id가 중복된 경우
+        """
+        if self.batch_id is not None:
+            raise ValueError(f"이미 제출한 작업입니다: {self.name} ({self.batch_id})")
+        if custom_id in self._custom_ids:
+            raise ValueError(f"중복된 custom_id입니다: {custom_id}")
+        additional_params = dict(kwargs)
+        if system_prompt:
+            additional_params["system_prompt"] = system_prompt
+        prompt, max_tokens = self.client._fit_token_budget(prompt, max_tokens, additional_params)
+        params = self.client._prepare_request_params(prompt, max_tokens, temperature, additional_params)
+        self._lines.append(self.protocol.request_line(custom_id, params))
+        self._custom_ids.add(custom_id)
+
+    def submit(self) -> str:
+        """
+        요청을 JSONL 파일로 저장하고 서비스에 제출 (이미 제출했으면 그대로 반환)
+
+        Returns:
+            서비스가 부여한 작업 ID
+
+        Raises:
+            ValueError: 추가한 요청이 없는 경우
+            AIClientError: 제출에 실패한 경우
+        """
+        if self.batch_id is not None:
+            return self.batch_id
+        if not self._lines:
+            raise ValueError("제출할 요청이 없습니다. add()로 요청을 먼저 추가하세요.")
+
+        os.makedirs(self.state_dir, exist_ok=True)
+        with open(self.requests_path, "w", encoding="utf-8") as f:
+            for line in self._lines:
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+        batch = self.protocol.create(self.requests_path)
+        self.state.update(batch_id=batch["id"], status=self.protocol.status(batch),
+                          request_count=len(self._lines), submitted_at=time.time(), batch=batch)
+        self._save_state()
+        print(f"일괄 처리 작업을 제출했습니다: {self.name} ({batch['id']}, 요청 {len(self._lines)}개)")
+        return batch["id"]
+
+    def poll(self) -> str:
+        """
+        서비스에서 작업 상태를 다시 확인하고 상태 파일에 저장
+
+        Returns:
+            작업 상태
+        """
+        if self.batch_id is None:
+            return self.status
+        batch = self.protocol.retrieve(self.batch_id)
+        self.state.update(status=self.protocol.status(batch), batch=batch)
+        self._save_state()
+        return self.status
+
+    def is_finished(self) -> bool:
+        """작업이 끝났는지 여부 (마지막으로 확인한 상태 기준)"""
+        return self.state["batch"] is not None and self.protocol.is_finished(self.state["batch"])
+
+    def iter_results(self, timeout: Optional[float] = None,
+                     poll_interval: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        결과를 받는 대로 하나씩 반환 (작업이 끝날 때까지 간격을 늘려 가며 상태 확인)
+
+        이미 받아 둔 결과를 먼저 반환하고, 결과 파일을 내려받으면서 새 결과를
+        결과 파일에 추가합니다. 중간에 멈춰도 다시 호출하면 받은 결과는 건너뜁니다.
+
+        Args:
+            timeout: 작업이 끝나기를 기다릴 최대 시간 (초, 없으면 제한 없음)
+            poll_interval: 첫 상태 확인 간격 (초, 없으면 batch.poll_interval 설정)
+
+        Yields:
+            {"custom_id", "response", "error", "usage"} 딕셔너리
+
+        Raises:
+            APITimeoutError: timeout 안에 작업이 끝나지 않은 경우
+        """
+        received = set()
+        for result in self._load_results():
+            received.add(result["custom_id"])
+            yield result
+        if len(received) >= self.state["request_count"] and self.is_finished():
+            return
+
+        self.submit()
+        self._wait(timeout, poll_interval)
+        broken_line = self._ends_with_partial_line()
+        with open(self.results_path, "a", encoding="utf-8") as f:
+            if broken_line:
+                # 이전 실행이 줄을 쓰는 도중 끝났다면 잘린 줄과 이어지지 않도록 줄을 바꿈
+                f.write("\n")
+            for result in self.protocol.iter_results(self.state["batch"]):
+                if result["custom_id"] in received:
+                    continue
+                received.add(result["custom_id"])
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+                f.flush()
+                yield result
+
+    def wait(self, timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        작업이 끝날 때까지 기다려 모든 결과 받기
+
+        Args:
+            timeout: 최대 대기 시간 (초, 없으면 제한 없음)
+
+        Returns:
+            custom_id별 결과 딕셔너리
+        """
+        return {result["custom_id"]: result for result in self.iter_results(timeout)}
+
+    def _wait(self, timeout: Optional[float], poll_interval: Optional[float]) -> None:
+        """작업이 끝날 때까지 상태 확인 (간격은 1.5배씩 늘리고 약간의 무작위 값을 더함)"""
+        interval = poll_interval if poll_interval is not None else _get_batch_setting("poll_interval")
+        max_interval = max(interval, _get_batch_setting("max_poll_interval"))
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            try:
+                self.poll()
+            except AIClientError as e:
+                # 상태 확인은 언제든 다시 할 수 있으므로 재시도 후에도 실패하면 다음 간격에 다시 시도
+                print(f"일괄 처리 작업 상태 확인 실패 ({self.name}): {e}")
+            if self.is_finished():
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                raise APITimeoutError(f"일괄 처리 작업이 {timeout}초 안에 끝나지 않았습니다: "
+                                      f"{self.name} ({self.batch_id}, 상태 {self.status})",
+                                      service=self.client.service)
+            delay = interval * random.uniform(0.9, 1.1)
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.monotonic(), 0.0))
+            time.sleep(delay)
+            interval = min(interval * _POLL_BACKOFF, max_interval)
+
+    def _ends_with_partial_line(self) -> bool:
+        """결과 파일의 마지막 줄이 줄바꿈 없이 끝나는지 여부"""
+        if not os.path.exists(self.results_path) or os.path.getsize(self.results_path) == 0:
+            return False
+        with open(self.results_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def _load_results(self) -> List[Dict[str, Any]]:
+        """결과 파일에 저장된 결과 읽기 (마지막 줄이 잘린 경우는 건너뜀)"""
+        if not os.path.exists(self.results_path):
+            return []
+        results = []
+        with open(self.results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    results.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return results
+
+    def _save_state(self) -> None:
+        """상태 파일을 임시 파일에 쓴 뒤 교체 (쓰는 도중 종료되어도 이전 상태 유지)"""
+        os.makedirs(self.state_dir, exist_ok=True)
+        temp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.state_path)
@@ -0,0 +1,292 @@
+"""
+요청 기록/재생(카세트) 모듈
+
+record 모드에서는 AIClient의 모든 요청과 응답을 지연 시간, 사용량과 함께
+JSONL 카세트 파일에 한 줄씩 기록하고, replay 모드에서는 네트워크 없이
+기록된 응답을 그대로 돌려줍니다. 오프라인 실행, 재현 가능한 벤치마크와
+회귀 테스트에 사용합니다.
+
+카세트 옆에는 요청 해시 → 파일 위치(offset) 색인 파일(.idx)을 두어
+항목이 많아도 파일 전체를 훑지 않고 바로 찾아갑니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from utils.config import CONFIG_FILE, get_setting, add_setting_listener
+from utils.errors import CassetteMissError
+
+# 카세트 기본 설정값
+DEFAULT_CASSETTE_SETTINGS = {
+    "mode": "off",                     # off, record, replay
+    "path": "cassettes/default.jsonl",  # 프로젝트 루트 기준 상대 경로 또는 절대 경로
+    "simulate_latency": False,         # replay 시 기록된 지연 시간만큼 대기할지 여부
+    "latency_scale": 1.0               # 지연 시간 배율 (0.5이면 절반만 대기)
+}
+
+# 설정 파일보다 우선하는 환경 변수
+MODE_ENV = "AI_CASSETTE_MODE"
+PATH_ENV = "AI_CASSETTE_PATH"
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+# 색인 유효성 확인에 사용할 파일 앞부분 크기 (파일이 교체되었는지 판단)
+_HEAD_BYTES = 4096
+
+_cassette: Optional['Cassette'] = None
+_cassette_lock = threading.Lock()
+
+
+def _file_head_digest(path: str, size: int) -> str:
+    """파일 앞부분(최대 _HEAD_BYTES)의 해시 (색인이 같은 파일의 것인지 확인용)"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read(min(size, _HEAD_BYTES))).hexdigest()
+
+
+class Cassette:
+    """JSONL 카세트 파일 (요청 해시로 색인)"""
+
+    def __init__(self, path: str, mode: str = "replay",
+                 simulate_latency: bool = False, latency_scale: float = 1.0):
+        """
+        카세트 초기화
+
+        Args:
+            path: 카세트 파일 경로 (.jsonl)
+            mode: record 또는 replay
+            simulate_latency: replay 시 기록된 지연 시간만큼 대기할지 여부
+            latency_scale: 지연 시간 배율
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"지원하지 않는 카세트 모드입니다: {mode}")
+        self.path = path
+        self.index_path = path + ".idx"
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._offsets: Optional[Dict[str, int]] = None
+        self._indexed_size = 0
+        self._reader = None
+        self.stats = {"recorded": 0, "replayed": 0, "misses": 0}
+
+    def record(self, key: str, request: Dict[str, Any], response: str,
+               latency: float, usage: Optional[int] = None) -> None:
+        """
+        요청과 응답을 카세트 끝에 한 줄로 추가
+
+        Args:
+            key: 요청 해시
+            request: 요청 내용 (service, model, prompt, temperature 등)
+            response: 응답 텍스트
+            latency: 응답까지 걸린 시간 (초)
+            usage: 사용 토큰 수 (알 수 없으면 None)
+        """
+        entry = {
+            "key": key,
+            "request": request,
+            "response": response,
+            "latency": round(latency, 6),
+            "usage": usage,
+            "recorded_at": time.time()
+        }
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._lock:
+            # 한 줄을 한 번에 써서 여러 스레드/프로세스가 기록해도 줄이 섞이지 않게 함
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                f.write(line)
+            if self._offsets is not None and offset == self._indexed_size:
+                self._offsets[key] = offset
+                self._indexed_size = offset + len(line)
+            self.stats["recorded"] += 1
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        요청 해시로 기록된 항목 찾기
+
+        Args:
+            key: 요청 해시
+
+        Returns:
+            기록된 항목 딕셔너리 (없으면 None, 같은 키가 여러 번 기록되었으면 마지막 항목)
+        """
+        with self._lock:
+            if self._offsets is None:
+                self._load_index()
+            offset = self._offsets.get(key)
+            if offset is None:
+                return None
+            if self._reader is None:
+                self._reader = open(self.path, "rb")
+            self._reader.seek(offset)
+            return json.loads(self._reader.readline())
+
+    def replay(self, key: str) -> Dict[str, Any]:
+        """
+        기록된 항목 반환 (replay 모드에서 사용)
+
+        Args:
+            key: 요청 해시
+
+        Returns:
+            기록된 항목 딕셔너리
+
+        Raises:
+            CassetteMissError: 카세트에 기록되지 않은 요청인 경우
+        """
+        entry = self.lookup(key)
+        with self._lock:
+            self.stats["replayed" if entry else "misses"] += 1
+        if entry is None:
+            raise CassetteMissError(
+                f"카세트({os.path.basename(self.path)})에 기록되지 않은 요청입니다. "
+                f"record 모드로 먼저 실행하세요. (key={key[:12]})"
+            )
+        return entry
+
+    def replay_delay(self, entry: Dict[str, Any]) -> float:
+        """
+        기록된 항목을 재생할 때 기다릴 시간
+
+        Args:
+            entry: 기록된 항목
+
+        Returns:
+            대기 시간 (초, simulate_latency가 꺼져 있으면 0)
+        """
+        if not self.simulate_latency:
+            return 0.0
+        return max(0.0, (entry.get("latency") or 0.0) * self.latency_scale)
+
+    def _load_index(self) -> None:
+        """
+        색인 파일을 읽고, 색인 이후에 추가된 부분만 이어서 색인
+
+        카세트는 끝에만 추가되므로 이미 색인한 부분은 다시 읽지 않습니다.
+        파일이 교체되었거나 줄어들었으면 처음부터 다시 색인합니다.
+        """
+        self._offsets, self._indexed_size = {}, 0
+        if not os.path.exists(self.path):
+            return
+
+        size = os.path.getsize(self.path)
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    saved = json.load(f)
+                saved_size = saved.get("size", 0)
+                # 색인 당시 크기 이하이고 앞부분이 같으면 같은 파일에 내용만 추가된 것
+                if saved_size <= size and saved.get("head") == _file_head_digest(self.path, saved_size):
+                    self._offsets = saved.get("offsets", {})
+                    self._indexed_size = saved_size
+            except (OSError, ValueError):
+                pass
+
+        if self._indexed_size < size:
+            with open(self.path, "rb") as f:
+                f.seek(self._indexed_size)
+                offset = self._indexed_size
+                for line in f:
+                    if line.endswith(b"\n"):
+                        try:
+                            self._offsets[json.loads(line)["key"]] = offset
+                        except (ValueError, KeyError):
+                            pass
+                        offset += len(line)
+                    else:
+                        # 기록 중인 마지막 줄은 다음에 다시 색인
+                        break
+            self._indexed_size = offset
+            self._save_index()
+
+    def _save_index(self) -> None:
+        """색인을 카세트 옆 .idx 파일에 저장"""
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        head = _file_head_digest(self.path, self._indexed_size)
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"size": self._indexed_size, "head": head, "offsets": self._offsets}, f)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            print(f"카세트 색인 저장 오류: {e}")
+
+    def close(self) -> None:
+        """열려 있는 파일 닫기"""
+        with self._lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+
+def _resolve_path(path: str) -> str:
+    """프로젝트 루트 기준 상대 경로를 절대 경로로 변환"""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.dirname(CONFIG_FILE), path)
+
+
+def get_cassette_mode() -> str:
+    """
+    현재 카세트 모드 (환경 변수 AI_CASSETTE_MODE가 설정 파일보다 우선)
+
+    Returns:
+        off, record, replay 중 하나
+    """
+    mode = os.environ.get(MODE_ENV) or get_setting("cassette.mode", DEFAULT_CASSETTE_SETTINGS["mode"])
+    mode = (mode or "off").lower()
+    if mode not in CASSETTE_MODES:
+        print(f"알 수 없는 카세트 모드 '{mode}'입니다. 카세트를 사용하지 않습니다.")
+        return "off"
+    return mode
+
+
+def get_cassette() -> Optional[Cassette]:
+    """
+    설정에 따른 공유 카세트 반환
+
+    Returns:
+        Cassette 객체 (모드가 off이면 None)
+    """
+    global _cassette
+
+    mode = get_cassette_mode()
+    if mode == "off":
+        return None
+
+    path = _resolve_path(os.environ.get(PATH_ENV)
+                         or get_setting("cassette.path", DEFAULT_CASSETTE_SETTINGS["path"]))
+    cassette = _cassette
+    if cassette is not None and cassette.mode == mode and cassette.path == path:
+        return cassette
+
+    with _cassette_lock:
+        if _cassette is None or _cassette.mode != mode or _cassette.path != path:
+            if _cassette is not None:
+                _cassette.close()
+            _cassette = Cassette(
+                path, mode,
+                simulate_latency=get_setting("cassette.simulate_latency",
+                                             DEFAULT_CASSETTE_SETTINGS["simulate_latency"]),
+                latency_scale=get_setting("cassette.latency_scale", DEFAULT_CASSETTE_SETTINGS["latency_scale"])
+            )
+        return _cassette
+
+
+def reset_cassette() -> None:
+    """공유 카세트를 닫고 폐기 (설정 변경 후 다시 생성됨)"""
+    global _cassette
+
+    with _cassette_lock:
+        if _cassette is not None:
+            _cassette.close()
+            _cassette = None
+
+
+# 'cassette.*' 설정이 바뀌면 새 설정으로 다시 열도록 기존 카세트 폐기
+add_setting_listener("cassette", lambda key, value: reset_cassette())
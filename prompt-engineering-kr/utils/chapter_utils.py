@@ -6,7 +6,38 @@
 
 import os
 import re
-import inspect
+import sys
+import threading
+from functools import lru_cache
+
+from utils.config import is_debug_enabled
+
+# 프로젝트 루트 (utils 패키지가 있는 폴더, import 시 한 번만 계산)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 이 프로세스에서 이미 만든(또는 있는 것을 확인한) 폴더
+_created_dirs = set()
+_created_dirs_lock = threading.Lock()
+
+def get_caller_file(depth=1):
+    """
+    호출한 쪽의 파일 경로를 반환합니다.
+    
+    inspect.stack()은 모든 프레임의 정보를 만들고 소스 줄까지 읽으므로,
+    필요한 프레임 하나만 sys._getframe으로 조회합니다.
+    
+    Args:
+        depth: 이 함수를 부른 함수 기준으로 몇 단계 위의 호출자인지 (1이면 바로 위 호출자)
+        
+    Returns:
+        호출한 파일의 경로
+    """
+    try:
+        frame = sys._getframe(depth + 1)
+    except AttributeError:  # sys._getframe이 없는 인터프리터
+        import inspect
+        frame = inspect.stack()[depth + 1].frame
+    return frame.f_code.co_filename
 
 def get_chapter_save_path(file_path=None):
     """
@@ -20,20 +51,65 @@ def get_chapter_save_path(file_path=None):
     """
     # 파일 경로가 제공되지 않으면 호출한 파일의 경로를 사용
     if file_path is None:
-        frame = inspect.stack()[1]
-        file_path = frame.filename
+        file_path = get_caller_file()
+    
+    save_path = resolve_chapter_path(file_path)
+    
+    # 디버그 출력 (logging.log_level이 DEBUG일 때만)
+    if is_debug_enabled():
+        print(f"파일 경로: {os.path.normpath(file_path)}")
+        print(f"저장 경로: {save_path}")
+    
+    # 디렉토리가 없으면 생성
+    ensure_directory(save_path)
     
+    return save_path
+
+def ensure_directory(path):
+    """
+    폴더가 없으면 생성합니다. (프로세스마다 폴더별로 한 번만 os.makedirs 호출)
+    
+    Args:
+        path: 폴더 경로
+        
+    Returns:
+        폴더 경로
+    """
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        with _created_dirs_lock:
+            _created_dirs.add(path)
+    return path
+
+def clear_chapter_path_cache():
+    """
+    챕터 경로 캐시와 폴더 생성 기록을 비웁니다.
+    
+    실행 중에 results 폴더를 지웠다면 호출해야 다음 저장 때 폴더를 다시 만듭니다.
+    """
+    resolve_chapter_path.cache_clear()
+    with _created_dirs_lock:
+        _created_dirs.clear()
+
+@lru_cache(maxsize=512)
+def resolve_chapter_path(file_path):
+    """
+    파일 경로에 해당하는 챕터 결과 폴더 경로를 계산합니다. (파일 경로별로 결과를 기억)
+    
+    폴더를 만들거나 출력하지 않으므로 같은 파일에 대해 여러 번 호출해도
+    경로 분석(정규식)은 처음 한 번만 실행됩니다.
+    
+    Args:
+        file_path: 파일 경로
+        
+    Returns:
+        저장할 경로 (results/part{}/챕터/...)
+    """
     # 경로를 정규화 (슬래시 방향 통일)
     file_path = os.path.normpath(file_path).replace('\\', '/')
     file_name = os.path.basename(file_path)
     
-    # 프로젝트 루트 찾기
-    project_root = os.path.dirname(file_path)
-    while project_root and os.path.basename(project_root).lower() != 'prompt-engineering-kr':
-        parent = os.path.dirname(project_root)
-        if parent == project_root:  # 루트에 도달
-            break
-        project_root = parent
+    project_root = PROJECT_ROOT
     
     # 1. 파일 이름에서 챕터 번호 추출 시도
     # 1.1_clear_instructions.py 또는 1.1.1_specific_requests.py 패턴
@@ -90,13 +166,6 @@ def get_chapter_save_path(file_path=None):
                 # 챕터 정보를 찾지 못한 경우 임시 디렉토리
                 save_path = os.path.join(project_root, "results", "unknown")
     
-    # 디버그 출력
-    print(f"파일 경로: {file_path}")
-    print(f"저장 경로: {save_path}")
-    
-    # 디렉토리가 없으면 생성
-    os.makedirs(save_path, exist_ok=True)
-    
     return save_path
 
 def save_result(content, filename, title=None, calling_file=None):
@@ -114,8 +183,7 @@ def save_result(content, filename, title=None, calling_file=None):
     """
     # 호출 파일이 제공되지 않으면 호출 스택에서 추출
     if calling_file is None:
-        frame = inspect.stack()[1]
-        calling_file = frame.filename
+        calling_file = get_caller_file()
         
     # 호출한 파일에 맞는 저장 경로 가져오기
     save_path = get_chapter_save_path(calling_file)
@@ -6,7 +6,7 @@
 
 import os
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, List, Tuple
 
 # 기본 설정값
 DEFAULT_CONFIG = {
@@ -19,12 +19,140 @@ DEFAULT_CONFIG = {
         # "max_tokens": 
     },
     
+    # HTTP 연결 풀 설정
+    "http": {
+        "pool_connections": 4,
+        "pool_maxsize": 10,
+        "pool_block": False,
+        "timeout": 30,
+        "max_concurrency": 32,
+        "coalesce": True  # 동시에 들어온 동일 요청을 한 번만 전송
+    },
+    
+    # 재시도 설정 (429, 5xx, 연결 오류 등 일시적인 오류)
+    "retry": {
+        "max_attempts": 4,
+        "base_delay": 0.5,
+        "max_delay": 20.0,
+        "max_elapsed": 60.0,
+        "verbose": True
+    },
+    
+    # 응답 캐시 (같은 요청을 다시 보내지 않고 저장된 응답 사용)
+    "cache": {
+        "enabled": True,
+        "path": ".cache/responses.sqlite3",  # 프로젝트 루트 기준 상대 경로
+        "memory_entries": 256,
+        "max_bytes": 104857600,  # 100MB
+        "ttl": 604800  # 7일 (초, 0이면 만료 없음)
+    },
+    
+    # 요청 기록/재생 카세트 (환경 변수 AI_CASSETTE_MODE, AI_CASSETTE_PATH가 우선)
+    "cassette": {
+        "mode": "off",  # off, record, replay
+        "path": "cassettes/default.jsonl",  # 프로젝트 루트 기준 상대 경로
+        "simulate_latency": False,  # replay 시 기록된 지연 시간만큼 대기
+        "latency_scale": 1.0
+    },
+    
+    # 모의 AI 서비스 (provider를 "mock"으로 지정하면 API 키 없이 실행)
+    "mock": {
+        "backend": "inprocess",  # inprocess(네트워크 없음) 또는 http(로컬 모의 서버)
+        "wire_format": "openai",  # http 백엔드의 API 형식 (openai 또는 anthropic)
+        "latency": {
+            "distribution": "fixed",  # fixed, lognormal, replay(카세트에 기록된 지연 시간)
+            "value": 0.0,
+            "median": 0.3,
+            "sigma": 0.5,
+            "path": None
+        },
+        "tokens_per_second": 0,  # 0이면 생성 지연 없음
+        "output_tokens": 32,
+        "error_rate": 0.0,
+        "error_status": 503,  # HTTP 상태 코드 또는 "disconnect"
+        "seed": 0,
+        "batch_delay": 1.0  # 모의 일괄 처리 작업이 완료되기까지의 시간 (초)
+    },
+    
+    # 일괄 처리(batch) 작업 (OpenAI Batch API / Anthropic Message Batches, 동기 호출의 절반 비용)
+    "batch": {
+        "state_dir": ".batches",  # 작업 상태/요청/결과 파일 폴더 (프로젝트 루트 기준 상대 경로)
+        "poll_interval": 5.0,  # 첫 상태 확인 간격 (초)
+        "max_poll_interval": 60.0,  # 상태 확인 간격 상한 (초, 확인할 때마다 1.5배씩 늘어남)
+        "completion_window": "24h"  # OpenAI 작업 완료 기한
+    },
+    
+    # 무인 실행 (python main.py --headless)
+    "headless": {
+        "max_concurrency": 4,  # 실습 하나에서 동시에 진행할 최대 요청 수
+        "save_results": True  # 질문 없이 결과 저장 (스크립트의 save로 덮어쓰기 가능)
+    },
+    
+    # 실습 일괄 실행 (python main.py --run-all)
+    "run_all": {
+        "workers": 4,  # 동시에 실행할 최대 프로세스 수
+        "timeout": 600.0,  # 실습별 제한 시간 (초, 넘기면 프로세스 종료)
+        "log_dir": ".runs"  # 실습별 표준 출력/오류 로그 폴더 (프로젝트 루트 기준 상대 경로)
+    },
+    
+    # 실습 목록 (exercises 폴더를 한 번 훑어 만든 ID -> 파일 정보, 폴더가 바뀌면 다시 생성)
+    "manifest": {
+        "path": ".cache/exercise_manifest.json"  # 프로젝트 루트 기준 상대 경로
+    },
+    
+    # 상주 서버 (python main.py --serve / --connect)
+    "daemon": {
+        "socket_path": None,  # Unix 소켓 경로 (없으면 임시 폴더에 프로젝트별 이름으로 생성)
+        "preload": True  # 서버 시작 시 모든 실습 모듈을 미리 불러옴
+    },
+    
+    # 실험 저널 (8.3 실험의 완료된 요청을 기록해 중단 후 다시 실행하면 이어서 진행)
+    "journal": {
+        "enabled": True,
+        "dir": ".cache/journal",  # 프로젝트 루트 기준 상대 경로
+        "fsync_every": 8,  # 이 줄 수만큼 모아서 fsync
+        "fsync_interval": 1.0  # 마지막 fsync 후 이 시간(초)이 지나면 fsync
+    },
+    
+    # 토큰 예산 (전송 전 컨텍스트 한도 확인과 max_tokens 조정)
+    "tokens": {
+        "budget_check": True,
+        "over_budget": "reject",  # reject(오류) 또는 trim(프롬프트 가운데를 잘라냄)
+        "safety_margin": 0.1,  # 추정 오차를 고려해 더할 비율
+        "min_output": 256,  # 응답을 위해 남겨야 하는 최소 토큰 수
+        "use_tiktoken": False,  # tiktoken이 설치되어 있으면 OpenAI 모델의 정확한 토큰 수 사용
+        "models": {}  # 모델별 한도 덮어쓰기 {"모델명": {"context": ..., "max_output": ...}}
+    },
+    
+    # 호출별 원격 측정 (memory: 최근 기록 링 버퍼, jsonl: 파일 기록, prometheus: 지표 파일)
+    "telemetry": {
+        "enabled": True,
+        "sinks": ["memory"],
+        "ring_size": 1000,
+        "jsonl_path": ".telemetry/calls.jsonl",  # 프로젝트 루트 기준 상대 경로
+        "prometheus_path": ".telemetry/metrics.prom",
+        "prometheus_interval": 5.0  # 지표 파일을 다시 쓰는 최소 간격 (초)
+    },
+    
+    # 클라이언트 측 요청 한도 (서비스별 분당 요청 수 / 분당 토큰 수)
+    # 모델별 한도는 providers.<서비스>.models.<모델명>에 지정
+    "rate_limits": {
+        "enabled": True,
+        "shared_state": None,  # 여러 프로세스가 한도를 공유할 상태 파일 경로
+        "providers": {
+            "gemini": {"rpm": 15, "tpm": 1000000},
+            "openai": {"rpm": 500, "tpm": 200000},
+            "anthropic": {"rpm": 50, "tpm": 40000}
+        }
+    },
+    
     # 출력 설정
     "output": {
         "default_format": "markdown",
         "save_results": True,
         "results_dir": "results",
-        "use_chapter_folders": True  # 챕터별 폴더 사용 여부 설정 추가
+        "use_chapter_folders": True,  # 챕터별 폴더 사용 여부 설정 추가
+        "stream": False  # 응답을 생성되는 대로 출력할지 여부
     },
     
     # 학습 예제 설정
@@ -50,6 +178,9 @@ CONFIG_FILE = os.path.join(
 # 전역 설정 객체
 _config = None
 
+# 설정 변경 리스너 목록 (키 접두사, 콜백)
+_setting_listeners: List[Tuple[str, Callable[[str, Any], None]]] = []
+
 
 def load_config() -> Dict[str, Any]:
     """
@@ -156,6 +287,46 @@ def update_setting(key: str, value: Any) -> None:
     
     # 설정 저장
     save_config(config)
+    
+    # 변경된 키에 해당하는 리스너 호출
+    for prefix, callback in _setting_listeners:
+        if key == prefix or key.startswith(prefix + '.'):
+            callback(key, value)
+
+
+def add_setting_listener(prefix: str, callback: Callable[[str, Any], None]) -> None:
+    """
+    설정 변경 리스너 등록
+    
+    update_setting으로 prefix 또는 그 하위 키가 바뀌면 callback(key, value)가 호출됩니다.
+    
+    Args:
+        prefix: 감시할 설정 키 접두사 (예: 'ai')
+        callback: 변경 시 호출할 함수
+    """
+    _setting_listeners.append((prefix, callback))
+
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    """
+    .env 파일의 값을 환경 변수로 불러오기 (처음 호출할 때 한 번만)
+
+    import 시점에 파일을 읽지 않도록 API 키가 처음 필요할 때 호출합니다.
+    python-dotenv가 없으면 이미 설정된 환경 변수만 사용합니다.
+    """
+    global _env_loaded
+
+    if _env_loaded:
+        return
+    _env_loaded = True
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
 
 
 def get_api_key(provider: Optional[str] = None) -> Optional[str]:
@@ -171,6 +342,7 @@ def get_api_key(provider: Optional[str] = None) -> Optional[str]:
     if provider is None:
         provider = get_setting('ai.provider')
     
+    load_env()
     env_var = f"{provider.upper()}_API_KEY"
     
     # 설정에 지정된 환경변수 이름이 있으면 사용
@@ -201,6 +373,18 @@ def get_results_dir() -> str:
     return results_dir
 
 
+def is_debug_enabled() -> bool:
+    """
+    디버그 출력 여부 (logging.enabled가 켜져 있고 logging.log_level이 DEBUG인 경우)
+    
+    Returns:
+        디버그 정보를 출력해야 하면 True
+    """
+    if not get_setting('logging.enabled', True):
+        return False
+    return str(get_setting('logging.log_level', 'INFO')).upper() == 'DEBUG'
+
+
 def _merge_dicts(target: Dict[str, Any], source: Dict[str, Any]) -> None:
     """
     딕셔너리 재귀적 병합 (target을 업데이트)
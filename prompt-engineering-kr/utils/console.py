@@ -0,0 +1,146 @@
+"""
+콘솔 입출력 전환 모듈
+
+sys.stdout / sys.stderr / sys.stdin을 컨텍스트별로 다른 스트림에 연결합니다.
+상주 서버(main.py --serve)가 여러 클라이언트의 실습을 한 프로세스에서 동시에
+실행할 때, 각 실습의 print와 input이 자기 클라이언트로만 오가도록 사용합니다.
+
+install_routing을 호출하기 전에는 redirect_input이 sys.stdin을 직접 바꾸므로
+일반 실행에서도 같은 방식으로 사용할 수 있습니다.
+"""
+
+import contextvars
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Optional, TextIO
+
+# 현재 컨텍스트의 출력/입력 대상 (None이면 원래 콘솔)
+_stdout_target: contextvars.ContextVar = contextvars.ContextVar("console_stdout", default=None)
+_stderr_target: contextvars.ContextVar = contextvars.ContextVar("console_stderr", default=None)
+_stdin_target: contextvars.ContextVar = contextvars.ContextVar("console_stdin", default=None)
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+class _RoutedStream:
+    """컨텍스트에 지정된 스트림으로 읽기/쓰기를 넘기는 sys.stdout / sys.stdin 대체 객체"""
+
+    def __init__(self, default: TextIO, target: contextvars.ContextVar):
+        """
+        Args:
+            default: 대상이 지정되지 않았을 때 사용할 원래 스트림
+            target: 대상 스트림을 담은 컨텍스트 변수
+        """
+        self._default = default
+        self._target = target
+
+    def _stream(self) -> TextIO:
+        return self._target.get() or self._default
+
+    def write(self, text: str) -> int:
+        return self._stream().write(text)
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
+    def flush(self) -> None:
+        self._stream().flush()
+
+    def readline(self, size: int = -1) -> str:
+        return self._stream().readline(size)
+
+    def read(self, size: int = -1) -> str:
+        return self._stream().read(size)
+
+    def __iter__(self):
+        return iter(self.readline, "")
+
+    def isatty(self) -> bool:
+        return self._stream().isatty()
+
+    def fileno(self) -> int:
+        # 대상이 지정된 동안에는 파일 번호를 숨겨 input()이 실제 터미널에서 읽지 않게 함
+        if self._target.get() is not None:
+            raise io.UnsupportedOperation("fileno")
+        return self._default.fileno()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream(), name)
+
+
+def install_routing() -> None:
+    """sys.stdout / sys.stderr / sys.stdin을 컨텍스트별 전환 객체로 교체 (한 번만 실행)"""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        sys.stdout = _RoutedStream(sys.stdout, _stdout_target)
+        sys.stderr = _RoutedStream(sys.stderr, _stderr_target)
+        sys.stdin = _RoutedStream(sys.stdin, _stdin_target)
+        _installed = True
+
+
+def is_routing_installed() -> bool:
+    """
+    컨텍스트별 전환이 설치되었는지 여부
+
+    Returns:
+        install_routing을 호출했으면 True
+    """
+    return _installed
+
+
+@contextmanager
+def redirect_console(stdout: Optional[TextIO] = None, stdin: Optional[TextIO] = None,
+                     stderr: Optional[TextIO] = None):
+    """
+    with 블록(과 그 컨텍스트를 이어받은 스레드)의 콘솔 입출력 대상 지정
+
+    install_routing이 설치된 상태에서만 다른 컨텍스트에 영향을 주지 않습니다.
+
+    Args:
+        stdout: 출력 대상 (없으면 그대로)
+        stdin: 입력 대상 (없으면 그대로)
+        stderr: 오류 출력 대상 (없으면 stdout과 같은 대상)
+    """
+    install_routing()
+    tokens = []
+    if stdout is not None:
+        tokens.append((_stdout_target, _stdout_target.set(stdout)))
+    if stderr is not None or stdout is not None:
+        tokens.append((_stderr_target, _stderr_target.set(stderr or stdout)))
+    if stdin is not None:
+        tokens.append((_stdin_target, _stdin_target.set(stdin)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+@contextmanager
+def redirect_input(stream: TextIO):
+    """
+    with 블록의 입력 대상 지정 (전환이 설치되었으면 현재 컨텍스트만, 아니면 sys.stdin 교체)
+
+    Args:
+        stream: 입력 스트림 (예: 빈 입력이면 io.StringIO())
+    """
+    if _installed:
+        token = _stdin_target.set(stream)
+        try:
+            yield
+        finally:
+            _stdin_target.reset(token)
+        return
+
+    original = sys.stdin
+    sys.stdin = stream
+    try:
+        yield
+    finally:
+        sys.stdin = original
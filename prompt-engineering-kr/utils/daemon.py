@@ -0,0 +1,327 @@
+"""
+상주 실행 서버 모듈
+
+`python main.py --serve` 로 인터프리터 하나를 띄워 두고, AI 클라이언트와 연결,
+응답 캐시, 실습 목록, 불러온 실습 모듈을 메모리에 유지합니다.
+`python main.py --connect --run 1.1` 처럼 얇은 클라이언트가 Unix 소켓으로
+명령을 보내면 서버가 실행하고 출력을 그대로 돌려보냅니다. 실습의 input()은
+클라이언트 터미널에서 입력받아 전달하므로 대화형 실습도 그대로 동작합니다.
+
+프로토콜은 한 줄에 JSON 하나입니다.
+- 클라이언트 -> 서버: {"type": "run", "args": [...], "cwd": ...}, {"type": "input", "data": ...},
+  {"type": "shutdown"}
+- 서버 -> 클라이언트: {"type": "output", "stream": "stdout"|"stderr", "data": ...},
+  {"type": "input"} (한 줄 입력 요청), {"type": "exit", "code": ...}
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.config import CONFIG_FILE, get_setting
+
+# 상주 서버 기본 설정값
+DEFAULT_DAEMON_SETTINGS = {
+    "socket_path": None,
+    "preload": True
+}
+
+
+def _get_daemon_setting(key: str) -> Any:
+    """상주 서버 설정값 가져오기 (없으면 기본값)"""
+    return get_setting(f"daemon.{key}", DEFAULT_DAEMON_SETTINGS[key])
+
+
+def get_socket_path(path: Optional[str] = None) -> str:
+    """
+    서버 소켓 경로
+
+    Args:
+        path: 직접 지정한 경로 (없으면 daemon.socket_path 설정, 그것도 없으면 임시 폴더)
+
+    Returns:
+        소켓 파일 경로 (프로젝트마다 다른 이름)
+    """
+    path = path or _get_daemon_setting("socket_path")
+    if path:
+        return path
+    # 클라이언트 시작 시간을 줄이려고 기본 경로가 필요할 때만 import
+    import hashlib
+    import tempfile
+
+    # Unix 소켓 경로 길이 제한(약 100자)을 피하려고 프로젝트 경로 대신 해시 사용
+    digest = hashlib.sha1(os.path.dirname(CONFIG_FILE).encode("utf-8")).hexdigest()[:10]
+    return os.path.join(tempfile.gettempdir(), f"prompt-engineering-kr-{digest}.sock")
+
+
+def _check_unix_socket() -> bool:
+    """Unix 소켓을 쓸 수 있는지 확인 (없으면 안내 출력)"""
+    if hasattr(socket, "AF_UNIX"):
+        return True
+    print("오류: 이 환경에서는 Unix 소켓을 사용할 수 없어 상주 서버를 실행할 수 없습니다.")
+    return False
+
+
+class _Connection:
+    """서버 쪽 연결 하나의 메시지 송수신 (출력 스트림 / 입력 스트림 역할 겸용)"""
+
+    def __init__(self, rfile, wfile):
+        self._rfile = rfile
+        self._wfile = wfile
+        self._write_lock = threading.Lock()
+        self._streams: List["_ConnectionStream"] = []
+        self.closed = False
+
+    def send(self, message: Dict[str, Any]) -> None:
+        """메시지 전송 (클라이언트가 끊겼으면 무시)"""
+        data = (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._write_lock:
+            if self.closed:
+                return
+            try:
+                self._wfile.write(data)
+                self._wfile.flush()
+            except OSError:
+                self.closed = True
+
+    def receive(self) -> Optional[Dict[str, Any]]:
+        """메시지 한 개 수신 (연결이 끊겼으면 None)"""
+        try:
+            line = self._rfile.readline()
+        except OSError:
+            line = b""
+        if not line:
+            self.closed = True
+            return None
+        return json.loads(line.decode("utf-8"))
+
+    def stream(self, name: str) -> "_ConnectionStream":
+        """print 대상으로 쓸 출력/입력 스트림"""
+        stream = _ConnectionStream(self, name)
+        self._streams.append(stream)
+        return stream
+
+    def flush_output(self) -> None:
+        """모아 둔 출력을 모두 전송"""
+        for stream in self._streams:
+            stream.flush()
+
+
+class _ConnectionStream:
+    """연결로 출력을 보내고 입력을 요청하는 텍스트 스트림"""
+
+    encoding = "utf-8"
+
+    def __init__(self, connection: _Connection, name: str):
+        self._connection = connection
+        self._name = name
+        # print 한 번이 write 여러 번으로 나뉘므로 줄 단위로 모아서 전송
+        self._buffer: List[str] = []
+        self._buffer_lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        if text:
+            with self._buffer_lock:
+                self._buffer.append(text)
+            if "\n" in text:
+                self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        with self._buffer_lock:
+            data = "".join(self._buffer)
+            self._buffer.clear()
+        if data:
+            self._connection.send({"type": "output", "stream": self._name, "data": data})
+
+    def readline(self, size: int = -1) -> str:
+        # 입력 안내 문구(줄바꿈 없는 input 프롬프트)가 먼저 보이도록 출력을 비운 뒤 요청
+        self._connection.flush_output()
+        self._connection.send({"type": "input"})
+        message = self._connection.receive()
+        if not message or message.get("type") != "input":
+            return ""
+        return message.get("data", "")
+
+    def read(self, size: int = -1) -> str:
+        return self.readline()
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """클라이언트 연결 하나를 처리"""
+
+    def handle(self) -> None:
+        from utils.console import redirect_console
+
+        connection = _Connection(self.rfile, self.wfile)
+        request = connection.receive()
+        if not request:
+            return
+        if request.get("type") == "shutdown":
+            connection.send({"type": "exit", "code": 0})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+
+        start = time.perf_counter()
+        with redirect_console(stdout=connection.stream("stdout"), stdin=connection.stream("stdin"),
+                              stderr=connection.stream("stderr")):
+            try:
+                code = self.server.execute(request.get("args", []), request.get("cwd") or os.getcwd())
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:
+                print(f"서버에서 명령 실행 중 오류 발생: {type(e).__name__}: {e}")
+                code = 1
+        connection.flush_output()
+        self.server.record(time.perf_counter() - start)
+        connection.send({"type": "exit", "code": code or 0})
+
+
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """요청마다 스레드에서 명령을 실행하는 Unix 소켓 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, execute: Callable[[List[str], str], int]):
+        self.execute = execute
+        self.requests_served = 0
+        self.total_time = 0.0
+        self._stats_lock = threading.Lock()
+        super().__init__(path, _RequestHandler)
+
+    def record(self, elapsed: float) -> None:
+        with self._stats_lock:
+            self.requests_served += 1
+            self.total_time += elapsed
+
+
+def _is_server_running(path: str) -> bool:
+    """소켓 경로에 응답하는 서버가 있는지 확인"""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def warm_up() -> None:
+    """
+    자주 쓰는 모듈과 상태를 미리 준비 (무거운 모듈 import, 실습 목록, 실습 모듈, AI 클라이언트)
+    """
+    start = time.perf_counter()
+    import utils.ai_client  # noqa: F401  (SDK와 HTTP 모듈 import)
+    import utils.exercise_template  # noqa: F401
+    from utils.manifest import get_manifest, iter_entries, PROJECT_ROOT
+
+    get_manifest()
+    loaded = 0
+    if _get_daemon_setting("preload"):
+        from utils.exercise_loader import load_exercise
+        for entry in iter_entries():
+            try:
+                load_exercise(os.path.join(PROJECT_ROOT, entry["path"]))
+                loaded += 1
+            except Exception as e:
+                print(f"실습 모듈 미리 불러오기 실패 ({entry['id']}): {e}")
+
+    # 실습이 사용하는 기본 서비스와 설정된 서비스의 클라이언트를 미리 생성 (API 키가 없으면 건너뜀)
+    from utils.ai_client import get_client
+    for service in {"gemini", get_setting("ai.provider", "gemini")}:
+        try:
+            get_client(service=service)
+        except Exception:
+            pass
+    print(f"준비 완료: 실습 모듈 {loaded}개, {time.perf_counter() - start:.2f}초")
+
+
+def serve(execute: Callable[[List[str], str], int], path: Optional[str] = None) -> int:
+    """
+    상주 서버 실행 (Ctrl-C 또는 --shutdown 요청까지)
+
+    Args:
+        execute: (명령줄 인자 목록, 클라이언트 작업 디렉토리) -> 종료 코드 함수
+        path: 소켓 경로 (없으면 get_socket_path)
+
+    Returns:
+        종료 코드
+    """
+    if not _check_unix_socket():
+        return 1
+    path = get_socket_path(path)
+    if os.path.exists(path):
+        if _is_server_running(path):
+            print(f"오류: 이미 실행 중인 서버가 있습니다 ({path})")
+            return 1
+        os.remove(path)
+
+    warm_up()
+    server = _DaemonServer(path, execute)
+    os.chmod(path, 0o600)
+    print(f"상주 서버 실행 중: {path} (종료: Ctrl-C 또는 python main.py --connect --shutdown)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.remove(path)
+    print(f"상주 서버 종료 (처리한 요청 {server.requests_served}개, 합계 {server.total_time:.2f}초)")
+    return 0
+
+
+def run_client(args: List[str], path: Optional[str] = None, shutdown: bool = False) -> int:
+    """
+    상주 서버에 명령을 보내고 출력을 받아 표시 (서버가 입력을 요청하면 터미널에서 읽어 전달)
+
+    Args:
+        args: 서버에서 실행할 명령줄 인자 (예: ["--run", "1.1"])
+        path: 소켓 경로 (없으면 get_socket_path)
+        shutdown: True이면 서버 종료 요청
+
+    Returns:
+        서버에서 실행한 명령의 종료 코드 (연결 실패 시 1)
+    """
+    if not _check_unix_socket():
+        return 1
+    path = get_socket_path(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError as e:
+        print(f"오류: 상주 서버에 연결할 수 없습니다 ({path}): {e}")
+        print("먼저 python main.py --serve 로 서버를 실행하세요.")
+        sock.close()
+        return 1
+
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    with sock, sock.makefile("rwb") as conn:
+        request = {"type": "shutdown"} if shutdown else {"type": "run", "args": args, "cwd": os.getcwd()}
+        conn.write((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+        conn.flush()
+        for line in conn:
+            message = json.loads(line.decode("utf-8"))
+            kind = message.get("type")
+            if kind == "output":
+                stream = streams.get(message.get("stream"), sys.stdout)
+                stream.write(message["data"])
+                stream.flush()
+            elif kind == "input":
+                data = sys.stdin.readline()
+                conn.write((json.dumps({"type": "input", "data": data}, ensure_ascii=False) + "\n").encode("utf-8"))
+                conn.flush()
+            elif kind == "exit":
+                return message.get("code", 0)
+    print("오류: 서버와의 연결이 끊어졌습니다.")
+    return 1
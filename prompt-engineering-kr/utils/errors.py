@@ -0,0 +1,212 @@
+"""
+AI 서비스 오류 모듈
+
+AI 서비스 호출 실패를 종류별 예외로 구분합니다.
+각 예외는 재시도할 가치가 있는지(retryable)와
+서버가 이미 요청을 처리했을 가능성이 있는지(may_have_executed)를 함께 알려줍니다.
+"""
+
+import sys
+import time
+from typing import Any, Mapping, Optional
+
+
+class AIClientError(Exception):
+    """AI 서비스 호출 오류의 기본 클래스"""
+
+    # 잠시 후 다시 시도하면 성공할 수 있는 오류인지 여부
+    retryable = False
+    # 서버가 요청을 이미 처리했을 수 있는지 여부 (멱등하지 않은 요청은 재시도하면 안 됨)
+    may_have_executed = True
+
+    def __init__(self, message: str, service: Optional[str] = None,
+                 status: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        오류 객체 초기화
+
+        Args:
+            message: 오류 메시지
+            service: AI 서비스 이름
+            status: HTTP 상태 코드 (있는 경우)
+            retry_after: 서버가 알려준 재시도 대기 시간 (초)
+        """
+        super().__init__(message)
+        self.service = service
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AuthenticationError(AIClientError):
+    """API 키가 없거나 권한이 없는 경우 (401, 403)"""
+
+
+class BadRequestError(AIClientError):
+    """요청 형식이나 파라미터가 잘못된 경우 (400, 404, 422 등)"""
+
+
+class TokenLimitError(BadRequestError):
+    """프롬프트가 모델의 컨텍스트 한도를 넘는 경우 (전송 전에 확인)"""
+
+
+class RateLimitError(AIClientError):
+    """요청 한도를 초과한 경우 (429) - 서버는 요청을 처리하지 않음"""
+    retryable = True
+    may_have_executed = False
+
+
+class ServerError(AIClientError):
+    """서버 내부 오류 (5xx)"""
+    retryable = True
+
+
+class OverloadedError(ServerError):
+    """서버 과부하로 요청을 거절한 경우 (503, 529) - 서버는 요청을 처리하지 않음"""
+    may_have_executed = False
+
+
+class APIConnectionError(AIClientError):
+    """응답을 받기 전에 연결이 끊긴 경우"""
+    retryable = True
+
+
+class APIConnectError(APIConnectionError):
+    """서버에 연결하지 못한 경우 - 요청이 전송되지 않음"""
+    may_have_executed = False
+
+
+class APITimeoutError(AIClientError, TimeoutError):
+    """제한 시간 안에 응답을 받지 못한 경우"""
+    retryable = True
+
+
+class ResponseFormatError(AIClientError):
+    """응답을 해석할 수 없는 경우"""
+
+
+class CassetteMissError(AIClientError):
+    """카세트 재생(replay) 모드에서 기록되지 않은 요청을 보낸 경우"""
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    응답 헤더에서 재시도 대기 시간 추출
+
+    retry-after-ms(밀리초), Retry-After(초 또는 HTTP 날짜)를 지원합니다.
+
+    Args:
+        headers: 응답 헤더
+
+    Returns:
+        대기 시간 (초), 헤더가 없거나 해석할 수 없으면 None
+    """
+    if not headers:
+        return None
+    lowered = {str(k).lower(): v for k, v in headers.items()}
+
+    value = lowered.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(float(value) / 1000, 0.0)
+        except ValueError:
+            pass
+
+    value = lowered.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    # email 패키지는 import 비용이 커서 HTTP 날짜 형식일 때만 불러옴
+    from email.utils import parsedate_to_datetime
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def error_from_status(service: str, status: int, body: Any = None,
+                      headers: Optional[Mapping[str, str]] = None) -> AIClientError:
+    """
+    HTTP 오류 응답을 알맞은 예외 객체로 변환
+
+    Args:
+        service: AI 서비스 이름
+        status: HTTP 상태 코드
+        body: 응답 본문 (bytes, 문자열 또는 파싱된 JSON)
+        headers: 응답 헤더
+
+    Returns:
+        AIClientError 하위 클래스의 예외 객체
+    """
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    message = f"{service} API 오류 (HTTP {status}): {str(body)[:200]}"
+    retry_after = parse_retry_after(headers)
+
+    if status in (401, 403):
+        error_cls = AuthenticationError
+    elif status == 429:
+        error_cls = RateLimitError
+    elif status in (503, 529):
+        error_cls = OverloadedError
+    elif status == 408:
+        error_cls = APITimeoutError
+    elif status >= 500:
+        error_cls = ServerError
+    else:
+        error_cls = BadRequestError
+    return error_cls(message, service=service, status=status, retry_after=retry_after)
+
+
+def error_from_exception(service: str, error: BaseException) -> AIClientError:
+    """
+    라이브러리 예외를 알맞은 AIClientError로 변환
+
+    requests / google-api-core / 비동기 HTTP 모듈의 예외를 구분합니다.
+
+    Args:
+        service: AI 서비스 이름
+        error: 원래 예외
+
+    Returns:
+        AIClientError 하위 클래스의 예외 객체 (이미 AIClientError이면 그대로 반환)
+    """
+    if isinstance(error, AIClientError):
+        return error
+
+    # google-api-core 예외는 HTTP 상태 코드를 code 속성으로 가지고 있음
+    code = getattr(error, "code", None)
+    if isinstance(code, int) and code >= 400:
+        return error_from_status(service, code, str(error))
+
+    name = type(error).__name__
+    # 연결 단계에서 실패해 요청이 전송되지 않았음을 알려주는 예외 (비동기 HTTP 모듈)
+    request_sent = getattr(error, "request_sent", True)
+    message = f"{service} API 호출 실패 ({name}): {error}"
+    # requests가 아직 로드되지 않았다면 requests 예외일 수 없으므로 새로 불러오지 않음
+    requests = sys.modules.get("requests")
+
+    if requests is not None:
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return APIConnectError(message, service=service)
+        if isinstance(error, requests.exceptions.Timeout):
+            return APITimeoutError(message, service=service)
+        if isinstance(error, requests.exceptions.ConnectionError):
+            # 연결 자체를 맺지 못한 경우에만 요청이 전송되지 않았다고 판단
+            if "NewConnectionError" in str(error) or "NameResolutionError" in str(error):
+                return APIConnectError(message, service=service)
+            return APIConnectionError(message, service=service)
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            response = error.response
+            return error_from_status(service, response.status_code, response.text, response.headers)
+
+    if isinstance(error, TimeoutError):
+        return APITimeoutError(message, service=service)
+    if request_sent is False or isinstance(error, ConnectionRefusedError):
+        return APIConnectError(message, service=service)
+    if isinstance(error, (ConnectionError, EOFError)):
+        return APIConnectionError(message, service=service)
+    if isinstance(error, (ValueError, KeyError, IndexError)):
+        return ResponseFormatError(message, service=service)
+    return AIClientError(message, service=service)
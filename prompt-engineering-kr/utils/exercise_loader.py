@@ -0,0 +1,128 @@
+"""
+실습 모듈 로더
+
+실습 파일을 작업 디렉토리 변경이나 sys.path 추가 없이 파일 위치로 직접 불러옵니다.
+불러온 모듈은 (경로, 내용 해시)별로 보관하므로 같은 실습을 다시 실행할 때는
+파일을 다시 실행하지 않고, 파일 내용이 바뀌었을 때만 새로 불러옵니다.
+
+불러온 모듈은 sys.modules에 등록하지 않으므로 이름이 같은 실습 파일이나
+다른 파트의 실습이 서로 덮어쓰지 않고, 여러 스레드에서 동시에 실행할 수 있습니다.
+"""
+
+import hashlib
+import importlib.util
+import os
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Dict, Optional, Tuple
+
+from utils.config import CONFIG_FILE
+
+# 프로젝트 루트 (utils 패키지가 있는 폴더)
+PROJECT_ROOT = os.path.dirname(CONFIG_FILE)
+
+# 실습 파일의 `from utils...` 가 항상 이 프로젝트의 utils를 가리키도록 한 번만 등록
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+# 경로 -> (내용 해시, 모듈)
+_modules: Dict[str, Tuple[str, ModuleType]] = {}
+_modules_lock = threading.Lock()
+# 경로별 로드 잠금 (같은 파일을 여러 스레드가 동시에 처음 불러와도 한 번만 실행)
+_path_locks: Dict[str, threading.Lock] = {}
+
+_loader_stats = {"hits": 0, "loads": 0}
+
+
+def exercise_module_name(path: str) -> str:
+    """
+    실습 파일의 모듈 이름 (파일 이름의 점은 밑줄로 바꿈)
+
+    Args:
+        path: 실습 파일 경로
+
+    Returns:
+        모듈 이름 (예: exercise_8_3_1_performance_metrics)
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"exercise_{stem.replace('.', '_')}"
+
+
+def load_exercise(path: str) -> ModuleType:
+    """
+    실습 파일을 모듈로 불러오기 (내용이 같으면 이전에 불러온 모듈 재사용)
+
+    Args:
+        path: 실습 파일 경로
+
+    Returns:
+        실습 모듈
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        Exception: 모듈 최상위 코드 실행 중 발생한 오류
+    """
+    path = os.path.abspath(path)
+    with open(path, 'rb') as f:
+        source = f.read()
+    digest = hashlib.sha1(source).hexdigest()
+
+    cached = _modules.get(path)
+    if cached is not None and cached[0] == digest:
+        with _modules_lock:
+            _loader_stats["hits"] += 1
+        return cached[1]
+
+    with _modules_lock:
+        path_lock = _path_locks.setdefault(path, threading.Lock())
+
+    with path_lock:
+        cached = _modules.get(path)
+        if cached is not None and cached[0] == digest:
+            with _modules_lock:
+                _loader_stats["hits"] += 1
+            return cached[1]
+
+        spec = importlib.util.spec_from_file_location(exercise_module_name(path), path)
+        module = importlib.util.module_from_spec(spec)
+        # 해시를 계산한 내용 그대로 실행 (읽은 뒤 파일이 바뀌어도 캐시와 어긋나지 않음)
+        exec(compile(source, path, "exec"), module.__dict__)
+
+        with _modules_lock:
+            _modules[path] = (digest, module)
+            _loader_stats["loads"] += 1
+        return module
+
+
+def get_loaded_exercise(path: str) -> Optional[ModuleType]:
+    """
+    이미 불러온 실습 모듈 반환 (파일을 읽거나 실행하지 않음)
+
+    Args:
+        path: 실습 파일 경로
+
+    Returns:
+        실습 모듈 (불러온 적이 없으면 None)
+    """
+    cached = _modules.get(os.path.abspath(path))
+    return cached[1] if cached else None
+
+
+def clear_exercise_cache() -> None:
+    """불러온 실습 모듈 캐시 비우기 (다음 실행 때 파일을 다시 실행)"""
+    with _modules_lock:
+        _modules.clear()
+        _path_locks.clear()
+        _loader_stats.update(hits=0, loads=0)
+
+
+def get_loader_stats() -> Dict[str, int]:
+    """
+    로더 통계 반환
+
+    Returns:
+        {"hits": 재사용 횟수, "loads": 파일 실행 횟수, "modules": 보관 중인 모듈 수}
+    """
+    with _modules_lock:
+        return dict(_loader_stats, modules=len(_modules))
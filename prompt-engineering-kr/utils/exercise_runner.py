@@ -0,0 +1,205 @@
+"""
+실습 일괄 실행 모듈
+
+여러 실습 파일을 각각 별도 프로세스에서 무인 실행(headless)으로 돌립니다.
+동시에 실행할 프로세스 수와 실습별 제한 시간을 정할 수 있고, 각 실습의
+표준 출력/오류는 로그 파일로 남기며 마지막에 하나의 요약을 출력합니다.
+
+실습 하나는 `python main.py --worker <파일> --report-file <보고서>` 로 실행되고,
+작업 프로세스는 주제별 결과와 호출 통계를 보고서(JSON)로 남깁니다.
+시간 초과한 프로세스는 종료시키므로 멈춘 실습이 전체 실행을 막지 않습니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from utils.config import CONFIG_FILE, get_setting
+from utils.manifest import iter_entries
+
+# 일괄 실행 기본 설정값
+DEFAULT_RUN_ALL_SETTINGS = {
+    "workers": 4,
+    "timeout": 600.0,
+    "log_dir": ".runs"
+}
+
+# 프로젝트 루트와 작업 프로세스가 실행할 main.py
+PROJECT_ROOT = os.path.dirname(CONFIG_FILE)
+MAIN_SCRIPT = os.path.join(PROJECT_ROOT, "main.py")
+
+
+def _get_run_all_setting(key: str) -> Any:
+    """일괄 실행 설정값 가져오기 (없으면 기본값)"""
+    return get_setting(f"run_all.{key}", DEFAULT_RUN_ALL_SETTINGS[key])
+
+
+def discover_exercises(part_id: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    실습 파일 목록 찾기 (섹션 파일과 하위 섹션 파일 모두 포함, 실습 목록에서 조회)
+
+    Args:
+        part_id: 파트/섹션 ID (예: "8", "8.3", 없으면 전체)
+
+    Returns:
+        ID 순으로 정렬된 {"id", "path"} 목록
+    """
+    return [{"id": entry["id"], "path": os.path.join(PROJECT_ROOT, entry["path"])}
+            for entry in iter_entries(part_id)]
+
+
+def worker_command(script_path: str, report_path: str) -> List[str]:
+    """
+    실습 하나를 실행할 작업 프로세스 명령
+
+    Args:
+        script_path: 실습 파일 경로
+        report_path: 작업 보고서(JSON)를 쓸 경로
+
+    Returns:
+        subprocess에 전달할 명령 목록
+    """
+    return [sys.executable, MAIN_SCRIPT, "--worker", script_path, "--report-file", report_path]
+
+
+def write_worker_report(report_path: str, plan: Dict[str, Any]) -> None:
+    """
+    작업 프로세스의 실행 결과를 보고서로 저장 (작업 프로세스에서 호출)
+
+    Args:
+        report_path: 보고서 경로
+        plan: 실행을 마친 무인 실행 계획
+    """
+    from utils.telemetry import get_telemetry_summary
+
+    totals = {"calls": 0, "errors": 0, "cache_hits": 0}
+    for summary in get_telemetry_summary().values():
+        for key in totals:
+            totals[key] += summary[key]
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump({"results": plan["results"], "telemetry": totals}, f, ensure_ascii=False)
+
+
+def _run_one(exercise: Dict[str, str], log_dir: str, timeout: float) -> Dict[str, Any]:
+    """실습 하나를 작업 프로세스로 실행하고 결과 요약 반환"""
+    name = os.path.splitext(os.path.basename(exercise["path"]))[0]
+    log_path = os.path.join(log_dir, f"{name}.log")
+    fd, report_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".json", dir=log_dir)
+    os.close(fd)
+
+    # 작업 프로세스의 출력이 콘솔 인코딩과 상관없이 UTF-8로 오도록 설정
+    env = dict(os.environ, PYTHONIOENCODING="utf-8")
+    start = time.perf_counter()
+    process = subprocess.Popen(worker_command(exercise["path"], report_path),
+                               stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               cwd=PROJECT_ROOT, env=env)
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+        status = "ok" if process.returncode == 0 else f"exit {process.returncode}"
+    except subprocess.TimeoutExpired:
+        process.kill()
+        stdout, stderr = process.communicate()
+        status = "timeout"
+    duration = time.perf_counter() - start
+
+    with open(log_path, 'wb') as f:
+        f.write(stdout)
+        if stderr:
+            f.write(b"\n----- stderr -----\n")
+            f.write(stderr)
+
+    report = {"results": [], "telemetry": {}}
+    try:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        pass
+    finally:
+        os.remove(report_path)
+
+    failures = [result for result in report["results"] if result.get("error")]
+    if status == "ok" and failures:
+        status = "failed"
+    return {
+        "id": exercise["id"],
+        "path": exercise["path"],
+        "status": status,
+        "duration": duration,
+        "topics": len(report["results"]),
+        "failures": len(failures),
+        "api_calls": report["telemetry"].get("calls", 0),
+        "api_errors": report["telemetry"].get("errors", 0),
+        "cache_hits": report["telemetry"].get("cache_hits", 0),
+        "outputs": sorted({result["saved_to"] for result in report["results"] if result.get("saved_to")}),
+        "log": log_path
+    }
+
+
+def run_exercises(exercises: List[Dict[str, str]],
+                  workers: Optional[int] = None,
+                  timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    실습들을 프로세스별로 동시에 실행
+
+    Args:
+        exercises: discover_exercises가 반환한 실습 목록
+        workers: 동시에 실행할 최대 프로세스 수 (없으면 run_all.workers 설정)
+        timeout: 실습별 제한 시간 (초, 없으면 run_all.timeout 설정)
+
+    Returns:
+        입력 순서를 유지한 실습별 결과 목록
+        (id, path, status, duration, topics, failures, api_calls, api_errors, cache_hits, outputs, log 키)
+    """
+    workers = max(1, int(workers or _get_run_all_setting("workers")))
+    timeout = float(timeout or _get_run_all_setting("timeout"))
+    log_root = get_setting("run_all.log_dir", DEFAULT_RUN_ALL_SETTINGS["log_dir"])
+    if not os.path.isabs(log_root):
+        log_root = os.path.join(PROJECT_ROOT, log_root)
+    log_dir = os.path.join(log_root, time.strftime("%Y%m%d-%H%M%S"))
+    os.makedirs(log_dir, exist_ok=True)
+
+    print(f"실습 {len(exercises)}개를 동시 {workers}개 프로세스로 실행합니다 "
+          f"(실습별 제한 시간 {timeout:.0f}초, 로그: {os.path.relpath(log_dir)})\n")
+    results: List[Optional[Dict[str, Any]]] = [None] * len(exercises)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_run_one, exercise, log_dir, timeout): index
+                   for index, exercise in enumerate(exercises)}
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results[futures[future]] = result
+            print(f"[{done}/{len(exercises)}] {result['id']:<8} {result['status']:<8} "
+                  f"{result['duration']:6.1f}초 | API 호출 {result['api_calls']}회")
+    return results
+
+
+def print_run_report(results: List[Dict[str, Any]], elapsed: float) -> int:
+    """
+    일괄 실행 결과 요약 출력
+
+    Args:
+        results: run_exercises 결과
+        elapsed: 전체 실행 시간 (초)
+
+    Returns:
+        성공하지 못한 실습 수
+    """
+    print("\n===== 일괄 실행 결과 =====\n")
+    print(f"{'ID':<8} {'상태':<8} {'시간(초)':>8} {'주제':>4} {'실패':>4} {'API 호출':>8}  출력 폴더")
+    for result in results:
+        outputs = ", ".join(os.path.relpath(path, PROJECT_ROOT) for path in result["outputs"]) or "-"
+        print(f"{result['id']:<8} {result['status']:<8} {result['duration']:8.1f} "
+              f"{result['topics']:>4} {result['failures']:>4} {result['api_calls']:>8}  {outputs}")
+
+    unsuccessful = [result for result in results if result["status"] != "ok"]
+    print(f"\n전체 {elapsed:.1f}초 (실습별 합계 {sum(r['duration'] for r in results):.1f}초) | "
+          f"API 호출 {sum(r['api_calls'] for r in results)}회 "
+          f"(오류 {sum(r['api_errors'] for r in results)}, 캐시 적중 {sum(r['cache_hits'] for r in results)}) | "
+          f"실패 {len(unsuccessful)}개")
+    for result in unsuccessful:
+        print(f"  - {result['id']} {result['status']}: {os.path.relpath(result['log'])}")
+    return len(unsuccessful)
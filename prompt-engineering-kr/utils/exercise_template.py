@@ -6,19 +6,27 @@
 
 import os
 import sys
-import inspect
+import queue
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Callable, Tuple
 
 from utils.ai_client import get_completion
+from utils.errors import AIClientError
 from utils.prompt_builder import PromptBuilder
-from utils.file_handler import save_markdown
+from utils.file_handler import save_markdown, get_chapter_info
 from utils.ui_helpers import (
     print_header, print_step, get_user_input, 
     display_results_comparison, print_prompt_summary,
     print_learning_points
 )
 from utils.example_data import get_examples_by_category
-from utils.chapter_utils import get_chapter_save_path
+from utils.chapter_utils import get_caller_file, get_chapter_save_path
+from utils.config import get_setting, is_debug_enabled
+from utils.telemetry import set_chapter
+from utils.headless import get_headless_plan, iter_plan_topics
 
 def run_exercise(
     title: str,
@@ -26,7 +34,8 @@ def run_exercise(
     get_basic_prompt: Callable[[str], str],
     get_enhanced_prompt: Callable[[str, Optional[str], Optional[str]], str],
     prompt_summary: Dict[str, List[str]],
-    learning_points: List[str]
+    learning_points: List[str],
+    stream: Optional[bool] = None
 ) -> None:
     """
     표준 실습 실행 함수
@@ -38,12 +47,25 @@ def run_exercise(
         get_enhanced_prompt: 향상된 프롬프트 생성 함수
         prompt_summary: 프롬프트 요약 정보
         learning_points: 학습 포인트 목록
+        stream: 응답을 생성되는 대로 출력할지 여부 (없으면 output.stream 설정 사용)
     """
-    # 디버그 정보 출력
-    frame = inspect.stack()[1]
-    calling_file = frame.filename
-    print(f"실행 파일: {calling_file}")
-    print(f"파일 이름: {os.path.basename(calling_file)}")
+    if stream is None:
+        stream = get_setting("output.stream", False)
+    
+    # 디버그 정보 출력 (logging.log_level이 DEBUG일 때만)
+    calling_file = get_caller_file()
+    if is_debug_enabled():
+        print(f"실행 파일: {calling_file}")
+        print(f"파일 이름: {os.path.basename(calling_file)}")
+    
+    # 이후 AI 호출의 원격 측정 기록에 챕터 표시 (챕터별 지연 시간 집계용)
+    set_chapter(get_chapter_info(calling_file)[0])
+    
+    # 무인 실행 중이면 질문 없이 계획된 모든 주제를 동시에 실행
+    plan = get_headless_plan()
+    if plan is not None:
+        run_exercise_headless(title, topic_options, get_basic_prompt, get_enhanced_prompt, calling_file, plan)
+        return
     
     print_header(title)
     
@@ -62,33 +84,52 @@ def run_exercise(
     # 주제 선택 및 관련 정보 처리
     topic, purpose, output_format = select_topic(topic_options)
     
-    # 2. 기본 프롬프트 실행 단계
-    print_step(2, "기본 프롬프트로 요청하기")
-    
-    # 기본 프롬프트 생성
+    # 두 요청은 서로 독립적이므로 주제가 정해지는 즉시 함께 보내고,
+    # 화면 출력은 기존 단계 순서대로 진행 (전체 대기 시간: 두 요청의 합 → 최댓값)
     basic_prompt = get_basic_prompt(topic)
-    
-    print("\n기본 프롬프트:")
-    print(f"'{basic_prompt}'")
-    
-    # AI 응답 요청
-    print("\n응답 생성 중...")
-    basic_result = get_completion(basic_prompt, temperature=0.7)
-    
-    print("\n✅ 기본 프롬프트 응답이 생성되었습니다.")
-    
-    # 3. 향상된 프롬프트 실행 단계
-    print_step(3, "향상된 프롬프트로 요청하기")
-    
-    # 향상된 프롬프트 생성
     enhanced_prompt = get_enhanced_prompt(topic, purpose, output_format)
     
-    # 프롬프트 요약 정보 출력
-    print_prompt_summary("향상된", prompt_summary.get("enhanced", []))
-    
-    # AI 응답 요청
-    print("\n응답 생성 중...")
-    enhanced_result = get_completion(enhanced_prompt, temperature=0.5)
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="exercise")
+    basic_request = enhanced_request = None
+    try:
+        basic_request = PendingCompletion(executor, basic_prompt, temperature=0.7, stream=stream)
+        enhanced_request = PendingCompletion(executor, enhanced_prompt, temperature=0.5, stream=stream)
+        
+        # 2. 기본 프롬프트 실행 단계
+        print_step(2, "기본 프롬프트로 요청하기")
+        
+        print("\n기본 프롬프트:")
+        print(f"'{basic_prompt}'")
+        
+        # AI 응답 대기
+        print("\n응답 생성 중...")
+        try:
+            basic_result = basic_request.result()
+        except AIClientError as e:
+            print_request_failure(e)
+            return
+        
+        print("\n✅ 기본 프롬프트 응답이 생성되었습니다.")
+        
+        # 3. 향상된 프롬프트 실행 단계
+        print_step(3, "향상된 프롬프트로 요청하기")
+        
+        # 프롬프트 요약 정보 출력
+        print_prompt_summary("향상된", prompt_summary.get("enhanced", []))
+        
+        # AI 응답 대기
+        print("\n응답 생성 중...")
+        try:
+            enhanced_result = enhanced_request.result()
+        except AIClientError as e:
+            print_request_failure(e)
+            return
+    finally:
+        # 실패, Ctrl-C 등으로 중단하면 남은 요청을 시작하지 않고 스트리밍 수신도 멈춤
+        for request in (basic_request, enhanced_request):
+            if request is not None:
+                request.cancel()
+        shutdown_executor(executor)
     
     print("\n✅ 향상된 프롬프트 응답이 생성되었습니다.")
     
@@ -109,6 +150,228 @@ def run_exercise(
     # 학습 포인트 출력
     print_learning_points(learning_points)
 
+def run_exercise_headless(
+    title: str,
+    topic_options: Dict[str, Any],
+    get_basic_prompt: Callable[[str], str],
+    get_enhanced_prompt: Callable[[str, Optional[str], Optional[str]], str],
+    calling_file: str,
+    plan: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    무인 실행 계획의 모든 주제를 질문 없이 실행
+    
+    주제별 기본/향상된 요청을 한꺼번에 스레드 풀에 넣고,
+    주제 순서대로 결과를 기다려 저장합니다.
+    
+    Args:
+        title: 실습 제목
+        topic_options: 주제 선택 옵션
+        get_basic_prompt: 기본 프롬프트 생성 함수
+        get_enhanced_prompt: 향상된 프롬프트 생성 함수
+        calling_file: 실습 파일 경로 (결과 저장 위치 결정)
+        plan: 무인 실행 계획 (주제별 결과가 plan["results"]에 추가됨)
+        
+    Returns:
+        주제별 결과 목록 (option, topic, error, elapsed, saved_to 키)
+        (elapsed는 주제별 요청 시작부터 두 응답이 끝날 때까지의 시간, 전체 시간은 plan["elapsed"])
+    """
+    print_header(f"{title} (무인 실행)")
+    
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=plan["max_concurrency"], thread_name_prefix="headless")
+    runs = []
+    results = []
+    try:
+        for key, option in iter_plan_topics(topic_options, plan):
+            topic, purpose, output_format = resolve_topic(option)
+            basic_prompt = get_basic_prompt(topic)
+            enhanced_prompt = get_enhanced_prompt(topic, purpose, output_format)
+            topic_start = time.perf_counter()
+            runs.append((key, topic, basic_prompt, enhanced_prompt, topic_start,
+                         PendingCompletion(executor, basic_prompt, temperature=0.7),
+                         PendingCompletion(executor, enhanced_prompt, temperature=0.5)))
+        
+        print(f"주제 {len(runs)}개를 동시 {plan['max_concurrency']}개까지 요청합니다.")
+        for key, topic, basic_prompt, enhanced_prompt, topic_start, basic_request, enhanced_request in runs:
+            result = {"option": key, "topic": topic, "error": None, "elapsed": 0.0, "saved_to": None}
+            # 한 주제의 실패(요청, 저장 등)가 나머지 주제의 실행과 보고를 막지 않도록 주제별로 처리
+            try:
+                basic_result = basic_request.result()
+                enhanced_result = enhanced_request.result()
+                result["elapsed"] = max(basic_request.finished_at, enhanced_request.finished_at) - topic_start
+                print(f"\n✅ [{key}] {topic}: 응답이 생성되었습니다.")
+                if plan["save"]:
+                    save_results(topic, basic_prompt, basic_result, enhanced_prompt, enhanced_result, calling_file)
+                    result["saved_to"] = get_chapter_save_path(calling_file)
+            except Exception as e:
+                enhanced_request.cancel()
+                result["error"] = str(e) if isinstance(e, AIClientError) else f"{type(e).__name__}: {e}"
+                result["elapsed"] = time.perf_counter() - topic_start
+                print(f"\n⚠️ [{key}] {topic}: 실패했습니다: {result['error']}")
+            results.append(result)
+            plan["results"].append(result)
+    finally:
+        # Ctrl-C 등으로 중단하면 아직 시작하지 않은 주제의 요청은 보내지 않음
+        for *_, basic_request, enhanced_request in runs:
+            basic_request.cancel()
+            enhanced_request.cancel()
+        shutdown_executor(executor)
+        plan["elapsed"] = plan.get("elapsed", 0.0) + time.perf_counter() - start
+    
+    print(f"\n무인 실행 완료: 주제 {len(results)}개, 전체 {time.perf_counter() - start:.2f}초")
+    return results
+
+def request_completion(prompt: str, temperature: float = 0.7, stream: bool = False) -> str:
+    """
+    AI 응답 요청 (스트리밍 시 생성되는 대로 화면에 출력)
+    
+    Args:
+        prompt: 프롬프트
+        temperature: 응답 다양성 조절
+        stream: 스트리밍 출력 여부
+        
+    Returns:
+        전체 응답 텍스트
+    """
+    if not stream:
+        return get_completion(prompt, temperature=temperature)
+    
+    response = get_completion(prompt, temperature=temperature, stream=True)
+    print()
+    for delta in response:
+        print(delta, end="", flush=True)
+    print()
+    
+    print_stream_metrics(response)
+    return response.text
+
+def print_stream_metrics(response) -> None:
+    """
+    스트리밍 응답의 첫 응답 지연과 전체 소요 시간 출력
+    
+    Args:
+        response: 조각을 모두 받은 StreamingResponse
+    """
+    metrics = response.metrics
+    if metrics.get("ttft") is not None:
+        print(f"\n⏱️ 첫 응답까지 {metrics['ttft']:.2f}초, 전체 {metrics['total_time']:.2f}초")
+
+def shutdown_executor(executor: ThreadPoolExecutor) -> None:
+    """
+    스레드 풀을 기다리지 않고 종료 (아직 시작하지 않은 작업은 취소)
+    
+    Args:
+        executor: 종료할 스레드 풀
+    """
+    if sys.version_info >= (3, 9):
+        executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        # cancel_futures는 Python 3.9부터 지원
+        executor.shutdown(wait=False)
+
+class PendingCompletion:
+    """
+    백그라운드 스레드에서 미리 시작한 AI 응답 요청
+    
+    스트리밍 요청은 받은 조각을 큐에 쌓아 두었다가 result 호출 시
+    화면에 이어서 출력하므로, 두 요청의 출력이 섞이지 않습니다.
+    호출 스레드의 컨텍스트(원격 측정 챕터 표시 등)를 그대로 이어받습니다.
+    """
+    
+    _DONE = object()
+    
+    def __init__(self, executor: ThreadPoolExecutor, prompt: str,
+                 temperature: float = 0.7, stream: bool = False):
+        """
+        요청 시작
+        
+        Args:
+            executor: 요청을 실행할 스레드 풀
+            prompt: 프롬프트
+            temperature: 응답 다양성 조절
+            stream: 스트리밍 출력 여부
+        """
+        self.stream = stream
+        # 요청이 끝난(성공/실패) 시각 (time.perf_counter 기준, 끝나기 전에는 None)
+        self.finished_at: Optional[float] = None
+        self._deltas = queue.Queue()
+        self._cancelled = threading.Event()
+        context = contextvars.copy_context()
+        self._future = executor.submit(context.run, self._run, prompt, temperature)
+    
+    def _run(self, prompt: str, temperature: float):
+        """작업 스레드에서 실행되는 요청 본체"""
+        try:
+            if not self.stream:
+                return get_completion(prompt, temperature=temperature)
+            response = get_completion(prompt, temperature=temperature, stream=True)
+            for delta in response:
+                if self._cancelled.is_set():
+                    break
+                self._deltas.put(delta)
+            return response
+        finally:
+            # future가 완료되기 전에 기록 (완료 콜백은 result()를 기다리던 스레드가 깨어난 뒤에 실행됨)
+            self.finished_at = time.perf_counter()
+            if self.stream:
+                self._deltas.put(self._DONE)
+    
+    def _iter_deltas(self):
+        """큐에 쌓인 조각을 요청이 끝날 때까지 차례로 반환"""
+        while True:
+            delta = self._deltas.get()
+            if delta is self._DONE:
+                return
+            yield delta
+    
+    def result(self) -> str:
+        """
+        응답이 끝날 때까지 기다린 뒤 전체 텍스트 반환 (스트리밍 시 받은 조각 출력)
+        
+        Returns:
+            전체 응답 텍스트
+            
+        Raises:
+            AIClientError: 재시도 후에도 응답을 받지 못한 경우 (캐시, 기록 등 다른 오류도 변환)
+        """
+        if not self.stream:
+            return self._wait()
+        
+        print()
+        for delta in self._iter_deltas():
+            print(delta, end="", flush=True)
+        response = self._wait()
+        print()
+        
+        print_stream_metrics(response)
+        return response.text
+    
+    def _wait(self):
+        """작업 스레드의 결과 반환 (AIClientError가 아닌 오류는 AIClientError로 변환)"""
+        try:
+            return self._future.result()
+        except AIClientError:
+            raise
+        except Exception as e:
+            # 응답 캐시, 원격 측정 등 부가 기능의 오류도 실습을 중단시키지 않고 요청 실패로 안내
+            raise AIClientError(f"{type(e).__name__}: {e}") from e
+    
+    def cancel(self) -> None:
+        """결과가 더 이상 필요 없음을 표시 (시작 전이면 취소, 스트리밍 중이면 수신 중단)"""
+        self._cancelled.set()
+        self._future.cancel()
+
+def print_request_failure(error: AIClientError) -> None:
+    """
+    AI 응답 요청 실패 안내 (오류 내용을 결과로 저장하지 않고 실습 중단)
+    
+    Args:
+        error: 발생한 오류
+    """
+    print(f"\n⚠️ 응답을 생성하지 못했습니다: {error}")
+    print("잠시 후 다시 실행하거나 API 키와 네트워크 연결을 확인하세요.")
+
 def select_topic(topic_options: Dict[str, Any]) -> Tuple[str, str, str]:
     """
     주제 선택 처리
@@ -126,15 +389,7 @@ def select_topic(topic_options: Dict[str, Any]) -> Tuple[str, str, str]:
         purpose = get_user_input("이 정보를 사용할 목적을 입력하세요", "휴가 계획 수립")
         output_format = get_user_input("원하는 출력 형식을 입력하세요", "일정표")
     else:
-        selected = topic_options.get(choice, topic_options["1"])
-        if isinstance(selected, dict):
-            topic = selected.get("topic", "")
-            purpose = selected.get("name", "") + " 작성"
-            output_format = selected.get("output_format", "")
-        else:
-            topic = selected
-            purpose = "정보 수집"
-            output_format = "구조화된 형식"
+        topic, purpose, output_format = resolve_topic(topic_options.get(choice, topic_options["1"]))
     
     print(f"\n선택한 주제: {topic}")
     print(f"사용 목적: {purpose}")
@@ -142,6 +397,27 @@ def select_topic(topic_options: Dict[str, Any]) -> Tuple[str, str, str]:
     
     return topic, purpose, output_format
 
+def resolve_topic(selected: Any) -> Tuple[str, str, str]:
+    """
+    주제 옵션 값을 주제, 목적, 출력 형식으로 변환
+    
+    Args:
+        selected: 주제 옵션 값 (name/topic/output_format 딕셔너리, 직접 지정한
+            topic/purpose/output_format 딕셔너리 또는 주제 문자열)
+        
+    Returns:
+        주제, 목적, 출력 형식 튜플
+    """
+    if isinstance(selected, dict):
+        topic = selected.get("topic", "")
+        purpose = selected.get("purpose") or selected.get("name", "") + " 작성"
+        output_format = selected.get("output_format", "")
+    else:
+        topic = selected
+        purpose = "정보 수집"
+        output_format = "구조화된 형식"
+    return topic, purpose, output_format
+
 def save_comparison(basic_prompt, basic_result, enhanced_prompt, enhanced_result, topic, filename=None, calling_file=None):
     """
     기본 프롬프트와 향상된 프롬프트의 비교 결과를 저장합니다.
@@ -160,8 +436,7 @@ def save_comparison(basic_prompt, basic_result, enhanced_prompt, enhanced_result
     """
     # 호출 파일이 제공되지 않으면 호출 스택에서 추출
     if calling_file is None:
-        frame = inspect.stack()[1]
-        calling_file = frame.filename
+        calling_file = get_caller_file()
     
     # 파일 이름이 제공되지 않으면 주제에서 생성
     if filename is None:
@@ -235,8 +510,7 @@ def save_results(
     """
     # 호출 파일이 제공되지 않으면 호출 스택에서 추출
     if calling_file is None:
-        frame = inspect.stack()[1]
-        calling_file = frame.filename
+        calling_file = get_caller_file()
     
     # 파일명 생성
     safe_topic = topic.replace(' ', '_').lower()
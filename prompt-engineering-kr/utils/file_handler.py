@@ -7,10 +7,12 @@
 import os
 import json
 import csv
-import inspect
 import re
+from functools import lru_cache
 from typing import Dict, List, Any, Union, Optional, Tuple
 
+from utils.chapter_utils import PROJECT_ROOT, ensure_directory, get_caller_file
+
 def read_file(file_path: str, encoding: str = 'utf-8') -> str:
     """
     파일 읽기 함수
@@ -128,24 +130,21 @@ def get_chapter_info(calling_file: str = None) -> Tuple[Optional[str], str, str]
     """
     # 호출 파일이 제공되지 않으면 스택에서 추출
     if calling_file is None:
-        frame = inspect.stack()[1]
-        calling_file = frame.filename
+        calling_file = get_caller_file()
     
+    return _resolve_chapter_info(os.path.abspath(calling_file))
+
+@lru_cache(maxsize=512)
+def _resolve_chapter_info(file_path: str) -> Tuple[Optional[str], str, str]:
+    """파일 절대 경로별 챕터 정보 계산 (결과를 기억해 같은 파일은 한 번만 계산)"""
     # 파일 경로 정규화
-    file_path = os.path.abspath(calling_file)
     file_basename = os.path.basename(file_path)
     
     # 기본값 설정
     chapter_id = None
     chapter_name = "unknown"
     
-    # 프로젝트 루트 찾기
-    project_root = os.path.dirname(file_path)
-    while project_root and os.path.basename(project_root).lower() != 'prompt-engineering-kr':
-        parent = os.path.dirname(project_root)
-        if parent == project_root:  # 루트에 도달
-            break
-        project_root = parent
+    project_root = PROJECT_ROOT
     
     # 파일 이름 패턴에서 챕터 ID와 이름 추출
     # 패턴 1: 1.1_clear_instructions.py
@@ -183,8 +182,7 @@ def get_chapter_results_dir(calling_file: str = None) -> str:
     
     # 호출 파일이 제공되지 않으면 스택에서 추출
     if calling_file is None:
-        frame = inspect.stack()[1]
-        calling_file = frame.filename
+        calling_file = get_caller_file()
     
     # 새로운 chapter_utils 모듈의 함수 사용
     return get_chapter_save_path(calling_file)
@@ -209,8 +207,7 @@ def get_templates_path() -> str:
     Returns:
         템플릿 디렉토리 절대 경로
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(base_dir, 'templates')
+    return os.path.join(PROJECT_ROOT, 'templates')
 
 
 def load_template(template_name: str, encoding: str = 'utf-8') -> str:
@@ -275,8 +272,7 @@ def save_markdown(content: Union[str, Dict[str, str]],
     # 파일 경로 처리
     if use_chapter_path:
         # 호출자 스택에서 호출 파일 가져오기
-        frame = inspect.stack()[1]
-        caller_file = frame.filename
+        caller_file = get_caller_file()
         
         # 챕터 기반 결과 경로 가져오기
         chapter_results_dir = get_chapter_save_path(caller_file)
@@ -291,8 +287,7 @@ def save_markdown(content: Union[str, Dict[str, str]],
         # 챕터 경로를 사용하지 않는 경우
         if not os.path.isabs(file_path):
             # 상대 경로인 경우 프로젝트 루트의 results 디렉토리에 저장
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            full_path = os.path.join(base_dir, "results", file_path)
+            full_path = os.path.join(PROJECT_ROOT, "results", file_path)
         else:
             # 절대 경로인 경우 그대로 사용
             full_path = file_path
@@ -302,7 +297,7 @@ def save_markdown(content: Union[str, Dict[str, str]],
         full_path += '.md'
     
     # 디렉토리가 없으면 생성
-    os.makedirs(os.path.dirname(os.path.abspath(full_path)), exist_ok=True)
+    ensure_directory(os.path.dirname(os.path.abspath(full_path)))
     
     # 파일에 저장
     with open(full_path, 'w', encoding=encoding) as f:
@@ -0,0 +1,239 @@
+"""
+무인(headless) 실행 모듈
+
+주제 선택과 저장 여부를 묻지 않고 실습을 실행합니다. 캐시를 미리 채우거나
+밤사이 결과를 만들어 둘 때 `python main.py --headless` 로 사용합니다.
+
+입력 스크립트는 JSON 또는 YAML(PyYAML 설치 시) 파일이며, 문자열 "all"은
+모든 섹션의 모든 주제 옵션을 뜻합니다.
+
+    {
+        "max_concurrency": 4,
+        "save": true,
+        "exercises": [
+            {"section": "1.1", "options": "all"},
+            {"file": "exercises/part1/1.1/1.1.2_key_questions.py",
+             "options": ["1", "3"],
+             "topics": [{"topic": "여름 휴가 계획", "purpose": "휴가 계획 수립", "output_format": "일정표"}],
+             "answers": {"선택하세요": "2"}}
+        ]
+    }
+
+- options: 실행할 주제 옵션 키 목록 또는 "all" (생략 시 "all")
+- topics: 옵션 외에 직접 입력한 주제로 추가 실행할 항목
+- answers: run_exercise를 쓰지 않는 실습의 get_user_input 질문(일부 문자열) -> 응답
+  (지정하지 않은 질문에는 기본값 사용)
+"""
+
+import contextvars
+import json
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from utils.config import get_setting
+
+# 무인 실행 기본 설정값
+DEFAULT_HEADLESS_SETTINGS = {
+    "max_concurrency": 4,
+    "save_results": True
+}
+
+# 현재 컨텍스트에서 실행 중인 실습의 무인 실행 계획 (없으면 대화형 실행)
+_current_plan: contextvars.ContextVar = contextvars.ContextVar("headless_plan", default=None)
+
+
+def _get_headless_setting(key: str) -> Any:
+    """무인 실행 설정값 가져오기 (없으면 기본값)"""
+    return get_setting(f"headless.{key}", DEFAULT_HEADLESS_SETTINGS[key])
+
+
+def make_plan(options: Union[str, List[str]] = "all",
+              topics: Optional[List[Dict[str, str]]] = None,
+              answers: Optional[Dict[str, str]] = None,
+              max_concurrency: Optional[int] = None,
+              save: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    실습 하나의 무인 실행 계획 생성
+
+    Args:
+        options: 실행할 주제 옵션 키 목록 또는 "all"
+        topics: 직접 지정할 주제 목록 (topic, purpose, output_format 키)
+        answers: get_user_input 질문(일부 문자열) -> 응답
+        max_concurrency: 동시에 진행할 최대 요청 수 (없으면 headless.max_concurrency 설정)
+        save: 결과 저장 여부 (없으면 headless.save_results 설정)
+
+    Returns:
+        실행 계획 딕셔너리 (실행 후 results 키에 주제별 결과가, elapsed 키에 전체 실행 시간이 쌓임)
+
+    Raises:
+        ValueError: options나 topics 형식이 잘못된 경우
+    """
+    if options != "all":
+        if isinstance(options, (str, int)):
+            options = [options]
+        options = [str(key) for key in options]
+    for topic in topics or []:
+        if not isinstance(topic, dict) or not topic.get("topic"):
+            raise ValueError(f"topics 항목에는 topic 키가 필요합니다: {topic!r}")
+    return {
+        "options": options,
+        "topics": list(topics or []),
+        "answers": dict(answers or {}),
+        "max_concurrency": max(1, int(max_concurrency or _get_headless_setting("max_concurrency"))),
+        "save": _get_headless_setting("save_results") if save is None else bool(save),
+        "results": [],
+        "elapsed": 0.0
+    }
+
+
+def load_script(source: str) -> Dict[str, Any]:
+    """
+    무인 실행 입력 스크립트 읽기
+
+    Args:
+        source: 스크립트 파일 경로(.json/.yaml/.yml) 또는 "all"
+
+    Returns:
+        {"exercises": [{"section" 또는 "file", "plan"}, ...]} 딕셔너리
+        ("all"이면 exercises가 None이며 모든 섹션을 실행한다는 뜻)
+
+    Raises:
+        FileNotFoundError: 스크립트 파일이 없는 경우
+        ValueError: 스크립트 형식이 잘못되었거나 YAML을 읽을 수 없는 경우
+    """
+    if source == "all":
+        return {"exercises": None, "defaults": make_plan()}
+
+    with open(source, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    if source.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML 스크립트를 읽으려면 PyYAML을 설치하세요 (pip install pyyaml)")
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+
+    if data == "all":
+        return {"exercises": None, "defaults": make_plan()}
+    if isinstance(data, list):
+        data = {"exercises": data}
+    if not isinstance(data, dict) or not isinstance(data.get("exercises"), list):
+        raise ValueError("스크립트에는 exercises 목록이 필요합니다")
+
+    max_concurrency = data.get("max_concurrency")
+    save = data.get("save")
+    exercises = []
+    for entry in data["exercises"]:
+        if isinstance(entry, str):
+            entry = {"section": entry}
+        if not isinstance(entry, dict) or not (entry.get("section") or entry.get("file")):
+            raise ValueError(f"exercises 항목에는 section 또는 file 키가 필요합니다: {entry!r}")
+        plan = make_plan(
+            options=entry.get("options", "all"),
+            topics=entry.get("topics"),
+            answers=entry.get("answers"),
+            max_concurrency=entry.get("max_concurrency", max_concurrency),
+            save=entry.get("save", save)
+        )
+        exercises.append({"section": entry.get("section"), "file": entry.get("file"), "plan": plan})
+
+    return {"exercises": exercises, "defaults": make_plan(max_concurrency=max_concurrency, save=save)}
+
+
+@contextmanager
+def headless_scope(plan: Dict[str, Any]):
+    """
+    with 블록 안에서 실행되는 실습을 무인 실행 계획대로 처리
+
+    Args:
+        plan: make_plan으로 만든 실행 계획
+    """
+    token = _current_plan.set(plan)
+    try:
+        yield plan
+    finally:
+        _current_plan.reset(token)
+
+
+def get_headless_plan() -> Optional[Dict[str, Any]]:
+    """
+    현재 컨텍스트의 무인 실행 계획 반환
+
+    Returns:
+        실행 계획 (대화형 실행 중이면 None)
+    """
+    return _current_plan.get()
+
+
+def scripted_input(prompt: str, default: str = "") -> Optional[str]:
+    """
+    무인 실행 중인 get_user_input 질문에 대한 응답
+
+    Args:
+        prompt: 질문 문구
+        default: 기본값
+
+    Returns:
+        answers에서 찾은 응답 또는 기본값 (대화형 실행 중이면 None)
+    """
+    plan = _current_plan.get()
+    if plan is None:
+        return None
+    answer = next((value for key, value in plan["answers"].items() if key in prompt), default)
+    print(f"{prompt} [무인 실행]: {answer}")
+    return str(answer)
+
+
+def iter_plan_topics(topic_options: Dict[str, Any], plan: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+    """
+    실행 계획에 포함된 주제 옵션 반환
+
+    Args:
+        topic_options: 실습의 주제 옵션
+        plan: 실행 계획
+
+    Returns:
+        (옵션 키, 옵션 값) 이터레이터 (직접 지정한 주제는 키가 "0")
+    """
+    keys = list(topic_options) if plan["options"] == "all" else plan["options"]
+    for key in keys:
+        if key not in topic_options:
+            print(f"⚠️ 주제 옵션 '{key}'이(가) 없어 건너뜁니다.")
+            continue
+        yield key, topic_options[key]
+    for topic in plan["topics"]:
+        yield "0", topic
+
+
+def print_plan_report(plans: List[Tuple[str, Dict[str, Any]]]) -> int:
+    """
+    무인 실행 결과 요약 출력
+
+    Args:
+        plans: (실습 이름, 실행 계획) 목록
+
+    Returns:
+        실패한 주제 수
+    """
+    print("\n===== 무인 실행 결과 =====\n")
+    failed = 0
+    for name, plan in plans:
+        if not plan["results"]:
+            print(f"- {name}: run_exercise 결과 없음")
+            continue
+        for result in plan["results"]:
+            if result["error"]:
+                failed += 1
+                status = f"실패 ({result['error']})"
+            else:
+                status = f"완료 {result['elapsed']:.2f}초"
+            print(f"- {name} [{result['option']}] {result['topic']}: {status}")
+            if result.get("saved_to"):
+                print(f"    {os.path.relpath(result['saved_to'])}")
+        print(f"  {name} 전체 {plan.get('elapsed', 0.0):.2f}초 (주제 {len(plan['results'])}개 동시 실행)")
+    print(f"\n실패: {failed}건")
+    return failed
@@ -0,0 +1,221 @@
+"""
+HTTP 연결 풀 관리 모듈
+
+AI 서비스별로 keep-alive 세션을 프로세스 전체에서 공유하여
+매 요청마다 발생하는 TCP/TLS 핸드셰이크 비용을 줄입니다.
+requests는 import 비용이 크므로 처음 세션을 만들 때 불러옵니다.
+"""
+
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from utils.config import get_setting, add_setting_listener
+from utils.telemetry import record_add
+
+# 연결 풀 기본 설정값
+DEFAULT_POOL_SETTINGS = {
+    "pool_connections": 4,   # 서비스별로 유지할 호스트 풀 개수
+    "pool_maxsize": 10,      # 호스트당 최대 연결 수
+    "pool_block": False,     # 연결이 모두 사용 중일 때 대기 여부
+    "timeout": 30,           # 요청 타임아웃 (초)
+    "max_concurrency": 32,   # 이벤트 루프별 최대 동시 비동기 요청 수
+    "coalesce": True         # 진행 중인 동일 요청을 하나로 병합할지 여부
+}
+
+# 서비스별 공유 세션(requests.Session) 및 통계
+_sessions: Dict[str, Any] = {}
+_stats: Dict[str, 'PoolStats'] = {}
+_lock = threading.Lock()
+
+
+class PoolStats:
+    """서비스별 연결 풀 사용 통계"""
+
+    def __init__(self):
+        """통계 초기화"""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """모든 통계값을 0으로 초기화"""
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+            self.wait_time = 0.0
+            self.max_wait_time = 0.0
+            self.connect_time = 0.0
+
+    def record_checkout(self, wait_time: float) -> None:
+        """풀에서 연결을 꺼낸 기록 (대기 시간은 진행 중인 호출의 원격 측정 기록에도 더함)"""
+        with self._lock:
+            self.requests += 1
+            self.wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+        record_add("queue_wait", wait_time)
+
+    def record_connect(self, connect_time: float) -> None:
+        """새 TCP(TLS) 연결을 맺은 기록 (연결 시간은 진행 중인 호출의 원격 측정 기록에도 더함)"""
+        with self._lock:
+            self.new_connections += 1
+            self.connect_time += connect_time
+        record_add("connect_time", connect_time)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        통계를 딕셔너리로 반환
+
+        Returns:
+            요청 수, 재사용(hits), 새 연결 수, 대기/연결 시간 정보
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hits": max(self.requests - self.new_connections, 0),
+                "new_connections": self.new_connections,
+                "wait_time": self.wait_time,
+                "max_wait_time": self.max_wait_time,
+                "connect_time": self.connect_time
+            }
+
+
+def _instrument_pool(pool_cls, stats: PoolStats):
+    """연결 생성과 대기 시간을 기록하는 urllib3 풀 클래스 생성"""
+
+    class InstrumentedConnection(pool_cls.ConnectionCls):
+        def connect(self):
+            start = time.perf_counter()
+            super().connect()
+            stats.record_connect(time.perf_counter() - start)
+
+    class InstrumentedPool(pool_cls):
+        ConnectionCls = InstrumentedConnection
+
+        def _get_conn(self, timeout=None):
+            start = time.perf_counter()
+            conn = super()._get_conn(timeout)
+            stats.record_checkout(time.perf_counter() - start)
+            return conn
+
+    return InstrumentedPool
+
+
+def _make_adapter_class():
+    """연결 통계를 수집하는 HTTP 어댑터 클래스 생성 (requests를 처음 사용할 때 한 번만 호출)"""
+    from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class PooledHTTPAdapter(HTTPAdapter):
+        """연결 통계를 수집하는 HTTP 어댑터"""
+
+        def __init__(self, stats: PoolStats, **kwargs):
+            """
+            어댑터 초기화
+
+            Args:
+                stats: 통계를 기록할 PoolStats 객체
+                **kwargs: HTTPAdapter 인자 (pool_connections, pool_maxsize, pool_block 등)
+            """
+            # HTTPAdapter.__init__에서 init_poolmanager를 호출하므로 먼저 설정
+            self._stats = stats
+            super().__init__(**kwargs)
+
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": _instrument_pool(HTTPConnectionPool, self._stats),
+                "https": _instrument_pool(HTTPSConnectionPool, self._stats)
+            }
+
+    return PooledHTTPAdapter
+
+
+_adapter_class = None
+
+
+def get_pool_setting(service: str, key: str) -> Any:
+    """
+    연결 풀 설정값 가져오기
+
+    서비스별 설정(http.providers.<service>.<key>)이 있으면 우선 사용합니다.
+
+    Args:
+        service: AI 서비스 이름
+        key: 설정 키 (pool_connections, pool_maxsize, pool_block, timeout)
+
+    Returns:
+        설정값
+    """
+    value = get_setting(f"http.providers.{service}.{key}")
+    if value is None:
+        value = get_setting(f"http.{key}", DEFAULT_POOL_SETTINGS.get(key))
+    return value
+
+
+def get_session(service: str) -> 'requests.Session':
+    """
+    서비스별 공유 세션 반환 (없으면 생성)
+
+    Args:
+        service: AI 서비스 이름 (openai, anthropic 등)
+
+    Returns:
+        keep-alive 연결을 재사용하는 requests.Session
+    """
+    global _adapter_class
+
+    session = _sessions.get(service)
+    if session is not None:
+        return session
+
+    with _lock:
+        if service not in _sessions:
+            import requests
+            if _adapter_class is None:
+                _adapter_class = _make_adapter_class()
+            stats = _stats.setdefault(service, PoolStats())
+            adapter = _adapter_class(
+                stats,
+                pool_connections=get_pool_setting(service, "pool_connections"),
+                pool_maxsize=get_pool_setting(service, "pool_maxsize"),
+                pool_block=get_pool_setting(service, "pool_block")
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[service] = session
+        return _sessions[service]
+
+
+def get_pool_stats(service: Optional[str] = None) -> Dict[str, Any]:
+    """
+    연결 풀 통계 조회
+
+    Args:
+        service: 조회할 서비스 (없으면 전체 서비스)
+
+    Returns:
+        서비스의 통계 딕셔너리 또는 서비스별 통계 딕셔너리
+    """
+    if service is not None:
+        stats = _stats.get(service)
+        return stats.as_dict() if stats else PoolStats().as_dict()
+    return {name: stats.as_dict() for name, stats in _stats.items()}
+
+
+def reset_pool_stats() -> None:
+    """모든 서비스의 연결 풀 통계 초기화"""
+    for stats in _stats.values():
+        stats.reset()
+
+
+def close_sessions() -> None:
+    """공유 세션을 모두 닫기 (설정 변경 후 다시 생성됨)"""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+# 'http.*' 설정이 바뀌면 새 설정으로 세션을 다시 만들도록 기존 세션 폐기
+add_setting_listener("http", lambda key, value: close_sessions())
@@ -0,0 +1,241 @@
+"""
+실험 진행 기록(저널) 모듈
+
+여러 번의 API 요청으로 이루어진 실험에서 완료된 단계마다 프롬프트 해시와
+응답을 JSONL 파일에 한 줄씩 추가합니다. 중간에 요청이 실패하거나 Ctrl-C로
+중단한 뒤 같은 실험을 다시 실행하면 기록된 단계는 요청하지 않고 저장된
+응답을 그대로 사용하므로, 남은 단계만 다시 요청합니다.
+
+파일은 끝에만 추가하고, 쓸 때마다 flush하되 fsync는 여러 줄을 모아서
+(journal.fsync_every 줄 또는 journal.fsync_interval 초마다, 닫을 때) 한 번에
+호출합니다. 중간에 끊겨 마지막 줄이 잘린 경우 그 줄은 무시합니다.
+experiment_journal 블록 안의 모든 단계가 성공하면 기록을 지워 다음 실행은 새로 시작합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from utils.config import CONFIG_FILE, get_setting
+
+# 실험 저널 기본 설정값
+DEFAULT_JOURNAL_SETTINGS = {
+    "enabled": True,
+    "dir": ".cache/journal",
+    "fsync_every": 8,
+    "fsync_interval": 1.0
+}
+
+# 프로젝트 루트
+PROJECT_ROOT = os.path.dirname(CONFIG_FILE)
+
+# 요청 해시에 포함할 get_completion 인자 (응답에 영향을 주는 값만)
+_KEY_FIELDS = ("prompt", "provider", "model", "temperature", "max_tokens", "system_prompt", "messages")
+
+
+def _get_journal_setting(key: str) -> Any:
+    """실험 저널 설정값 가져오기 (없으면 기본값)"""
+    return get_setting(f"journal.{key}", DEFAULT_JOURNAL_SETTINGS[key])
+
+
+def step_key(request: Dict[str, Any]) -> str:
+    """
+    요청 하나의 단계 해시 (프롬프트와 응답에 영향을 주는 인자로 계산)
+
+    Args:
+        request: get_completion 인자 딕셔너리 (prompt, temperature 등)
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    fields = {name: request.get(name) for name in _KEY_FIELDS if request.get(name) is not None}
+    data = json.dumps(fields, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class ExperimentJournal:
+    """실험 하나의 완료 단계 기록 (append-only JSONL)"""
+
+    def __init__(self, path: str, fsync_every: int = 8, fsync_interval: float = 1.0):
+        """
+        저널 초기화 (기존 기록이 있으면 읽어 둠)
+
+        Args:
+            path: 저널 파일 경로 (.jsonl)
+            fsync_every: fsync 없이 쌓아 둘 최대 줄 수
+            fsync_interval: fsync 없이 지날 수 있는 최대 시간 (초)
+        """
+        self.path = path
+        self.fsync_every = max(1, int(fsync_every))
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._steps: Dict[str, Dict[str, Any]] = self._load()
+        self.resumed = len(self._steps)
+        self.failures = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """기존 기록 읽기 (잘린 마지막 줄이나 손상된 줄은 건너뜀)"""
+        steps: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        entry = json.loads(line)
+                        steps[entry["key"]] = entry
+                    except (ValueError, KeyError):
+                        continue
+        except FileNotFoundError:
+            pass
+        return steps
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __enter__(self) -> "ExperimentJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        완료된 단계 조회
+
+        Args:
+            key: 단계 해시 (step_key)
+
+        Returns:
+            {"key", "label", "response", "elapsed", "recorded_at"} 딕셔너리 (없으면 None)
+        """
+        return self._steps.get(key)
+
+    def record(self, key: str, response: str, label: Optional[str] = None, elapsed: float = 0.0) -> None:
+        """
+        완료된 단계를 파일 끝에 한 줄로 추가
+
+        Args:
+            key: 단계 해시 (step_key)
+            response: 응답 텍스트
+            label: 단계 이름 (기록 확인용)
+            elapsed: 요청에 걸린 시간 (초)
+        """
+        entry = {
+            "key": key,
+            "label": label,
+            "response": response,
+            "elapsed": round(elapsed, 6),
+            "recorded_at": time.time()
+        }
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._file = open(self.path, "ab")
+            # 한 줄을 한 번에 쓰고 바로 flush (프로세스가 종료되어도 운영체제에는 남음)
+            self._file.write(line)
+            self._file.flush()
+            self._steps[key] = entry
+            self._pending += 1
+            if self._pending >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def record_failure(self, key: str) -> None:
+        """
+        실패한 단계 표시 (파일에는 쓰지 않고, 다음 실행에서 다시 요청)
+
+        Args:
+            key: 단계 해시 (step_key)
+        """
+        with self._lock:
+            self.failures += 1
+
+    def _sync(self) -> None:
+        """쌓인 기록을 디스크에 반영 (잠금을 잡은 상태에서 호출)"""
+        if self._file is not None and self._pending:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """남은 기록을 디스크에 반영하고 파일 닫기"""
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+
+    def complete(self) -> None:
+        """모든 단계가 끝난 실험의 기록 삭제 (다음 실행은 처음부터 요청)"""
+        self.close()
+        with self._lock:
+            self._steps.clear()
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def open_journal(name: str, *parts: Any) -> Optional[ExperimentJournal]:
+    """
+    실험 저널 열기
+
+    Args:
+        name: 실험 이름 (예: "8.3.1_balance")
+        *parts: 같은 실험을 구분할 값 (예: 주제, 선택한 실험 목록)
+
+    Returns:
+        ExperimentJournal (journal.enabled가 꺼져 있으면 None)
+    """
+    if not _get_journal_setting("enabled"):
+        return None
+    directory = _get_journal_setting("dir")
+    if not os.path.isabs(directory):
+        directory = os.path.join(PROJECT_ROOT, directory)
+    digest = hashlib.sha1(json.dumps(parts, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()[:12]
+    journal = ExperimentJournal(
+        os.path.join(directory, f"{name}-{digest}.jsonl"),
+        fsync_every=_get_journal_setting("fsync_every"),
+        fsync_interval=_get_journal_setting("fsync_interval")
+    )
+    if journal.resumed:
+        print(f"이전 실행에서 완료된 {journal.resumed}개 단계를 이어서 사용합니다. ({os.path.relpath(journal.path, PROJECT_ROOT)})")
+    return journal
+
+
+@contextmanager
+def experiment_journal(name: str, *parts: Any):
+    """
+    with 블록 동안 실험 저널 사용 (블록이 끝나면 닫고, 실패한 단계가 없으면 기록 삭제)
+
+    예외나 Ctrl-C로 블록을 빠져나가면 기록을 남겨 다음 실행에서 이어서 진행합니다.
+
+    Args:
+        name: 실험 이름
+        *parts: 같은 실험을 구분할 값
+
+    Yields:
+        ExperimentJournal (journal.enabled가 꺼져 있으면 None)
+    """
+    journal = open_journal(name, *parts)
+    if journal is None:
+        yield None
+        return
+    try:
+        yield journal
+    except BaseException:
+        journal.close()
+        raise
+    if journal.failures:
+        journal.close()
+        print(f"실패한 {journal.failures}개 단계는 다시 실행하면 이어서 요청합니다.")
+    else:
+        journal.complete()
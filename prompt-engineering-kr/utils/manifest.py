@@ -0,0 +1,305 @@
+"""
+실습 목록(manifest) 모듈
+
+exercises 폴더를 os.scandir로 한 번 훑어 실습 ID(섹션/하위 섹션)마다
+파일 경로, 모듈 이름, main() 유무, 제목, 주제 옵션, 내용 해시를 정리하고
+디스크(manifest.path)에 저장합니다. 이후 실행에서는 저장된 목록을 읽어
+--list와 --run이 폴더를 다시 훑지 않고 바로 찾습니다.
+
+목록은 각 폴더의 수정 시각이 저장 당시와 다르면(파일 추가/삭제/이름 변경)
+다시 만들고, 파일 내용이 바뀐 항목은 조회할 때 그 파일만 다시 분석합니다.
+주제 옵션과 제목은 파일을 실행하지 않고 AST에서 읽습니다.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from utils.config import CONFIG_FILE, get_setting
+from utils.exercise_loader import exercise_module_name
+
+# 실습 목록 기본 설정값
+DEFAULT_MANIFEST_SETTINGS = {
+    "path": ".cache/exercise_manifest.json"
+}
+
+# 저장 형식이 바뀌면 올려서 기존 파일을 다시 만들게 함
+MANIFEST_VERSION = 1
+
+# 프로젝트 루트와 실습 폴더
+PROJECT_ROOT = os.path.dirname(CONFIG_FILE)
+EXERCISES_DIR = os.path.join(PROJECT_ROOT, "exercises")
+
+# 실습 파일 이름 형식 (예: 8.3.1_performance_metrics.py, 1.1_clear_instructions.py)
+_EXERCISE_FILE = re.compile(r"^(\d+(?:\.\d+)+)_.+\.py$")
+
+_manifest: Optional[Dict[str, Any]] = None
+_manifest_lock = threading.Lock()
+
+
+def _get_manifest_path() -> str:
+    """실습 목록 파일 경로 (프로젝트 루트 기준 상대 경로는 절대 경로로 변환)"""
+    path = get_setting("manifest.path", DEFAULT_MANIFEST_SETTINGS["path"])
+    return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+
+def _id_key(exercise_id: str) -> List[int]:
+    """실습 ID를 숫자 순서로 정렬하기 위한 키"""
+    return [int(part) for part in exercise_id.split(".")]
+
+
+def _literal(node: Optional[ast.AST]) -> Any:
+    """리터럴 노드의 값 (리터럴이 아니면 None)"""
+    if node is None:
+        return None
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def _analyze_source(source: bytes) -> Dict[str, Any]:
+    """
+    실습 파일 소스에서 main() 유무, 제목, 주제 옵션 추출 (파일은 실행하지 않음)
+
+    Returns:
+        {"has_main", "title", "topic_options", "error"} 딕셔너리
+    """
+    info = {"has_main": False, "title": None, "topic_options": None, "error": None}
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError) as e:
+        info["error"] = f"{type(e).__name__}: {e}"
+        return info
+
+    assignments = {}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "main":
+            info["has_main"] = True
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            assignments[node.targets[0].id] = node.value
+
+    # run_exercise(title=..., topic_options=...) 호출에서 제목과 주제 옵션 찾기
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and getattr(node.func, "id", None) == "run_exercise"):
+            continue
+        keywords = {keyword.arg: keyword.value for keyword in node.keywords}
+        title = keywords.get("title", node.args[0] if node.args else None)
+        options = keywords.get("topic_options", node.args[1] if len(node.args) > 1 else None)
+        if isinstance(options, ast.Name):
+            options = assignments.get(options.id)
+        info["title"] = _literal(title)
+        info["topic_options"] = _literal(options)
+        break
+
+    if info["title"] is None:
+        docstring = ast.get_docstring(tree)
+        if docstring:
+            info["title"] = re.sub(r"\s*(실습)?\s*모듈$", "", docstring.strip().splitlines()[0].strip())
+    return info
+
+
+def _build_entry(exercise_id: str, path: str, stat: os.stat_result) -> Dict[str, Any]:
+    """실습 파일 하나의 목록 항목 생성"""
+    with open(path, 'rb') as f:
+        source = f.read()
+    entry = {
+        "id": exercise_id,
+        "path": os.path.relpath(path, PROJECT_ROOT),
+        "module": exercise_module_name(path),
+        "hash": hashlib.sha1(source).hexdigest(),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size
+    }
+    entry.update(_analyze_source(source))
+    return entry
+
+
+def build_manifest() -> Dict[str, Any]:
+    """
+    exercises 폴더를 한 번 훑어 실습 목록 생성
+
+    Returns:
+        {"version", "dirs": {폴더: 수정 시각}, "entries": {ID: 항목}, "children": {상위 ID: [ID...]}}
+    """
+    dirs: Dict[str, int] = {}
+    entries: Dict[str, Dict[str, Any]] = {}
+    extra: Dict[str, List[str]] = {}
+
+    def walk(directory: str) -> None:
+        dirs[os.path.relpath(directory, PROJECT_ROOT)] = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as it:
+            for item in it:
+                if item.name.startswith(("__", ".")):
+                    continue
+                if item.is_dir():
+                    walk(item.path)
+                    continue
+                match = _EXERCISE_FILE.match(item.name)
+                if not match or not item.is_file():
+                    continue
+                exercise_id = match.group(1)
+                entry = _build_entry(exercise_id, item.path, item.stat())
+                if exercise_id in entries:
+                    # 같은 ID의 파일이 여러 개이면 이름순으로 첫 번째를 대표로 사용
+                    first, second = sorted([entries[exercise_id], entry], key=lambda e: e["path"])
+                    entries[exercise_id] = first
+                    extra.setdefault(exercise_id, []).append(second["path"])
+                else:
+                    entries[exercise_id] = entry
+
+    if os.path.isdir(EXERCISES_DIR):
+        walk(EXERCISES_DIR)
+    for exercise_id, paths in extra.items():
+        entries[exercise_id]["duplicates"] = sorted(paths)
+
+    children: Dict[str, List[str]] = {}
+    for exercise_id in sorted(entries, key=_id_key):
+        parent = exercise_id.rsplit(".", 1)[0]
+        children.setdefault(parent, []).append(exercise_id)
+
+    return {"version": MANIFEST_VERSION, "dirs": dirs, "entries": entries, "children": children}
+
+
+def _is_fresh(manifest: Dict[str, Any]) -> bool:
+    """저장된 목록의 폴더 수정 시각이 현재와 같은지 확인 (폴더는 훑지 않고 stat만 호출)"""
+    if manifest.get("version") != MANIFEST_VERSION or not manifest.get("dirs"):
+        return False
+    for directory, mtime_ns in manifest["dirs"].items():
+        try:
+            if os.stat(os.path.join(PROJECT_ROOT, directory)).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _save(manifest: Dict[str, Any]) -> None:
+    """실습 목록을 디스크에 저장 (임시 파일에 쓴 뒤 교체, 실패해도 실행은 계속)"""
+    path = _get_manifest_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"실습 목록 저장 오류: {e}")
+
+
+def get_manifest(refresh: bool = False) -> Dict[str, Any]:
+    """
+    실습 목록 반환 (프로세스 안에서는 메모리, 다음 실행부터는 디스크에 저장된 목록 사용)
+
+    Args:
+        refresh: True이면 저장된 목록을 무시하고 다시 생성
+
+    Returns:
+        실습 목록 딕셔너리
+    """
+    global _manifest
+    if _manifest is not None and not refresh:
+        return _manifest
+
+    with _manifest_lock:
+        if _manifest is not None and not refresh:
+            return _manifest
+
+        manifest = None
+        if not refresh:
+            try:
+                with open(_get_manifest_path(), 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = None
+            if manifest is not None and not _is_fresh(manifest):
+                manifest = None
+
+        if manifest is None:
+            manifest = build_manifest()
+            _save(manifest)
+        _manifest = manifest
+        return manifest
+
+
+def clear_manifest() -> None:
+    """메모리의 실습 목록 비우기 (다음 조회 때 디스크에서 다시 읽음)"""
+    global _manifest
+    with _manifest_lock:
+        _manifest = None
+
+
+def get_entry(exercise_id: str) -> Optional[Dict[str, Any]]:
+    """
+    실습 ID의 목록 항목 조회 (파일이 바뀌었으면 그 파일만 다시 분석)
+
+    Args:
+        exercise_id: 섹션/하위 섹션 ID (예: "1.1", "8.3.1")
+
+    Returns:
+        {"id", "path"(프로젝트 루트 기준), "module", "hash", "has_main", "title", "topic_options", ...}
+        (없으면 None)
+    """
+    manifest = get_manifest()
+    entry = manifest["entries"].get(exercise_id)
+    if entry is None:
+        return None
+
+    path = os.path.join(PROJECT_ROOT, entry["path"])
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if (stat.st_mtime_ns, stat.st_size) != (entry["mtime_ns"], entry["size"]):
+        with _manifest_lock:
+            entry = _build_entry(exercise_id, path, stat)
+            manifest["entries"][exercise_id] = entry
+        _save(manifest)
+    return entry
+
+
+def get_entry_path(exercise_id: str) -> Optional[str]:
+    """
+    실습 ID의 파일 절대 경로
+
+    Args:
+        exercise_id: 섹션/하위 섹션 ID
+
+    Returns:
+        파일 경로 (없으면 None)
+    """
+    entry = get_manifest()["entries"].get(exercise_id)
+    return os.path.join(PROJECT_ROOT, entry["path"]) if entry else None
+
+
+def get_children(parent_id: str) -> List[str]:
+    """
+    바로 아래 단계의 실습 ID 목록 (예: "8" -> ["8.1", "8.2", ...], "8.3" -> ["8.3.1", ...])
+
+    Args:
+        parent_id: 파트/섹션 ID
+
+    Returns:
+        ID 순으로 정렬된 목록
+    """
+    return list(get_manifest()["children"].get(parent_id, []))
+
+
+def iter_entries(part_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    파트/섹션에 속한 모든 실습 항목 (자기 자신 포함, 하위 단계 전체)
+
+    Args:
+        part_id: 파트/섹션 ID (없으면 전체)
+
+    Returns:
+        ID 순으로 정렬된 항목 목록
+    """
+    entries = get_manifest()["entries"]
+    ids = [exercise_id for exercise_id in entries
+           if part_id is None or exercise_id == part_id or exercise_id.startswith(f"{part_id}.")]
+    return [entries[exercise_id] for exercise_id in sorted(ids, key=_id_key)]
@@ -0,0 +1,389 @@
+"""
+모의(mock) AI 서비스 모듈
+
+AIClient(service="mock")가 사용하는 모의 서비스를 제공합니다.
+실제 API 키 없이 노트북에서도 처리량, 지연 시간, 장애 대응을 측정할 수 있습니다.
+
+- inprocess 백엔드: 네트워크 없이 같은 프로세스 안에서 응답 생성
+- http 백엔드: OpenAI / Anthropic 형식을 흉내 내는 로컬 HTTP 서버(MockAPIServer)에 요청
+
+두 백엔드 모두 같은 MockProfile(지연 시간 분포, 초당 토큰 수, 오류율, 시드)을 따릅니다.
+"""
+
+import json
+import math
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.config import CONFIG_FILE, get_setting, add_setting_listener
+from utils.errors import APIConnectionError, error_from_status
+from utils.mock_server import MockAPIServer, build_mock_text, _split_tokens
+
+# 모의 서비스 기본 설정값
+DEFAULT_MOCK_SETTINGS = {
+    "backend": "inprocess",      # inprocess 또는 http
+    "wire_format": "openai",     # http 백엔드가 사용할 API 형식 (openai 또는 anthropic)
+    "latency": {
+        "distribution": "fixed",  # fixed, lognormal, replay
+        "value": 0.0,             # fixed: 첫 토큰까지의 지연 시간 (초)
+        "median": 0.3,            # lognormal: 지연 시간 중앙값 (초)
+        "sigma": 0.5,             # lognormal: 로그 표준편차 (클수록 꼬리가 김)
+        "path": None              # replay: 지연 시간을 가져올 카세트(JSONL) 경로
+    },
+    "tokens_per_second": 0,      # 출력 토큰 생성 속도 (0이면 지연 없음)
+    "output_tokens": 32,         # 기본 응답에 덧붙일 토큰 수 (max_tokens를 넘지 않음)
+    "error_rate": 0.0,           # 요청이 실패할 확률 (0~1)
+    "error_status": 503,         # 발생시킬 장애 (HTTP 상태 코드 또는 "disconnect")
+    "seed": 0,                   # 지연 시간/오류/응답 내용 난수 시드
+    "batch_delay": 1.0           # http 백엔드의 일괄 처리 작업이 완료되기까지의 시간 (초)
+}
+
+# 응답 내용을 만들 때 사용할 단어 목록
+_WORDS = ("프롬프트", "모델", "응답", "예시", "설명", "단계", "결과", "질문", "요약", "분석",
+          "맥락", "지시", "형식", "평가", "개선", "토큰", "사용자", "목표", "조건", "출력")
+
+_backend: Optional['InProcessMockBackend'] = None
+_server: Optional[MockAPIServer] = None
+_mock_lock = threading.Lock()
+
+
+def _get_mock_setting(key: str) -> Any:
+    """모의 서비스 설정값 가져오기 (없으면 기본값)"""
+    return get_setting(f"mock.{key}", DEFAULT_MOCK_SETTINGS[key])
+
+
+def _load_replay_samples(path: str) -> List[float]:
+    """카세트(JSONL) 파일에 기록된 지연 시간 목록 읽기"""
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(CONFIG_FILE), path)
+    samples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                latency = json.loads(line).get("latency")
+            except ValueError:
+                continue
+            if isinstance(latency, (int, float)):
+                samples.append(float(latency))
+    if not samples:
+        raise ValueError(f"지연 시간이 기록되지 않은 파일입니다: {path}")
+    return samples
+
+
+class LatencyModel:
+    """첫 토큰까지의 지연 시간 분포"""
+
+    def __init__(self, distribution: str = "fixed", value: float = 0.0,
+                 median: float = 0.3, sigma: float = 0.5,
+                 samples: Optional[List[float]] = None):
+        """
+        지연 시간 분포 초기화
+
+        Args:
+            distribution: fixed(고정), lognormal(로그정규), replay(기록된 값 재사용)
+            value: fixed 분포의 지연 시간 (초)
+            median: lognormal 분포의 중앙값 (초)
+            sigma: lognormal 분포의 로그 표준편차
+            samples: replay 분포에서 뽑을 지연 시간 목록 (초)
+        """
+        if distribution not in ("fixed", "lognormal", "replay"):
+            raise ValueError(f"지원하지 않는 지연 시간 분포입니다: {distribution}")
+        if distribution == "replay" and not samples:
+            raise ValueError("replay 분포에는 지연 시간 목록이 필요합니다.")
+        self.distribution = distribution
+        self.value = value
+        self.median = median
+        self.sigma = sigma
+        self.samples = samples or []
+
+    @classmethod
+    def from_config(cls, spec: Dict[str, Any]) -> 'LatencyModel':
+        """
+        설정 딕셔너리로 분포 생성
+
+        Args:
+            spec: distribution, value, median, sigma, path(또는 samples) 키를 가진 딕셔너리
+
+        Returns:
+            LatencyModel 객체
+        """
+        spec = dict(DEFAULT_MOCK_SETTINGS["latency"], **(spec or {}))
+        samples = spec.get("samples")
+        if spec["distribution"] == "replay" and not samples and spec.get("path"):
+            samples = _load_replay_samples(spec["path"])
+        return cls(spec["distribution"], spec["value"], spec["median"], spec["sigma"], samples)
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        지연 시간 하나 뽑기
+
+        Args:
+            rng: 난수 생성기
+
+        Returns:
+            지연 시간 (초)
+        """
+        if self.distribution == "lognormal":
+            if self.median <= 0:
+                return 0.0
+            return rng.lognormvariate(math.log(self.median), self.sigma)
+        if self.distribution == "replay":
+            return rng.choice(self.samples)
+        return self.value
+
+
+class MockProfile:
+    """모의 서비스의 동작 방식 (지연 시간, 생성 속도, 오류율, 응답 내용)"""
+
+    def __init__(self, latency: Optional[LatencyModel] = None, tokens_per_second: float = 0,
+                 output_tokens: int = 32, error_rate: float = 0.0, error_status: Any = 503,
+                 seed: Optional[int] = 0):
+        """
+        모의 서비스 동작 초기화
+
+        Args:
+            latency: 첫 토큰까지의 지연 시간 분포 (없으면 지연 없음)
+            tokens_per_second: 출력 토큰 생성 속도 (0이면 지연 없음)
+            output_tokens: 기본 응답에 덧붙일 토큰 수
+            error_rate: 요청이 실패할 확률 (0~1)
+            error_status: 발생시킬 장애 (HTTP 상태 코드 또는 "disconnect")
+            seed: 난수 시드 (같은 시드와 같은 요청 순서면 같은 지연 시간/오류/응답)
+        """
+        self.latency = latency or LatencyModel()
+        self.tokens_per_second = tokens_per_second
+        self.output_tokens = output_tokens
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> 'MockProfile':
+        """
+        설정 파일의 mock 항목으로 동작 방식 생성
+
+        Returns:
+            MockProfile 객체
+        """
+        return cls(
+            latency=LatencyModel.from_config(_get_mock_setting("latency")),
+            tokens_per_second=_get_mock_setting("tokens_per_second"),
+            output_tokens=_get_mock_setting("output_tokens"),
+            error_rate=_get_mock_setting("error_rate"),
+            error_status=_get_mock_setting("error_status"),
+            seed=_get_mock_setting("seed")
+        )
+
+    def sample_latency(self) -> float:
+        """첫 토큰까지의 지연 시간 뽑기 (초)"""
+        with self._lock:
+            return self.latency.sample(self._rng)
+
+    def next_fault(self) -> Optional[Any]:
+        """이번 요청에 적용할 장애 (error_rate 확률, 없으면 None)"""
+        if not self.error_rate:
+            return None
+        with self._lock:
+            failed = self._rng.random() < self.error_rate
+        return self.error_status if failed else None
+
+    def token_delay(self) -> float:
+        """토큰 하나를 생성하는 데 걸리는 시간 (초)"""
+        return 1.0 / self.tokens_per_second if self.tokens_per_second else 0.0
+
+    def generate(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        """
+        프롬프트와 시드로 결정되는 응답 텍스트 생성
+
+        요청 순서와 관계없이 같은 시드, 같은 프롬프트에는 항상 같은 응답을 돌려줍니다.
+
+        Args:
+            prompt: 사용자 프롬프트
+            max_tokens: 최대 출력 토큰 수
+
+        Returns:
+            응답 텍스트
+        """
+        count = self.output_tokens if max_tokens is None else min(self.output_tokens, max_tokens)
+        rng = random.Random(f"{self.seed}:{prompt}")
+        words = [rng.choice(_WORDS) for _ in range(max(0, count))]
+        return " ".join([build_mock_text(prompt)] + words)
+
+
+class InProcessMockBackend:
+    """네트워크 없이 같은 프로세스 안에서 OpenAI 형식 응답을 만드는 모의 백엔드"""
+
+    def __init__(self, profile: MockProfile, model: str = "mock"):
+        """
+        백엔드 초기화
+
+        Args:
+            profile: 모의 서비스 동작 방식
+            model: 응답에 표시할 모델명
+        """
+        self.profile = profile
+        self.model = model
+
+    def _check_fault(self) -> None:
+        """장애가 발생할 차례이면 HTTP 백엔드와 같은 종류의 예외 발생"""
+        fault = self.profile.next_fault()
+        if fault == "disconnect":
+            raise APIConnectionError("mock API 호출 실패 (disconnect): 연결이 끊겼습니다.", service="mock")
+        if fault is not None:
+            raise error_from_status("mock", int(fault), f"Injected fault {fault}")
+
+    def _build_response(self, prompt: str, text: str) -> Dict[str, Any]:
+        """OpenAI chat.completion 형식 응답 구성"""
+        prompt_tokens = len(_split_tokens(prompt))
+        completion_tokens = len(_split_tokens(text))
+        return {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "model": self.model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    def _generation_time(self, text: str) -> float:
+        """첫 토큰 지연 + 토큰 생성 시간"""
+        return self.profile.sample_latency() + self.profile.token_delay() * len(_split_tokens(text))
+
+    def complete(self, prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """
+        응답 생성 (생성 시간만큼 대기)
+
+        Args:
+            prompt: 사용자 프롬프트
+            max_tokens: 최대 출력 토큰 수
+
+        Returns:
+            OpenAI 형식 응답 딕셔너리
+
+        Raises:
+            AIClientError: 장애가 발생할 차례인 경우
+        """
+        self._check_fault()
+        text = self.profile.generate(prompt, max_tokens)
+        time.sleep(self._generation_time(text))
+        return self._build_response(prompt, text)
+
+    async def acomplete(self, prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """complete의 비동기 버전 (이벤트 루프를 막지 않고 대기)"""
+        import asyncio
+        self._check_fault()
+        text = self.profile.generate(prompt, max_tokens)
+        await asyncio.sleep(self._generation_time(text))
+        return self._build_response(prompt, text)
+
+    def stream(self, prompt: str, max_tokens: Optional[int] = None) -> Iterator[str]:
+        """
+        스트리밍 응답 시작 (장애와 첫 토큰 지연은 호출 시점에 처리)
+
+        Args:
+            prompt: 사용자 프롬프트
+            max_tokens: 최대 출력 토큰 수
+
+        Returns:
+            토큰 조각을 생성 속도에 맞춰 차례로 내보내는 이터레이터
+        """
+        self._check_fault()
+        text = self.profile.generate(prompt, max_tokens)
+        time.sleep(self.profile.sample_latency())
+        return self._iter_tokens(text)
+
+    def _iter_tokens(self, text: str) -> Iterator[str]:
+        """토큰 조각을 생성 속도에 맞춰 내보내기"""
+        delay = self.profile.token_delay()
+        for token in _split_tokens(text):
+            if delay:
+                time.sleep(delay)
+            yield token
+
+
+def get_mock_backend() -> InProcessMockBackend:
+    """
+    설정에 따른 공유 inprocess 백엔드 반환 (없으면 생성)
+
+    Returns:
+        InProcessMockBackend 객체
+    """
+    global _backend
+
+    backend = _backend
+    if backend is None:
+        with _mock_lock:
+            if _backend is None:
+                _backend = InProcessMockBackend(MockProfile.from_config())
+            backend = _backend
+    return backend
+
+
+def get_mock_server() -> MockAPIServer:
+    """
+    설정에 따른 공유 로컬 HTTP 모의 서버 반환 (처음 호출할 때 백그라운드에서 시작)
+
+    Returns:
+        실행 중인 MockAPIServer 객체
+    """
+    global _server
+
+    server = _server
+    if server is None:
+        with _mock_lock:
+            if _server is None:
+                _server = MockAPIServer(profile=MockProfile.from_config(),
+                                        batch_delay=_get_mock_setting("batch_delay")).start()
+            server = _server
+    return server
+
+
+def get_mock_wire_format() -> str:
+    """
+    http 백엔드가 사용할 API 형식
+
+    Returns:
+        openai 또는 anthropic
+    """
+    wire_format = _get_mock_setting("wire_format")
+    return wire_format if wire_format in ("openai", "anthropic") else "openai"
+
+
+def get_mock_backend_name() -> str:
+    """
+    설정된 모의 백엔드 이름
+
+    Returns:
+        inprocess 또는 http
+    """
+    backend = _get_mock_setting("backend")
+    if backend not in ("inprocess", "http"):
+        print(f"알 수 없는 모의 백엔드 '{backend}'입니다. inprocess 백엔드를 사용합니다.")
+        return "inprocess"
+    return backend
+
+
+def reset_mock_provider() -> None:
+    """공유 백엔드와 모의 서버를 정리 (설정 변경 후 다시 생성됨)"""
+    global _backend, _server
+
+    with _mock_lock:
+        _backend = None
+        if _server is not None:
+            _server.stop()
+            _server = None
+
+
+# 'mock.*' 설정이 바뀌면 새 설정으로 다시 만들도록 기존 백엔드와 서버 정리
+add_setting_listener("mock", lambda key, value: reset_mock_provider())
@@ -0,0 +1,599 @@
+"""
+로컬 모의 API 서버 모듈
+
+OpenAI / Anthropic 응답 형식을 흉내 내는 작은 HTTP 서버를 제공합니다.
+API 키나 네트워크 없이 클라이언트 성능을 측정할 때 사용합니다.
+지연 시간 분포, 생성 속도, 오류율을 세밀하게 조정하려면
+utils.mock_provider.MockProfile을 profile 인자로 넘깁니다.
+
+일괄 처리(batch) 프로토콜도 흉내 냅니다.
+- OpenAI: POST /v1/files, POST /v1/batches, GET /v1/batches/{id}, GET /v1/files/{id}/content
+- Anthropic: POST /v1/messages/batches, GET /v1/messages/batches/{id}, GET .../{id}/results
+작업은 batch_delay초가 지나면 완료된 것으로 보고됩니다.
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from collections import deque
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Union
+
+# 모의 서버가 흉내 낼 수 있는 장애 종류: HTTP 상태 코드(429, 500, 503 등) 또는 "disconnect"
+Fault = Union[int, str]
+
+
+def build_mock_text(prompt: str) -> str:
+    """
+    프롬프트에 대한 결정적(deterministic) 모의 응답 생성
+
+    Args:
+        prompt: 사용자 프롬프트
+
+    Returns:
+        모의 응답 텍스트
+    """
+    preview = prompt.strip().replace("\n", " ")[:40]
+    return f"[모의 응답] {preview}"
+
+
+def _split_tokens(text: str):
+    """스트리밍 전송을 위해 텍스트를 공백 단위 조각으로 분리"""
+    words = text.split(" ")
+    return [word if i == 0 else " " + word for i, word in enumerate(words)]
+
+
+def _last_user_text(messages) -> str:
+    """메시지 목록에서 마지막 사용자 메시지 텍스트 추출"""
+    for message in reversed(messages or []):
+        if message.get("role") == "user":
+            content = message.get("content", "")
+            if isinstance(content, list):
+                return "".join(block.get("text", "") for block in content)
+            return content
+    return ""
+
+
+def _split_cache_prefix(body: Dict[str, Any]):
+    """
+    Anthropic 요청에서 cache_control이 붙은 마지막 블록까지의 앞부분과 나머지 입력 텍스트 분리
+
+    Returns:
+        (캐시 구간 안의 블록 경계별 앞부분 목록, 나머지 입력 텍스트) 튜플
+        (표시가 없으면 앞부분 목록은 비어 있음)
+    """
+    blocks = []
+    system = body.get("system")
+    if isinstance(system, list):
+        blocks.extend(system)
+    elif system:
+        blocks.append({"text": system})
+    for message in body.get("messages") or []:
+        content = message.get("content", "")
+        blocks.extend(content if isinstance(content, list) else [{"text": content}])
+
+    marked = [i for i, block in enumerate(blocks) if block.get("cache_control")]
+    end = marked[-1] + 1 if marked else 0
+    prefixes, prefix = [], ""
+    for block in blocks[:end]:
+        prefix += block.get("text", "")
+        prefixes.append(prefix)
+    return prefixes, "".join(block.get("text", "") for block in blocks[end:])
+
+
+def _parse_multipart(content_type: str, data: bytes) -> Dict[str, bytes]:
+    """multipart/form-data 본문을 {필드 이름: 값} 딕셔너리로 변환"""
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + data)
+    return {part.get_param("name", header="content-disposition"): part.get_payload(decode=True)
+            for part in message.iter_parts()}
+
+
+class MockBatchStore:
+    """모의 서버의 업로드 파일과 일괄 처리 작업 저장소"""
+
+    def __init__(self, delay: float = 0.0):
+        """
+        저장소 초기화
+
+        Args:
+            delay: 작업을 만든 뒤 완료로 보고할 때까지의 시간 (초)
+        """
+        self.delay = delay
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def new_id(self, prefix: str) -> str:
+        """prefix가 붙은 새 ID 생성"""
+        with self._lock:
+            self._count += 1
+            return f"{prefix}_mock{self._count}"
+
+    def add_file(self, data: bytes, file_id: Optional[str] = None) -> str:
+        """파일 저장 후 ID 반환"""
+        file_id = file_id or self.new_id("file")
+        with self._lock:
+            self.files[file_id] = data
+        return file_id
+
+    def create(self, kind: str, results: List[Dict[str, Any]], failed: List[bool],
+               **fields) -> Dict[str, Any]:
+        """
+        결과가 미리 계산된 작업 등록
+
+        Args:
+            kind: openai 또는 anthropic
+            results: 요청별 결과 줄 (입력 순서)
+            failed: 요청별 실패 여부
+            **fields: 작업 객체에 그대로 보관할 값 (endpoint, input_file_id 등)
+
+        Returns:
+            작업 정보 딕셔너리
+        """
+        now = time.time()
+        batch = dict(fields, id=self.new_id("msgbatch" if kind == "anthropic" else "batch"), kind=kind,
+                     created_at=now, ready_at=now + self.delay, results=results, failed=failed)
+        with self._lock:
+            self.batches[batch["id"]] = batch
+        return batch
+
+    def get(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """작업 정보 반환 (완료 시간이 지났으면 done=True)"""
+        batch = self.batches.get(batch_id)
+        if batch is not None:
+            batch["done"] = time.time() >= batch["ready_at"]
+        return batch
+
+
+def _jsonl(lines: List[Dict[str, Any]]) -> bytes:
+    """딕셔너리 목록을 JSONL 바이트로 변환"""
+    return "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines).encode("utf-8")
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """OpenAI / Anthropic 엔드포인트를 처리하는 요청 핸들러"""
+
+    # keep-alive 연결을 지원하기 위해 HTTP/1.1 사용
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문이 나뉘어 전송될 때 Nagle 알고리즘으로 인한 지연 방지
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        # 벤치마크 출력이 섞이지 않도록 접근 로그 생략
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        data = self.rfile.read(length)
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.startswith("multipart/form-data"):
+            body = _parse_multipart(content_type, data)
+        else:
+            body = json.loads(data or b"{}")
+
+        server = self.server
+        latency = server.profile.sample_latency() if server.profile else server.latency
+        if latency:
+            time.sleep(latency)
+
+        fault = server.next_fault()
+        if fault == "disconnect":
+            # 응답 없이 연결을 끊어 네트워크 장애를 흉내 냄
+            self.close_connection = True
+            return
+        if fault is not None:
+            headers = {}
+            if server.retry_after is not None:
+                headers["Retry-After"] = str(server.retry_after)
+            self._send_json(fault, {"error": {"type": "mock_fault", "message": f"Injected fault {fault}"}},
+                            headers)
+            return
+
+        if self.path.endswith("/files"):
+            self._send_json(200, self._openai_upload(body))
+        elif self.path.endswith("/messages/batches"):
+            self._send_json(200, self._anthropic_batch(self.server.batches.create(
+                "anthropic", *self._run_anthropic_batch(body.get("requests") or []))))
+        elif self.path.endswith("/batches"):
+            self._send_json(*self._openai_create_batch(body))
+        elif self.path.endswith("/chat/completions"):
+            if body.get("stream"):
+                self._send_events(self._openai_events(body))
+            else:
+                self._send_json(200, self._openai_response(body))
+        elif self.path.endswith("/messages"):
+            if body.get("stream"):
+                self._send_events(self._anthropic_events(body))
+            else:
+                self._send_json(200, self._anthropic_response(body))
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path: {self.path}"}})
+
+    def do_GET(self):
+        store = self.server.batches
+        parts = self.path.rstrip("/").split("/")
+        # /v1/files/{id}/content
+        if len(parts) >= 3 and parts[-1] == "content" and parts[-3] == "files":
+            data = store.files.get(parts[-2])
+            if data is None:
+                self._send_json(404, {"error": {"message": f"No such file: {parts[-2]}"}})
+            else:
+                self._send_bytes(200, data, "application/jsonl")
+            return
+        # /v1/messages/batches/{id}/results
+        if parts[-1] == "results":
+            batch = store.get(parts[-2])
+            if batch is None or not batch["done"]:
+                self._send_json(404, {"error": {"message": "Batch results are not available yet"}})
+            else:
+                self._send_bytes(200, _jsonl(batch["results"]), "application/binary")
+            return
+        batch = store.get(parts[-1])
+        if batch is None:
+            self._send_json(404, {"error": {"message": f"Unknown path: {self.path}"}})
+        elif batch["kind"] == "anthropic":
+            self._send_json(200, self._anthropic_batch(batch))
+        else:
+            self._send_json(200, self._openai_batch(batch))
+
+    def _batch_item_fault(self) -> Optional[Fault]:
+        """일괄 처리 요청 하나에 적용할 장애 (profile의 오류율을 따름)"""
+        return self.server.profile.next_fault() if self.server.profile else None
+
+    def _openai_upload(self, body: Dict[str, bytes]) -> Dict[str, Any]:
+        data = body.get("file") or b""
+        return {"id": self.server.batches.add_file(data), "object": "file", "bytes": len(data),
+                "purpose": (body.get("purpose") or b"batch").decode("utf-8")}
+
+    def _openai_create_batch(self, body: Dict[str, Any]):
+        """입력 파일의 요청을 모두 처리해 두고 작업 생성 (상태 코드, 작업 객체) 반환"""
+        store = self.server.batches
+        data = store.files.get(body.get("input_file_id"))
+        if data is None:
+            return 400, {"error": {"message": f"No such file: {body.get('input_file_id')}"}}
+        results, failed = [], []
+        for line in data.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            fault = self._batch_item_fault()
+            if fault is None:
+                response = {"status_code": 200, "body": self._openai_response(request["body"], wait=False)}
+            else:
+                status = fault if isinstance(fault, int) else 500
+                response = {"status_code": status,
+                            "body": {"error": {"type": "mock_fault", "message": f"Injected fault {fault}"}}}
+            results.append({"id": store.new_id("batch_req"), "custom_id": request["custom_id"],
+                            "response": response, "error": None})
+            failed.append(fault is not None)
+        batch = store.create("openai", results, failed, endpoint=body.get("endpoint"),
+                             input_file_id=body.get("input_file_id"),
+                             completion_window=body.get("completion_window", "24h"))
+        return 200, self._openai_batch(batch)
+
+    def _openai_batch(self, batch: Dict[str, Any]) -> Dict[str, Any]:
+        """OpenAI batch 객체 (완료되면 결과/오류 파일을 만들어 ID를 알려줌)"""
+        store = self.server.batches
+        done = batch.get("done", False)
+        output_file_id = error_file_id = None
+        if done:
+            ok = [line for line, failed in zip(batch["results"], batch["failed"]) if not failed]
+            errors = [line for line, failed in zip(batch["results"], batch["failed"]) if failed]
+            output_file_id = store.add_file(_jsonl(ok), f"{batch['id']}_output") if ok else None
+            error_file_id = store.add_file(_jsonl(errors), f"{batch['id']}_errors") if errors else None
+        total = len(batch["results"])
+        failed_count = sum(batch["failed"]) if done else 0
+        return {
+            "id": batch["id"],
+            "object": "batch",
+            "endpoint": batch["endpoint"],
+            "input_file_id": batch["input_file_id"],
+            "completion_window": batch["completion_window"],
+            "status": "completed" if done else "in_progress",
+            "output_file_id": output_file_id,
+            "error_file_id": error_file_id,
+            "created_at": int(batch["created_at"]),
+            "completed_at": int(batch["ready_at"]) if done else None,
+            "request_counts": {"total": total, "completed": total - failed_count if done else 0,
+                               "failed": failed_count}
+        }
+
+    def _run_anthropic_batch(self, requests: List[Dict[str, Any]]):
+        """Anthropic 일괄 처리 요청을 모두 처리해 (결과 줄 목록, 실패 여부 목록) 반환"""
+        results, failed = [], []
+        for request in requests:
+            fault = self._batch_item_fault()
+            if fault is None:
+                result = {"type": "succeeded", "message": self._anthropic_response(request["params"], wait=False)}
+            else:
+                result = {"type": "errored", "error": {"type": "error", "error": {
+                    "type": "api_error", "message": f"Injected fault {fault}"}}}
+            results.append({"custom_id": request["custom_id"], "result": result})
+            failed.append(fault is not None)
+        return results, failed
+
+    def _anthropic_batch(self, batch: Dict[str, Any]) -> Dict[str, Any]:
+        """Anthropic message_batch 객체"""
+        done = batch.get("done", False)
+        total = len(batch["results"])
+        errored = sum(batch["failed"]) if done else 0
+        host, port = self.server.server_address[:2]
+        return {
+            "id": batch["id"],
+            "type": "message_batch",
+            "processing_status": "ended" if done else "in_progress",
+            "request_counts": {"processing": 0 if done else total,
+                               "succeeded": total - errored if done else 0,
+                               "errored": errored, "canceled": 0, "expired": 0},
+            "results_url": f"http://{host}:{port}/v1/messages/batches/{batch['id']}/results" if done else None,
+            "created_at": int(batch["created_at"]),
+            "ended_at": int(batch["ready_at"]) if done else None
+        }
+
+    def _openai_response(self, body: Dict[str, Any], wait: bool = True) -> Dict[str, Any]:
+        prompt = _last_user_text(body.get("messages"))
+        text = self._build_text(body)
+        if wait:
+            self._wait_generation(text)
+        return {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "model": body.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": len(prompt),
+                "completion_tokens": len(text),
+                "total_tokens": len(prompt) + len(text)
+            }
+        }
+
+    def _anthropic_response(self, body: Dict[str, Any], wait: bool = True) -> Dict[str, Any]:
+        text = self._build_text(body)
+        if wait:
+            self._wait_generation(text)
+        # 캐시에 있는 가장 긴 앞부분은 캐시에서 읽고, cache_control까지의 나머지 구간은 캐시에 씀
+        prefixes, rest = _split_cache_prefix(body)
+        cached = self.server.use_prompt_cache(prefixes)
+        written = len(prefixes[-1]) - cached if prefixes else 0
+        return {
+            "id": "msg_mock",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "mock"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "usage": {
+                "input_tokens": len(rest),
+                "output_tokens": len(text),
+                "cache_creation_input_tokens": written,
+                "cache_read_input_tokens": cached
+            }
+        }
+
+    def _build_text(self, body: Dict[str, Any]) -> str:
+        """요청에 대한 응답 텍스트 (profile이 있으면 시드로 결정되는 응답)"""
+        prompt = _last_user_text(body.get("messages"))
+        if self.server.profile:
+            return self.server.profile.generate(prompt, body.get("max_tokens"))
+        return build_mock_text(prompt)
+
+    def _token_delay(self) -> float:
+        """조각 하나를 생성하는 데 걸리는 시간 (초)"""
+        if self.server.profile:
+            return self.server.profile.token_delay()
+        return self.server.token_latency
+
+    def _wait_generation(self, text: str) -> None:
+        """스트리밍이 아닌 응답도 조각 수만큼 생성 시간이 걸리도록 대기"""
+        delay = self._token_delay()
+        if delay:
+            time.sleep(delay * len(_split_tokens(text)))
+
+    def _openai_events(self, body: Dict[str, Any]):
+        """OpenAI 스트리밍 형식의 (이벤트, 데이터) 목록 생성"""
+        text = self._build_text(body)
+        for token in _split_tokens(text):
+            yield None, {"choices": [{"index": 0, "delta": {"content": token}}]}
+        yield None, {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        yield None, "[DONE]"
+
+    def _anthropic_events(self, body: Dict[str, Any]):
+        """Anthropic 스트리밍 형식의 (이벤트, 데이터) 목록 생성"""
+        text = self._build_text(body)
+        yield "message_start", {"type": "message_start", "message": {"id": "msg_mock", "role": "assistant"}}
+        yield "content_block_start", {"type": "content_block_start", "index": 0,
+                                      "content_block": {"type": "text", "text": ""}}
+        for token in _split_tokens(text):
+            yield "content_block_delta", {"type": "content_block_delta", "index": 0,
+                                          "delta": {"type": "text_delta", "text": token}}
+        yield "content_block_stop", {"type": "content_block_stop", "index": 0}
+        yield "message_stop", {"type": "message_stop"}
+
+    def _send_events(self, events) -> None:
+        """SSE 이벤트를 chunked 전송으로 하나씩 보내기"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        delay = self._token_delay()
+        for event, data in events:
+            if delay:
+                time.sleep(delay)
+            payload = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False)
+            message = (f"event: {event}\n" if event else "") + f"data: {payload}\n\n"
+            chunk = message.encode("utf-8")
+            self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_json(self, status: int, payload: Dict[str, Any],
+                   headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._send_bytes(status, data, "application/json", headers)
+
+    def _send_bytes(self, status: int, data: bytes, content_type: str,
+                    headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class MockHTTPServer(ThreadingHTTPServer):
+    """동시 연결이 많은 벤치마크를 위해 대기열을 늘린 HTTP 서버"""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def next_fault(self) -> Optional[Fault]:
+        """이번 요청에 적용할 장애 반환 (예약된 장애 우선, 없으면 fault_rate 확률)"""
+        with self.fault_lock:
+            self.request_count += 1
+            if self.faults:
+                return self.faults.popleft()
+            if self.profile:
+                return self.profile.next_fault()
+            if self.fault_rate and self.rng.random() < self.fault_rate:
+                return self.fault_status
+        return None
+
+    def use_prompt_cache(self, prefixes) -> int:
+        """
+        블록 경계별 앞부분 중 캐시에 있는 가장 긴 것의 길이를 반환하고, 전체 캐시 구간을 저장
+
+        Args:
+            prefixes: 짧은 것부터 정렬된 앞부분 목록 (마지막이 cache_control까지의 전체 구간)
+
+        Returns:
+            캐시에서 읽은 앞부분 길이 (없으면 0)
+        """
+        if not prefixes:
+            return 0
+        with self.prompt_cache_lock:
+            hit = next((len(prefix) for prefix in reversed(prefixes) if prefix in self.prompt_cache), 0)
+            self.prompt_cache.add(prefixes[-1])
+        return hit
+
+    def handle_error(self, request, client_address):
+        # 클라이언트가 타임아웃/취소로 먼저 연결을 끊은 경우는 정상 상황으로 간주
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class MockAPIServer:
+    """백그라운드 스레드에서 실행되는 로컬 모의 API 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 token_latency: float = 0.0, fault_rate: float = 0.0,
+                 fault_status: Fault = 503, retry_after: Optional[float] = None,
+                 seed: Optional[int] = None, profile=None, batch_delay: float = 0.0):
+        """
+        모의 서버 초기화
+
+        Args:
+            host: 바인딩할 호스트
+            port: 바인딩할 포트 (0이면 임의의 빈 포트)
+            latency: 요청마다 추가할 지연 시간 (초)
+            token_latency: 스트리밍 응답에서 조각마다 추가할 지연 시간 (초)
+            fault_rate: 요청이 장애로 응답할 확률 (0~1)
+            fault_status: fault_rate로 발생시킬 장애 (HTTP 상태 코드 또는 "disconnect")
+            retry_after: 장애 응답에 넣을 Retry-After 헤더 값 (초)
+            seed: 장애 발생 난수 시드 (재현용)
+            profile: 지연 시간 분포/생성 속도/오류율/응답 내용을 정하는 MockProfile
+                     (지정하면 latency, token_latency, fault_rate 대신 사용)
+            batch_delay: 일괄 처리 작업이 완료로 보고되기까지의 시간 (초)
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.token_latency = token_latency
+        self.fault_rate = fault_rate
+        self.fault_status = fault_status
+        self.retry_after = retry_after
+        self.seed = seed
+        self.profile = profile
+        self.batch_delay = batch_delay
+        self._faults: deque = deque()
+        self._server: Optional[MockHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """서버 기본 URL"""
+        return f"http://{self.host}:{self.port}"
+
+    def get_endpoint(self, service: str) -> str:
+        """
+        서비스별 모의 엔드포인트 URL 반환
+
+        Args:
+            service: openai 또는 anthropic
+
+        Returns:
+            엔드포인트 URL
+        """
+        if service == "anthropic":
+            return f"{self.url}/v1/messages"
+        return f"{self.url}/v1/chat/completions"
+
+    @property
+    def request_count(self) -> int:
+        """서버가 받은 요청 수 (장애 응답 포함)"""
+        return self._server.request_count if self._server else 0
+
+    def inject_faults(self, *faults: Fault) -> None:
+        """
+        다음 요청들에 차례로 적용할 장애 예약
+
+        Args:
+            *faults: HTTP 상태 코드(429, 500, 503 등) 또는 "disconnect"
+        """
+        self._faults.extend(faults)
+
+    def start(self) -> 'MockAPIServer':
+        """서버를 백그라운드 스레드에서 시작"""
+        self._server = MockHTTPServer((self.host, self.port), MockRequestHandler)
+        self._server.latency = self.latency
+        self._server.token_latency = self.token_latency
+        self._server.fault_rate = self.fault_rate
+        self._server.fault_status = self.fault_status
+        self._server.retry_after = self.retry_after
+        self._server.profile = self.profile
+        self._server.rng = random.Random(self.seed)
+        self._server.faults = self._faults
+        self._server.fault_lock = threading.Lock()
+        self._server.request_count = 0
+        self._server.prompt_cache = set()
+        self._server.prompt_cache_lock = threading.Lock()
+        self._server.batches = MockBatchStore(self.batch_delay)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'MockAPIServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
@@ -0,0 +1,473 @@
+"""
+응답 캐시 모듈
+
+같은 요청(서비스, 모델, 프롬프트, 시스템 프롬프트, 생성 설정)에 대한 AI 응답을
+메모리 LRU와 디스크(SQLite, WAL 모드) 두 단계로 저장하여
+실습을 다시 실행할 때 같은 유료 API 호출을 반복하지 않도록 합니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from utils.config import CONFIG_FILE, get_setting, add_setting_listener
+
+# 캐시 기본 설정값
+DEFAULT_CACHE_SETTINGS = {
+    "enabled": True,
+    "path": ".cache/responses.sqlite3",   # 프로젝트 루트 기준 상대 경로 또는 절대 경로
+    "memory_entries": 256,                # 메모리 LRU에 보관할 최대 항목 수
+    "max_bytes": 100 * 1024 * 1024,       # 디스크 캐시 최대 크기 (바이트)
+    "ttl": 7 * 24 * 60 * 60               # 항목 유효 기간 (초, 0이면 만료 없음)
+}
+
+# 캐시 키 형식이 바뀌면 버전을 올려 이전 항목과 섞이지 않게 함
+_KEY_VERSION = 1
+
+# SQLite 잠금 대기 시간 (초)
+_BUSY_TIMEOUT = 5.0
+
+# 만료 항목 정리와 디스크 크기 재계산(전체 테이블 조회)을 하는 저장 간격
+_SWEEP_EVERY = 256
+
+# 크기 한도를 넘으면 한도의 이 비율까지 줄여, 한도 근처에서 저장할 때마다 정리하지 않도록 함
+_EVICT_TARGET = 0.9
+
+_default_cache: Optional['ResponseCache'] = None
+_default_cache_lock = threading.Lock()
+
+
+def normalize_prompt(prompt: Optional[str]) -> str:
+    """
+    캐시 키 계산을 위한 프롬프트 정규화
+
+    유니코드 정규화(NFC), 줄바꿈 통일, 줄 끝 공백과 앞뒤 공백 제거를 수행합니다.
+
+    Args:
+        prompt: 원본 프롬프트
+
+    Returns:
+        정규화된 프롬프트
+    """
+    if not prompt:
+        return ""
+    text = unicodedata.normalize("NFC", prompt).replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).strip()
+
+
+def make_cache_key(provider: str, model: Optional[str], prompt: str,
+                   system_prompt: Optional[str] = None,
+                   temperature: Optional[float] = None,
+                   max_tokens: Optional[int] = None,
+                   params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    요청 내용으로 캐시 키 생성
+
+    Args:
+        provider: AI 서비스 이름
+        model: 모델명
+        prompt: 사용자 프롬프트
+        system_prompt: 시스템 프롬프트
+        temperature: 응답 다양성
+        max_tokens: 최대 토큰 수
+        params: 그 밖의 요청 파라미터
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    payload = {
+        "v": _KEY_VERSION,
+        "provider": provider,
+        "model": model,
+        "prompt": normalize_prompt(prompt),
+        "system_prompt": normalize_prompt(system_prompt),
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "params": params or {}
+    }
+    data = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=repr)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class CacheStats:
+    """캐시 사용 통계"""
+
+    def __init__(self):
+        """통계 초기화"""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """모든 통계값을 0으로 초기화"""
+        with self._lock:
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.stores = 0
+            self.evictions = 0
+            self.expired = 0
+            self.bytes_read = 0
+            self.bytes_written = 0
+            self.errors = 0
+
+    def add(self, **counts: int) -> None:
+        """통계값 더하기"""
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        통계를 딕셔너리로 반환
+
+        Returns:
+            적중(hits, memory_hits, disk_hits), 미스, 저장, 제거, 읽고 쓴 바이트 수, 적중률
+        """
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "hits": hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "expired": self.expired,
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+                "errors": self.errors
+            }
+
+
+class ResponseCache:
+    """메모리 LRU + SQLite 2단계 응답 캐시"""
+
+    def __init__(self, path: Optional[str] = None, memory_entries: int = 256,
+                 max_bytes: int = 100 * 1024 * 1024, ttl: float = 0):
+        """
+        캐시 초기화
+
+        Args:
+            path: SQLite 파일 경로 (없으면 메모리 캐시만 사용)
+            memory_entries: 메모리 LRU에 보관할 최대 항목 수
+            max_bytes: 디스크 캐시 최대 크기 (바이트), 넘으면 오래 사용하지 않은 항목부터 제거
+            ttl: 기본 유효 기간 (초, 0이면 만료 없음)
+        """
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        # key -> (응답, 만료 시각)
+        self._memory: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._memory_lock = threading.Lock()
+        # sqlite3 연결은 스레드 간 공유할 수 없으므로 스레드별로 생성
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        # 디스크 캐시의 전체 크기 (저장/삭제할 때마다 갱신하고 주기적으로 다시 계산)
+        self._disk_bytes = 0
+        self._writes_since_sweep = 0
+        self._size_lock = threading.Lock()
+
+        self._warned = False
+
+        if self.path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS responses ("
+                        " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+                        " created REAL NOT NULL, accessed REAL NOT NULL, expires REAL)"
+                    )
+                    conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+                self._disk_bytes = self._sum_size(conn)
+            except (sqlite3.Error, OSError) as e:
+                # 디스크 캐시를 열 수 없으면 메모리 캐시만 사용
+                self._disk_error(e)
+                self.path = None
+
+    def _disk_error(self, error: Exception) -> None:
+        """
+        디스크 캐시 오류 기록 (캐시는 요청을 막지 않도록 오류를 전파하지 않고 처음 한 번만 안내)
+
+        Args:
+            error: 발생한 sqlite3 / OS 오류
+        """
+        self.stats.add(errors=1)
+        if not self._warned:
+            self._warned = True
+            print(f"⚠️ 응답 캐시 오류로 디스크 캐시를 건너뜁니다: {type(error).__name__}: {error}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 SQLite 연결 반환 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # 캐시는 요청을 오래 막으면 안 되므로 잠금 대기는 짧게 (넘기면 캐시 없이 진행)
+            conn = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT)
+            # WAL: 읽기와 쓰기가 서로를 막지 않아 여러 스레드/프로세스가 동시에 사용 가능
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            key: make_cache_key로 만든 키
+
+        Returns:
+            캐시된 응답 (없거나 만료되었으면 None)
+        """
+        now = time.time()
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > now:
+                    self._memory.move_to_end(key)
+                    self.stats.add(memory_hits=1, bytes_read=len(value.encode("utf-8")))
+                    return value
+                del self._memory[key]
+
+        if self.path:
+            try:
+                value = self._disk_get(key, now)
+            except sqlite3.Error as e:
+                # 캐시를 읽지 못하면 캐시에 없는 것으로 보고 API를 호출
+                self._disk_error(e)
+                value = None
+            if value is not None:
+                return value
+
+        self.stats.add(misses=1)
+        return None
+
+    def _disk_get(self, key: str, now: float) -> Optional[str]:
+        """디스크 캐시에서 조회 (만료된 항목은 삭제)"""
+        conn = self._connect()
+        row = conn.execute("SELECT value, size, expires FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, size, expires = row
+        if expires is None or expires > now:
+            with conn:
+                conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._remember(key, value, expires)
+            self.stats.add(disk_hits=1, bytes_read=len(value.encode("utf-8")))
+            return value
+        with conn:
+            deleted = conn.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount
+        if deleted:
+            self._add_disk_bytes(-size)
+        self.stats.add(expired=1)
+        return None
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        응답 저장
+
+        Args:
+            key: make_cache_key로 만든 키
+            value: 응답 텍스트
+            ttl: 유효 기간 (초, 없으면 기본값 사용, 0이면 만료 없음)
+        """
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        expires = now + ttl if ttl else None
+        size = len(value.encode("utf-8"))
+        self._remember(key, value, expires)
+
+        if self.path:
+            try:
+                conn = self._connect()
+                with conn:
+                    # 같은 키를 덮어쓰면 이전 항목 크기만큼 빼야 하므로 먼저 조회 (기본 키 조회라 빠름)
+                    old = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, value, size, created, accessed, expires)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, value, size, now, now, expires)
+                    )
+                if self._add_disk_bytes(size - (old[0] if old else 0), write=True):
+                    self._evict(conn)
+            except sqlite3.Error as e:
+                # 저장에 실패해도 받은 응답은 그대로 사용 (메모리 캐시에는 남음)
+                self._disk_error(e)
+                return
+        self.stats.add(stores=1, bytes_written=size)
+
+    def _remember(self, key: str, value: str, expires: Optional[float]) -> None:
+        """메모리 LRU에 저장 (최대 항목 수를 넘으면 가장 오래된 항목 제거)"""
+        if self.memory_entries <= 0:
+            return
+        with self._memory_lock:
+            self._memory[key] = (value, expires)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    @staticmethod
+    def _sum_size(conn: sqlite3.Connection) -> int:
+        """디스크 캐시의 전체 크기 계산 (테이블 전체를 읽으므로 열 때와 주기적인 정리 때만 사용)"""
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _add_disk_bytes(self, delta: int, write: bool = False) -> bool:
+        """
+        디스크 캐시 크기 갱신
+
+        Args:
+            delta: 늘어난(줄어든) 바이트 수
+            write: 저장으로 인한 변경인지 여부 (정리 주기 계산에 사용)
+
+        Returns:
+            정리(_evict)가 필요한지 여부 (크기 한도 초과 또는 정리 주기 도달)
+        """
+        with self._size_lock:
+            self._disk_bytes += delta
+            if write:
+                self._writes_since_sweep += 1
+            if self._disk_bytes > self.max_bytes or self._writes_since_sweep >= _SWEEP_EVERY:
+                self._writes_since_sweep = 0
+                return True
+            return False
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """
+        만료된 항목과 크기 한도를 넘는 오래된 항목 제거
+
+        다른 프로세스가 같은 파일에 저장한 항목도 반영되도록 전체 크기를 다시 계산하고,
+        한도를 넘으면 한도의 _EVICT_TARGET 비율까지 오래 사용하지 않은 항목부터 제거합니다.
+        """
+        # DELETE는 지운 항목이 없어도 쓰기 트랜잭션을 열므로 항상 커밋(오류 시 롤백)해야
+        # 이 스레드의 연결이 쓰기 잠금을 계속 잡고 있지 않음
+        with conn:
+            removed = conn.execute(
+                "DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?", (time.time(),)
+            ).rowcount
+            total = self._sum_size(conn)
+            if total > self.max_bytes:
+                target = int(self.max_bytes * _EVICT_TARGET)
+                while total > target:
+                    # 전체 목록을 읽지 않도록 오래된 항목부터 조금씩 가져와 제거
+                    rows = conn.execute(
+                        "SELECT key, size FROM responses ORDER BY accessed LIMIT 64"
+                    ).fetchall()
+                    if not rows:
+                        break
+                    for key, size in rows:
+                        if total <= target:
+                            break
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        with self._memory_lock:
+                            self._memory.pop(key, None)
+                        total -= size
+                        removed += 1
+        with self._size_lock:
+            self._disk_bytes = total
+        if removed:
+            self.stats.add(evictions=removed)
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        with self._memory_lock:
+            self._memory.clear()
+        if self.path:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM responses")
+            with self._size_lock:
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        """열려 있는 SQLite 연결 닫기"""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.ProgrammingError:
+                    # 다른 스레드에서 만든 연결은 그 스레드가 끝날 때 정리됨
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
+
+def _resolve_cache_path(path: Optional[str]) -> Optional[str]:
+    """설정의 캐시 경로를 프로젝트 루트 기준 절대 경로로 변환"""
+    if not path:
+        return None
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.dirname(CONFIG_FILE), path)
+
+
+def get_response_cache(enabled: Optional[bool] = None) -> Optional[ResponseCache]:
+    """
+    설정 파일의 cache 항목으로 만든 공유 응답 캐시 반환
+
+    Args:
+        enabled: 사용 여부 (None이면 cache.enabled 설정, True이면 설정과 관계없이 사용)
+
+    Returns:
+        ResponseCache 객체 (사용하지 않으면 None)
+    """
+    global _default_cache
+
+    if enabled is None:
+        enabled = get_setting("cache.enabled", DEFAULT_CACHE_SETTINGS["enabled"])
+    if not enabled:
+        return None
+    if _default_cache is not None:
+        return _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            def setting(key):
+                return get_setting(f"cache.{key}", DEFAULT_CACHE_SETTINGS[key])
+
+            _default_cache = ResponseCache(
+                path=_resolve_cache_path(setting("path")),
+                memory_entries=setting("memory_entries"),
+                max_bytes=setting("max_bytes"),
+                ttl=setting("ttl")
+            )
+        return _default_cache
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    공유 응답 캐시의 통계 조회
+
+    Returns:
+        통계 딕셔너리 (캐시가 꺼져 있거나 아직 만들어지지 않았으면 모두 0)
+    """
+    cache = _default_cache
+    return cache.stats.as_dict() if cache else CacheStats().as_dict()
+
+
+def reset_response_cache() -> None:
+    """공유 응답 캐시 객체를 닫고 폐기 (설정 변경 후 다시 생성됨)"""
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is not None:
+            _default_cache.close()
+            _default_cache = None
+
+
+# 'cache.*' 설정이 바뀌면 새 설정으로 캐시를 다시 열도록 기존 캐시 폐기
+add_setting_listener("cache", lambda key, value: reset_response_cache())
@@ -0,0 +1,302 @@
+"""
+재시도 정책 모듈
+
+일시적인 오류(429, 5xx, 연결 끊김 등)가 발생하면 지수 백오프와
+전체 지터(full jitter)로 대기한 뒤 다시 요청합니다.
+서버가 Retry-After로 대기 시간을 알려주면 그 시간을 우선하며,
+전체 재시도 시간이 정해진 한도(max_elapsed)를 넘지 않도록 합니다.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from utils.config import get_setting
+from utils.errors import AIClientError, error_from_exception
+from utils.telemetry import record_add
+
+# 재시도 기본 설정값
+DEFAULT_RETRY_SETTINGS = {
+    "max_attempts": 4,     # 첫 시도를 포함한 최대 시도 횟수
+    "base_delay": 0.5,     # 첫 재시도의 최대 대기 시간 (초)
+    "max_delay": 20.0,     # 한 번의 대기 시간 상한 (초)
+    "max_elapsed": 60.0,   # 첫 시도부터 포기할 때까지의 전체 시간 한도 (초)
+    "verbose": True        # 재시도할 때 안내 메시지 출력 여부
+}
+
+# 서비스별 재시도 통계
+_stats: Dict[str, 'RetryStats'] = {}
+_stats_lock = threading.Lock()
+
+
+class RetryStats:
+    """서비스별 재시도 통계"""
+
+    def __init__(self):
+        """통계 초기화"""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """모든 통계값을 0으로 초기화"""
+        with self._lock:
+            self.calls = 0
+            self.attempts = 0
+            self.retries = 0
+            self.successes = 0
+            self.failures = 0
+            self.wait_time = 0.0
+            self.errors: Dict[str, int] = {}
+
+    def record_attempt(self, first: bool) -> None:
+        """요청 시도 기록"""
+        with self._lock:
+            self.attempts += 1
+            if first:
+                self.calls += 1
+
+    def record_error(self, error: AIClientError) -> None:
+        """오류 종류별 발생 횟수 기록"""
+        name = type(error).__name__
+        with self._lock:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def record_retry(self, delay: float) -> None:
+        """재시도 대기 기록"""
+        with self._lock:
+            self.retries += 1
+            self.wait_time += delay
+
+    def record_result(self, success: bool) -> None:
+        """최종 성공/실패 기록"""
+        with self._lock:
+            if success:
+                self.successes += 1
+            else:
+                self.failures += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        통계를 딕셔너리로 반환
+
+        Returns:
+            호출 수, 시도 수, 재시도 수, 성공/실패 수, 대기 시간, 오류 종류별 횟수
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "successes": self.successes,
+                "failures": self.failures,
+                "wait_time": self.wait_time,
+                "errors": dict(self.errors)
+            }
+
+
+def _get_stats(service: str) -> RetryStats:
+    """서비스별 통계 객체 반환 (없으면 생성)"""
+    stats = _stats.get(service)
+    if stats is None:
+        with _stats_lock:
+            stats = _stats.setdefault(service, RetryStats())
+    return stats
+
+
+def get_retry_setting(service: str, key: str) -> Any:
+    """
+    재시도 설정값 가져오기
+
+    서비스별 설정(retry.providers.<service>.<key>)이 있으면 우선 사용합니다.
+
+    Args:
+        service: AI 서비스 이름
+        key: 설정 키 (max_attempts, base_delay, max_delay, max_elapsed, verbose)
+
+    Returns:
+        설정값
+    """
+    value = get_setting(f"retry.providers.{service}.{key}")
+    if value is None:
+        value = get_setting(f"retry.{key}", DEFAULT_RETRY_SETTINGS.get(key))
+    return value
+
+
+class RetryPolicy:
+    """지수 백오프 + 전체 지터 재시도 정책"""
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5,
+                 max_delay: float = 20.0, max_elapsed: float = 60.0,
+                 verbose: bool = True, rng: Optional[random.Random] = None):
+        """
+        재시도 정책 초기화
+
+        Args:
+            max_attempts: 첫 시도를 포함한 최대 시도 횟수
+            base_delay: 첫 재시도의 최대 대기 시간 (초), 시도마다 2배씩 증가
+            max_delay: 한 번의 대기 시간 상한 (초)
+            max_elapsed: 첫 시도부터 포기할 때까지의 전체 시간 한도 (초)
+            verbose: 재시도할 때 안내 메시지 출력 여부
+            rng: 지터 계산에 사용할 난수 생성기 (테스트 재현용)
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.verbose = verbose
+        self._rng = rng or random.Random()
+
+    @classmethod
+    def from_config(cls, service: str) -> 'RetryPolicy':
+        """
+        설정 파일의 retry 항목으로 정책 생성
+
+        Args:
+            service: AI 서비스 이름
+
+        Returns:
+            RetryPolicy 객체
+        """
+        return cls(**{key: get_retry_setting(service, key) for key in DEFAULT_RETRY_SETTINGS})
+
+    def backoff(self, attempt: int) -> float:
+        """
+        전체 지터를 적용한 대기 시간 계산
+
+        Args:
+            attempt: 실패한 시도 번호 (1부터 시작)
+
+        Returns:
+            0 ~ min(max_delay, base_delay * 2^(attempt-1)) 사이의 임의 대기 시간 (초)
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return self._rng.uniform(0, ceiling)
+
+    def next_delay(self, error: AIClientError, attempt: int, elapsed: float,
+                   idempotent: bool = True) -> Optional[float]:
+        """
+        다음 재시도까지의 대기 시간 결정
+
+        Args:
+            error: 발생한 오류
+            attempt: 실패한 시도 번호 (1부터 시작)
+            elapsed: 첫 시도부터 지금까지 걸린 시간 (초)
+            idempotent: 요청을 반복해도 결과가 달라지지 않는지 여부
+
+        Returns:
+            대기 시간 (초), 재시도하지 않아야 하면 None
+        """
+        if not error.retryable or attempt >= self.max_attempts:
+            return None
+        # 서버가 이미 처리했을 수 있는 요청은 멱등할 때만 다시 보냄
+        if error.may_have_executed and not idempotent:
+            return None
+
+        delay = self.backoff(attempt)
+        if error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+        if elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+    def _on_error(self, error: BaseException, service: str, attempt: int,
+                  start: float, idempotent: bool) -> float:
+        """오류를 기록하고 대기 시간 반환 (재시도하지 않으면 예외 발생)"""
+        stats = _get_stats(service)
+        typed = error_from_exception(service, error)
+        stats.record_error(typed)
+
+        delay = self.next_delay(typed, attempt, time.monotonic() - start, idempotent)
+        if delay is None:
+            stats.record_result(False)
+            if typed is error:
+                raise typed
+            raise typed from error
+
+        stats.record_retry(delay)
+        record_add("retries", 1)
+        if self.verbose:
+            print(f"⚠️ {typed} - {delay:.1f}초 후 다시 시도합니다. ({attempt + 1}/{self.max_attempts})")
+        return delay
+
+    def call(self, func: Callable[[], Any], service: str, idempotent: bool = True) -> Any:
+        """
+        함수를 재시도 정책에 따라 실행
+
+        Args:
+            func: 실행할 함수 (인자 없음)
+            service: 통계를 기록할 AI 서비스 이름
+            idempotent: 요청을 반복해도 결과가 달라지지 않는지 여부
+
+        Returns:
+            함수의 반환값
+
+        Raises:
+            AIClientError: 재시도할 수 없거나 한도를 넘긴 경우 마지막 오류
+        """
+        stats = _get_stats(service)
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            stats.record_attempt(first=attempt == 1)
+            try:
+                result = func()
+            except Exception as e:
+                time.sleep(self._on_error(e, service, attempt, start, idempotent))
+                continue
+            stats.record_result(True)
+            return result
+
+    async def acall(self, func: Callable[[], Awaitable[Any]], service: str,
+                    idempotent: bool = True) -> Any:
+        """
+        call의 비동기 버전
+
+        Args:
+            func: 실행할 코루틴을 만드는 함수 (인자 없음)
+            service: 통계를 기록할 AI 서비스 이름
+            idempotent: 요청을 반복해도 결과가 달라지지 않는지 여부
+
+        Returns:
+            코루틴의 반환값
+        """
+        import asyncio
+        stats = _get_stats(service)
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            stats.record_attempt(first=attempt == 1)
+            try:
+                result = await func()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await asyncio.sleep(self._on_error(e, service, attempt, start, idempotent))
+                continue
+            stats.record_result(True)
+            return result
+
+
+def get_retry_stats(service: Optional[str] = None) -> Dict[str, Any]:
+    """
+    재시도 통계 조회
+
+    Args:
+        service: 조회할 서비스 (없으면 전체 서비스)
+
+    Returns:
+        서비스의 통계 딕셔너리 또는 서비스별 통계 딕셔너리
+    """
+    if service is not None:
+        stats = _stats.get(service)
+        return stats.as_dict() if stats else RetryStats().as_dict()
+    return {name: stats.as_dict() for name, stats in _stats.items()}
+
+
+def reset_retry_stats() -> None:
+    """모든 서비스의 재시도 통계 초기화"""
+    for stats in _stats.values():
+        stats.reset()
@@ -0,0 +1,199 @@
+"""
+요청 병합(single-flight) 모듈
+
+완전히 같은 요청이 동시에 여러 번 들어오면 첫 요청만 API를 호출하고,
+나머지 요청은 그 결과를 기다렸다가 함께 받도록 합니다.
+여러 학생이 같은 실습의 기본 주제를 동시에 실행할 때 중복 호출을 줄여줍니다.
+"""
+
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from utils.telemetry import record_set
+
+# 이벤트 루프별 비동기 병합 객체 (루프가 사라지면 자동 제거)
+_async_groups: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+class CoalesceStats:
+    """요청 병합 통계"""
+
+    def __init__(self):
+        """통계 초기화"""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """모든 통계값을 0으로 초기화"""
+        with self._lock:
+            self.calls = 0
+            self.upstream = 0
+            self.coalesced = 0
+            self.max_waiters = 0
+
+    def record(self, coalesced: bool, waiters: int = 0) -> None:
+        """호출 기록 (coalesced=True이면 진행 중인 요청에 합류한 호출)"""
+        with self._lock:
+            self.calls += 1
+            if coalesced:
+                self.coalesced += 1
+                self.max_waiters = max(self.max_waiters, waiters)
+            else:
+                self.upstream += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        통계를 딕셔너리로 반환
+
+        Returns:
+            전체 호출 수, 실제 API 호출 수(upstream), 병합된 호출 수, 한 요청의 최대 대기자 수
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "upstream": self.upstream,
+                "coalesced": self.coalesced,
+                "max_waiters": self.max_waiters
+            }
+
+
+# 동기/비동기 경로가 함께 쓰는 통계
+coalesce_stats = CoalesceStats()
+
+
+class _Call:
+    """진행 중인 동기 요청"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """스레드 간 동일 요청 병합"""
+
+    def __init__(self, stats: CoalesceStats = coalesce_stats):
+        """
+        병합 객체 초기화
+
+        Args:
+            stats: 통계를 기록할 CoalesceStats 객체
+        """
+        self.stats = stats
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        같은 키의 요청이 진행 중이면 그 결과를 기다리고, 없으면 직접 실행
+
+        Args:
+            key: 요청을 구분하는 키
+            func: 실제 요청을 수행하는 함수 (인자 없음)
+
+        Returns:
+            함수의 반환값 (진행 중이던 요청과 공유)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        self.stats.record(coalesced=not leader, waiters=call.waiters)
+
+        if not leader:
+            record_set(coalesced=True)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """하나의 이벤트 루프 안에서 태스크 간 동일 요청 병합"""
+
+    def __init__(self, stats: CoalesceStats = coalesce_stats):
+        """
+        병합 객체 초기화
+
+        Args:
+            stats: 통계를 기록할 CoalesceStats 객체
+        """
+        self.stats = stats
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        같은 키의 요청이 진행 중이면 그 결과를 기다리고, 없으면 새 태스크로 실행
+
+        요청은 별도 태스크에서 실행되므로 먼저 호출한 쪽이 취소되어도
+        함께 기다리던 호출은 결과를 받을 수 있습니다.
+
+        Args:
+            key: 요청을 구분하는 키
+            func: 실제 요청을 수행하는 코루틴을 만드는 함수 (인자 없음)
+
+        Returns:
+            코루틴의 반환값 (진행 중이던 요청과 공유)
+        """
+        import asyncio
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(func())
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t: self._finish(key, t))
+            self.stats.record(coalesced=False)
+        else:
+            self._waiters[key] += 1
+            self.stats.record(coalesced=True, waiters=self._waiters[key])
+            record_set(coalesced=True)
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: 'asyncio.Task') -> None:
+        """완료된 요청 정리 (기다리는 쪽이 모두 취소된 경우의 미확인 예외 경고 방지)"""
+        self._tasks.pop(key, None)
+        self._waiters.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+
+def get_async_singleflight() -> AsyncSingleFlight:
+    """
+    현재 이벤트 루프의 비동기 병합 객체 반환 (없으면 생성)
+
+    Returns:
+        AsyncSingleFlight 객체
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    group = _async_groups.get(loop)
+    if group is None:
+        group = _async_groups[loop] = AsyncSingleFlight()
+    return group
+
+
+def get_coalescing_stats() -> Dict[str, Any]:
+    """
+    요청 병합 통계 조회
+
+    Returns:
+        calls, upstream, coalesced, max_waiters 키를 가진 딕셔너리
+    """
+    return coalesce_stats.as_dict()
@@ -0,0 +1,146 @@
+"""
+스트리밍 응답 처리 모듈
+
+AI 서비스의 스트리밍 응답(SSE)을 텍스트 조각 단위로 전달하고,
+첫 토큰까지 걸린 시간(TTFT)과 토큰 간 지연 시간을 측정합니다.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+# 최근 스트리밍 호출의 측정값 (최대 1000개 보관)
+_recent_metrics: deque = deque(maxlen=1000)
+_metrics_lock = threading.Lock()
+
+
+class StreamingResponse:
+    """
+    텍스트 조각(delta)을 차례로 내보내는 스트리밍 응답
+
+    for 문으로 순회하면 조각이 도착하는 대로 전달되며,
+    순회가 끝나면 text와 metrics에서 전체 텍스트와 측정값을 확인할 수 있습니다.
+    """
+
+    def __init__(self, deltas: Iterable[str], service: str, model: str):
+        """
+        스트리밍 응답 초기화
+
+        Args:
+            deltas: 텍스트 조각을 내보내는 이터러블
+            service: AI 서비스 이름
+            model: 모델명
+        """
+        self._deltas = deltas
+        self.service = service
+        self.model = model
+        self.text = ""
+        self.metrics: Dict[str, Any] = {}
+        self._start = 0.0
+
+    def __iter__(self) -> Iterator[str]:
+        # 요청은 첫 순회 시점에 전송되므로 이때부터 시간 측정
+        self._start = time.perf_counter()
+        chunks: List[str] = []
+        arrivals: List[float] = []
+        try:
+            for delta in self._deltas:
+                if not delta:
+                    continue
+                arrivals.append(time.perf_counter())
+                chunks.append(delta)
+                yield delta
+        finally:
+            self.text = "".join(chunks)
+            self.metrics = self._build_metrics(arrivals, time.perf_counter())
+            with _metrics_lock:
+                _recent_metrics.append(self.metrics)
+
+    def _build_metrics(self, arrivals: List[float], end: float) -> Dict[str, Any]:
+        """도착 시각 목록으로 TTFT와 토큰 간 지연 시간 계산"""
+        gaps = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+        return {
+            "service": self.service,
+            "model": self.model,
+            "chunks": len(arrivals),
+            "ttft": arrivals[0] - self._start if arrivals else None,
+            "total_time": end - self._start,
+            "mean_inter_token": sum(gaps) / len(gaps) if gaps else None,
+            "max_inter_token": max(gaps) if gaps else None
+        }
+
+    def read(self) -> str:
+        """남은 조각을 모두 받아 전체 텍스트 반환"""
+        for _ in self:
+            pass
+        return self.text
+
+
+def iter_sse_events(lines: Iterable[bytes]) -> Iterator[Tuple[Optional[str], str]]:
+    """
+    SSE(Server-Sent Events) 줄 목록을 (이벤트 이름, 데이터) 튜플로 변환
+
+    Args:
+        lines: 응답 본문의 줄 단위 이터러블
+
+    Returns:
+        (event, data) 튜플 이터레이터
+    """
+    event = None
+    data: List[str] = []
+    for raw in lines:
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        line = line.rstrip("\r\n")
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = None, []
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            data.append(line[5:].lstrip())
+    if data:
+        yield event, "\n".join(data)
+
+
+def iter_openai_deltas(lines: Iterable[bytes]) -> Iterator[str]:
+    """OpenAI 스트리밍 응답에서 텍스트 조각 추출"""
+    for _, data in iter_sse_events(lines):
+        if data == "[DONE]":
+            break
+        choices = json.loads(data).get("choices") or [{}]
+        delta = choices[0].get("delta", {}).get("content")
+        if delta:
+            yield delta
+
+
+def iter_anthropic_deltas(lines: Iterable[bytes]) -> Iterator[str]:
+    """Anthropic 스트리밍 응답에서 텍스트 조각 추출"""
+    for event, data in iter_sse_events(lines):
+        payload = json.loads(data)
+        event = event or payload.get("type")
+        if event == "content_block_delta":
+            delta = payload.get("delta", {}).get("text")
+            if delta:
+                yield delta
+        elif event == "message_stop":
+            break
+        elif event == "error":
+            raise RuntimeError(payload.get("error", {}).get("message", data))
+
+
+def get_stream_metrics(last: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    최근 스트리밍 호출의 측정값 조회
+
+    Args:
+        last: 최근 몇 개만 조회할지 (없으면 전체)
+
+    Returns:
+        측정값 딕셔너리 목록 (ttft, total_time, mean_inter_token 등, 단위: 초)
+    """
+    with _metrics_lock:
+        metrics = list(_recent_metrics)
+    return metrics[-last:] if last else metrics
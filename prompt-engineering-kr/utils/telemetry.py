@@ -0,0 +1,565 @@
+"""
+호출별 원격 측정(telemetry) 모듈
+
+AIClient의 모든 호출마다 서비스, 모델, 대기/연결 시간, 첫 토큰 시간(TTFT),
+전체 지연 시간, 요청/응답 바이트, 사용 토큰 수, 재시도 횟수, 캐시 적중 여부를
+하나의 기록(딕셔너리)으로 남기고 등록된 싱크(sink)로 보냅니다.
+
+- memory: 최근 기록을 보관하는 링 버퍼 (get_telemetry_summary 등 조회에 사용)
+- jsonl: 기록을 한 줄씩 추가하는 JSONL 파일
+- prometheus: Prometheus 텍스트 형식 지표 파일
+
+진행 중인 호출의 기록은 contextvars로 전달되므로 재시도, 요청 한도, 연결 풀 등
+하위 모듈은 record_add / record_set으로 현재 호출의 기록에 값을 더할 수 있습니다.
+"""
+
+import atexit
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.config import CONFIG_FILE, get_setting, add_setting_listener
+
+# 원격 측정 기본 설정값
+DEFAULT_TELEMETRY_SETTINGS = {
+    "enabled": True,
+    "sinks": ["memory"],                          # memory, jsonl, prometheus
+    "ring_size": 1000,                            # memory 싱크가 보관할 최근 기록 수
+    "jsonl_path": ".telemetry/calls.jsonl",       # 프로젝트 루트 기준 상대 경로
+    "prometheus_path": ".telemetry/metrics.prom",
+    "prometheus_interval": 5.0                    # 지표 파일을 다시 쓰는 최소 간격 (초)
+}
+
+# Prometheus 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 진행 중인 호출의 기록과 현재 실행 중인 챕터
+_current_record: contextvars.ContextVar = contextvars.ContextVar("telemetry_record", default=None)
+_current_chapter: contextvars.ContextVar = contextvars.ContextVar("telemetry_chapter", default=None)
+
+_sinks: Optional[List['TelemetrySink']] = None
+_memory_sink: Optional['MemorySink'] = None
+_sinks_lock = threading.Lock()
+
+
+def _resolve_path(path: str) -> str:
+    """프로젝트 루트 기준 상대 경로를 절대 경로로 변환"""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.dirname(CONFIG_FILE), path)
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """
+    백분위수 계산 (nearest-rank 방식)
+
+    Args:
+        values: 값 목록
+        p: 백분위 (0~100)
+
+    Returns:
+        백분위수 (값이 없으면 None)
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[min(len(ordered), int(rank)) - 1]
+
+
+class TelemetrySink:
+    """원격 측정 기록을 받는 싱크의 기본 클래스"""
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        """기록 하나 처리"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """열려 있는 자원 정리"""
+
+
+class MemorySink(TelemetrySink):
+    """최근 기록을 보관하는 링 버퍼"""
+
+    def __init__(self, size: int = 1000):
+        """
+        링 버퍼 초기화
+
+        Args:
+            size: 보관할 최대 기록 수 (넘치면 오래된 기록부터 버림)
+        """
+        self._records: deque = deque(maxlen=max(1, int(size)))
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def records(self) -> List[Dict[str, Any]]:
+        """보관 중인 기록 목록 (오래된 순)"""
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        """보관 중인 기록 모두 삭제"""
+        with self._lock:
+            self._records.clear()
+
+
+class JSONLSink(TelemetrySink):
+    """기록을 JSONL 파일에 한 줄씩 추가하는 싱크"""
+
+    def __init__(self, path: str):
+        """
+        JSONL 싱크 초기화
+
+        Args:
+            path: 기록할 파일 경로
+        """
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class PrometheusSink(TelemetrySink):
+    """(서비스, 모델, 챕터)별 누적 지표를 Prometheus 텍스트 형식 파일로 내보내는 싱크"""
+
+    def __init__(self, path: str, interval: float = 5.0):
+        """
+        Prometheus 싱크 초기화
+
+        Args:
+            path: 지표 파일 경로 (node_exporter textfile collector 등에서 읽음)
+            interval: 파일을 다시 쓰는 최소 간격 (초, 종료 시에는 항상 기록)
+        """
+        self.path = path
+        self.interval = interval
+        self._series: Dict[tuple, Dict[str, Any]] = {}
+        self._last_write = 0.0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        labels = (record.get("provider"), record.get("model"), record.get("chapter") or "")
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = {
+                    "calls": 0, "errors": 0, "cache_hits": 0, "retries": 0,
+                    "prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0,
+                    "request_bytes": 0, "response_bytes": 0,
+                    "latency_sum": 0.0, "buckets": [0] * len(LATENCY_BUCKETS)
+                }
+            series["calls"] += 1
+            series["errors"] += 1 if record.get("error") else 0
+            series["cache_hits"] += 1 if record.get("cache_hit") else 0
+            for key in ("retries", "prompt_tokens", "completion_tokens", "cached_tokens",
+                        "request_bytes", "response_bytes"):
+                series[key] += record.get(key) or 0
+            latency = record.get("latency") or 0.0
+            series["latency_sum"] += latency
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    series["buckets"][i] += 1
+            self._dirty = True
+            due = time.monotonic() - self._last_write >= self.interval
+        if due:
+            self.flush()
+
+    def render(self) -> str:
+        """
+        누적 지표를 Prometheus 텍스트 형식으로 변환
+
+        Returns:
+            텍스트 형식 지표
+        """
+        lines = []
+        counters = (
+            ("calls", "ai_client_calls_total", "AI 서비스 호출 수"),
+            ("errors", "ai_client_errors_total", "실패한 호출 수"),
+            ("cache_hits", "ai_client_cache_hits_total", "응답 캐시 적중 수"),
+            ("retries", "ai_client_retries_total", "재시도 횟수"),
+            ("prompt_tokens", "ai_client_prompt_tokens_total", "입력 토큰 수"),
+            ("completion_tokens", "ai_client_completion_tokens_total", "출력 토큰 수"),
+            ("cached_tokens", "ai_client_cached_tokens_total", "프롬프트 캐시에서 읽은 입력 토큰 수"),
+            ("request_bytes", "ai_client_request_bytes_total", "요청 본문 바이트 수"),
+            ("response_bytes", "ai_client_response_bytes_total", "응답 본문 바이트 수")
+        )
+        with self._lock:
+            series = {labels: dict(values, buckets=list(values["buckets"]))
+                      for labels, values in self._series.items()}
+
+        def label_text(labels, extra=""):
+            provider, model, chapter = (str(v).replace("\\", "\\\\").replace('"', '\\"') for v in labels)
+            return f'{{provider="{provider}",model="{model}",chapter="{chapter}"{extra}}}'
+
+        for key, name, help_text in counters:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, values in series.items():
+                lines.append(f"{name}{label_text(labels)} {values[key]}")
+
+        name = "ai_client_latency_seconds"
+        lines.append(f"# HELP {name} 호출 전체 지연 시간 (초)")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, values in series.items():
+            for bound, count in zip(LATENCY_BUCKETS, values["buckets"]):
+                le = ',le="%s"' % bound
+                lines.append(f"{name}_bucket{label_text(labels, le)} {count}")
+            le = ',le="+Inf"'
+            lines.append(f"{name}_bucket{label_text(labels, le)} {values['calls']}")
+            lines.append(f"{name}_sum{label_text(labels)} {values['latency_sum']:.6f}")
+            lines.append(f"{name}_count{label_text(labels)} {values['calls']}")
+        return "\n".join(lines) + "\n"
+
+    def flush(self) -> None:
+        """지표 파일을 원자적으로 다시 쓰기 (변경된 내용이 있을 때만)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._last_write = time.monotonic()
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Prometheus 지표 저장 오류: {e}")
+
+    def close(self) -> None:
+        self.flush()
+
+
+def _build_sinks() -> List[TelemetrySink]:
+    """설정 파일의 telemetry.sinks 항목으로 싱크 목록 생성"""
+    global _memory_sink
+
+    def setting(key):
+        return get_setting(f"telemetry.{key}", DEFAULT_TELEMETRY_SETTINGS[key])
+
+    sinks: List[TelemetrySink] = []
+    _memory_sink = None
+    for name in setting("sinks") or []:
+        if name == "memory":
+            _memory_sink = MemorySink(setting("ring_size"))
+            sinks.append(_memory_sink)
+        elif name == "jsonl":
+            sinks.append(JSONLSink(_resolve_path(setting("jsonl_path"))))
+        elif name == "prometheus":
+            sinks.append(PrometheusSink(_resolve_path(setting("prometheus_path")),
+                                        setting("prometheus_interval")))
+        else:
+            print(f"알 수 없는 원격 측정 싱크 '{name}'는 건너뜁니다.")
+    return sinks
+
+
+def get_sinks() -> List[TelemetrySink]:
+    """
+    등록된 싱크 목록 반환 (처음 호출할 때 설정으로 생성)
+
+    Returns:
+        TelemetrySink 객체 목록
+    """
+    global _sinks
+
+    sinks = _sinks
+    if sinks is None:
+        with _sinks_lock:
+            if _sinks is None:
+                _sinks = _build_sinks()
+            sinks = _sinks
+    return sinks
+
+
+def add_sink(sink: TelemetrySink) -> None:
+    """
+    사용자 정의 싱크 추가
+
+    Args:
+        sink: emit(record) 메서드를 가진 TelemetrySink 객체
+    """
+    global _sinks
+
+    with _sinks_lock:
+        if _sinks is None:
+            _sinks = _build_sinks()
+        _sinks = _sinks + [sink]
+
+
+def remove_sink(sink: TelemetrySink) -> None:
+    """
+    싱크 제거
+
+    Args:
+        sink: 제거할 TelemetrySink 객체
+    """
+    global _sinks
+
+    with _sinks_lock:
+        if _sinks is not None:
+            _sinks = [s for s in _sinks if s is not sink]
+
+
+def reset_telemetry() -> None:
+    """싱크를 모두 닫고 폐기 (설정 변경 후 다시 생성됨)"""
+    global _sinks, _memory_sink
+
+    with _sinks_lock:
+        for sink in _sinks or []:
+            sink.close()
+        _sinks, _memory_sink = None, None
+
+
+def set_chapter(chapter: Optional[str]) -> contextvars.Token:
+    """
+    이후 현재 컨텍스트에서 이루어지는 호출에 표시할 챕터 설정
+
+    Args:
+        chapter: 챕터 ID (예: 4.3.1)
+
+    Returns:
+        이전 값으로 되돌릴 때 사용할 토큰
+    """
+    return _current_chapter.set(chapter)
+
+
+@contextmanager
+def chapter_scope(chapter: Optional[str]):
+    """
+    with 블록 안의 호출에만 챕터 표시
+
+    Args:
+        chapter: 챕터 ID
+    """
+    token = _current_chapter.set(chapter)
+    try:
+        yield
+    finally:
+        _current_chapter.reset(token)
+
+
+def _new_record(provider: str, model: str, stream: bool) -> Dict[str, Any]:
+    """빈 호출 기록 생성"""
+    return {
+        "provider": provider,
+        "model": model,
+        "chapter": _current_chapter.get(),
+        "stream": stream,
+        "started_at": time.time(),
+        "queue_wait": 0.0,
+        "connect_time": 0.0,
+        "ttft": None,
+        "latency": None,
+        "request_bytes": None,
+        "response_bytes": None,
+        "prompt_tokens": None,
+        "completion_tokens": None,
+        "cached_tokens": None,
+        "retries": 0,
+        "cache_hit": False,
+        "coalesced": False,
+        "error": None
+    }
+
+
+def _finish(record: Dict[str, Any], start: float, error: Optional[BaseException] = None) -> None:
+    """지연 시간을 채우고 모든 싱크로 기록 전송"""
+    record["latency"] = time.perf_counter() - start
+    if error is not None:
+        record["error"] = type(error).__name__
+    for sink in get_sinks():
+        try:
+            sink.emit(record)
+        except Exception as e:
+            print(f"원격 측정 기록 오류 ({type(sink).__name__}): {e}")
+
+
+@contextmanager
+def track_call(provider: str, model: str, stream: bool = False):
+    """
+    with 블록을 하나의 호출로 기록
+
+    블록 안에서는 record_add / record_set이 이 호출의 기록을 수정합니다.
+    블록이 끝나면 기록이 싱크로 전송되며, track_stream으로 넘긴 경우에는
+    스트림이 끝날 때 전송됩니다.
+
+    Args:
+        provider: AI 서비스 이름
+        model: 모델명
+        stream: 스트리밍 호출 여부
+
+    Yields:
+        호출 기록 딕셔너리 (원격 측정이 꺼져 있으면 None)
+    """
+    if not get_setting("telemetry.enabled", DEFAULT_TELEMETRY_SETTINGS["enabled"]):
+        yield None
+        return
+
+    record = _new_record(provider, model, stream)
+    start = time.perf_counter()
+    record["_start"] = start
+    token = _current_record.set(record)
+    try:
+        yield record
+    except BaseException as e:
+        record.pop("_start", None)
+        _finish(record, start, e)
+        raise
+    finally:
+        _current_record.reset(token)
+    # track_stream에 넘기지 않은 호출은 여기서 완료
+    if record.pop("_start", None) is not None:
+        _finish(record, start)
+
+
+def track_stream(deltas: Iterator[str], record: Optional[Dict[str, Any]]) -> Iterator[str]:
+    """
+    스트리밍 조각을 그대로 전달하면서 TTFT를 기록하고, 스트림이 끝나면 기록 전송
+
+    조각을 받는 동안에도 하위 모듈이 이 호출의 기록을 수정할 수 있도록
+    각 조각을 기록이 설정된 별도 컨텍스트에서 가져옵니다.
+
+    Args:
+        deltas: 텍스트 조각 이터레이터
+        record: track_call이 만든 호출 기록 (None이면 그대로 반환)
+
+    Returns:
+        텍스트 조각 이터레이터
+    """
+    if record is None:
+        return deltas
+    start = record.pop("_start")
+    context = contextvars.copy_context()
+    context.run(_current_record.set, record)
+    return _iter_tracked(iter(deltas), record, start, context)
+
+
+def _iter_tracked(deltas, record, start, context):
+    """track_stream의 제너레이터 본체"""
+    try:
+        while True:
+            try:
+                delta = context.run(next, deltas)
+            except StopIteration:
+                break
+            if record["ttft"] is None:
+                record["ttft"] = time.perf_counter() - start
+            yield delta
+    except GeneratorExit:
+        # 소비하는 쪽이 스트림을 중간에 닫은 경우는 오류로 보지 않음
+        _finish(record, start)
+        raise
+    except BaseException as e:
+        _finish(record, start, e)
+        raise
+    _finish(record, start)
+
+
+def current_record() -> Optional[Dict[str, Any]]:
+    """
+    진행 중인 호출의 기록
+
+    Returns:
+        호출 기록 딕셔너리 (호출 밖이거나 원격 측정이 꺼져 있으면 None)
+    """
+    return _current_record.get()
+
+
+def record_set(**fields: Any) -> None:
+    """
+    진행 중인 호출의 기록에 값 설정 (호출 밖에서는 아무것도 하지 않음)
+
+    Args:
+        **fields: 설정할 필드와 값
+    """
+    record = _current_record.get()
+    if record is not None:
+        record.update(fields)
+
+
+def record_add(field: str, amount: float) -> None:
+    """
+    진행 중인 호출의 기록에 값 더하기 (호출 밖에서는 아무것도 하지 않음)
+
+    Args:
+        field: 필드 이름 (queue_wait, connect_time, retries, response_bytes 등)
+        amount: 더할 값
+    """
+    record = _current_record.get()
+    if record is not None:
+        record[field] = (record.get(field) or 0) + amount
+
+
+def get_call_records() -> List[Dict[str, Any]]:
+    """
+    memory 싱크가 보관 중인 최근 호출 기록
+
+    Returns:
+        호출 기록 목록 (memory 싱크가 없으면 빈 목록)
+    """
+    get_sinks()
+    return _memory_sink.records() if _memory_sink is not None else []
+
+
+def get_telemetry_summary(group_by: str = "chapter") -> Dict[Any, Dict[str, Any]]:
+    """
+    최근 호출 기록을 그룹별로 집계
+
+    Args:
+        group_by: 묶을 필드 (chapter, provider, model 등)
+
+    Returns:
+        그룹별 {calls, errors, cache_hits, retries, p50, p95, p99, mean, ttft_p50,
+        prompt_tokens, completion_tokens, cached_tokens} 딕셔너리
+    """
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for record in get_call_records():
+        groups.setdefault(record.get(group_by), []).append(record)
+
+    summary = {}
+    for key, records in groups.items():
+        latencies = [r["latency"] for r in records if r.get("latency") is not None]
+        ttfts = [r["ttft"] for r in records if r.get("ttft") is not None]
+        summary[key] = {
+            "calls": len(records),
+            "errors": sum(1 for r in records if r.get("error")),
+            "cache_hits": sum(1 for r in records if r.get("cache_hit")),
+            "retries": sum(r.get("retries") or 0 for r in records),
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "mean": sum(latencies) / len(latencies) if latencies else None,
+            "ttft_p50": percentile(ttfts, 50),
+            "prompt_tokens": sum(r.get("prompt_tokens") or 0 for r in records),
+            "completion_tokens": sum(r.get("completion_tokens") or 0 for r in records),
+            "cached_tokens": sum(r.get("cached_tokens") or 0 for r in records)
+        }
+    return summary
+
+
+# 'telemetry.*' 설정이 바뀌면 새 설정으로 싱크를 다시 만들도록 기존 싱크 정리
+add_setting_listener("telemetry", lambda key, value: reset_telemetry())
+# 종료할 때 파일 싱크의 남은 내용 기록
+atexit.register(reset_telemetry)
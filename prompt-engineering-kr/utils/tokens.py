@@ -0,0 +1,311 @@
+"""
+토큰 수 추정 모듈
+
+API를 호출하지 않고 프롬프트의 토큰 수를 서비스(토크나이저 계열)별로 추정합니다.
+한글은 토크나이저마다 음절당 토큰 수 차이가 크므로 계열별 비율을 따로 둡니다.
+추정값은 전송 전 예산 확인(컨텍스트 한도 초과 거절/자르기, max_tokens 조정)과
+요청 한도(TPM) 예약에 사용합니다.
+
+tiktoken이 설치되어 있고 tokens.use_tiktoken 설정이 켜져 있으면
+OpenAI 모델은 정확한 토큰 수를 계산합니다.
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.config import get_setting
+from utils.errors import TokenLimitError
+
+# 토큰 예산 기본 설정값
+DEFAULT_TOKEN_SETTINGS = {
+    "budget_check": True,     # 전송 전에 컨텍스트 한도를 확인하고 max_tokens를 조정할지 여부
+    "over_budget": "reject",  # 한도를 넘는 프롬프트 처리: reject(오류) 또는 trim(가운데를 잘라냄)
+    "safety_margin": 0.1,     # 추정 오차를 고려해 프롬프트 추정값에 더할 비율
+    "min_output": 256,        # 응답을 위해 남겨야 하는 최소 토큰 수
+    "use_tiktoken": False,    # tiktoken이 있으면 OpenAI 모델의 정확한 토큰 수 사용
+    "models": {}              # 모델별 한도 덮어쓰기 {"모델명": {"context": ..., "max_output": ...}}
+}
+
+# 토크나이저 계열별 문자 종류당 토큰 비율
+# latin: 영단어 하나에서 토큰 하나가 차지하는 글자 수 (흔한 단어는 한 토큰),
+# digits: 토큰당 숫자 수, hangul/other: 문자당 토큰 수
+TOKENIZER_PROFILES = {
+    "openai": {"latin": 6.0, "digits": 3, "hangul": 1.2, "other": 1.3},         # cl100k (gpt-3.5, gpt-4)
+    "openai-o200k": {"latin": 6.5, "digits": 3, "hangul": 0.65, "other": 0.9},  # o200k (gpt-4o, o1 등)
+    "anthropic": {"latin": 5.0, "digits": 3, "hangul": 1.1, "other": 1.3},
+    "gemini": {"latin": 6.0, "digits": 1, "hangul": 0.6, "other": 0.9},         # SentencePiece
+    "default": {"latin": 5.0, "digits": 3, "hangul": 1.0, "other": 1.0}
+}
+
+# 모델별 컨텍스트 한도와 최대 출력 토큰 수 (모델명 접두어로 찾음, 긴 접두어 우선)
+MODEL_LIMITS = {
+    "gpt-3.5-turbo": {"context": 16385, "max_output": 4096},
+    "gpt-4": {"context": 8192, "max_output": 8192},
+    "gpt-4-turbo": {"context": 128000, "max_output": 4096},
+    "gpt-4o": {"context": 128000, "max_output": 16384},
+    "gpt-4.1": {"context": 1047576, "max_output": 32768},
+    "o1": {"context": 200000, "max_output": 100000},
+    "claude-instant-1": {"context": 100000, "max_output": 4096},
+    "claude-2": {"context": 100000, "max_output": 4096},
+    "claude-3": {"context": 200000, "max_output": 4096},
+    "claude-3-5": {"context": 200000, "max_output": 8192},
+    "gemini-1.0-pro": {"context": 32760, "max_output": 8192},
+    "gemini-1.5-flash": {"context": 1048576, "max_output": 8192},
+    "gemini-1.5-pro": {"context": 2097152, "max_output": 8192},
+    "mock": {"context": 32768, "max_output": 4096}
+}
+
+# 요청마다 메시지 형식(역할, 구분자 등)으로 더해지는 토큰 수
+MESSAGE_OVERHEAD = 8
+
+_HANGUL = re.compile(r"[가-힣ᄀ-ᇿ㄰-㆏]")
+_LATIN = re.compile(r"[A-Za-z]+")
+_DIGITS = re.compile(r"[0-9]+")
+_PUNCT = re.compile(r"[!-/:-@\[-`{-~]")
+_NEWLINES = re.compile(r"\n+")
+_SPACE = re.compile(r"\s")
+
+# tiktoken은 선택 사항 (없으면 비율 기반 추정 사용)
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+_encodings: Dict[str, Any] = {}
+
+
+def get_token_setting(key: str) -> Any:
+    """토큰 예산 설정값 가져오기 (없으면 기본값)"""
+    return get_setting(f"tokens.{key}", DEFAULT_TOKEN_SETTINGS[key])
+
+
+def tokenizer_family(service: str, model: Optional[str] = None) -> str:
+    """
+    서비스와 모델에 맞는 토크나이저 계열 이름
+
+    Args:
+        service: AI 서비스 이름
+        model: 모델명
+
+    Returns:
+        TOKENIZER_PROFILES의 키
+    """
+    if service == "openai":
+        if model and (model.startswith(("gpt-4o", "gpt-4.1", "o1", "o3", "o4"))):
+            return "openai-o200k"
+        return "openai"
+    if service in TOKENIZER_PROFILES:
+        return service
+    return "default"
+
+
+def _get_encoding(family: str, model: Optional[str]):
+    """OpenAI 계열의 tiktoken 인코딩 (사용할 수 없으면 None)"""
+    if tiktoken is None or not family.startswith("openai") or not get_token_setting("use_tiktoken"):
+        return None
+    name = "o200k_base" if family == "openai-o200k" else "cl100k_base"
+    encoding = _encodings.get(name)
+    if encoding is None:
+        try:
+            encoding = _encodings[name] = tiktoken.get_encoding(name)
+        except Exception as e:
+            # 인코딩 파일을 내려받을 수 없는 오프라인 환경 등
+            print(f"tiktoken 인코딩을 불러올 수 없어 추정값을 사용합니다: {e}")
+            encoding = _encodings[name] = False
+    return encoding or None
+
+
+@lru_cache(maxsize=4096)
+def _estimate_cached(text: str, family: str) -> int:
+    """문자 종류별 비율로 토큰 수 추정 (같은 텍스트는 캐시)"""
+    profile = TOKENIZER_PROFILES[family]
+    hangul = len(_HANGUL.findall(text))
+    latin_runs = _LATIN.findall(text)
+    digit_runs = _DIGITS.findall(text)
+    punct = len(_PUNCT.findall(text))
+    newlines = len(_NEWLINES.findall(text))
+    spaces = len(_SPACE.findall(text))
+
+    latin_chars = sum(len(run) for run in latin_runs)
+    digit_chars = sum(len(run) for run in digit_runs)
+    other = len(text) - hangul - latin_chars - digit_chars - punct - spaces
+
+    tokens = sum(math.ceil(len(run) / profile["latin"]) for run in latin_runs)
+    tokens += sum(math.ceil(len(run) / profile["digits"]) for run in digit_runs)
+    tokens += hangul * profile["hangul"] + max(other, 0) * profile["other"]
+    # 문장 부호는 대부분 한 토큰, 공백은 뒤 단어에 붙으므로 줄바꿈 묶음만 셈
+    tokens += punct + newlines
+    return int(math.ceil(tokens))
+
+
+def estimate_tokens(text: str, service: str = "default", model: Optional[str] = None) -> int:
+    """
+    텍스트의 토큰 수 추정
+
+    Args:
+        text: 추정할 텍스트
+        service: AI 서비스 이름 (토크나이저 계열 결정)
+        model: 모델명
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    family = tokenizer_family(service, model)
+    encoding = _get_encoding(family, model)
+    if encoding is not None:
+        return len(encoding.encode_ordinary(text))
+    return _estimate_cached(text, family)
+
+
+def estimate_tokens_batch(texts: List[str], service: str = "default",
+                          model: Optional[str] = None) -> List[int]:
+    """
+    여러 텍스트의 토큰 수를 한 번에 추정 (중복 텍스트는 한 번만 계산)
+
+    Args:
+        texts: 추정할 텍스트 목록
+        service: AI 서비스 이름
+        model: 모델명
+
+    Returns:
+        입력 순서와 같은 추정 토큰 수 목록
+    """
+    family = tokenizer_family(service, model)
+    unique = list(dict.fromkeys(text for text in texts if text))
+    encoding = _get_encoding(family, model)
+    if encoding is not None:
+        counts = dict(zip(unique, (len(ids) for ids in encoding.encode_ordinary_batch(unique))))
+    else:
+        counts = {text: _estimate_cached(text, family) for text in unique}
+    return [counts.get(text, 0) for text in texts]
+
+
+def get_estimator_cache_info() -> Dict[str, int]:
+    """
+    추정 결과 LRU 캐시 통계
+
+    Returns:
+        hits, misses, size, maxsize 키를 가진 딕셔너리
+    """
+    info = _estimate_cached.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
+
+
+def get_model_limits(model: str) -> Dict[str, int]:
+    """
+    모델의 컨텍스트 한도와 최대 출력 토큰 수
+
+    설정의 tokens.models.<모델명>이 있으면 우선 사용하고,
+    없으면 MODEL_LIMITS에서 가장 긴 접두어가 일치하는 항목을 사용합니다.
+
+    Args:
+        model: 모델명
+
+    Returns:
+        context, max_output 키를 가진 딕셔너리 (알 수 없는 모델은 보수적인 기본값)
+    """
+    # 모델명에는 '.'이 들어갈 수 있으므로 점 표기 대신 딕셔너리로 조회
+    override = (get_token_setting("models") or {}).get(model)
+    if override:
+        return dict(MODEL_LIMITS.get(model, {"context": 8192, "max_output": 4096}), **override)
+    matches = [prefix for prefix in MODEL_LIMITS if model and model.startswith(prefix)]
+    if not matches:
+        return {"context": 8192, "max_output": 4096}
+    return dict(MODEL_LIMITS[max(matches, key=len)])
+
+
+def trim_to_tokens(text: str, limit: int, service: str = "default",
+                   model: Optional[str] = None, marker: str = "\n...(중략)...\n") -> str:
+    """
+    텍스트를 토큰 한도 안으로 줄이기 (앞부분 2/3, 뒷부분 1/3을 남기고 가운데를 잘라냄)
+
+    지시문은 앞에, 질문은 뒤에 오는 경우가 많으므로 양 끝을 남깁니다.
+
+    Args:
+        text: 줄일 텍스트
+        limit: 최대 토큰 수
+        service: AI 서비스 이름
+        model: 모델명
+        marker: 잘라낸 자리에 넣을 표시
+
+    Returns:
+        한도 안으로 줄인 텍스트
+    """
+    if estimate_tokens(text, service, model) <= limit:
+        return text
+    budget = limit - estimate_tokens(marker, service, model)
+    if budget <= 0:
+        return ""
+
+    # 남길 글자 수를 이분 탐색 (추정값이 글자 수에 대해 단조 증가한다고 가정)
+    def fits(keep: int) -> bool:
+        head = text[:keep * 2 // 3]
+        tail = text[len(text) - (keep - len(head)):] if keep > len(head) else ""
+        return estimate_tokens(head, service, model) + estimate_tokens(tail, service, model) <= budget
+
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if fits(mid):
+            low = mid
+        else:
+            high = mid - 1
+    head = text[:low * 2 // 3]
+    tail = text[len(text) - (low - len(head)):] if low > len(head) else ""
+    return head + marker + tail
+
+
+def fit_request(prompt: str, max_tokens: Optional[int], service: str, model: str,
+                system_prompt: Optional[str] = None,
+                history: Optional[List[Dict[str, str]]] = None) -> Tuple[str, int]:
+    """
+    요청을 보내기 전에 토큰 예산을 확인하고 프롬프트와 max_tokens 조정
+
+    - 프롬프트가 컨텍스트 한도를 넘으면 over_budget 설정에 따라 오류를 내거나 가운데를 잘라냅니다.
+    - max_tokens가 없거나 모델의 최대 출력/남은 컨텍스트보다 크면 가능한 최대값으로 줄입니다.
+
+    Args:
+        prompt: 사용자 프롬프트
+        max_tokens: 요청한 최대 출력 토큰 수 (None이면 가능한 최대값)
+        service: AI 서비스 이름
+        model: 모델명
+        system_prompt: 시스템 프롬프트 (추정에 포함)
+        history: 이전 대화 메시지 목록 (추정에 포함, 줄이지는 않음)
+
+    Returns:
+        (프롬프트, max_tokens) 튜플
+
+    Raises:
+        TokenLimitError: over_budget이 reject이고 프롬프트가 한도를 넘는 경우
+    """
+    limits = get_model_limits(model)
+    margin = 1 + get_token_setting("safety_margin")
+    min_output = min(get_token_setting("min_output"), limits["max_output"])
+    # 줄이지 않는 부분 (시스템 프롬프트 + 이전 대화)
+    fixed_tokens = estimate_tokens(system_prompt or "", service, model)
+    for message in history or []:
+        fixed_tokens += estimate_tokens(message["content"], service, model) + MESSAGE_OVERHEAD
+    prompt_tokens = estimate_tokens(prompt, service, model)
+    used = int(math.ceil((prompt_tokens + fixed_tokens) * margin)) + MESSAGE_OVERHEAD
+    available = limits["context"] - used
+
+    if available < min_output:
+        if get_token_setting("over_budget") != "trim":
+            raise TokenLimitError(
+                f"프롬프트가 {model}의 컨텍스트 한도를 넘습니다. "
+                f"(추정 {used} 토큰 + 응답 최소 {min_output} 토큰 > 한도 {limits['context']} 토큰)",
+                service=service
+            )
+        limit = int((limits["context"] - min_output - MESSAGE_OVERHEAD) / margin) - fixed_tokens
+        prompt = trim_to_tokens(prompt, max(limit, 0), service, model)
+        print(f"⚠️ 프롬프트가 컨텍스트 한도를 넘어 약 {prompt_tokens}→{limit} 토큰으로 줄였습니다.")
+        available = min_output
+
+    ceiling = min(limits["max_output"], available)
+    if max_tokens is None or max_tokens > ceiling:
+        max_tokens = ceiling
+    return prompt, max_tokens
@@ -6,6 +6,8 @@
 
 from typing import Dict, List, Any, Optional
 
+from utils.headless import scripted_input
+
 def print_header(title: str) -> None:
     """
     제목 출력 함수
@@ -36,8 +38,12 @@ def get_user_input(prompt: str, default: str = "") -> str:
         default: 기본값
         
     Returns:
-        사용자 입력 또는 기본값
+        사용자 입력 또는 기본값 (무인 실행 중이면 스크립트의 응답 또는 기본값)
     """
+    answer = scripted_input(prompt, default)
+    if answer is not None:
+        return answer
+    
     user_input = input(f"{prompt} [기본값: {default}]: ").strip()
     return user_input if user_input else default
 
@@ -62,6 +68,35 @@ def display_results_comparison(basic_result: str, enhanced_result: str, preview_
     print("\n" + "-" * 80)
     print("* 전체 결과는 저장된 파일에서 확인할 수 있습니다.")
 
+def get_result_text(result: Dict[str, Any]) -> str:
+    """
+    일괄 요청(get_completions) 결과에서 표시할 텍스트 반환
+    
+    Args:
+        result: get_completions가 반환한 결과 항목
+        
+    Returns:
+        응답 텍스트 또는 실패 안내 문구
+    """
+    if result.get("error"):
+        return f"⚠️ 응답 생성 실패: {result['error']}"
+    return result.get("response") or ""
+
+def print_completion_status(label: str, result: Dict[str, Any]) -> None:
+    """
+    일괄 요청 항목의 완료 상태 출력 함수
+    
+    Args:
+        label: 프롬프트 표시 이름
+        result: get_completions가 반환한 결과 항목
+    """
+    if result.get("error"):
+        print(f"⚠️ {label} 응답 생성에 실패했습니다: {result['error']}")
+    elif result.get("resumed"):
+        print(f"⏩ {label} 응답을 이전 실행 기록에서 불러왔습니다.")
+    else:
+        print(f"✅ {label} 응답이 생성되었습니다.")
+
 def print_prompt_summary(prompt_type: str, summary_points: List[str]) -> None:
     """
     프롬프트 요약 출력 함수